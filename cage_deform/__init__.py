@@ -9,9 +9,11 @@ from . import (
     chain,
     core,
     animation_io,  # noqa: F401 — imported for registration completeness
+    cache_stats,
     curve,
     curve_presets,
     ffd_native_edit,
+    ffd_resolution,
     gizmos,
     merge,
     stack_presets,
@@ -40,6 +42,7 @@ from .core import (  # noqa: F401 — public API for draw.py / siblings
     curve_effect_range,
     deform_point_for_display,
     deform_point_local,
+    deform_points_local,
     deform_point_from_properties,
     deform_stack_modifiers,
     evaluator_end_scales,
@@ -116,6 +119,7 @@ classes = (
     *stage_apply.classes,
     *stage_mirror.classes,
     *stack_presets.classes,
+    *cache_stats.classes,
     gizmos.SDHCageBendStrengthGizmo,
     gizmos.SDHCageTwistStrengthGizmo,
     gizmos.SDHCageTaperFactorGizmo,
@@ -157,6 +161,7 @@ def _cleanup_registration(*, remove_runtime=True):
     core.disable_runtime_handlers()
     core.clear_chain_reconnect_state()
     core.remove_ffd_draw_handlers()
+    ffd_resolution.cancel_persistent_flush()
     if _pointer_registered or hasattr(bpy.types.Object, "sdh_cage_deform"):
         try:
             del bpy.types.Object.sdh_cage_deform
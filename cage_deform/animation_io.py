@@ -321,6 +321,8 @@ def _prepare_bake_frame(context, frame):
     whole = int(math.floor(frame))
     subframe = min(max(frame - whole, 0.0), 0.999999)
     context.scene.frame_set(whole, subframe=subframe)
+    # A baked frame must match the render exactly, so every controller is
+    # synced instead of only those the frame-change handler queued.
     core.sync_all_controllers(pull_transform=True, sync_mode="timer")
     core._drain_chain_reconnect_queue()
     core._drain_stack_auto_fit_queue()
@@ -0,0 +1,61 @@
+"""Diagnostics operator reporting the bounded redraw cache counters."""
+from __future__ import annotations
+
+from bpy.props import BoolProperty
+from bpy.types import Operator
+
+from .lru_cache import cache_stats, reset_cache_stats
+
+
+def _format_bytes(value):
+    value = int(value)
+    if value < 1024:
+        return f"{value} B"
+    if value < 1024 * 1024:
+        return f"{value / 1024.0:.1f} KiB"
+    return f"{value / (1024.0 * 1024.0):.1f} MiB"
+
+
+def format_cache_stats(stats=None):
+    """Return one readable line per registered cache."""
+    lines = []
+    for info in cache_stats() if stats is None else stats:
+        budget = info.get("byte_budget")
+        lines.append(
+            f"{info['name']}: {info['size']}/{info['limit']} entries, "
+            f"{_format_bytes(info['bytes'])}"
+            f"{'' if budget is None else ' / ' + _format_bytes(budget)}, "
+            f"hits {info['hits']}, misses {info['misses']}, "
+            f"evictions {info['evictions']} "
+            f"({info['hit_rate'] * 100.0:.1f}% hit)"
+        )
+    return tuple(lines)
+
+
+class SDH_OT_report_cache_stats(Operator):
+    bl_idname = "sdh.report_cache_stats"
+    bl_label = "Report Cage Cache Statistics"
+    bl_description = (
+        "Print hit, miss, eviction, and memory counters of the cage redraw "
+        "caches to the console and the Info log"
+    )
+    bl_options = {"REGISTER"}
+
+    reset: BoolProperty(
+        name="Reset Counters",
+        description="Zero the hit, miss, and eviction counters after reporting",
+        default=False,
+        options={"SKIP_SAVE"},
+    )
+
+    def execute(self, _context):
+        lines = format_cache_stats()
+        for line in lines:
+            print(f"SDH_CACHE::{line}")
+            self.report({"INFO"}, line)
+        if self.reset:
+            reset_cache_stats()
+        return {"FINISHED"}
+
+
+classes = (SDH_OT_report_cache_stats,)
@@ -9,8 +9,10 @@ from __future__ import annotations
 
 import math
 import uuid
+from contextlib import nullcontext
 
 import bpy
+import numpy as np
 from bpy.app.translations import pgettext_iface as iface_
 from bpy.props import (
     BoolProperty,
@@ -24,8 +26,15 @@ from bpy.types import Operator
 from mathutils import Euler, Matrix, Vector
 
 from .deform_contract import CHAIN_GAP_MAX
+from .ffd_points import (
+    read_influences as _read_ffd_influences,
+    read_offsets as _read_ffd_offsets,
+    write_influences as _write_ffd_influences,
+    write_offsets as _write_ffd_offsets,
+    write_selected as _write_ffd_selected,
+)
 from .ffd_resolution import (
-    invert_dense_matrix as _invert_dense_matrix,
+    native_axis_inverse as _native_ffd_axis_inverse,
     native_axis_weights as _native_ffd_axis_weights,
 )
 
@@ -130,6 +139,12 @@ def _call(name, *args, default=None, **kwargs):
     return function(*args, **kwargs) if function is not None else default
 
 
+def _input_batch():
+    """Return core's modifier input batch, or a no-op context."""
+    batch = _call("batched_modifier_inputs")
+    return batch if batch is not None else nullcontext()
+
+
 def _target_from_context(context):
     target = _call("target_from_context", context)
     if target is not None:
@@ -333,34 +348,21 @@ def sync_chain_domain_inputs(controller, modifier):
     values = _call(
         "_chain_domain_input_values", controller, modifier, default={}) or {}
     changed = False
-    for name in (
-            "Chain Domain Attribute", "Chain Root Stage", "Chain Tip Stage",
-            "Chain Source Start", "Chain Source End",
-    ):
-        if name not in values:
-            continue
-        value = values[name]
-        old = _call("modifier_input", modifier, name)
-        if isinstance(value, str) or isinstance(old, str):
-            different = str(old or "") != str(value or "")
-        elif isinstance(value, bool):
-            different = old is None or bool(old) != value
-        else:
-            try:
-                different = old is None or abs(
-                    float(old) - float(value)) > EPSILON
-            except (TypeError, ValueError):
-                different = True
-        if not different:
-            continue
-        _call("set_modifier_input", modifier, name, value)
-        changed = True
-    if changed:
-        target = getattr(modifier, "id_data", None)
-        try:
-            target.update_tag()
-        except (AttributeError, ReferenceError, RuntimeError, TypeError):
-            pass
+    with _input_batch():
+        for name in (
+                "Chain Domain Attribute", "Chain Root Stage",
+                "Chain Tip Stage", "Chain Source Start", "Chain Source End",
+        ):
+            if name not in values:
+                continue
+            value = values[name]
+            old = _call("modifier_input", modifier, name)
+            if not _call("_modifier_input_differs", old, value, default=True):
+                continue
+            _call("set_modifier_input", modifier, name, value)
+            changed = True
+        if changed:
+            _call("tag_modifier_target", getattr(modifier, "id_data", None))
     return changed
 
 
@@ -858,26 +860,26 @@ def sync_chain_shared_end_scale(
     def apply_scale():
         guard.update(pointers)
         try:
-            if not _end_scales_match(getattr(source_properties, source_name), value):
-                setattr(source_properties, source_name, value)
-            if not _end_scales_match(getattr(peer_properties, peer_name), value):
-                setattr(peer_properties, peer_name, value)
-            focused_results = None
-            if callable(sync_end_scales):
-                focused_results = (
-                    sync_end_scales(source_controller, modifier),
-                    sync_end_scales(peer_controller, peer_modifier),
-                )
-            if (
-                    focused_results is None or
-                    any(result is None for result in focused_results)
-            ) and sync is not None:
-                sync(source_controller, pull_transform=False)
-                sync(peer_controller, pull_transform=False)
-            try:
-                target.update_tag()
-            except (AttributeError, ReferenceError, RuntimeError, TypeError):
-                pass
+            with _input_batch():
+                if not _end_scales_match(
+                        getattr(source_properties, source_name), value):
+                    setattr(source_properties, source_name, value)
+                if not _end_scales_match(
+                        getattr(peer_properties, peer_name), value):
+                    setattr(peer_properties, peer_name, value)
+                focused_results = None
+                if callable(sync_end_scales):
+                    focused_results = (
+                        sync_end_scales(source_controller, modifier),
+                        sync_end_scales(peer_controller, peer_modifier),
+                    )
+                if (
+                        focused_results is None or
+                        any(result is None for result in focused_results)
+                ) and sync is not None:
+                    sync(source_controller, pull_transform=False)
+                    sync(peer_controller, pull_transform=False)
+                _call("tag_modifier_target", target)
         finally:
             for pointer in pointers:
                 guard.discard(pointer)
@@ -2002,29 +2004,33 @@ def reconnect_chain(
     if sync is not None and callable(precompute):
         frame_map = precompute(controllers, stages)
     fast_sync = getattr(_core(), "sync_chain_runtime_inputs", None)
-    if sync is not None:
-        for stage, controller in zip(
-                stages[start_index + 1:],
-                controllers[start_index + 1:]):
-            frames = frame_map.get(_pointer(controller))
-            if runtime_only and frames is not None and callable(fast_sync):
-                fast_sync(target, stage, controller, frames)
-            elif frames is None:
-                sync(controller, pull_transform=False)
-            else:
-                sync(
-                    controller, pull_transform=False,
-                    chain_frames=frames)
-    # Reconnecting a valid chain changes frames, not topology. Rewriting every
-    # metadata owner here made each drag perform dozens of redundant ID writes
-    # (and unsupported modifier writes on Blender 5.2). Broken chains still
-    # need their diagnostic metadata normalized.
-    if report["broken"]:
-        _normalize_metadata(target, chain_uuid, broken=True)
-    try:
-        target.update_tag()
-    except (AttributeError, RuntimeError, TypeError):
-        pass
+    # Every downstream stage writes into the same target; one batch turns
+    # the per-stage tags into a single re-evaluation.
+    with _input_batch():
+        if sync is not None:
+            for stage, controller in zip(
+                    stages[start_index + 1:],
+                    controllers[start_index + 1:]):
+                frames = frame_map.get(_pointer(controller))
+                if (
+                        runtime_only and frames is not None and
+                        callable(fast_sync)
+                ):
+                    fast_sync(target, stage, controller, frames)
+                elif frames is None:
+                    sync(controller, pull_transform=False)
+                else:
+                    sync(
+                        controller, pull_transform=False,
+                        chain_frames=frames)
+        # Reconnecting a valid chain changes frames, not topology. Rewriting
+        # every metadata owner here made each drag perform dozens of
+        # redundant ID writes (and unsupported modifier writes on Blender
+        # 5.2). Broken chains still need their diagnostic metadata
+        # normalized.
+        if report["broken"]:
+            _normalize_metadata(target, chain_uuid, broken=True)
+        _call("tag_modifier_target", target)
     return updated
 
 
@@ -2651,55 +2657,66 @@ def _cleanup_created(target, created):
         cleanup()
 
 
-def _ffd_grid_offset(properties, u, v, w, offsets=None):
-    """Sample a source FFD field with trilinear control-point interpolation.
+def _ffd_source_field(properties, offsets=None):
+    """Snapshot a source FFD field as one ``(U, V, W, 3)`` array.
 
-    Blender's native lattice interpolation can be higher order, but linear
-    resampling is deterministic and gives subdivided stages the same boundary
-    values for every supported Blender version.  The authored interpolation
-    mode remains copied to each stage for subsequent edits.
+    Without explicit ``offsets`` every effective point offset is read from
+    RNA once, instead of once per resampled target.
     """
     core = _core()
     resolution = tuple(core.ffd_resolution(properties))
-    for axis, value in enumerate((u, v, w)):
-        if resolution[axis] <= 1:
-            continue
-        if not math.isfinite(float(value)):
+    count = math.prod(resolution)
+    if offsets is None:
+        effective = core.ffd_point_effective_offsets(properties)
+        offsets = tuple(
+            effective[index] if index < len(effective) else
+            core.ffd_point_effective_offset(properties, index)
+            for index in range(count))
+    field = np.array(
+        [tuple(offsets[index]) for index in range(count)], dtype=float)
+    points_u, points_v, points_w = resolution
+    return field.reshape(points_w, points_v, points_u, 3).transpose(
+        2, 1, 0, 3)
+
+
+def _ffd_linear_axis_weights(samples, count):
+    """Return ``(len(samples), count)`` linear weights on one lattice axis."""
+    weights = np.zeros((len(samples), count))
+    for row, value in enumerate(samples):
+        value = float(value)
+        if not math.isfinite(value):
             value = 0.0
-        if axis == 0:
-            u = min(max(float(value), 0.0), 1.0)
-        elif axis == 1:
-            v = min(max(float(value), 0.0), 1.0)
-        else:
-            w = min(max(float(value), 0.0), 1.0)
-
-    def axis_pair(value, count):
-        scaled = min(max(float(value), 0.0), 1.0) * max(count - 1, 1)
+        scaled = min(max(value, 0.0), 1.0) * max(count - 1, 1)
         lower = min(int(math.floor(scaled)), max(count - 2, 0))
-        return lower, min(lower + 1, count - 1), scaled - lower
-
-    u0, u1, fu = axis_pair(u, resolution[0])
-    v0, v1, fv = axis_pair(v, resolution[1])
-    w0, w1, fw = axis_pair(w, resolution[2])
-    result = Vector((0.0, 0.0, 0.0))
-    for uu, wu in ((u0, 1.0 - fu), (u1, fu)):
-        for vv, wv in ((v0, 1.0 - fv), (v1, fv)):
-            for ww, wwgt in ((w0, 1.0 - fw), (w1, fw)):
-                index = core.ffd_point_index(uu, vv, ww, resolution)
-                value = (
-                    offsets[index] if offsets is not None else
-                    core.ffd_point_effective_offset(properties, index))
-                result += Vector(value) * (
-                    wu * wv * wwgt)
-    return result
+        upper = min(lower + 1, count - 1)
+        fraction = scaled - lower
+        weights[row, lower] += 1.0 - fraction
+        weights[row, upper] += fraction
+    return weights
+
+
+def _ffd_contract(field, weights_u, weights_v, weights_w):
+    """Contract a ``(U, V, W, 3)`` field with one weight matrix per axis.
+
+    Returns target offsets in Blender's point order, W-major then V then U.
+    """
+    result = np.tensordot(weights_u, field, axes=(1, 0))
+    result = np.tensordot(weights_v, result, axes=(1, 1))
+    result = np.tensordot(weights_w, result, axes=(1, 2))
+    return result.reshape(-1, 3)
 
 
 def _ffd_resampled_offsets(properties, start, end, resolution, offsets=None):
-    """Return native-basis control offsets for one physical FFD slice."""
-    core = _core()
+    """Return native-basis control offsets for one physical FFD slice.
+
+    The source field is snapshotted once and each slice is one contraction:
+    the native V basis is solved exactly, while U/W retain their authored
+    grid and are linearly sampled only when a capped legacy resolution
+    differs from the source.
+    """
     ru, rv, rw = (int(value) for value in resolution)
-    source_resolution = tuple(core.ffd_resolution(properties))
-    source_v = source_resolution[1]
+    field = _ffd_source_field(properties, offsets)
+    source_u, source_v, source_w = field.shape[:3]
     interpolation = getattr(
         properties, "ffd_interpolation_v", "KEY_BSPLINE")
     local_samples = tuple(
@@ -2707,78 +2724,22 @@ def _ffd_resampled_offsets(properties, start, end, resolution, offsets=None):
     span = max(float(end) - float(start), 0.0)
     global_samples = tuple(
         float(start) + span * value for value in local_samples)
-    source_weights = _native_ffd_axis_weights(
-        source_v, interpolation, global_samples)
-    stage_weights = _native_ffd_axis_weights(
-        rv, interpolation, local_samples)
-    inverse = _invert_dense_matrix(stage_weights)
+    weights_u = _ffd_linear_axis_weights(
+        tuple(value / max(ru - 1, 1) for value in range(ru)), source_u)
+    weights_w = _ffd_linear_axis_weights(
+        tuple(value / max(rw - 1, 1) for value in range(rw)), source_w)
+    inverse = _native_ffd_axis_inverse(rv, interpolation)
     if inverse is None:
         # A malformed legacy lattice should still be subdividable.  The
         # linear fallback is deterministic and matches the pre-2.4 path.
-        values = []
-        for w in range(rw):
-            w_t = w / max(rw - 1, 1)
-            for v in range(rv):
-                local_t = local_samples[v]
-                source_t = float(start) + span * local_t
-                for u in range(ru):
-                    u_t = u / max(ru - 1, 1)
-                    values.append(tuple(_ffd_grid_offset(
-                        properties, u_t, source_t, w_t, offsets=offsets)))
-        return tuple(values)
-
-    def source_value(u, v, w):
-        index = core.ffd_point_index(u, v, w, source_resolution)
-        return Vector(
-            offsets[index] if offsets is not None else
-            core.ffd_point_effective_offset(properties, index))
-
-    values_by_v = {}
-    for w in range(rw):
-        source_w = w / max(rw - 1, 1) * max(source_resolution[2] - 1, 1)
-        w0 = min(max(int(math.floor(source_w)), 0), source_resolution[2] - 1)
-        w1 = min(w0 + 1, source_resolution[2] - 1)
-        fw = source_w - w0
-        for u in range(ru):
-            source_u = u / max(ru - 1, 1) * max(source_resolution[0] - 1, 1)
-            u0 = min(max(int(math.floor(source_u)), 0), source_resolution[0] - 1)
-            u1 = min(u0 + 1, source_resolution[0] - 1)
-            fu = source_u - u0
-            desired = []
-            for row_weights in source_weights:
-                value = Vector((0.0, 0.0, 0.0))
-                for source_index, weight in enumerate(row_weights):
-                    # The native V basis is solved exactly; U/W retain their
-                    # authored grid and are bilinearly sampled only when a
-                    # capped legacy resolution differs from the source.
-                    value += (
-                        source_value(u0, source_index, w0) *
-                        (1.0 - fu) * (1.0 - fw) * weight
-                    )
-                    if u1 != u0:
-                        value += source_value(u1, source_index, w0) * fu * (
-                            1.0 - fw) * weight
-                    if w1 != w0:
-                        value += source_value(u0, source_index, w1) * (
-                            1.0 - fu) * fw * weight
-                        if u1 != u0:
-                            value += source_value(u1, source_index, w1) * (
-                                fu * fw * weight)
-                desired.append(value)
-            controls = []
-            for control_index in range(rv):
-                value = Vector((0.0, 0.0, 0.0))
-                for sample_index, weight in enumerate(inverse[control_index]):
-                    value += desired[sample_index] * weight
-                controls.append(tuple(value))
-            values_by_v[(u, w)] = tuple(controls)
-
-    values = []
-    for w in range(rw):
-        for v in range(rv):
-            for u in range(ru):
-                values.append(values_by_v[(u, w)][v])
-    return tuple(values)
+        weights_v = _ffd_linear_axis_weights(global_samples, source_v)
+    else:
+        weights_v = np.array(inverse, dtype=float) @ np.array(
+            _native_ffd_axis_weights(
+                source_v, interpolation, global_samples),
+            dtype=float)
+    values = _ffd_contract(field, weights_u, weights_v, weights_w)
+    return tuple(tuple(row) for row in values.tolist())
 
 
 def _set_ffd_stage_offsets(
@@ -2796,12 +2757,14 @@ def _set_ffd_stage_offsets(
         core.ensure_ffd_point_collection(properties, preserve=False)
         if influences is None:
             influences = (1.0,) * len(values)
-        for point, value, influence in zip(
-                properties.ffd_points, values, influences):
-            point.offset = tuple(float(component) for component in value)
-            if hasattr(point, "influence"):
-                point.influence = min(max(float(influence), 0.0), 1.0)
-            point.selected = False
+        offsets = _read_ffd_offsets(properties)
+        weights = _read_ffd_influences(properties)
+        count = min(len(offsets), len(values), len(influences))
+        offsets[:count] = np.asarray(values[:count], dtype=float)
+        weights[:count] = np.asarray(influences[:count], dtype=float)
+        _write_ffd_offsets(properties, offsets)
+        _write_ffd_influences(properties, weights)
+        _write_ffd_selected(properties, np.zeros(len(offsets), bool))
     finally:
         if pointer:
             syncing.discard(pointer)
@@ -2811,10 +2774,7 @@ def _capture_ffd_selection(properties):
     """Capture FFD selection in normalized UVW coordinates, not raw indices."""
     core = _core()
     resolution = tuple(core.ffd_resolution(properties))
-    selected = tuple(
-        index for index, point in enumerate(getattr(properties, "ffd_points", ()))
-        if bool(getattr(point, "selected", False))
-    )
+    selected = core.ffd_selected_point_indices(properties)
     coordinates = tuple(
         tuple(
             float(axis) / max(int(size) - 1, 1)
@@ -2978,13 +2938,15 @@ def _subdivide_ffd_cage_to_chain(context, target, source_modifier,
     base_location = Vector(source_controller.location)
     original_bottom = base_location + rotation_matrix @ Vector((
         0.0, -total_length * 0.5, 0.0))
+    raw_offsets = _read_ffd_offsets(source_properties).tolist()
+    raw_influences = _read_ffd_influences(source_properties).tolist()
     source_offsets = tuple(
+        tuple(raw_offsets[index]) if index < len(raw_offsets) else
         tuple(core.ffd_point_offset(source_properties, index))
         for index in range(math.prod(source_resolution))
     )
     source_influences = tuple(
-        float(getattr(source_properties.ffd_points[index], "influence", 1.0))
-        if index < len(getattr(source_properties, "ffd_points", ())) else 1.0
+        raw_influences[index] if index < len(raw_influences) else 1.0
         for index in range(math.prod(source_resolution))
     )
     source_effective_offsets = tuple(
@@ -6,6 +6,7 @@ import math
 import time
 import uuid
 from array import array
+from collections import namedtuple
 from contextlib import contextmanager
 from functools import lru_cache
 from pathlib import Path
@@ -22,7 +23,15 @@ from bpy.props import (
 from bpy.types import Operator, PropertyGroup, WorkSpaceTool
 from mathutils import Euler, Matrix, Quaternion, Vector
 
-from .curve import SDHCurvePoint, SDHCurveStation
+from .curve import (
+    CURVE_HELPER_MODIFIER_UUID,
+    SDHCurvePoint,
+    SDHCurveStation,
+    curve_guide_object,
+    is_curve_guide,
+    is_curve_helper,
+    request_curve_relation_sync_from_update,
+)
 from .deform_contract import (  # noqa: F401 - compatibility exports
     CHAIN_BOUNDARY_EPSILON,
     CHAIN_GAP_MAX,
@@ -42,7 +51,22 @@ from .deform_contract import (  # noqa: F401 - compatibility exports
     deform_order_signature,
     normalize_deform_order,
 )
-from .ffd_projection import projected_entity_cache
+from .ffd_points import (
+    bump_generation as bump_ffd_point_generation,
+    clear_generations as clear_ffd_point_generations,
+    point_arrays as ffd_point_arrays,
+    read_influences as _read_ffd_influences,
+    read_offsets as _read_ffd_offsets,
+    read_selected as _read_ffd_selected,
+    write_influences as _write_ffd_influences,
+    write_offsets as _write_ffd_offsets,
+    write_selected as _write_ffd_selected,
+)
+from .ffd_projection import (
+    FFDProjectedEntities,
+    convex_hull,
+    projected_entity_cache,
+)
 from .ffd_guard import (
     MIN_JACOBIAN_RATIO,
     SAFE_INTERPOLATION,
@@ -54,6 +78,10 @@ from .ffd_resolution import (
     resample_offsets,
     resample_values,
 )
+from .input_batch import ModifierInputBatch
+from .lru_cache import BoundedLRUCache
+from .ownership import OwnershipIndex
+from .revisions import bump_revision, clear_revisions, take_dirty_owners
 from .node_runtime import (
     cache_interface_identifiers,
     cached_interface_identifiers,
@@ -823,6 +851,50 @@ def _data_objects_available():
     except (AttributeError, ReferenceError, RuntimeError, TypeError):
         return False
 
+
+def _ownership_pairs(obj):
+    """Return the ownership index entries of one object.
+
+    Controllers are filed by ``(target UUID, modifier UUID)`` and by target
+    UUID alone; targets,
+    stage helpers (FFD lattices, native-edit proxies, curve guides) and
+    traditional Origins by the UUID of what owns them.
+    """
+    if obj.get(CONTROLLER_MARKER, False):
+        target_uuid = str(obj.get(TARGET_UUID, ""))
+        return (
+            ("controllers", (target_uuid, str(obj.get(MODIFIER_UUID, "")))),
+            ("target_controllers", target_uuid),
+        )
+    pairs = []
+    target_uuid = str(obj.get(TARGET_UUID, ""))
+    if target_uuid:
+        pairs.append(("targets", target_uuid))
+    if (
+            obj.get(FFD_NATIVE_EDIT_PROXY_MARKER, False) or
+            obj.get(FFD_LATTICE_MARKER, False)
+    ):
+        pairs.append((
+            "stage_helpers", str(obj.get(FFD_LATTICE_MODIFIER_MARKER, ""))))
+    elif is_curve_helper(obj):
+        pairs.append((
+            "stage_helpers", str(obj.get(CURVE_HELPER_MODIFIER_UUID, ""))))
+    if obj.get(PublicData.G_OWNER_PROP, False):
+        pairs.append((
+            "origins", str(obj.get(PublicData.G_OWNER_UUID_PROP, ""))))
+    else:
+        object_uuid = str(obj.get(PublicData.G_OBJECT_UUID_PROP, ""))
+        if object_uuid:
+            pairs.append(("owners", object_uuid))
+    return tuple(pairs)
+
+
+# UUID lookups go through this index instead of scanning ``bpy.data.objects``.
+# Load and undo invalidate it, UUID writers and the depsgraph handler re-file
+# single objects, and an object-count change or a stale hit rebuilds it.
+_OWNERSHIP = OwnershipIndex(
+    lambda: bpy.data.objects, _ownership_pairs, _pointer)
+
 _SYNCING = set()
 _FFD_AXES_LINK_SYNCING = set()
 # Curve presets can update several helper datablocks from one RNA callback.
@@ -840,12 +912,13 @@ _CHAIN_SHARED_SCALE_GUARD = set()
 _CHAIN_GLOBAL_STRETCH_GUARD = set()
 _CHAIN_RECONNECTING = set()
 _CHAIN_RECONNECT_QUEUE = {}
-_CHAIN_AFFINE_FRAME_CACHE = {}
+_CHAIN_AFFINE_FRAME_CACHE = BoundedLRUCache(
+    "core.chain_affine_frames", limit=512, byte_budget=4 * 1024 * 1024)
 # A wire rebuild samples dozens of points from the same chained stage. Cache
 # the immutable chain traversal plan so those points share controller lookup,
 # matrices, domains, relative end scales, and conjugation frames.
-_CHAIN_DISPLAY_STATE_CACHE = {}
-_CHAIN_DISPLAY_STATE_CACHE_LIMIT = 64
+_CHAIN_DISPLAY_STATE_CACHE = BoundedLRUCache(
+    "core.chain_display_states", limit=128, byte_budget=8 * 1024 * 1024)
 # Hidden chain-domain inputs are read by every stage synchronisation and by
 # the affine-frame solver.  Their values only change when chain metadata,
 # gaps, global chain options, or a controller's authored size changes.  Keep
@@ -873,6 +946,13 @@ _FFD_GUARD_VALID_OFFSETS = {}
 # cycle. Queue their world-space Origin refreshes after the depsgraph returns.
 _LATTICE_ORIGIN_QUEUE = {}
 _LATTICE_ORIGIN_SIGNATURES = {}
+# Native modifier reorders are reported as target geometry updates.  The
+# depsgraph handler only queues chained targets; the timer validates a chain
+# when the target's modifier stack actually changed.
+_CHAIN_VALIDATION_QUEUE = {}
+_CHAIN_STACK_SIGNATURES = {}
+# Pointer sets that route depsgraph updates; see ``depsgraph_dispatch``.
+_DEPSGRAPH_DISPATCH = None
 # Ordinary stack cages can opt into refitting their frame to the evaluated
 # output entering the stage.  The queue is keyed by target and stores the
 # earliest modifier index that needs propagation.
@@ -911,6 +991,10 @@ _PENDING_STAGE_SELECTION_RESTORE = None
 _SELECTION_WATCH_INTERVAL = 0.12
 _ORPHAN_HELPER_OBJECT_COUNT = -1
 _ORPHAN_HELPER_CLEANUP_RUNNING = False
+# Dirty-only controller syncs still reconcile every controller this often.
+_CONTROLLER_FULL_SYNC_INTERVAL = 5.0
+_CONTROLLER_FULL_SYNC_TIME = -_CONTROLLER_FULL_SYNC_INTERVAL
+_CONTROLLER_FULL_SYNC_PENDING = True
 _RELATIONSHIP_OVERLAY_STATES = {}
 _RUNTIME_HANDLERS_REGISTERED = False
 
@@ -960,10 +1044,15 @@ def invalidate_chain_domain_cache():
     frame, while a size change can invalidate both.  The chain module calls
     this helper after writing any mirrored ownership metadata.
     """
-    global _CHAIN_DOMAIN_INPUT_CACHE_VERSION
+    global _CHAIN_DOMAIN_INPUT_CACHE_VERSION, _DEPSGRAPH_DISPATCH
     _CHAIN_DOMAIN_INPUT_CACHE_VERSION += 1
     _CHAIN_DOMAIN_INPUT_CACHE.clear()
     projected_entity_cache.clear()
+    # Chain membership may have changed without touching ownership UUIDs.
+    if _DEPSGRAPH_DISPATCH is not None:
+        _DEPSGRAPH_DISPATCH = _DEPSGRAPH_DISPATCH._replace(
+            chained_targets=None)
+    _CHAIN_STACK_SIGNATURES.clear()
 
 
 def deform_type_mask(deform_types, fallback="BEND") -> int:
@@ -1273,13 +1362,13 @@ def ensure_unique_target_uuid(target) -> str:
     """
     target_uuid = str(target.get(TARGET_UUID, "")) if target else ""
     conflict = any(
-        obj != target and not is_cage_controller(obj) and
-        str(obj.get(TARGET_UUID, "")) == target_uuid
-        for obj in bpy.data.objects
+        obj != target
+        for obj in _OWNERSHIP.get("targets", target_uuid)
     ) if target_uuid else False
     if not target_uuid or conflict:
         target_uuid = str(uuid.uuid4())
         target[TARGET_UUID] = target_uuid
+        _OWNERSHIP.note(target)
     return target_uuid
 
 
@@ -1795,10 +1884,7 @@ def find_target(controller):
             str(parent.get(TARGET_UUID, "")) == target_uuid
     ):
         return parent
-    for obj in _data_objects_snapshot():
-        if str(obj.get(TARGET_UUID, "")) == target_uuid and not is_cage_controller(obj):
-            return obj
-    return None
+    return _OWNERSHIP.first("targets", target_uuid)
 
 
 def find_modifier(target, controller=None, modifier_uuid=None):
@@ -1864,6 +1950,7 @@ def _adopt_controller_metadata(target, modifier, controller):
             controller[TARGET_UUID] = target_uuid
         if modifier_uuid:
             controller[MODIFIER_UUID] = modifier_uuid
+        _OWNERSHIP.note(controller)
     except (AttributeError, ReferenceError, RuntimeError, TypeError, ValueError):
         pass
     return controller
@@ -1875,7 +1962,11 @@ def _fallback_controller_candidates(target, modifier):
     modifier_uuid = str(cage_modifier_uuid(modifier) or "")
     expected_name = _controller_name_matches_stage
     candidates = []
-    for obj in _data_objects_snapshot():
+    try:
+        children = tuple(getattr(target, "children", ()))
+    except (AttributeError, ReferenceError, RuntimeError, TypeError):
+        children = ()
+    for obj in children:
         try:
             if obj.type != "EMPTY" or getattr(obj, "parent", None) != target:
                 continue
@@ -1906,35 +1997,13 @@ def find_controller(target, modifier):
     if target is None or modifier is None:
         return None
     target_uuid = str(target.get(TARGET_UUID, ""))
-    modifier_uuid = cage_modifier_uuid(modifier)
-    try:
-        scenes = tuple(getattr(target, "users_scene", ()))
-        controls = control_collection(
-            scenes[0] if scenes else None, create=False)
-    except (AttributeError, ReferenceError, RuntimeError, TypeError):
-        controls = None
-    if controls is not None:
-        for obj in controls.objects:
-            if (
-                    getattr(obj, "parent", None) == target and
-                    is_cage_controller(obj) and
-                    str(obj.get(TARGET_UUID, "")) == target_uuid and
-                    str(obj.get(MODIFIER_UUID, "")) == modifier_uuid
-            ):
-                return obj
-    fallback = None
-    for obj in _data_objects_snapshot():
-        if (
-                is_cage_controller(obj) and
-                str(obj.get(TARGET_UUID, "")) == target_uuid and
-                str(obj.get(MODIFIER_UUID, "")) == modifier_uuid
-        ):
-            if getattr(obj, "parent", None) == target:
-                return obj
-            if fallback is None:
-                fallback = obj
-    if fallback is not None:
-        return fallback
+    modifier_uuid = str(cage_modifier_uuid(modifier) or "")
+    candidates = _OWNERSHIP.get("controllers", (target_uuid, modifier_uuid))
+    for obj in candidates:
+        if getattr(obj, "parent", None) == target:
+            return obj
+    if candidates:
+        return candidates[0]
 
     # Repair controllers saved by builds that predate the ownership markers,
     # or files where a custom-property copy was incomplete.  This keeps all
@@ -2105,10 +2174,7 @@ def _modifier_input_property(modifier, identifier):
     return getattr(inputs, identifier, None) if inputs else None
 
 
-def modifier_input(modifier, name, default=None):
-    identifier = modifier_input_identifier(modifier, name)
-    if not identifier:
-        return default
+def _read_modifier_input(modifier, identifier, default=None):
     socket = _modifier_input_property(modifier, identifier)
     if socket is not None and hasattr(socket, "value"):
         return socket.value
@@ -2118,17 +2184,84 @@ def modifier_input(modifier, name, default=None):
         return default
 
 
+def _write_modifier_input(modifier, identifier, value):
+    socket = _modifier_input_property(modifier, identifier)
+    if socket is not None and hasattr(socket, "value"):
+        socket.value = value
+    else:
+        modifier[identifier] = value
+
+
+def _modifier_input_differs(old, value):
+    """Return whether a socket holding ``old`` must be rewritten."""
+    if isinstance(value, bpy.types.ID) or isinstance(old, bpy.types.ID):
+        return not _same_rna_value(old, value)
+    if isinstance(value, str) or isinstance(old, str):
+        return str(old or "") != str(value or "")
+    if isinstance(value, bool) or isinstance(old, bool):
+        return old is None or bool(old) != bool(value)
+    try:
+        value_tuple = tuple(value)
+    except TypeError:
+        value_tuple = None
+    try:
+        old_tuple = None if old is None else tuple(old)
+    except TypeError:
+        old_tuple = None
+    try:
+        if value_tuple is not None or old_tuple is not None:
+            return (
+                value_tuple is None or old_tuple is None or
+                len(old_tuple) != len(value_tuple) or any(
+                    abs(float(first) - float(second)) > EPSILON
+                    for first, second in zip(old_tuple, value_tuple)))
+        return old is None or abs(float(old) - float(value)) > EPSILON
+    except (TypeError, ValueError):
+        return True
+
+
+_INPUT_BATCH = ModifierInputBatch(
+    read=_read_modifier_input,
+    write=_write_modifier_input,
+    tag=lambda target: target.update_tag(),
+    different=_modifier_input_differs,
+    key=_pointer,
+)
+_NO_PENDING_INPUT = object()
+
+
+def batched_modifier_inputs():
+    """Collect modifier input writes until the outermost batch closes.
+
+    Reads inside the batch see pending values; on close each changed socket
+    is written once and each affected target receives one ``update_tag``.
+    """
+    return _INPUT_BATCH.batch()
+
+
+def tag_modifier_target(target):
+    """Tag a target for re-evaluation, deferred while a batch is open."""
+    _INPUT_BATCH.tag(target)
+
+
+def modifier_input(modifier, name, default=None):
+    identifier = modifier_input_identifier(modifier, name)
+    if not identifier:
+        return default
+    if _INPUT_BATCH.active:
+        value = _INPUT_BATCH.pending(modifier, identifier, _NO_PENDING_INPUT)
+        if value is not _NO_PENDING_INPUT:
+            return value
+    return _read_modifier_input(modifier, identifier, default)
+
+
 def set_modifier_input(modifier, name, value):
     identifier = modifier_input_identifier(modifier, name)
     if not identifier:
         return False
     if isinstance(value, (Vector, Euler)):
         value = tuple(value)
-    socket = _modifier_input_property(modifier, identifier)
-    if socket is not None and hasattr(socket, "value"):
-        socket.value = value
-    else:
-        modifier[identifier] = value
+    _INPUT_BATCH.set(modifier, identifier, value)
     return True
 
 
@@ -2210,26 +2343,31 @@ from . import deform_math as _deform_math
 
 normalized_ffd_offsets = _deform_math.normalized_ffd_offsets
 deform_point_local = _deform_math.deform_point_local
-
-
-def deform_point_from_properties(
-        point, properties, *, evaluator=False, chain_eligible=True,
-        apply_chain_input_offset=True, chain_preview=False,
-        chain_frame_sampling=False,
+deform_points_local = _deform_math.deform_points_local
+DeformPlan = _deform_math.DeformPlan
+compile_deform_plan = _deform_math.compile_deform_plan
+evaluate_deform_plan = _deform_math.evaluate
+evaluate_deform_point = _deform_math.evaluate_point
+deform_point_local_with_jacobian = (
+    _deform_math.deform_point_local_with_jacobian)
+evaluate_deform_plan_with_jacobian = _deform_math.evaluate_with_jacobian
+
+
+def _deform_arguments_from_properties(
+        properties, *, evaluator=False, apply_chain_input_offset=True,
+        chain_preview=False, chain_frame_sampling=False,
         preview_output_frame=None, chain_profile_after_end=False,
-        chain_profile_gap_distance=None, chain_source_coordinate=None,
-        chain_source_start=None, operation_order_override=None,
-        ffd_offsets_override=None, curve_deformer_override=None,
-        ignore_chain_stage_profile=False, chain_frames_override=None,
-        chain_domain_values_override=None,
+        chain_profile_gap_distance=None, chain_source_start=None,
+        operation_order_override=None, ffd_offsets_override=None,
+        curve_deformer_override=None, ignore_chain_stage_profile=False,
+        chain_frames_override=None, chain_domain_values_override=None,
         evaluator_end_scales_override=None,
         chain_stage_index_override=None):
-    """Evaluate a point from controller state.
+    """Decode controller state into ``deform_point_local`` stage arguments.
 
-    Standalone cages and subdivided global-profile previews use authored end
-    profiles. Modifier evaluation and direct linked-chain previews use
-    relative downstream profiles so the incoming seam scale is not applied
-    twice.
+    Returns ``(kwargs, prefix)``.  ``prefix`` is ``None`` unless the stage
+    owns the chain-global prefix pass, which transforms each point before
+    the local evaluation; see :func:`_apply_properties_global_prefix`.
     """
     enabled = active_deform_types(properties)
     active_order = tuple(
@@ -2365,64 +2503,20 @@ def deform_point_from_properties(
     apply_chain_frames = bool(
         chain_frames_override is not None or
         is_non_root_chain or has_root_output)
-    point = Vector(point)
+    prefix = None
     if (
             evaluator and (not chain_preview or chain_frame_sampling) and
             is_chained and not is_non_root_chain and
             (global_prefix_active or global_profile_active) and
             bool(getattr(properties, "stage_enabled", True))
     ):
-        try:
-            source_value = (
-                float(chain_source_coordinate)
-                if chain_source_coordinate is not None else float(point.y))
-            stage_matrix = (
-                Matrix.Translation(Vector(controller.location)) @
-                _controller_rotation_xyz(controller).to_matrix().to_4x4()
-            )
-            target_point = stage_matrix @ point
-            target_point = apply_chain_global_prefix(
-                target_point,
-                source_value,
-                deform_mask=global_prefix_mask,
-                bend=domain_values.get("Chain Global Prefix Bend", 0.0),
-                direction=domain_values.get(
-                    "Chain Global Prefix Direction", 0.0),
-                twist=domain_values.get("Chain Global Prefix Twist", 0.0),
-                taper=domain_values.get("Chain Global Prefix Taper", 0.0),
-                stretch=domain_values.get("Chain Global Prefix Stretch", 0.0),
-                shear=domain_values.get(
-                    "Chain Global Prefix Shear", (0.0, 0.0, 0.0)),
-                pre_shear_mask=domain_values.get(
-                    "Chain Global Prefix Pre Shear Types", 0),
-                post_shear_mask=domain_values.get(
-                    "Chain Global Prefix Post Shear Types", 0),
-                center=domain_values.get(
-                    "Chain Global Prefix Center", (0.0, 0.0, 0.0)),
-                rotation=domain_values.get(
-                    "Chain Global Prefix Rotation", (0.0, 0.0, 0.0)),
-                source_offset=domain_values.get(
-                    "Chain Global Prefix Source Offset", 0.0),
-                length=domain_values.get("Chain Global Prefix Length", 2.0),
-                origin=domain_values.get(
-                    "Chain Global Prefix Origin", ORIGIN_VALUES["BOTTOM"]),
-                profile_active=global_profile_active,
-                bottom_scale=domain_values.get(
-                    "Chain Global Profile Bottom Scale", (1.0, 1.0, 1.0)),
-                top_scale=domain_values.get(
-                    "Chain Global Profile Top Scale", (1.0, 1.0, 1.0)),
-                bottom_offset=domain_values.get(
-                    "Chain Global Profile Bottom Offset", (0.0, 0.0, 0.0)),
-                top_offset=domain_values.get(
-                    "Chain Global Profile Top Offset", (0.0, 0.0, 0.0)),
-                preserve_volume=bool(properties.preserve_volume),
-            )
-            point = stage_matrix.inverted_safe() @ target_point
-        except (
-                AttributeError, ReferenceError, RuntimeError, TypeError,
-                ValueError, OverflowError,
-        ):
-            pass
+        prefix = {
+            "controller": controller,
+            "domain_values": domain_values,
+            "deform_mask": global_prefix_mask,
+            "profile_active": global_profile_active,
+            "preserve_volume": bool(properties.preserve_volume),
+        }
     # A subdivided source profile is stored on each stage for editing and
     # animation, but a chain-global profile is evaluated exactly once in the
     # root frame. Do not apply the visible per-stage values a second time to
@@ -2465,7 +2559,6 @@ def deform_point_from_properties(
         top_offset=effective_top_offset,
         bottom_offset=effective_bottom_offset,
         stage_enabled=bool(getattr(properties, "stage_enabled", True)),
-        chain_eligible=chain_eligible,
         chain_root_stage=is_chained and not is_non_root_chain,
         deform_types=enabled,
         bend_strength=local_bend_strength,
@@ -2480,8 +2573,8 @@ def deform_point_from_properties(
         curve_deformer=curve_deformer,
         deform_order=active_order,
         chain_profile_gap_distance=resolved_profile_gap_distance,
-        chain_source_coordinate=chain_source_coordinate,
         chain_source_start=chain_source_start,
+        chain_profile_after_end=chain_profile_after_end,
     )
     chain_input_frame = None
     chain_output_frame = None
@@ -2507,15 +2600,131 @@ def deform_point_from_properties(
                     controller, modifier, properties))
         else:
             chain_output_frame = preview_output_frame
+    kwargs["chain_input_frame"] = chain_input_frame
+    kwargs["chain_output_frame"] = chain_output_frame
+    return kwargs, prefix
+
+
+def _apply_properties_global_prefix(point, source_coordinate, prefix):
+    """Move one stage-local point through the chain-global prefix pass."""
+    domain_values = prefix["domain_values"]
+    controller = prefix["controller"]
+    try:
+        source_value = (
+            float(source_coordinate)
+            if source_coordinate is not None else float(point.y))
+        stage_matrix = (
+            Matrix.Translation(Vector(controller.location)) @
+            _controller_rotation_xyz(controller).to_matrix().to_4x4()
+        )
+        target_point = stage_matrix @ point
+        target_point = apply_chain_global_prefix(
+            target_point,
+            source_value,
+            deform_mask=prefix["deform_mask"],
+            bend=domain_values.get("Chain Global Prefix Bend", 0.0),
+            direction=domain_values.get(
+                "Chain Global Prefix Direction", 0.0),
+            twist=domain_values.get("Chain Global Prefix Twist", 0.0),
+            taper=domain_values.get("Chain Global Prefix Taper", 0.0),
+            stretch=domain_values.get("Chain Global Prefix Stretch", 0.0),
+            shear=domain_values.get(
+                "Chain Global Prefix Shear", (0.0, 0.0, 0.0)),
+            pre_shear_mask=domain_values.get(
+                "Chain Global Prefix Pre Shear Types", 0),
+            post_shear_mask=domain_values.get(
+                "Chain Global Prefix Post Shear Types", 0),
+            center=domain_values.get(
+                "Chain Global Prefix Center", (0.0, 0.0, 0.0)),
+            rotation=domain_values.get(
+                "Chain Global Prefix Rotation", (0.0, 0.0, 0.0)),
+            source_offset=domain_values.get(
+                "Chain Global Prefix Source Offset", 0.0),
+            length=domain_values.get("Chain Global Prefix Length", 2.0),
+            origin=domain_values.get(
+                "Chain Global Prefix Origin", ORIGIN_VALUES["BOTTOM"]),
+            profile_active=prefix["profile_active"],
+            bottom_scale=domain_values.get(
+                "Chain Global Profile Bottom Scale", (1.0, 1.0, 1.0)),
+            top_scale=domain_values.get(
+                "Chain Global Profile Top Scale", (1.0, 1.0, 1.0)),
+            bottom_offset=domain_values.get(
+                "Chain Global Profile Bottom Offset", (0.0, 0.0, 0.0)),
+            top_offset=domain_values.get(
+                "Chain Global Profile Top Offset", (0.0, 0.0, 0.0)),
+            preserve_volume=prefix["preserve_volume"],
+        )
+        return stage_matrix.inverted_safe() @ target_point
+    except (
+            AttributeError, ReferenceError, RuntimeError, TypeError,
+            ValueError, OverflowError,
+    ):
+        return point
+
+
+def deform_point_from_properties(
+        point, properties, *, evaluator=False, chain_eligible=True,
+        apply_chain_input_offset=True, chain_preview=False,
+        chain_frame_sampling=False,
+        preview_output_frame=None, chain_profile_after_end=False,
+        chain_profile_gap_distance=None, chain_source_coordinate=None,
+        chain_source_start=None, operation_order_override=None,
+        ffd_offsets_override=None, curve_deformer_override=None,
+        ignore_chain_stage_profile=False, chain_frames_override=None,
+        chain_domain_values_override=None,
+        evaluator_end_scales_override=None,
+        chain_stage_index_override=None):
+    """Evaluate a point from controller state.
+
+    Standalone cages and subdivided global-profile previews use authored end
+    profiles. Modifier evaluation and direct linked-chain previews use
+    relative downstream profiles so the incoming seam scale is not applied
+    twice.
+    """
+    kwargs, prefix = _deform_arguments_from_properties(
+        properties,
+        evaluator=evaluator,
+        apply_chain_input_offset=apply_chain_input_offset,
+        chain_preview=chain_preview,
+        chain_frame_sampling=chain_frame_sampling,
+        preview_output_frame=preview_output_frame,
+        chain_profile_after_end=chain_profile_after_end,
+        chain_profile_gap_distance=chain_profile_gap_distance,
+        chain_source_start=chain_source_start,
+        operation_order_override=operation_order_override,
+        ffd_offsets_override=ffd_offsets_override,
+        curve_deformer_override=curve_deformer_override,
+        ignore_chain_stage_profile=ignore_chain_stage_profile,
+        chain_frames_override=chain_frames_override,
+        chain_domain_values_override=chain_domain_values_override,
+        evaluator_end_scales_override=evaluator_end_scales_override,
+        chain_stage_index_override=chain_stage_index_override,
+    )
+    point = Vector(point)
+    if prefix is not None:
+        point = _apply_properties_global_prefix(
+            point, chain_source_coordinate, prefix)
     return deform_point_local(
         point,
-        chain_input_frame=chain_input_frame,
-        chain_output_frame=chain_output_frame,
-        chain_profile_after_end=chain_profile_after_end,
+        chain_eligible=chain_eligible,
+        chain_source_coordinate=chain_source_coordinate,
         **kwargs,
     )
 
 
+def deform_plan_from_properties(properties, **options):
+    """Compile controller state into one reusable :class:`DeformPlan`.
+
+    ``options`` are the stage options of :func:`deform_point_from_properties`.
+    Returns ``None`` when the stage owns a per-point chain-global prefix
+    pass; such callers keep the scalar property path.
+    """
+    kwargs, prefix = _deform_arguments_from_properties(properties, **options)
+    if prefix is not None:
+        return None
+    return compile_deform_plan(**kwargs)
+
+
 _CHAIN_PREFIX_PREVIEW_UNSET = object()
 _CHAIN_STRETCH_PREVIEW_UNSET = object()
 _CHAIN_DISPLAY_PREVIEW_UNSET = object()
@@ -3090,7 +3299,11 @@ def chain_display_preview_state(properties, *, through_current=False):
                 "curve_deformer": None,
                 "_prepared": True,
             })
-        prepared_stages = tuple(prepared_stages)
+        # Each prepared stage compiles into one immutable plan per chain
+        # state, shared by the single-point and batched display paths.
+        stage_plans = tuple(
+            None if prepared is None else compile_deform_plan(**prepared)
+            for prepared in prepared_stages)
         plan = {
             "controllers": controllers,
             "stages": stages,
@@ -3101,15 +3314,17 @@ def chain_display_preview_state(properties, *, through_current=False):
             "stage_orders": stage_orders,
             "frames": frames,
             "end_scales": end_scales,
-            "prepared_stages": prepared_stages,
+            "stage_plans": stage_plans,
+            "matrix_arrays": tuple(
+                np.array(matrix, dtype=np.float64) for matrix in matrices),
+            "inverse_arrays": tuple(
+                np.array(matrix, dtype=np.float64) for matrix in inverses),
             "root_half_y": max(
                 abs(float(controllers[0].sdh_cage_deform.size[1])) * 0.5,
                 EPSILON,
             ),
         }
-        if len(_CHAIN_DISPLAY_STATE_CACHE) >= _CHAIN_DISPLAY_STATE_CACHE_LIMIT:
-            _CHAIN_DISPLAY_STATE_CACHE.clear()
-        _CHAIN_DISPLAY_STATE_CACHE[plan_signature] = plan
+        _CHAIN_DISPLAY_STATE_CACHE.put(plan_signature, plan)
         return stage_view(plan)
     except (
             AttributeError, ImportError, IndexError, KeyError, ReferenceError,
@@ -3173,17 +3388,17 @@ def _chained_point_for_display(
                 target_point = stage_matrix @ local
                 continue
             active_stage = stage_controller == controller
-            prepared = state["prepared_stages"][index]
+            stage_plan = state["stage_plans"][index]
             active_override = bool(
                 active_stage and (
                     ffd_offsets_override is not None or
                     curve_deformer_override is not None))
-            if prepared is not None and not active_override:
-                deformed = deform_point_local(
+            if stage_plan is not None and not active_override:
+                deformed = evaluate_deform_point(
+                    stage_plan,
                     local,
                     chain_eligible=chain_eligible,
                     chain_source_coordinate=source_coordinate,
-                    **prepared,
                 )
             else:
                 deformed = deform_point_from_properties(
@@ -3213,12 +3428,17 @@ def _chained_point_for_display(
 
 
 def deform_point_for_display(
-        point, properties, *, preview_output_frame=None,
+        point, properties, *, plan=None, preview_output_frame=None,
         chain_prefix_state=_CHAIN_PREFIX_PREVIEW_UNSET,
         chain_stretch_state=_CHAIN_STRETCH_PREVIEW_UNSET,
         chain_display_state=_CHAIN_DISPLAY_PREVIEW_UNSET,
         ffd_offsets_override=None, curve_deformer_override=None):
-    """Evaluate one cage-local point in the final viewport display state."""
+    """Evaluate one cage-local point in the final viewport display state.
+
+    ``plan`` is an optional :func:`display_deform_plan` result for the same
+    arguments; per-point samplers pass it so a standalone stage is not
+    decoded again for every point.
+    """
     source_point = Vector(point)
     prefix_state = chain_prefix_state
     if prefix_state is _CHAIN_PREFIX_PREVIEW_UNSET:
@@ -3249,14 +3469,17 @@ def deform_point_for_display(
         )
         if chained_result is not None:
             return Vector(chained_result)
-        result = Vector(deform_point_from_properties(
-            source_point,
-            properties,
-            chain_preview=True,
-            preview_output_frame=preview_output_frame,
-            ffd_offsets_override=ffd_offsets_override,
-            curve_deformer_override=curve_deformer_override,
-        ))
+        if plan is not None:
+            result = evaluate_deform_point(plan, source_point)
+        else:
+            result = Vector(deform_point_from_properties(
+                source_point,
+                properties,
+                chain_preview=True,
+                preview_output_frame=preview_output_frame,
+                ffd_offsets_override=ffd_offsets_override,
+                curve_deformer_override=curve_deformer_override,
+            ))
     state = chain_stretch_state
     if state is _CHAIN_STRETCH_PREVIEW_UNSET:
         state = chain_global_stretch_preview_state(properties)
@@ -3306,6 +3529,226 @@ def deform_point_for_display(
         return result
 
 
+def _affine_points(matrix, points):
+    """Apply one 4x4 affine array to an ``(N, 3)`` point array."""
+    return points @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def _chained_points_for_display(
+        points, properties, *, ffd_offsets_override=None,
+        curve_deformer_override=None, chain_display_state=None):
+    """Batched counterpart of :func:`_chained_point_for_display`.
+
+    Stages with a compiled plan evaluate every eligible sample at once; the
+    remaining stages keep the scalar property path per sample.
+    """
+    controller = getattr(properties, "id_data", None)
+    if not is_cage_controller(controller):
+        return None
+    state = (
+        chain_display_preview_state(properties)
+        if chain_display_state is None else chain_display_state)
+    if not state or state.get("controller") != controller:
+        return None
+    try:
+        source = np.array(points, dtype=np.float64).reshape(-1, 3)
+        matrices = state["matrix_arrays"]
+        inverses = state["inverse_arrays"]
+        source_starts = state["source_starts"]
+        stage_index = int(state["current_index"])
+        source_coordinate = (
+            source_starts[stage_index] + source[:, 1] +
+            float(state["current_half_y"]))
+        source_local = source.copy()
+        source_local[:, 1] = (
+            source_coordinate - source_starts[0] -
+            float(state["root_half_y"]))
+        target_points = _affine_points(matrices[0], source_local)
+        for index, (
+                stage_controller, stage_matrix, inverse, source_start,
+                domain, frames, end_scales, stage_order, stage_plan,
+        ) in enumerate(zip(
+                state["controllers"], matrices, inverses, source_starts,
+                state["domains"], state["frames"], state["end_scales"],
+                state["stage_orders"], state["stage_plans"],
+        )):
+            local = _affine_points(inverse, target_points)
+            eligible = (
+                np.ones(len(local), dtype=bool) if index == 0 else
+                source_coordinate >= source_start - CHAIN_BOUNDARY_EPSILON)
+            deformed = local.copy()
+            active_stage = stage_controller == controller
+            active_override = bool(
+                active_stage and (
+                    ffd_offsets_override is not None or
+                    curve_deformer_override is not None))
+            if stage_plan is not None and not active_override:
+                if eligible.any():
+                    deformed[eligible] = evaluate_deform_plan(
+                        stage_plan,
+                        local[eligible],
+                        chain_source_coordinate=source_coordinate[eligible],
+                    )
+            else:
+                stage_properties = stage_controller.sdh_cage_deform
+                for row in np.flatnonzero(eligible):
+                    deformed[row] = tuple(deform_point_from_properties(
+                        Vector(local[row]),
+                        stage_properties,
+                        evaluator=True,
+                        chain_source_coordinate=float(
+                            source_coordinate[row]),
+                        chain_source_start=source_start,
+                        operation_order_override=stage_order,
+                        ffd_offsets_override=(
+                            ffd_offsets_override if active_stage else None),
+                        curve_deformer_override=(
+                            curve_deformer_override if active_stage
+                            else None),
+                        chain_frames_override=frames,
+                        chain_domain_values_override=domain,
+                        evaluator_end_scales_override=end_scales,
+                        chain_stage_index_override=index,
+                    ))
+            target_points = _affine_points(stage_matrix, deformed)
+        return _affine_points(inverses[stage_index], target_points)
+    except (
+            AttributeError, ImportError, IndexError, KeyError,
+            ReferenceError, RuntimeError, TypeError, ValueError,
+            OverflowError,
+    ):
+        return None
+
+
+def deform_points_for_display(
+        points, properties, *, plan=None, preview_output_frame=None,
+        chain_prefix_state=_CHAIN_PREFIX_PREVIEW_UNSET,
+        chain_stretch_state=_CHAIN_STRETCH_PREVIEW_UNSET,
+        chain_display_state=_CHAIN_DISPLAY_PREVIEW_UNSET,
+        ffd_offsets_override=None, curve_deformer_override=None):
+    """Evaluate an ``(N, 3)`` array of cage-local points for display.
+
+    Matches :func:`deform_point_for_display` point for point.  Standalone
+    stages evaluate one compiled :class:`DeformPlan` (``plan`` lets a caller
+    reuse one across redraws) and linked chains evaluate each stage plan
+    once; chain-global prefix and stretch previews keep the scalar path.
+    """
+    source = np.array(points, dtype=np.float64).reshape(-1, 3)
+    prefix_state = chain_prefix_state
+    if prefix_state is _CHAIN_PREFIX_PREVIEW_UNSET:
+        prefix_state = chain_global_prefix_preview_state(properties)
+    stretch_state = chain_stretch_state
+    if stretch_state is _CHAIN_STRETCH_PREVIEW_UNSET:
+        stretch_state = chain_global_stretch_preview_state(properties)
+    display_state = chain_display_state
+    if not prefix_state and not stretch_state:
+        if display_state is _CHAIN_DISPLAY_PREVIEW_UNSET:
+            display_state = chain_display_preview_state(properties)
+        chained = _chained_points_for_display(
+            source,
+            properties,
+            ffd_offsets_override=ffd_offsets_override,
+            curve_deformer_override=curve_deformer_override,
+            chain_display_state=display_state,
+        )
+        if chained is not None:
+            return chained
+        if plan is None:
+            plan = deform_plan_from_properties(
+                properties,
+                chain_preview=True,
+                preview_output_frame=preview_output_frame,
+                ffd_offsets_override=ffd_offsets_override,
+                curve_deformer_override=curve_deformer_override,
+            )
+        if plan is not None:
+            return evaluate_deform_plan(plan, source)
+    elif plan is None and not prefix_state:
+        # A stretch preview still evaluates the standalone stage first, so
+        # compile it once for the per-point fallback below.
+        if display_state is _CHAIN_DISPLAY_PREVIEW_UNSET:
+            display_state = chain_display_preview_state(properties)
+        plan = display_deform_plan(
+            properties,
+            preview_output_frame=preview_output_frame,
+            chain_prefix_state=prefix_state,
+            chain_display_state=display_state,
+            ffd_offsets_override=ffd_offsets_override,
+            curve_deformer_override=curve_deformer_override,
+        )
+    return np.array(tuple(
+        tuple(deform_point_for_display(
+            Vector(point),
+            properties,
+            plan=plan,
+            preview_output_frame=preview_output_frame,
+            chain_prefix_state=prefix_state,
+            chain_stretch_state=stretch_state,
+            chain_display_state=display_state,
+            ffd_offsets_override=ffd_offsets_override,
+            curve_deformer_override=curve_deformer_override,
+        ))
+        for point in source
+    ), dtype=np.float64).reshape(-1, 3)
+
+
+def deform_point_with_jacobian_for_display(
+        point, properties, *, plan=None, preview_output_frame=None,
+        chain_prefix_state=_CHAIN_PREFIX_PREVIEW_UNSET,
+        chain_stretch_state=_CHAIN_STRETCH_PREVIEW_UNSET,
+        chain_display_state=_CHAIN_DISPLAY_PREVIEW_UNSET):
+    """Return a display point and its closed-form local Jacobian.
+
+    Returns ``None`` for linked chains and chain-global prefix or stretch
+    previews; those compose several stages and callers keep sampling
+    :func:`deform_point_for_display` there.  ``plan`` is as for
+    :func:`deform_point_for_display`.
+    """
+    if chain_prefix_state is _CHAIN_PREFIX_PREVIEW_UNSET:
+        chain_prefix_state = chain_global_prefix_preview_state(properties)
+    if chain_stretch_state is _CHAIN_STRETCH_PREVIEW_UNSET:
+        chain_stretch_state = chain_global_stretch_preview_state(properties)
+    if chain_display_state is _CHAIN_DISPLAY_PREVIEW_UNSET:
+        chain_display_state = chain_display_preview_state(properties)
+    if chain_prefix_state or chain_stretch_state or chain_display_state:
+        return None
+    if plan is None:
+        plan = deform_plan_from_properties(
+            properties,
+            chain_preview=True,
+            preview_output_frame=preview_output_frame,
+        )
+    if plan is None:
+        return None
+    return evaluate_deform_plan_with_jacobian(plan, point)
+
+
+def display_deform_plan(
+        properties, *, preview_output_frame=None,
+        chain_prefix_state=_CHAIN_PREFIX_PREVIEW_UNSET,
+        chain_display_state=_CHAIN_DISPLAY_PREVIEW_UNSET,
+        ffd_offsets_override=None, curve_deformer_override=None):
+    """Compile the standalone display plan once for a per-point sampler.
+
+    Returns ``None`` when a chain-global prefix or a linked-chain preview
+    owns the display path; :func:`deform_point_for_display` then evaluates
+    from that state instead.
+    """
+    if chain_prefix_state is _CHAIN_PREFIX_PREVIEW_UNSET:
+        chain_prefix_state = chain_global_prefix_preview_state(properties)
+    if chain_display_state is _CHAIN_DISPLAY_PREVIEW_UNSET:
+        chain_display_state = chain_display_preview_state(properties)
+    if chain_prefix_state or chain_display_state:
+        return None
+    return deform_plan_from_properties(
+        properties,
+        chain_preview=True,
+        preview_output_frame=preview_output_frame,
+        ffd_offsets_override=ffd_offsets_override,
+        curve_deformer_override=curve_deformer_override,
+    )
+
+
 def _managed_chain_mode(controller, modifier=None):
     """Return the persisted chain mode for a controller, if it has one."""
     if controller is None or not is_cage_controller(controller):
@@ -3518,19 +3961,42 @@ def set_chain_root_output_affine(controller, modifier=None, matrix=None):
     return changed
 
 
+def _section_jacobian_bases(jacobian_function, authored):
+    """Return closed-form X/Z section bases, or ``None`` when unavailable."""
+    if jacobian_function is None:
+        return None
+    try:
+        evaluated = jacobian_function(authored)
+    except (
+            AttributeError, KeyError, ReferenceError, RuntimeError,
+            TypeError, ValueError, OverflowError,
+    ):
+        return None
+    if evaluated is None:
+        return None
+    jacobian = evaluated[1]
+    return Vector(jacobian.col[0]), Vector(jacobian.col[2])
+
+
 def _sample_chain_affine(
         function, bottom_y, half_y, *, sample_fraction=0.01,
-        linear_cross_section=False):
+        linear_cross_section=False, jacobian_function=None):
     """Sample a full affine section frame, retaining scale and shear.
 
     The one-sided axial sample stays inside the authored cage. A wider step
     keeps its tangent above Geometry Nodes' single-precision quantization;
     this matters because frame sockets are stored as float32 and errors can
-    compound through downstream chain stages.
+    compound through downstream chain stages.  ``jacobian_function`` may
+    supply the closed-form cross-section bases of an affine section.
     """
     authored = Vector((0.0, float(bottom_y), 0.0))
     center = Vector(function(authored))
-    if linear_cross_section:
+    bases = (
+        _section_jacobian_bases(jacobian_function, authored)
+        if linear_cross_section else None)
+    if bases is not None:
+        basis_x, basis_z = bases
+    elif linear_cross_section:
         # Standard chain deformations are affine across a fixed section, so a
         # one-sided sample is exact and avoids two redundant evaluations. FFD
         # keeps the central difference because its trilinear cross terms can
@@ -3569,7 +4035,8 @@ def _sample_chain_affine(
     return affine
 
 
-def _sample_chain_section_affine(function, bottom_y):
+def _sample_chain_section_affine(function, bottom_y, *,
+                                 jacobian_function=None):
     """Sample a boundary section without absorbing its axial derivative.
 
     A pure Shear is affine over the whole stage.  Using its full Jacobian as
@@ -3580,10 +4047,14 @@ def _sample_chain_section_affine(function, bottom_y):
     """
     authored = Vector((0.0, float(bottom_y), 0.0))
     center = Vector(function(authored))
-    basis_x = Vector(
-        function(authored + Vector((1.0, 0.0, 0.0)))) - center
-    basis_z = Vector(
-        function(authored + Vector((0.0, 0.0, 1.0)))) - center
+    bases = _section_jacobian_bases(jacobian_function, authored)
+    if bases is not None:
+        basis_x, basis_z = bases
+    else:
+        basis_x = Vector(
+            function(authored + Vector((1.0, 0.0, 0.0)))) - center
+        basis_z = Vector(
+            function(authored + Vector((0.0, 0.0, 1.0)))) - center
     basis_y = basis_z.cross(basis_x)
     if basis_y.length <= EPSILON:
         raise ValueError("singular chain section frame")
@@ -3619,6 +4090,27 @@ def _raw_chain_deform(
         ignore_chain_stage_profile=True))
 
 
+def _raw_chain_deform_with_jacobian(
+        point, properties, *, chain_source_coordinate=None,
+        chain_source_start=None, operation_order_override=None):
+    """Closed-form counterpart of :func:`_raw_chain_deform` for section frames.
+
+    Returns ``None`` when the stage owns a per-point chain-global prefix.
+    """
+    kwargs, prefix = _deform_arguments_from_properties(
+        properties, evaluator=True, apply_chain_input_offset=False,
+        chain_frame_sampling=True,
+        chain_profile_gap_distance=0.0,
+        chain_source_start=chain_source_start,
+        operation_order_override=operation_order_override,
+        ignore_chain_stage_profile=True)
+    if prefix is not None:
+        return None
+    return evaluate_deform_plan_with_jacobian(
+        compile_deform_plan(**kwargs), point,
+        chain_source_coordinate=chain_source_coordinate)
+
+
 def _chain_input_tuple(affine, half_y):
     inverse = affine.to_3x3().inverted()
     pivot = affine @ Vector((0.0, -float(half_y), 0.0))
@@ -3843,8 +4335,6 @@ def chain_conjugation_frames_for_controller(
                 tuple(Vector(value) for value in frame)
                 for frame in cached)
 
-        if len(_CHAIN_AFFINE_FRAME_CACHE) >= 128:
-            _CHAIN_AFFINE_FRAME_CACHE.clear()
         incoming_affines = [Matrix.Identity(4)] * (stage_index + 1)
         output_affines = [Matrix.Identity(4)] * (stage_index + 1)
         output_affines[0] = chain_root_output_affine(
@@ -3935,8 +4425,24 @@ def chain_conjugation_frames_for_controller(
                     operation_order_override=order,
                 )
 
+            def current_jacobian(value, *, order=None):
+                # Curve deformers are not affine across a section, so they
+                # keep the unit-step samples of the sampled frame.
+                if "CURVE" in (current_order if order is None else order):
+                    return None
+                return _raw_chain_deform_with_jacobian(
+                    value,
+                    current_properties,
+                    chain_source_coordinate=float(source_starts[index]) +
+                    float(Vector(value).y) + float(half_y),
+                    chain_source_start=source_starts[index],
+                    operation_order_override=order,
+                )
+
             current_affine = (
-                _sample_chain_section_affine(current_deform, bottom_y)
+                _sample_chain_section_affine(
+                    current_deform, bottom_y,
+                    jacobian_function=current_jacobian)
                 if current_order == ("SHEAR",) else
                 _sample_chain_affine(
                     current_deform,
@@ -3945,6 +4451,7 @@ def chain_conjugation_frames_for_controller(
                     sample_fraction=frame_sample_fraction(
                         controllers[index]),
                     linear_cross_section="FFD" not in current_order,
+                    jacobian_function=current_jacobian,
                 )
             )
             pre_affine = (
@@ -3957,6 +4464,8 @@ def chain_conjugation_frames_for_controller(
                     sample_fraction=frame_sample_fraction(
                         controllers[index]),
                     linear_cross_section="FFD" not in pre_order,
+                    jacobian_function=lambda value: current_jacobian(
+                        value, order=pre_order),
                 )
             )
             if "BEND" in current_order:
@@ -4044,49 +4553,21 @@ def sync_chain_runtime_inputs(target, modifier, controller, frames):
         (*input_frame, *output_frame),
     )))
 
-    def different(old, value):
-        if isinstance(value, str) or isinstance(old, str):
-            return str(old or "") != str(value)
-        if isinstance(value, bool) or isinstance(old, bool):
-            return old is None or bool(old) != bool(value)
-
-        def numeric_sequence(item):
-            if item is None or isinstance(item, (str, bytes)):
-                return None
-            try:
-                return tuple(item)
-            except (TypeError, ValueError):
-                return None
-
-        value_tuple = numeric_sequence(value)
-        old_tuple = numeric_sequence(old)
-        if value_tuple is not None:
-            if old_tuple is None:
-                return True
-            return len(old_tuple) != len(value_tuple) or any(
-                abs(float(first) - float(second)) > EPSILON
-                for first, second in zip(old_tuple, value_tuple))
-        if old_tuple is not None:
-            return True
-        return old is None or abs(float(old) - float(value)) > EPSILON
-
     changed = False
-    for name, value in values.items():
-        if modifier_input_identifier(modifier, name) is None:
-            continue
-        old = modifier_input(modifier, name)
-        if different(old, value):
-            set_modifier_input(modifier, name, value)
-            changed = True
+    with batched_modifier_inputs():
+        for name, value in values.items():
+            if modifier_input_identifier(modifier, name) is None:
+                continue
+            old = modifier_input(modifier, name)
+            if _modifier_input_differs(old, value):
+                set_modifier_input(modifier, name, value)
+                changed = True
+        if changed:
+            tag_modifier_target(target)
     pointer = _pointer(controller)
     if pointer:
         _CONTROLLER_TRANSFORM_SNAPSHOTS[pointer] = (
             _controller_transform_signature(controller))
-    if changed:
-        try:
-            target.update_tag()
-        except (AttributeError, ReferenceError, RuntimeError, TypeError):
-            pass
     return changed
 
 
@@ -4681,24 +5162,19 @@ def sync_end_scale_inputs(controller, modifier=None):
             "Top Scale": (top_scale[0], 1.0, top_scale[1]),
             "Bottom Scale": (bottom_scale[0], 1.0, bottom_scale[1]),
         }
+        if any(
+                modifier_input_identifier(modifier, name) is None
+                for name in values):
+            return None
         changed = _store_authored_end_scales(modifier, properties)
-        for name, value in values.items():
-            if modifier_input_identifier(modifier, name) is None:
-                return None
-            old = modifier_input(modifier, name)
-            try:
-                old_values = tuple(old) if old is not None else ()
-            except (ReferenceError, RuntimeError, TypeError, ValueError):
-                old_values = ()
-            if len(old_values) == len(value) and all(
-                    abs(float(first) - float(second)) <= EPSILON
-                    for first, second in zip(old_values, value)
-            ):
-                continue
-            set_modifier_input(modifier, name, value)
-            changed = True
-        if changed:
-            target.update_tag()
+        with batched_modifier_inputs():
+            for name, value in values.items():
+                if _modifier_input_differs(
+                        modifier_input(modifier, name), value):
+                    set_modifier_input(modifier, name, value)
+                    changed = True
+            if changed:
+                tag_modifier_target(target)
         return changed
     except (
             AttributeError, ReferenceError, RuntimeError, TypeError,
@@ -5259,6 +5735,48 @@ def _drain_chain_reconnect_queue():
     return updated
 
 
+def _drain_chain_validation_queue():
+    """Queue reconnects for chains whose stages were reordered natively."""
+    if not _CHAIN_VALIDATION_QUEUE:
+        return 0
+    pending = tuple(_CHAIN_VALIDATION_QUEUE.items())
+    _CHAIN_VALIDATION_QUEUE.clear()
+    try:
+        from . import chain as chain_module
+    except ImportError:
+        return 0
+    requested = 0
+    for pointer, target in pending:
+        try:
+            stack = tuple(_pointer(modifier) for modifier in target.modifiers)
+            if _CHAIN_STACK_SIGNATURES.get(pointer) == stack:
+                continue
+            _CHAIN_STACK_SIGNATURES[pointer] = stack
+            chain_uuids = tuple(chain_module.chain_ids(target))
+        except (AttributeError, ReferenceError, RuntimeError, TypeError,
+                ValueError):
+            continue
+        for chain_uuid in chain_uuids:
+            try:
+                report = chain_module.validate_chain(target, chain_uuid)
+            except (AttributeError, ReferenceError, RuntimeError, TypeError,
+                    ValueError):
+                continue
+            if not report.get("index_mismatch"):
+                continue
+            # Only the order-only mismatch can be repaired safely.  A
+            # missing/duplicate stage, an inserted ordinary modifier, or a
+            # missing controller needs explicit user-facing recovery.
+            if any(report.get(name) for name in (
+                    "missing_indices", "duplicate_indices",
+                    "ordinary_between", "missing_controllers",
+                    "mode_mismatch")):
+                continue
+            if request_chain_reconnect(target, chain_uuid):
+                requested += 1
+    return requested
+
+
 def _chain_reconnect_timer():
     """Sync direct transforms, then drain chains in one safe timer callback."""
     pending_controllers = tuple(_CONTROLLER_TRANSFORM_QUEUE.values())
@@ -5277,6 +5795,7 @@ def _chain_reconnect_timer():
                 ValueError):
             continue
     _drain_ffd_scope_refresh_queue()
+    _drain_chain_validation_queue()
     _drain_chain_reconnect_queue()
     _drain_stack_auto_fit_queue()
     _drain_lattice_origin_sync_queue()
@@ -5284,7 +5803,7 @@ def _chain_reconnect_timer():
     return 0.0 if (
         _CONTROLLER_TRANSFORM_QUEUE or _CHAIN_RECONNECT_QUEUE or
         _STACK_AUTO_FIT_QUEUE or _LATTICE_ORIGIN_QUEUE or
-        _FFD_SCOPE_REFRESH_QUEUE) else None
+        _FFD_SCOPE_REFRESH_QUEUE or _CHAIN_VALIDATION_QUEUE) else None
 
 
 def clear_chain_reconnect_state():
@@ -5315,6 +5834,8 @@ def clear_chain_reconnect_state():
     _STACK_AUTO_FIT_DEPSGRAPH_GUARD.clear()
     _LATTICE_ORIGIN_QUEUE.clear()
     _LATTICE_ORIGIN_SIGNATURES.clear()
+    _CHAIN_VALIDATION_QUEUE.clear()
+    _CHAIN_STACK_SIGNATURES.clear()
     _TARGET_OWNERSHIP_REPAIR_QUEUE.clear()
     _TARGET_OWNERSHIP_REPAIRING.clear()
     _CHAIN_AUTO_GUARD.clear()
@@ -5423,6 +5944,7 @@ def _sync_closed_curve_end_value(
 
 def _end_scale_update(properties, context, side):
     """Push one end scale, pairing it with a shared chain seam when enabled."""
+    bump_revision(properties)
     controller = getattr(properties, "id_data", None)
     if not is_cage_controller(controller):
         return
@@ -5455,6 +5977,7 @@ def _bottom_scale_update(properties, context):
 
 
 def _end_offset_update(properties, context, side):
+    bump_revision(properties)
     controller = getattr(properties, "id_data", None)
     if not is_cage_controller(controller):
         return
@@ -5502,6 +6025,8 @@ def _bottom_offset_update(properties, context):
 
 
 def _controller_update(properties, _context):
+    # Bump before any recursion guard: guarded writes still change geometry.
+    bump_revision(properties)
     controller = getattr(properties, "id_data", None)
     if is_cage_controller(controller):
         pointer = _pointer(controller)
@@ -5630,6 +6155,7 @@ def _controller_display_update(properties, context):
 
 
 def _property_update_guarded(properties):
+    bump_revision(properties)
     controller = getattr(properties, "id_data", None)
     pointer = _pointer(controller) if is_cage_controller(controller) else 0
     return pointer, bool(pointer and (
@@ -6604,6 +7130,112 @@ def _ffd_visible_topology(resolution, outside_only):
     )
 
 
+FFDWireTopology = namedtuple(
+    "FFDWireTopology", ("grid", "surface", "edges", "faces"))
+
+
+@lru_cache(maxsize=64)
+def ffd_wire_topology(resolution, outside_only):
+    """Return cached, read-only topology arrays for one FFD lattice shape.
+
+    ``grid`` holds each point's ``[0, 1]`` lattice fraction, ``surface`` the
+    outside-shell mask, and ``edges`` the ``(E, 2)`` int32 wire in the
+    historic U/V/W neighbor order.  ``faces`` maps ``UV``, ``VW``, and ``UW``
+    to ``(N, 4)`` int32 perimeter indices for a face anchored at each point,
+    using the same unclamped index arithmetic as ``ffd_point_index``.
+    """
+    resolution = tuple(int(value) for value in resolution)
+    points_u, points_v, points_w = resolution
+    w, v, u = np.meshgrid(
+        np.arange(points_w), np.arange(points_v), np.arange(points_u),
+        indexing="ij")
+    u, v, w = (value.reshape(-1) for value in (u, v, w))
+    coordinates = np.stack((u, v, w), axis=1)
+    grid = (
+        coordinates / np.maximum(np.array(resolution) - 1, 1)
+    ).astype(np.float32)
+    surface = np.any(
+        (coordinates == 0) | (coordinates == np.array(resolution) - 1),
+        axis=1)
+    indices = np.arange(len(coordinates), dtype=np.int32)
+
+    def index(du, dv, dw):
+        return (
+            (w + dw) * points_u * points_v + (v + dv) * points_u + (u + du)
+        ).astype(np.int32)
+
+    candidates = np.stack((
+        np.stack((indices, index(1, 0, 0)), axis=1),
+        np.stack((indices, index(0, 1, 0)), axis=1),
+        np.stack((indices, index(0, 0, 1)), axis=1),
+    ), axis=1)
+    keep = np.stack((
+        u + 1 < points_u, v + 1 < points_v, w + 1 < points_w), axis=1)
+    if outside_only:
+        keep &= surface[:, None]
+        neighbors = np.clip(candidates[:, :, 1], 0, len(indices) - 1)
+        keep &= surface[neighbors]
+    edges = np.ascontiguousarray(candidates[keep], dtype=np.int32)
+    faces = {
+        "UV": np.stack((
+            index(0, 0, 0), index(1, 0, 0),
+            index(1, 1, 0), index(0, 1, 0)), axis=1),
+        "VW": np.stack((
+            index(0, 0, 0), index(0, 1, 0),
+            index(0, 1, 1), index(0, 0, 1)), axis=1),
+        "UW": np.stack((
+            index(0, 0, 0), index(1, 0, 0),
+            index(1, 0, 1), index(0, 0, 1)), axis=1),
+    }
+    for value in (grid, surface, edges, *faces.values()):
+        value.flags.writeable = False
+    return FFDWireTopology(grid, surface, edges, faces)
+
+
+def ffd_authored_local_points(properties):
+    """Return every FFD point plus its offset in the authored cage frame.
+
+    The ``(N, 3)`` array matches ``ffd_point_offset`` per point, including
+    the legacy fallback for a collection that has not been resized yet.
+    """
+    resolution = tuple(ffd_resolution(properties))
+    grid = ffd_wire_topology(resolution, False).grid
+    points = (grid - 0.5) * np.array(tuple(properties.size), dtype=np.float64)
+    offsets = ffd_point_arrays(properties).offsets
+    available = min(len(offsets), len(points))
+    points[:available] += offsets[:available]
+    for index in range(available, len(points)):
+        points[index] += tuple(ffd_point_offset(properties, index))
+    return points
+
+
+def ffd_view_projection(
+        target, controller, region, region_data, points=None, source=None):
+    """Return the cached projection of one controller's FFD points.
+
+    ``points`` builds cage-local points and defaults to the authored
+    lattice; it only runs when the revision, ``source``, or the view
+    changed.  Custom points must pass a hashable ``source`` that changes
+    whenever they do.
+    """
+    properties = controller.sdh_cage_deform
+    if points is None:
+        def points():
+            return ffd_authored_local_points(properties)
+        source = "AUTHORED"
+    elif source is None:
+        raise ValueError("custom FFD projection points need a source key")
+    return projected_entity_cache.projection(
+        properties,
+        ffd_resolution(properties),
+        points,
+        region,
+        region_data,
+        matrix=cage_local_matrix(target, controller),
+        source=source,
+    )
+
+
 def ffd_visible_indices(properties):
     """Return editable FFD indices, respecting the native hollow mode."""
     return _ffd_visible_topology(
@@ -6814,12 +7446,20 @@ def _ffd_point_update(point, context):
     properties = getattr(owner, "sdh_cage_deform", None)
     if properties is None:
         return
+    bump_ffd_point_generation(properties)
+    bump_revision(properties)
     pointer = _pointer(owner)
     if pointer and pointer in _FFD_POINT_GUARD:
         return
     _controller_update(properties, context)
 
 
+def _ffd_point_selection_update(point, _context):
+    owner = getattr(point, "id_data", None)
+    bump_ffd_point_generation(owner)
+    bump_revision(owner)
+
+
 class SDHFFDPoint(PropertyGroup):
     """One compact, animatable local offset in a dedicated FFD cage."""
 
@@ -6836,6 +7476,7 @@ class SDHFFDPoint(PropertyGroup):
         name="Selected",
         description="Include this control point in the next viewport edit",
         default=False,
+        update=_ffd_point_selection_update,
     )
     influence: FloatProperty(
         name="Influence",
@@ -6879,8 +7520,9 @@ class SDHFFDPoint(PropertyGroup):
             return
         visible = set(ffd_visible_indices(properties))
         selected = {
-            index for index, point in enumerate(properties.ffd_points)
-            if bool(getattr(point, "selected", False)) and index in visible
+            index for index in np.flatnonzero(
+                _read_ffd_selected(properties)).tolist()
+            if index in visible
         }
         self_pointer = _pointer(self)
         active = next(
@@ -6896,10 +7538,10 @@ class SDHFFDPoint(PropertyGroup):
         if pointer:
             _FFD_POINT_GUARD.add(pointer)
         try:
-            for index in selected:
-                point = properties.ffd_points[index]
-                point.influence = min(
-                    max(float(point.influence) + delta, 0.0), 1.0)
+            influences = _read_ffd_influences(properties)
+            indices = np.fromiter(selected, dtype=np.int64)
+            influences[indices] += np.float32(delta)
+            _write_ffd_influences(properties, influences)
         finally:
             if pointer:
                 _FFD_POINT_GUARD.discard(pointer)
@@ -6926,14 +7568,7 @@ def _ensure_ffd_point_collection_impl(
     resolution = ffd_resolution(properties)
     count = resolution[0] * resolution[1] * resolution[2]
     collection = properties.ffd_points
-    old = tuple(
-        (
-            tuple(point.offset),
-            bool(point.selected),
-            min(max(float(getattr(point, "influence", 1.0)), 0.0), 1.0),
-        )
-        for point in collection
-    )
+    old_count = len(collection)
     old_active = int(getattr(properties, "ffd_active_point", 0))
     if previous_resolution is None:
         owner = getattr(properties, "id_data", None)
@@ -6944,10 +7579,12 @@ def _ensure_ffd_point_collection_impl(
             stored = ()
         previous_resolution = stored if len(stored) == 3 else resolution
     previous_resolution = tuple(int(value) for value in previous_resolution)
-    old_count = math.prod(previous_resolution) if len(previous_resolution) == 3 else 0
-    if old_count != len(old):
+    if (
+            len(previous_resolution) != 3 or
+            math.prod(previous_resolution) != old_count
+    ):
         previous_resolution = resolution
-    if len(old) == count and previous_resolution == resolution:
+    if old_count == count and previous_resolution == resolution:
         if count:
             properties.ffd_active_point = min(max(
                 int(getattr(properties, "ffd_active_point", 0)), 0), count - 1)
@@ -6958,11 +7595,11 @@ def _ensure_ffd_point_collection_impl(
             except (AttributeError, ReferenceError, RuntimeError, TypeError):
                 pass
         return count
-    if preserve and old:
+    if preserve and old_count:
         raw_offsets = tuple(
-            value for value, _selected, _influence in old)
-        raw_influences = tuple(
-            influence for _value, _selected, influence in old)
+            tuple(value) for value in _read_ffd_offsets(properties).tolist())
+        raw_influences = tuple(_read_ffd_influences(properties).tolist())
+        old_selected = _read_ffd_selected(properties)
         effective_offsets = tuple(
             tuple(component * influence for component in value)
             for value, influence in zip(raw_offsets, raw_influences)
@@ -6976,8 +7613,7 @@ def _ensure_ffd_point_collection_impl(
                 for axis in ("u", "v", "w")),
         )
         selected = remap_indices(
-            (index for index, (_value, is_selected, _influence) in enumerate(old)
-             if is_selected),
+            np.flatnonzero(old_selected).tolist(),
             previous_resolution,
             resolution,
         )
@@ -7017,10 +7653,13 @@ def _ensure_ffd_point_collection_impl(
     while len(collection) < count:
         collection.add()
     for index, point in enumerate(collection):
-        point.name = f"P{index:03d}"
-        point.offset = offsets[index]
-        point.influence = min(max(float(influences[index]), 0.0), 1.0)
-        point.selected = index in selected
+        name = f"P{index:03d}"
+        if point.name != name:
+            point.name = name
+    _write_ffd_offsets(properties, offsets)
+    _write_ffd_influences(properties, influences)
+    _write_ffd_selected(
+        properties, tuple(index in selected for index in range(count)))
     if count:
         properties.ffd_active_point = min(max(active, 0), count - 1)
     owner = getattr(properties, "id_data", None)
@@ -7130,10 +7769,7 @@ def _ffd_symmetry_update(properties, context):
             pass
     points = getattr(properties, "ffd_points", None)
     if points is not None and len(points):
-        selected = {
-            index for index, point in enumerate(points) if point.selected
-        }
-        ffd_set_selection(properties, selected)
+        ffd_set_selection(properties, ffd_selected_point_indices(properties))
     _controller_update(properties, context)
 
 
@@ -7153,10 +7789,7 @@ def _ffd_symmetry_axes_update(properties, context):
         pass
     points = getattr(properties, "ffd_points", None)
     if points is not None and len(points):
-        selected = {
-            index for index, point in enumerate(points) if point.selected
-        }
-        ffd_set_selection(properties, selected)
+        ffd_set_selection(properties, ffd_selected_point_indices(properties))
     _controller_update(properties, context)
 
 
@@ -7208,9 +7841,12 @@ def _ffd_use_outside_update(properties, context):
     _finish_native_ffd_edit(properties, context)
     ensure_ffd_point_collection(properties)
     visible = set(ffd_visible_indices(properties))
-    for index, point in enumerate(properties.ffd_points):
-        if index not in visible:
-            point.selected = False
+    selected = _read_ffd_selected(properties).tolist()
+    if any(value and index not in visible
+           for index, value in enumerate(selected)):
+        _write_ffd_selected(properties, tuple(
+            value and index in visible
+            for index, value in enumerate(selected)))
     if visible and int(properties.ffd_active_point) not in visible:
         properties.ffd_active_point = min(visible)
     controller = getattr(properties, "id_data", None)
@@ -7388,6 +8024,20 @@ def ffd_point_effective_offset(properties, index):
         properties, index)
 
 
+def ffd_point_effective_offsets(properties):
+    """Read every effective point offset with one bulk copy per attribute."""
+    offsets = _read_ffd_offsets(properties)
+    influences = _read_ffd_influences(properties)
+    return tuple(
+        Vector(value)
+        for value in (offsets * influences[:, None]).tolist())
+
+
+def ffd_selected_point_indices(properties):
+    """Return every selected FFD point index, visible or not."""
+    return tuple(np.flatnonzero(_read_ffd_selected(properties)).tolist())
+
+
 def ffd_runtime_interpolations(properties):
     """Return the native basis, using linear interpolation for safe FFDs."""
     if str(getattr(properties, "ffd_guard_mode", "OFF")).upper() == "SAFE":
@@ -7405,8 +8055,8 @@ def ffd_runtime_interpolations(properties):
 
 
 def _ffd_guard_offsets_snapshot(properties):
-    points = getattr(properties, "ffd_points", ())
-    return tuple(tuple(float(value) for value in point.offset) for point in points)
+    return tuple(
+        tuple(value) for value in _read_ffd_offsets(properties).tolist())
 
 
 def ffd_guard_offsets(properties, candidate_offsets, *, baseline_offsets=None):
@@ -7421,8 +8071,10 @@ def ffd_guard_offsets(properties, candidate_offsets, *, baseline_offsets=None):
         return candidate, 1.0, -math.inf, -math.inf
     cached = None
     cached_baseline_ratio = None
-    influences = tuple(
-        ffd_point_influence(properties, index) for index in range(count))
+    influences = tuple(_read_ffd_influences(properties).tolist())
+    if len(influences) != count:
+        influences = tuple(
+            ffd_point_influence(properties, index) for index in range(count))
     size = tuple(float(value) for value in properties.size)
     if baseline_offsets is None:
         baseline_offsets = None
@@ -7473,15 +8125,12 @@ def _apply_ffd_guard(properties, controller=None):
         if pointer:
             _FFD_POINT_GUARD.add(pointer)
         try:
-            for point, value in zip(properties.ffd_points, safe):
-                point.offset = value
+            _write_ffd_offsets(properties, safe)
         finally:
             if pointer:
                 _FFD_POINT_GUARD.discard(pointer)
     if baseline_ratio >= MIN_JACOBIAN_RATIO:
-        influences = tuple(
-            ffd_point_influence(properties, index)
-            for index in range(len(safe)))
+        influences = tuple(_read_ffd_influences(properties).tolist())
         cached_ratio = (
             min(float(baseline_ratio), float(candidate_ratio))
             if float(fraction) >= 1.0 else
@@ -7504,8 +8153,9 @@ def ffd_selected_indices(properties):
         return (min(max(int(getattr(properties, "ffd_active_point", 0)), 0), 7),)
     visible = set(ffd_visible_indices(properties))
     selected = tuple(
-        index for index, point in enumerate(points)
-        if point.selected and index in visible)
+        index for index in np.flatnonzero(
+            _read_ffd_selected(properties)).tolist()
+        if index in visible)
     active = min(max(
         int(getattr(properties, "ffd_active_point", 0)), 0),
         len(points) - 1)
@@ -7698,53 +8348,16 @@ def ffd_expand_selection(properties, indices, mode=None):
                 axis=None if orientation == "POINT" else orientation,
             )
             # A point controller represents exactly its anchor. The previous
-            # unconditional POINT branch expanded every point whenever point
-            # mode was enabled alongside LINE/FACE, so even a tiny box around
-            # one point selected the complete lattice. Lines and faces still
-            # expand when the box intersects any of their constituent points.
-            if (
-                    (active_mode == "POINT" and anchor in selected) or
-                    (active_mode != "POINT" and selected.intersection(group))
-            ):
-                expanded.update(group)
-    return tuple(sorted(expanded))
-
-
-def _screen_point_in_box(point, bounds):
-    left, right, bottom, top = bounds
-    return left <= point.x <= right and bottom <= point.y <= top
-
-
-def _screen_segment_intersects_box(first, second, bounds):
-    """Return whether one projected segment intersects an axis-aligned box."""
-    first = Vector((float(first[0]), float(first[1])))
-    second = Vector((float(second[0]), float(second[1])))
-    if (
-            _screen_point_in_box(first, bounds) or
-            _screen_point_in_box(second, bounds)
-    ):
-        return True
-    left, right, bottom, top = bounds
-    delta = second - first
-    minimum = 0.0
-    maximum = 1.0
-    for direction, distance in (
-            (-delta.x, first.x - left),
-            (delta.x, right - first.x),
-            (-delta.y, first.y - bottom),
-            (delta.y, top - first.y)):
-        if abs(direction) <= EPSILON:
-            if distance < 0.0:
-                return False
-            continue
-        factor = distance / direction
-        if direction < 0.0:
-            minimum = max(minimum, factor)
-        else:
-            maximum = min(maximum, factor)
-        if minimum > maximum:
-            return False
-    return True
+            # unconditional POINT branch expanded every point whenever point
+            # mode was enabled alongside LINE/FACE, so even a tiny box around
+            # one point selected the complete lattice. Lines and faces still
+            # expand when the box intersects any of their constituent points.
+            if (
+                    (active_mode == "POINT" and anchor in selected) or
+                    (active_mode != "POINT" and selected.intersection(group))
+            ):
+                expanded.update(group)
+    return tuple(sorted(expanded))
 
 
 def _trim_screen_polyline(points, ratio):
@@ -7783,37 +8396,8 @@ def _trim_screen_polyline(points, ratio):
     return tuple(trimmed)
 
 
-def _screen_polyline_intersects_box(points, bounds):
-    if not points:
-        return False
-    if len(points) == 1:
-        return _screen_point_in_box(points[0], bounds)
-    return any(
-        _screen_segment_intersects_box(first, second, bounds)
-        for first, second in zip(points, points[1:]))
-
-
 def _screen_convex_hull(points):
-    unique = sorted({(float(point[0]), float(point[1])) for point in points})
-    if len(unique) <= 1:
-        return tuple(Vector(point) for point in unique)
-
-    def cross(origin, first, second):
-        return (
-            (first[0] - origin[0]) * (second[1] - origin[1]) -
-            (first[1] - origin[1]) * (second[0] - origin[0]))
-
-    lower = []
-    for point in unique:
-        while len(lower) >= 2 and cross(lower[-2], lower[-1], point) <= 0.0:
-            lower.pop()
-        lower.append(point)
-    upper = []
-    for point in reversed(unique):
-        while len(upper) >= 2 and cross(upper[-2], upper[-1], point) <= 0.0:
-            upper.pop()
-        upper.append(point)
-    return tuple(Vector(point) for point in lower[:-1] + upper[:-1])
+    return tuple(Vector(point) for point in convex_hull(points))
 
 
 def _screen_point_in_polygon(point, polygon):
@@ -7832,30 +8416,6 @@ def _screen_point_in_polygon(point, polygon):
     return inside
 
 
-def _screen_polygon_intersects_box(points, bounds):
-    polygon = _screen_convex_hull(points)
-    if not polygon:
-        return False
-    if len(polygon) == 1:
-        return _screen_point_in_box(polygon[0], bounds)
-    if len(polygon) == 2:
-        return _screen_segment_intersects_box(polygon[0], polygon[1], bounds)
-    if any(_screen_point_in_box(point, bounds) for point in polygon):
-        return True
-    if any(
-            _screen_segment_intersects_box(first, second, bounds)
-            for first, second in zip(polygon, (*polygon[1:], polygon[0]))
-    ):
-        return True
-    left, right, bottom, top = bounds
-    return any(
-        _screen_point_in_polygon(Vector(corner), polygon)
-        for corner in (
-            (left, bottom), (right, bottom),
-            (right, top), (left, top))
-    )
-
-
 def _ffd_screen_value(value):
     """Return one projected point and optional view depth from a callback value."""
     if value is None:
@@ -7875,50 +8435,58 @@ def _ffd_screen_value(value):
 
 def _ffd_face_winding_indices(properties, anchor, orientation, group):
     """Return one grid face in perimeter order for screen-space hit tests."""
-    resolution = ffd_resolution(properties)
+    return _ffd_face_winding_topology(
+        tuple(ffd_resolution(properties)), anchor, orientation, group)
+
+
+def _ffd_face_winding_topology(resolution, anchor, orientation, group):
     group = set(group)
     if not group:
         return ()
-    u, v, w = ffd_point_coordinates(anchor, resolution)
+    anchor = min(max(int(anchor), 0), math.prod(resolution) - 1)
     plane = str(orientation or "UW").upper()
-    if plane == "UV":
-        coordinates = (
-            (u, v, w), (u + 1, v, w),
-            (u + 1, v + 1, w), (u, v + 1, w),
-        )
-    elif plane == "VW":
-        coordinates = (
-            (u, v, w), (u, v + 1, w),
-            (u, v + 1, w + 1), (u, v, w + 1),
-        )
-    else:
-        coordinates = (
-            (u, v, w), (u + 1, v, w),
-            (u + 1, v, w + 1), (u, v, w + 1),
-        )
-    ordered = tuple(
-        ffd_point_index(*coordinate, resolution)
-        for coordinate in coordinates)
+    if plane not in {"UV", "VW"}:
+        plane = "UW"
+    ordered = ffd_wire_topology(
+        tuple(resolution), False).faces[plane][anchor].tolist()
     visible = tuple(index for index in ordered if index in group)
     return visible or tuple(sorted(group))
 
 
-def _build_ffd_projected_selection_entities(
-        properties, project_point, mode, *, line_ratio=0.60, face_ratio=0.35):
-    """Build the same projected point, line, and face shapes shown by FFD."""
+@lru_cache(maxsize=750)
+def _ffd_projected_entity_topology(resolution, outside_only, mode):
+    """Return ``(order, anchor, orientation, group, display)`` per entity.
+
+    Projected entity sets are rebuilt whenever the view changes; their
+    selection groups and display winding only depend on the lattice.
+    """
     entities = []
     for order, (anchor, orientation) in enumerate(
-            ffd_selection_entities(properties, mode, ensure=False)):
-        group = tuple(ffd_selection_indices(
-            properties, anchor, mode,
-            axis=None if orientation == "POINT" else orientation,
-            ensure=False,
+            _ffd_selection_entity_topology(resolution, outside_only, mode)):
+        axis = None if orientation == "POINT" else orientation
+        group = tuple(_ffd_selection_group_topology(
+            resolution, outside_only, int(anchor), mode,
+            str(axis or ("V" if mode == "LINE" else "UW")).upper(),
         ))
         if not group:
             continue
         display_indices = (
-            _ffd_face_winding_indices(properties, anchor, orientation, group)
+            _ffd_face_winding_topology(resolution, anchor, orientation, group)
             if mode == "FACE" else group)
+        entities.append((order, anchor, orientation, group, display_indices))
+    return tuple(entities)
+
+
+def _build_ffd_projected_selection_entities(
+        properties, project_point, mode, *, line_ratio=0.60, face_ratio=0.35):
+    """Build the same projected point, line, and face shapes shown by FFD."""
+    entities = []
+    for order, anchor, orientation, group, display_indices in (
+            _ffd_projected_entity_topology(
+                tuple(ffd_resolution(properties)),
+                bool(getattr(properties, "ffd_use_outside", False)),
+                str(mode or ffd_selection_modes(properties)[0]),
+            )):
         screen_points = []
         depths = []
         for index in display_indices:
@@ -7949,19 +8517,22 @@ def _build_ffd_projected_selection_entities(
             "depth": (sum(depths) / len(depths)) if depths else None,
             "order": order,
         })
-    return tuple(entities)
+    return FFDProjectedEntities(entities, mode)
 
 
 def _ffd_projected_selection_entities(
         properties, project_point, mode, *, line_ratio=0.60, face_ratio=0.35):
+    if getattr(project_point, "view_key", None) is None:
+        # Plain callables carry no view identity, so they are never cached.
+        return _build_ffd_projected_selection_entities(
+            properties, project_point, mode,
+            line_ratio=line_ratio, face_ratio=face_ratio)
     return projected_entity_cache.get(
         properties,
         project_point,
         mode,
         builder=_build_ffd_projected_selection_entities,
         resolution_function=ffd_resolution,
-        point_index_function=ffd_point_index,
-        screen_value_function=_ffd_screen_value,
         line_ratio=line_ratio,
         face_ratio=face_ratio,
     )
@@ -7971,28 +8542,6 @@ def ffd_projected_entity_cache_info():
     return projected_entity_cache.info()
 
 
-def _screen_polyline_distance(point, points, *, closed=False):
-    """Return the shortest screen-space distance from a point to a polyline."""
-    point = Vector(point)
-    points = tuple(Vector(item) for item in points)
-    if not points:
-        return math.inf
-    if len(points) == 1:
-        return (point - points[0]).length
-    pairs = tuple(zip(points, points[1:]))
-    if closed:
-        pairs += ((points[-1], points[0]),)
-    nearest = math.inf
-    for first, second in pairs:
-        edge = second - first
-        denominator = edge.length_squared
-        factor = (
-            max(0.0, min(1.0, edge.dot(point - first) / denominator))
-            if denominator > EPSILON else 0.0)
-        nearest = min(nearest, (point - (first + edge * factor)).length)
-    return nearest
-
-
 def _ffd_projected_entities_overlap(mode, first, second, *, tolerance=4.0):
     """Identify controls that are visually coincident from the current view."""
     first_geometry = tuple(first["geometry"])
@@ -8052,29 +8601,20 @@ def ffd_screen_selection_entity(
     """Pick the front-most visible FFD controller under one screen position."""
     position = Vector((float(position[0]), float(position[1])))
     for mode in ffd_selection_modes(properties):
+        entities = _ffd_projected_selection_entities(
+            properties, project_point, mode,
+            line_ratio=line_ratio, face_ratio=face_ratio)
+        indices, distances = entities.screen_hits(
+            position,
+            point_radius=point_radius,
+            line_radius=line_radius,
+            face_margin=face_margin,
+        )
         candidates = []
-        for candidate in _ffd_projected_selection_entities(
-                properties, project_point, mode,
-                line_ratio=line_ratio, face_ratio=face_ratio):
-            geometry = candidate["geometry"]
-            if mode == "POINT":
-                distance = (position - geometry[0]).length
-                hit = distance <= point_radius
-            elif mode == "LINE":
-                distance = _screen_polyline_distance(position, geometry)
-                hit = distance <= line_radius
-            else:
-                polygon = _screen_convex_hull(geometry)
-                distance = _screen_polyline_distance(
-                    position, polygon, closed=True)
-                hit = (
-                    len(polygon) >= 3 and
-                    (_screen_point_in_polygon(position, polygon) or
-                     distance <= face_margin))
-            if hit:
-                candidate = dict(candidate)
-                candidate["distance"] = distance
-                candidates.append(candidate)
+        for index, distance in zip(indices.tolist(), distances.tolist()):
+            candidate = dict(entities[index])
+            candidate["distance"] = distance
+            candidates.append(candidate)
         visible = _ffd_front_visible_entities(mode, candidates)
         if visible:
             picked = min(
@@ -8107,21 +8647,12 @@ def ffd_box_selection_indices(
     bottom, top = sorted((float(bounds[2]), float(bounds[3])))
     normalized_bounds = (left, right, bottom, top)
     for active_mode in ffd_selection_modes(properties):
-        candidates = []
-        for candidate in _ffd_projected_selection_entities(
-                properties, project_point, active_mode,
-                line_ratio=line_ratio, face_ratio=face_ratio):
-            geometry = candidate["geometry"]
-            if active_mode == "POINT":
-                hit = _screen_point_in_box(geometry[0], normalized_bounds)
-            elif active_mode == "LINE":
-                hit = _screen_polyline_intersects_box(
-                    geometry, normalized_bounds)
-            else:
-                hit = _screen_polygon_intersects_box(
-                    geometry, normalized_bounds)
-            if hit:
-                candidates.append(candidate)
+        entities = _ffd_projected_selection_entities(
+            properties, project_point, active_mode,
+            line_ratio=line_ratio, face_ratio=face_ratio)
+        candidates = [
+            entities[index]
+            for index in entities.box_hits(normalized_bounds).tolist()]
         if candidates:
             visible = _ffd_front_visible_entities(active_mode, candidates)
             selected = set()
@@ -8202,8 +8733,8 @@ def ffd_set_selection(properties, indices, *, active=None):
     if points is None:
         return
     selected = ffd_symmetry_expand_indices(properties, indices)
-    for index, point in enumerate(points):
-        point.selected = index in selected
+    _write_ffd_selected(
+        properties, tuple(index in selected for index in range(len(points))))
     if active is not None and len(points):
         properties.ffd_active_point = min(max(int(active), 0), len(points) - 1)
 
@@ -8411,7 +8942,8 @@ def _ffd_axis_sample_weights(coordinate, count):
     return ((left, 1.0 - factor), (left + 1, factor))
 
 
-def _ffd_extended_offset(properties, source_resolution, source_coordinate):
+def _ffd_extended_offset(
+        properties, source_resolution, source_coordinate, effective=None):
     """Evaluate one separable linear extension of the authored offset grid."""
     axis_weights = tuple(
         _ffd_axis_sample_weights(coordinate, count)
@@ -8425,10 +8957,11 @@ def _ffd_extended_offset(properties, source_resolution, source_coordinate):
                 index = ffd_point_index(u, v, w, source_resolution)
                 if hollow and not ffd_point_is_surface(index, source_resolution):
                     continue
-                result += (
-                    ffd_point_effective_offset(properties, index) *
-                    weight_u * weight_v * weight_w
-                )
+                offset = (
+                    effective[index]
+                    if effective is not None and index < len(effective) else
+                    ffd_point_effective_offset(properties, index))
+                result += offset * weight_u * weight_v * weight_w
     return result
 
 
@@ -9021,6 +9554,7 @@ def ensure_ffd_lattice(target, modifier, controller):
         max(abs(float(value)), EPSILON)
         for value in lattice_matrix.to_scale()
     ))
+    effective = ffd_point_effective_offsets(properties)
     for index, point in enumerate(data.points):
         base = Vector(point.co)
         if unlimited:
@@ -9034,7 +9568,9 @@ def ensure_ffd_lattice(target, modifier, controller):
                 for axis, coordinate in enumerate((u, v, w))
             )
             offset = _ffd_extended_offset(
-                properties, source_resolution, source_coordinate)
+                properties, source_resolution, source_coordinate, effective)
+        elif index < len(effective):
+            offset = effective[index]
         else:
             offset = ffd_point_effective_offset(properties, index)
         normalized = Vector((
@@ -10283,6 +10819,133 @@ def _animation_paths(owner):
     return frozenset(paths)
 
 
+_TRANSFORM_ANIMATION_PATHS = frozenset((
+    "location", "rotation_euler", "rotation_quaternion", "rotation_axis_angle",
+    "scale", "delta_location", "delta_rotation_euler",
+    "delta_rotation_quaternion", "delta_scale",
+))
+# Animated-channel index: controller pointer -> (controller, channel kinds).
+# It is rebuilt when the ownership index changes or the depsgraph reports an
+# Action; a controller reported by the depsgraph is re-read on its own.
+_ANIMATED_CHANNELS = {}
+_ANIMATED_CHANNELS_STALE = {}
+_ANIMATED_CHANNELS_VERSION = None
+_FRAME_SYNC_CONTROLLERS = ()
+_CURVE_GUIDE_ANIMATION = {}
+
+
+def controller_animated_channels(controller):
+    """Return which of a controller's inputs are animated.
+
+    The result holds ``"PROPERTIES"`` for ``sdh_cage_deform`` values,
+    ``"FFD_POINTS"``, ``"TRANSFORM"`` for the Empty transform, and
+    ``"CURVE_GUIDE"`` when the stage's guide curve is animated.
+    ``"DEPENDENCIES"`` marks an Empty that constraints or a parent other than
+    its target can move through animation on other IDs.
+    """
+    kinds = set()
+    for path in _animation_paths(controller):
+        if path.startswith("sdh_cage_deform.ffd_points"):
+            kinds.add("FFD_POINTS")
+        elif path.startswith("sdh_cage_deform."):
+            kinds.add("PROPERTIES")
+        elif path in _TRANSFORM_ANIMATION_PATHS:
+            kinds.add("TRANSFORM")
+    target = find_target(controller)
+    parent = getattr(controller, "parent", None)
+    if len(getattr(controller, "constraints", ())) or (
+            parent is not None and parent != target):
+        kinds.add("DEPENDENCIES")
+    properties = getattr(controller, "sdh_cage_deform", None)
+    if str(getattr(properties, "cage_type", "STANDARD")) == "CURVE":
+        modifier = find_modifier(target, controller) if target else None
+        guide = curve_guide_object(target, modifier) if modifier else None
+        if guide is not None and (
+                _animation_paths(guide) or
+                _animation_paths(getattr(guide, "data", None))):
+            kinds.add("CURVE_GUIDE")
+    return frozenset(kinds)
+
+
+def invalidate_animated_channels(controller=None):
+    """Re-read one controller's channels, or every controller for ``None``."""
+    global _ANIMATED_CHANNELS_VERSION
+    if controller is None:
+        _ANIMATED_CHANNELS_VERSION = None
+        _ANIMATED_CHANNELS_STALE.clear()
+        return
+    pointer = _pointer(controller)
+    if pointer:
+        _ANIMATED_CHANNELS_STALE[pointer] = controller
+
+
+def note_curve_guide_animation(guide):
+    """Invalidate the index when a curve guide's animated paths change.
+
+    Animated guides are reported on every frame, so only a change of their
+    action, drivers, or animated paths triggers a rebuild.
+    """
+    pointer = _pointer(guide)
+    if not pointer:
+        return
+    try:
+        paths = (
+            _animation_paths(guide) |
+            _animation_paths(getattr(guide, "data", None)))
+    except (AttributeError, ReferenceError, RuntimeError, TypeError):
+        paths = frozenset()
+    if _CURVE_GUIDE_ANIMATION.get(pointer, frozenset()) != paths:
+        _CURVE_GUIDE_ANIMATION[pointer] = paths
+        invalidate_animated_channels()
+
+
+def _index_animated_channels(controller):
+    try:
+        kinds = (
+            controller_animated_channels(controller)
+            if is_cage_controller(controller) else frozenset())
+    except (AttributeError, ReferenceError, RuntimeError, TypeError):
+        kinds = frozenset()
+    pointer = _pointer(controller)
+    if kinds:
+        _ANIMATED_CHANNELS[pointer] = (controller, kinds)
+    else:
+        _ANIMATED_CHANNELS.pop(pointer, None)
+
+
+def frame_sync_controllers():
+    """Return the controllers a frame change must re-sync.
+
+    These are the controllers with animated channels plus the other stages
+    of their targets, whose chained inputs read the animated neighbours.
+    """
+    global _ANIMATED_CHANNELS_VERSION, _FRAME_SYNC_CONTROLLERS
+    version = _OWNERSHIP.current_version()
+    if version == _ANIMATED_CHANNELS_VERSION and not _ANIMATED_CHANNELS_STALE:
+        return _FRAME_SYNC_CONTROLLERS
+    if version != _ANIMATED_CHANNELS_VERSION:
+        _ANIMATED_CHANNELS.clear()
+        _ANIMATED_CHANNELS_STALE.clear()
+        for controller in _OWNERSHIP.objects("controllers"):
+            _index_animated_channels(controller)
+    else:
+        for controller in tuple(_ANIMATED_CHANNELS_STALE.values()):
+            _index_animated_channels(controller)
+        _ANIMATED_CHANNELS_STALE.clear()
+    controllers = {}
+    for controller, _kinds in tuple(_ANIMATED_CHANNELS.values()):
+        try:
+            target_uuid = str(controller.get(TARGET_UUID, ""))
+        except (AttributeError, ReferenceError, RuntimeError, TypeError):
+            continue
+        controllers.setdefault(_pointer(controller), controller)
+        for sibling in _OWNERSHIP.get("target_controllers", target_uuid):
+            controllers.setdefault(_pointer(sibling), sibling)
+    _ANIMATED_CHANNELS_VERSION = version
+    _FRAME_SYNC_CONTROLLERS = tuple(controllers.values())
+    return _FRAME_SYNC_CONTROLLERS
+
+
 def sync_controller(
         controller, pull_transform=True, *, sync_mode="push",
         chain_frames=None):
@@ -10317,6 +10980,9 @@ def sync_controller(
     previous_transform = _CONTROLLER_TRANSFORM_SNAPSHOTS.get(pointer)
     pending_shared_scale_sync = []
     _SYNCING.add(pointer)
+    # Socket writes from this pass, and from any enclosing chain or timer
+    # pass, reach the target together with a single update tag.
+    _INPUT_BATCH.begin()
     try:
         properties = controller.sdh_cage_deform
         if str(getattr(properties, "cage_type", "STANDARD")) == "CURVE":
@@ -10641,19 +11307,7 @@ def sync_controller(
                 normalized_ffd_offsets(properties.ffd_offsets)):
             param_values[socket_name] = tuple(offset)
 
-        def _different(old, value):
-            if isinstance(value, bpy.types.ID) or isinstance(old, bpy.types.ID):
-                return not _same_rna_value(old, value)
-            if isinstance(value, tuple):
-                old_tuple = tuple(old) if old is not None else ()
-                return len(old_tuple) != len(value) or any(
-                    abs(float(a) - float(b)) > EPSILON
-                    for a, b in zip(old_tuple, value))
-            if isinstance(value, str) or isinstance(old, str):
-                return str(old or "") != str(value)
-            if isinstance(value, bool) or isinstance(old, bool):
-                return old is None or bool(old) != bool(value)
-            return old is None or abs(float(old) - float(value)) > EPSILON
+        _different = _modifier_input_differs
 
         changed = bool(order_links_changed)
         # Transform always follows the Empty (viewport / fit).
@@ -11055,7 +11709,7 @@ def sync_controller(
                     TypeError, ValueError):
                 pass
         if changed:
-            target.update_tag()
+            tag_modifier_target(target)
         # Parameter edits arrive through the RNA callback, while Empty
         # transforms can change without one.  Cover both paths here and let
         # the timer coalesce repeated requests into one reconnect operation.
@@ -11081,24 +11735,59 @@ def sync_controller(
         if pointer not in _CONTROLLER_TRANSFORM_SNAPSHOTS:
             _CONTROLLER_TRANSFORM_SNAPSHOTS[pointer] = (
                 _controller_transform_signature(controller))
-        if pending_shared_scale_sync:
-            try:
-                from . import chain as chain_module
-                for side, scale in pending_shared_scale_sync:
-                    chain_module.sync_chain_shared_end_scale(
-                        target, modifier, side, scale)
-            except (ImportError, AttributeError, ReferenceError, RuntimeError,
-                    TypeError, ValueError):
-                pass
+        try:
+            if pending_shared_scale_sync:
+                try:
+                    from . import chain as chain_module
+                    for side, scale in pending_shared_scale_sync:
+                        chain_module.sync_chain_shared_end_scale(
+                            target, modifier, side, scale)
+                except (ImportError, AttributeError, ReferenceError,
+                        RuntimeError, TypeError, ValueError):
+                    pass
+        finally:
+            _INPUT_BATCH.end()
+
+
+def request_full_controller_sync():
+    """Make the next dirty-only sync reconcile every controller."""
+    global _CONTROLLER_FULL_SYNC_PENDING
+    _CONTROLLER_FULL_SYNC_PENDING = True
+
+
+def mark_animated_controllers_dirty():
+    """Queue the controllers a frame change affects for the next sync."""
+    for controller in frame_sync_controllers():
+        bump_revision(controller)
+
 
+def sync_all_controllers(
+        pull_transform=True, *, sync_mode="push", dirty_only=False):
+    """Sync cage controllers. Returns the number of controllers synced.
 
-def sync_all_controllers(pull_transform=True, *, sync_mode="push"):
-    """Sync every cage controller. Returns the number of controllers found."""
+    ``dirty_only`` visits just the controllers whose revision was bumped
+    since the previous pass: property callbacks, the depsgraph handler, and
+    the frame-change handler report them.  A pending or overdue full
+    reconciliation still visits every controller.
+    """
+    global _CONTROLLER_FULL_SYNC_PENDING, _CONTROLLER_FULL_SYNC_TIME
+    dirty = take_dirty_owners()
+    now = time.monotonic()
+    full = (
+        not dirty_only or _CONTROLLER_FULL_SYNC_PENDING or
+        now - _CONTROLLER_FULL_SYNC_TIME >= _CONTROLLER_FULL_SYNC_INTERVAL)
+    if full:
+        controllers = _OWNERSHIP.objects("controllers")
+        _CONTROLLER_FULL_SYNC_PENDING = False
+        _CONTROLLER_FULL_SYNC_TIME = now
+    else:
+        controllers = tuple(obj for obj in dirty if is_cage_controller(obj))
     count = 0
     live_pointers = set()
     orphan_targets = set()
-    for obj in _data_objects_snapshot():
-        if is_cage_controller(obj):
+    # One batch per pass tags each target once however many stages it has.
+    with batched_modifier_inputs():
+        for obj in controllers:
             target = find_target(obj)
             if target is not None and find_modifier(target, obj) is None:
                 orphan_targets.add(target)
@@ -11109,6 +11798,8 @@ def sync_all_controllers(pull_transform=True, *, sync_mode="push"):
                 obj, pull_transform=pull_transform, sync_mode=sync_mode)
     for target in orphan_targets:
         remove_orphan_cage_controllers(target)
+    if not full:
+        return count
     for pointer in tuple(_CONTROLLER_TRANSFORM_SNAPSHOTS):
         if pointer not in live_pointers:
             _CONTROLLER_TRANSFORM_SNAPSHOTS.pop(pointer, None)
@@ -11451,16 +12142,17 @@ def migrate_legacy_stages(context=None):
             new_group = create_stage_node_group()
             new_group[MODIFIER_UUID] = old_modifier_uuid
             modifier.node_group = new_group
+            target[TARGET_UUID] = old_target_uuid
+            _OWNERSHIP.note(target)
             if controller is None:
-                target[TARGET_UUID] = old_target_uuid
                 controller = _new_controller(context, target, modifier)
             else:
-                target[TARGET_UUID] = old_target_uuid
                 controller[CONTROLLER_MARKER] = True
                 controller[CONTROLLER_UUID] = str(
                     controller.get(legacy["controller_uuid"], "")) or str(uuid.uuid4())
                 controller[TARGET_UUID] = old_target_uuid
                 controller[MODIFIER_UUID] = old_modifier_uuid
+                _OWNERSHIP.note(controller)
                 controller.hide_render = True
                 controller.show_in_front = True
                 _set_controller_style(controller, "BEND")
@@ -11526,9 +12218,10 @@ def _controller_timer():
         organize_helper_objects()
         _LEGACY_MIGRATION_PENDING = False
     _cleanup_orphans_after_object_count_change(force=True)
-    # sync_all_controllers performs the single scene snapshot used by the
-    # maintenance pass; its count is only useful to direct callers.
-    sync_all_controllers(pull_transform=True, sync_mode="timer")
+    # Only controllers reported dirty are visited, with an occasional full
+    # reconciliation; the count is only useful to direct callers.
+    sync_all_controllers(
+        pull_transform=True, sync_mode="timer", dirty_only=True)
     _drain_ffd_scope_refresh_queue()
     refresh_controller_display()
     _drain_chain_reconnect_queue()
@@ -11541,6 +12234,16 @@ def _controller_timer():
     return 0.0 if (_STACK_AUTO_FIT_QUEUE or _LATTICE_ORIGIN_QUEUE) else None
 
 
+def _schedule_controller_sync():
+    """Run the controller maintenance pass on Blender's next event cycle."""
+    try:
+        if not bpy.app.timers.is_registered(_controller_timer):
+            bpy.app.timers.register(_controller_timer, first_interval=0.0)
+    except (RuntimeError, ValueError):
+        return False
+    return True
+
+
 def _selection_signature(context):
     """Return every source field that can change the expected cage tool."""
     try:
@@ -11886,12 +12589,18 @@ def schedule_runtime_bootstrap():
 @persistent
 def _runtime_load_discovery(_unused):
     """Always discover managed cages after opening another Blender file."""
+    _OWNERSHIP.invalidate()
+    invalidate_animated_channels()
+    _CURVE_GUIDE_ANIMATION.clear()
     schedule_runtime_bootstrap()
 
 
 @persistent
 def _runtime_undo_discovery(_unused):
     """Rediscover cages even after the heavy undo handler was disabled."""
+    _OWNERSHIP.invalidate()
+    invalidate_animated_channels()
+    _CURVE_GUIDE_ANIMATION.clear()
     schedule_runtime_bootstrap()
 
 
@@ -11975,19 +12684,125 @@ def disable_runtime_handlers():
                 break
     _RUNTIME_HANDLERS_REGISTERED = False
     _ORPHAN_HELPER_OBJECT_COUNT = -1
+    _OWNERSHIP.invalidate()
+
+
+DepsgraphDispatch = namedtuple(
+    "DepsgraphDispatch",
+    (
+        "version", "managed", "controllers", "ffd_lattices",
+        "origin_lattices", "curve_helpers", "curve_guide_data", "targets",
+        "chained_targets",
+    ),
+)
+
+
+def _build_depsgraph_dispatch(version):
+    controllers = set()
+    ffd_lattices = set()
+    origin_lattices = set()
+    curve_helpers = set()
+    curve_guide_data = {}
+    targets = {}
+    for table in ("controllers", "stage_helpers", "owners", "targets"):
+        for obj in _OWNERSHIP.objects(table):
+            try:
+                pointer = _pointer(obj)
+                if not pointer:
+                    continue
+                if table == "controllers":
+                    controllers.add(pointer)
+                elif table == "stage_helpers":
+                    if obj.get(FFD_LATTICE_MARKER, False):
+                        ffd_lattices.add(pointer)
+                    elif is_curve_helper(obj):
+                        curve_helpers.add(pointer)
+                        if is_curve_guide(obj):
+                            curve_guide_data.setdefault(
+                                _pointer(obj.data), []).append(obj)
+                elif table == "owners":
+                    if getattr(obj, "type", None) == "LATTICE":
+                        origin_lattices.add(pointer)
+                elif not obj.get(RUNTIME_EVALUATOR, False):
+                    targets[pointer] = obj
+            except (AttributeError, ReferenceError, RuntimeError, TypeError):
+                continue
+    curve_guide_data.pop(0, None)
+    managed = (
+        controllers | ffd_lattices | origin_lattices | curve_helpers |
+        set(targets))
+    return DepsgraphDispatch(
+        version, frozenset(managed), frozenset(controllers),
+        frozenset(ffd_lattices), frozenset(origin_lattices),
+        frozenset(curve_helpers),
+        {pointer: tuple(guides) for pointer, guides in curve_guide_data.items()},
+        targets, None)
+
+
+def _chained_target_pointers(targets):
+    try:
+        from . import chain as chain_module
+    except ImportError:
+        return frozenset()
+    chained = set()
+    for pointer, target in targets.items():
+        try:
+            if chain_module.chain_ids(target):
+                chained.add(pointer)
+        except (AttributeError, ReferenceError, RuntimeError, TypeError,
+                ValueError):
+            continue
+    return frozenset(chained)
+
+
+def _curve_guide_data_mapped(dispatch, helper):
+    """Return whether ``dispatch`` routes the helper's current curve data."""
+    try:
+        if not is_curve_guide(helper):
+            return True
+        data_pointer = _pointer(helper.data)
+    except (AttributeError, ReferenceError, RuntimeError, TypeError):
+        return True
+    return not data_pointer or helper in dispatch.curve_guide_data.get(
+        data_pointer, ())
+
+
+def depsgraph_dispatch(*, rebuild=False):
+    """Return the pointer sets that route depsgraph updates.
+
+    The sets are derived from the ownership index and rebuilt when its
+    version changes or ``rebuild`` is set, for example after a guide's curve
+    data was reassigned.  Chain membership is re-read separately whenever
+    chain metadata is rewritten, which ``invalidate_chain_domain_cache``
+    reports.
+    """
+    global _DEPSGRAPH_DISPATCH
+    version = _OWNERSHIP.current_version()
+    dispatch = _DEPSGRAPH_DISPATCH
+    if rebuild or dispatch is None or dispatch.version != version:
+        dispatch = _build_depsgraph_dispatch(version)
+    if dispatch.chained_targets is None:
+        dispatch = dispatch._replace(
+            chained_targets=_chained_target_pointers(dispatch.targets))
+    _DEPSGRAPH_DISPATCH = dispatch
+    return dispatch
 
 
 @persistent
 def _depsgraph_sync(_scene, depsgraph):
     """Queue controller transforms and recoverable chain stack edits.
 
-    Object-mode G/R/S does not invoke PropertyGroup callbacks.  Restricting
-    this handler to managed controllers, or to the updated target itself,
-    avoids a global object scan.  Native Modifier-panel drag-reordering
-    updates the target object's geometry instead of a controller; in that
-    case a persisted stage-index mismatch is recoverable and is queued for
-    the same zero-delay timer.  RNA writes remain outside dependency-graph
-    evaluation, where they could recursively trigger this handler.
+    Object-mode G/R/S does not invoke PropertyGroup callbacks.  Updates are
+    routed through ``depsgraph_dispatch`` in a single pass: IDs that are not
+    managed are skipped after one set-membership test, so sculpting and
+    playback never scan the scene.  Native Modifier-panel drag-reordering
+    updates the target object's geometry instead of a controller; chained
+    targets are queued and the timer validates their chains, where a
+    persisted stage-index mismatch is recoverable.  The same target updates
+    mark its controllers dirty, so a Modifier-panel socket edit is pulled by
+    the next dirty-only timer pass.  RNA writes remain outside
+    dependency-graph evaluation, where they could recursively trigger this
+    handler.
     """
     if depsgraph is None:
         return
@@ -11996,59 +12811,39 @@ def _depsgraph_sync(_scene, depsgraph):
     queued = False
     try:
         updates = tuple(depsgraph.updates)
+        dispatch = depsgraph_dispatch()
     except (AttributeError, ReferenceError, RuntimeError, TypeError):
         return
     # Updating one hidden FFD lattice also reports its evaluated target Mesh as
     # geometry-updated even though the source vertex coordinates did not
-    # change. Recognize that paired update before walking the list so ordinary
-    # point drags keep the scope-coordinate cache hot. A real source-mesh edit
-    # reports the Mesh without a managed lattice object and remains invalid.
+    # change. Mesh checks therefore run after the pass, once every paired
+    # lattice update has been seen, so ordinary point drags keep the
+    # scope-coordinate cache hot. A real source-mesh edit reports the Mesh
+    # without a managed lattice object and remains invalid.
     internal_ffd_mesh_updates = set()
-    for candidate_update in updates:
-        try:
-            candidate = getattr(
-                candidate_update.id, "original", candidate_update.id)
-            if not (
-                    isinstance(candidate, bpy.types.Object) and
-                    getattr(candidate, "type", None) == "LATTICE" and
-                    bool(candidate.get(FFD_LATTICE_MARKER, False)) and
-                    (
-                        getattr(candidate_update, "is_updated_geometry", False) or
-                        getattr(candidate_update, "is_updated_transform", False)
-                    )
-            ):
-                continue
-            owner = getattr(candidate, "parent", None)
-            mesh = getattr(owner, "data", None)
-            if isinstance(mesh, bpy.types.Mesh):
-                internal_ffd_mesh_updates.add(_pointer(mesh))
-        except (AttributeError, ReferenceError, RuntimeError, TypeError):
-            continue
+    mesh_updates = []
+    target_mesh_updates = []
     for update in updates:
         try:
             updated_id = update.id
-            try:
-                from .curve import request_curve_relation_sync_from_update
-                request_curve_relation_sync_from_update(updated_id)
-            except (AttributeError, ImportError, ReferenceError, RuntimeError,
-                    TypeError, ValueError):
-                pass
             updated_id = getattr(updated_id, "original", updated_id)
-            if isinstance(updated_id, bpy.types.Mesh):
-                mesh_pointer = _pointer(updated_id)
-                if mesh_pointer in internal_ffd_mesh_updates:
-                    _FFD_SCOPE_MESH_WRITE_GUARD.discard(mesh_pointer)
-                    continue
-                if mesh_pointer in _FFD_SCOPE_MESH_WRITE_GUARD:
-                    _FFD_SCOPE_MESH_WRITE_GUARD.discard(mesh_pointer)
-                    continue
-                if (
-                        getattr(update, "is_updated_geometry", False) and
-                        _mark_ffd_scope_mesh_dirty(updated_id)
-                ):
-                    queued = True
-                continue
+            pointer = _pointer(updated_id)
             if not isinstance(updated_id, bpy.types.Object):
+                if isinstance(updated_id, bpy.types.Mesh):
+                    if (
+                            pointer in _FFD_SCOPE_MESH_CACHE or
+                            pointer in _FFD_SCOPE_MESH_WRITE_GUARD
+                    ):
+                        mesh_updates.append((updated_id, update))
+                elif isinstance(updated_id, bpy.types.Action):
+                    # Keyframe, channel, and NLA strip edits reach the Action
+                    # without updating the animated object itself.
+                    invalidate_animated_channels()
+                else:
+                    for guide in dispatch.curve_guide_data.get(pointer, ()):
+                        request_curve_relation_sync_from_update(guide)
+                continue
+            if pointer not in dispatch.managed:
                 continue
             # Bounds sampling links a short-lived copy of the target so its
             # upstream modifier prefix can be evaluated.  That copy retains
@@ -12057,19 +12852,45 @@ def _depsgraph_sync(_scene, depsgraph):
             # sample. Never queue a reference that is about to become invalid.
             if bool(updated_id.get(RUNTIME_EVALUATOR, False)):
                 continue
-            target_mesh = getattr(updated_id, "data", None)
-            target_mesh_pointer = _pointer(target_mesh)
-            if (
-                    getattr(updated_id, "type", None) == "MESH" and
-                    getattr(update, "is_updated_geometry", False) and
-                    target_mesh_pointer not in internal_ffd_mesh_updates and
-                    target_mesh_pointer not in _FFD_SCOPE_MESH_WRITE_GUARD and
-                    not _ffd_scope_tracks_target(updated_id) and
-                    _mark_ffd_scope_target_dirty(updated_id)
-            ):
+            # Rewritten ownership markers reach the index here; new objects
+            # and deletions are caught by its object-count check.
+            _OWNERSHIP.note(updated_id)
+            if pointer in dispatch.controllers:
+                # Transforms, drivers, and bulk writes reach the controller
+                # without an update callback; any reported update may have
+                # changed its preview inputs or its FFD points.
+                bump_revision(updated_id)
+                bump_ffd_point_generation(updated_id)
+                invalidate_animated_channels(updated_id)
+                if not update.is_updated_transform:
+                    continue
+                signature = _controller_transform_signature(updated_id)
+                if _CONTROLLER_TRANSFORM_SNAPSHOTS.get(pointer) == signature:
+                    continue
+                _CONTROLLER_TRANSFORM_QUEUE[pointer] = updated_id
                 queued = True
+                continue
+            if pointer in dispatch.ffd_lattices:
+                if (
+                        getattr(update, "is_updated_geometry", False) or
+                        getattr(update, "is_updated_transform", False)
+                ):
+                    mesh = getattr(
+                        getattr(updated_id, "parent", None), "data", None)
+                    if isinstance(mesh, bpy.types.Mesh):
+                        internal_ffd_mesh_updates.add(_pointer(mesh))
+                continue
+            if pointer in dispatch.curve_helpers:
+                if not _curve_guide_data_mapped(dispatch, updated_id):
+                    # A reassigned ``data`` moved the guide to another Curve,
+                    # whose updates the cached map would not route.
+                    dispatch = depsgraph_dispatch(rebuild=True)
+                # Guide drivers and actions are assigned on the helper.
+                note_curve_guide_animation(updated_id)
+                request_curve_relation_sync_from_update(updated_id)
+                continue
             if (
-                    getattr(updated_id, "type", None) == "LATTICE" and
+                    pointer in dispatch.origin_lattices and
                     (
                         getattr(update, "is_updated_transform", False) or
                         getattr(update, "is_updated_geometry", False) or
@@ -12078,67 +12899,71 @@ def _depsgraph_sync(_scene, depsgraph):
                     request_lattice_origin_sync(updated_id)
             ):
                 queued = True
-            if is_cage_controller(updated_id):
-                if not update.is_updated_transform:
-                    continue
-                controller = updated_id
-                pointer = _pointer(controller)
-                if not pointer:
-                    continue
-                signature = _controller_transform_signature(controller)
-                if _CONTROLLER_TRANSFORM_SNAPSHOTS.get(pointer) == signature:
-                    continue
-                _CONTROLLER_TRANSFORM_QUEUE[pointer] = controller
-                queued = True
+            if pointer not in dispatch.targets:
                 continue
-
-            # A native modifier reorder is reported on the target Object as a
-            # geometry update.  Inspect only this updated object and only its
-            # managed chain UUIDs; never walk the scene from the depsgraph
-            # callback.  Structural errors remain untouched and are still
-            # surfaced to the panel/operator diagnostics.
+            if (
+                    getattr(updated_id, "type", None) == "MESH" and
+                    getattr(update, "is_updated_geometry", False)
+            ):
+                target_mesh_updates.append(updated_id)
             if not (
                     getattr(update, "is_updated_geometry", False) or
                     getattr(update, "is_updated_shading", False)):
                 continue
+            # A Modifier-panel socket edit updates the target, not its
+            # controllers, so dirty-only timer passes would never pull it.
+            target_controllers = _OWNERSHIP.get(
+                "target_controllers", str(updated_id.get(TARGET_UUID, "")))
+            for controller in target_controllers:
+                bump_revision(controller)
+            if target_controllers:
+                _schedule_controller_sync()
             # Mesh/object edits and native upstream modifiers do not invoke a
             # cage PropertyGroup callback. Let ordinary opt-in cages refit on
             # the next safe timer pass; cached bounds prevent self-triggered
             # updates from forming a dependency-graph loop.
-            target_pointer = _pointer(updated_id)
             if (
-                    target_pointer not in _STACK_AUTO_FIT_DEPSGRAPH_GUARD and
+                    pointer not in _STACK_AUTO_FIT_DEPSGRAPH_GUARD and
                     request_stack_auto_fit(updated_id)
             ):
                 queued = True
-            try:
-                from . import chain as chain_module
-                chain_ids = tuple(chain_module.chain_ids(updated_id))
-            except (ImportError, AttributeError, ReferenceError, RuntimeError,
-                    TypeError, ValueError):
-                continue
-            for chain_uuid in chain_ids:
-                try:
-                    report = chain_module.validate_chain(
-                        updated_id, chain_uuid)
-                except (AttributeError, ReferenceError, RuntimeError, TypeError,
-                        ValueError):
-                    continue
-                if not report.get("index_mismatch"):
-                    continue
-                # Only the order-only mismatch can be repaired safely.  A
-                # missing/duplicate stage, an inserted ordinary modifier, or
-                # a missing controller needs explicit user-facing recovery.
-                if any(report.get(name) for name in (
-                        "missing_indices", "duplicate_indices",
-                        "ordinary_between", "missing_controllers",
-                        "mode_mismatch")):
-                    continue
-                if request_chain_reconnect(updated_id, chain_uuid):
-                    queued = True
+            # A native modifier reorder is reported on the target Object as a
+            # geometry update.  Structural errors remain untouched and are
+            # still surfaced to the panel/operator diagnostics.
+            if pointer in dispatch.chained_targets:
+                _CHAIN_VALIDATION_QUEUE[pointer] = updated_id
+                queued = True
         except (AttributeError, ReferenceError, RuntimeError, TypeError,
                 ValueError):
             continue
+    for target in target_mesh_updates:
+        try:
+            target_mesh_pointer = _pointer(getattr(target, "data", None))
+            if (
+                    target_mesh_pointer not in internal_ffd_mesh_updates and
+                    target_mesh_pointer not in _FFD_SCOPE_MESH_WRITE_GUARD and
+                    not _ffd_scope_tracks_target(target) and
+                    _mark_ffd_scope_target_dirty(target)
+            ):
+                queued = True
+        except (AttributeError, ReferenceError, RuntimeError, TypeError):
+            continue
+    for mesh, update in mesh_updates:
+        try:
+            mesh_pointer = _pointer(mesh)
+            if (
+                    mesh_pointer in internal_ffd_mesh_updates or
+                    mesh_pointer in _FFD_SCOPE_MESH_WRITE_GUARD
+            ):
+                _FFD_SCOPE_MESH_WRITE_GUARD.discard(mesh_pointer)
+                continue
+            if (
+                    getattr(update, "is_updated_geometry", False) and
+                    _mark_ffd_scope_mesh_dirty(mesh)
+            ):
+                queued = True
+        except (AttributeError, ReferenceError, RuntimeError, TypeError):
+            continue
     if queued:
         _schedule_chain_reconnect()
 
@@ -12154,7 +12979,14 @@ def _frame_change_sync(_scene, *_args):
     synchronization stays immediate; structural work is already coalesced by
     the normal zero-delay timer and runs after the frame update returns.
     """
-    sync_all_controllers(pull_transform=True, sync_mode="timer")
+    # Animated FFD points and properties, and Empties moved by constraints or
+    # a foreign parent, change without running their update callbacks, so
+    # those controllers are queued explicitly.
+    bump_ffd_point_generation()
+    bump_revision()
+    mark_animated_controllers_dirty()
+    sync_all_controllers(
+        pull_transform=True, sync_mode="timer", dirty_only=True)
     if (
             _CONTROLLER_TRANSFORM_QUEUE or _CHAIN_RECONNECT_QUEUE or
             _STACK_AUTO_FIT_QUEUE
@@ -12164,6 +12996,8 @@ def _frame_change_sync(_scene, *_args):
 
 @persistent
 def _render_sync(_scene, *_args):
+    bump_ffd_point_generation()
+    bump_revision()
     sync_all_controllers(pull_transform=True, sync_mode="timer")
     _drain_chain_reconnect_queue()
     _drain_stack_auto_fit_queue()
@@ -12173,6 +13007,8 @@ def _render_sync(_scene, *_args):
 def _load_sync(_unused):
     global _LEGACY_MIGRATION_PENDING
     clear_chain_reconnect_state()
+    clear_ffd_point_generations()
+    clear_revisions()
     _cleanup_orphans_after_object_count_change(force=True)
     _reconcile_ffd_edit_session_flags()
     migrate_legacy_stages()
@@ -12194,6 +13030,9 @@ def _load_sync(_unused):
 def _undo_redo_sync(_unused):
     """Repair helper ownership once after Blender restores an undo state."""
     clear_ffd_scope_cache()
+    clear_ffd_point_generations()
+    clear_revisions()
+    request_full_controller_sync()
     _cleanup_orphans_after_object_count_change(force=True)
     _reconcile_ffd_edit_session_flags()
     refresh_controller_display(force=True)
@@ -12256,6 +13095,8 @@ def _modifier_input_bounds(context, target, modifier):
     operations. Mesh coordinates and arbitrary upstream modifier dependencies
     cannot be represented by a reliable cheap cache token.
     """
+    # The evaluator must see socket writes still queued by an open batch.
+    _INPUT_BATCH.flush()
     try:
         node_group = getattr(modifier, "node_group", None)
         source_index = int(node_group.get(
@@ -12292,6 +13133,7 @@ def _modifier_input_bounds(context, target, modifier):
                     pull_transform=False,
                     sync_mode="push",
                 )
+        _INPUT_BATCH.flush()
         context.view_layer.update()
     except (AttributeError, ReferenceError, RuntimeError, TypeError, ValueError):
         pass
@@ -12511,6 +13353,7 @@ def _new_controller(context, target, modifier):
     controller[CONTROLLER_UUID] = str(uuid.uuid4())
     controller[TARGET_UUID] = target_uuid
     controller[MODIFIER_UUID] = modifier_uuid
+    _OWNERSHIP.note(controller)
     controller.show_in_front = True
     controller.show_name = False
     controller.hide_render = True
@@ -12586,10 +13429,9 @@ def _copy_controller_state(destination_controller, source_controller):
             for source_point in source.ffd_points:
                 point = destination.ffd_points.add()
                 point.name = source_point.name
-                point.offset = tuple(source_point.offset)
-                point.influence = min(max(float(
-                    getattr(source_point, "influence", 1.0)), 0.0), 1.0)
-                point.selected = bool(source_point.selected)
+            _write_ffd_offsets(destination, _read_ffd_offsets(source))
+            _write_ffd_influences(destination, _read_ffd_influences(source))
+            _write_ffd_selected(destination, _read_ffd_selected(source))
             ensure_ffd_point_collection(destination)
         if (
                 hasattr(destination, "curve_points") and
@@ -12817,12 +13659,10 @@ def ensure_target_stage_ownership(
     if target is None or is_cage_controller(target):
         return False
     target_uuid = str(target.get(TARGET_UUID, ""))
-    data_objects = _data_objects_snapshot()
     conflicts = tuple(
-        obj for obj in data_objects
-        if obj != target and not is_cage_controller(obj) and
-        target_uuid and str(obj.get(TARGET_UUID, "")) == target_uuid
-    )
+        obj for obj in _OWNERSHIP.get("targets", target_uuid)
+        if obj != target
+    ) if target_uuid else ()
     if not conflicts:
         return False
 
@@ -12835,9 +13675,8 @@ def ensure_target_stage_ownership(
     # and make both stacks appear to swap ownership.
     owned_controller_uuids = {
         str(obj.get(MODIFIER_UUID, ""))
-        for obj in data_objects
-        if (is_cage_controller(obj) and obj.parent == target and
-            str(obj.get(TARGET_UUID, "")) == target_uuid)
+        for obj in _OWNERSHIP.get("target_controllers", target_uuid)
+        if obj.parent == target
     }
     if stages and all(
             cage_modifier_uuid(modifier) in owned_controller_uuids
@@ -12859,6 +13698,7 @@ def ensure_target_stage_ownership(
             request_target_ownership_repair(target)
             return False
         raise
+    _OWNERSHIP.note(target)
     for modifier, source_controller in zip(stages, source_controllers):
         source_curve_guide = None
         if (
@@ -12886,6 +13726,7 @@ def ensure_target_stage_ownership(
             new_controller = source_controller
             new_controller[TARGET_UUID] = new_target_uuid
             new_controller[MODIFIER_UUID] = cage_modifier_uuid(modifier)
+            _OWNERSHIP.note(new_controller)
         else:
             new_controller = _new_controller(context, target, modifier)
         if source_controller is not None:
@@ -13031,23 +13872,16 @@ def _remove_orphan_helper_object(obj, curve_module=None):
 
 def cleanup_orphan_deform_helpers():
     """Remove helpers whose target or owning deformation stage no longer exists."""
-    objects = _data_objects_snapshot()
-    if not objects:
+    if not _data_objects_available():
         return 0
     try:
         from . import curve as curve_module
     except ImportError:
         curve_module = None
 
-    legacy_owners = {}
-    for obj in objects:
-        try:
-            owner_uuid = str(obj.get(PublicData.G_OBJECT_UUID_PROP, ""))
-            if owner_uuid and not obj.get(PublicData.G_OWNER_PROP, False):
-                legacy_owners.setdefault(owner_uuid, []).append(obj)
-        except (AttributeError, ReferenceError, TypeError):
-            continue
-
+    # Only indexed helpers can be orphans; unrelated scene objects are never
+    # visited.
+    objects = _OWNERSHIP.objects("controllers", "stage_helpers", "origins")
     orphans = []
     for obj in objects:
         try:
@@ -13102,7 +13936,8 @@ def cleanup_orphan_deform_helpers():
             if not GizmoUtils.is_managed_origin(obj):
                 continue
             owner_uuid = str(obj.get(PublicData.G_OWNER_UUID_PROP, ""))
-            owners = legacy_owners.get(owner_uuid, ())
+            owners = (
+                _OWNERSHIP.get("owners", owner_uuid) if owner_uuid else ())
             in_use = any(
                 modifier.type == "SIMPLE_DEFORM" and
                 getattr(modifier, "origin", None) == obj
@@ -13154,8 +13989,7 @@ def _cleanup_orphans_after_object_count_change(*, force=False):
 
 def _runtime_has_managed_deformation():
     """Return whether any live cage or managed traditional Origin remains."""
-    objects = _data_objects_snapshot()
-    for obj in objects:
+    for obj in _OWNERSHIP.objects("controllers", "origins"):
         try:
             if is_cage_controller(obj):
                 target = find_target(obj)
@@ -13165,9 +13999,7 @@ def _runtime_has_managed_deformation():
                 owner_uuid = str(obj.get(PublicData.G_OWNER_UUID_PROP, ""))
                 if not owner_uuid:
                     continue
-                for owner in objects:
-                    if str(owner.get(PublicData.G_OBJECT_UUID_PROP, "")) != owner_uuid:
-                        continue
+                for owner in _OWNERSHIP.get("owners", owner_uuid):
                     if any(
                             modifier.type == "SIMPLE_DEFORM" and
                             getattr(modifier, "origin", None) == obj
@@ -13944,9 +14776,10 @@ class SDH_OT_select_ffd_points(Operator):
         elif self.action == "NONE":
             indices = ()
         else:
+            selected = set(ffd_selected_point_indices(properties))
             indices = tuple(
-                index for index, point in enumerate(properties.ffd_points)
-                if index in visible and not point.selected)
+                index for index in range(len(properties.ffd_points))
+                if index in visible and index not in selected)
         ffd_set_selection(properties, indices)
         if context.area:
             context.area.tag_redraw()
@@ -14072,8 +14905,8 @@ def reset_ffd_offsets(controller, context):
         if pointer:
             _FFD_POINT_GUARD.add(pointer)
         try:
-            for point in properties.ffd_points:
-                point.offset = (0.0, 0.0, 0.0)
+            _write_ffd_offsets(
+                properties, np.zeros((len(properties.ffd_points), 3)))
         finally:
             if pointer:
                 _FFD_POINT_GUARD.discard(pointer)
@@ -14606,8 +15439,8 @@ class SDH_OT_box_select_ffd_points(Operator):
     def _selected_transform_indices(self, properties):
         visible = set(ffd_visible_indices(properties))
         return tuple(
-            index for index, point in enumerate(properties.ffd_points)
-            if point.selected and index in visible)
+            index for index in ffd_selected_point_indices(properties)
+            if index in visible)
 
     def _begin_transform(self, context, event, mode, *, initial_mouse=None):
         controller = self._controller()
@@ -14622,8 +15455,13 @@ class SDH_OT_box_select_ffd_points(Operator):
             return False
         cage_matrix = cage_local_matrix(target, controller)
         visible_indices = tuple(ffd_visible_indices(properties))
+        raw_offsets = _read_ffd_offsets(properties).tolist()
         all_initial_points = {
-            index: self._point_local(properties, index)
+            index: (
+                self._point_source_local(properties, index) +
+                Vector(raw_offsets[index])
+                if index < len(raw_offsets) else
+                self._point_local(properties, index))
             for index in range(ffd_point_count(properties))
         }
         initial_points = {
@@ -14652,7 +15490,7 @@ class SDH_OT_box_select_ffd_points(Operator):
             active_index if active_index in selected_indices else selected_indices[0])
         self._transform_selected_indices = tuple(selected_indices)
         self._transform_initial_offsets = {
-            index: Vector(properties.ffd_points[index].offset)
+            index: Vector(raw_offsets[index])
             for index in visible_indices
         }
         if getattr(self, "_state", "") != "TRANSFORM":
@@ -14712,10 +15550,7 @@ class SDH_OT_box_select_ffd_points(Operator):
         group = set(ffd_selection_indices(
             properties, anchor, selection_mode, axis=axis))
         group = ffd_symmetry_expand_indices(properties, group)
-        current = {
-            index for index, point in enumerate(properties.ffd_points)
-            if point.selected
-        }
+        current = set(ffd_selected_point_indices(properties))
         selected, collapse_on_click = ffd_pointer_selection_update(
             current, group, extend=extend)
         active = (
@@ -14768,7 +15603,7 @@ class SDH_OT_box_select_ffd_points(Operator):
             # every mouse event idempotent and leaves point influence solely
             # in the runtime lattice evaluation path.
             requested = Vector(safe_offsets[index])
-            current = Vector(properties.ffd_points[index].offset)
+            current = Vector(current_offsets[index])
             if (requested - current).length > EPSILON:
                 updates[index] = requested
         if not updates:
@@ -14777,8 +15612,10 @@ class SDH_OT_box_select_ffd_points(Operator):
         pointer = int(controller.as_pointer())
         _FFD_POINT_GUARD.add(pointer)
         try:
+            written = list(current_offsets)
             for index, requested in updates.items():
-                properties.ffd_points[index].offset = tuple(requested)
+                written[index] = tuple(requested)
+            _write_ffd_offsets(properties, written)
         finally:
             _FFD_POINT_GUARD.discard(pointer)
         _controller_update(properties, context)
@@ -14798,9 +15635,11 @@ class SDH_OT_box_select_ffd_points(Operator):
             if cancel_offsets is None:
                 cancel_offsets = getattr(
                     self, "_transform_initial_offsets", {})
+            offsets = _read_ffd_offsets(properties)
             for index, value in cancel_offsets.items():
-                if index < len(properties.ffd_points):
-                    properties.ffd_points[index].offset = tuple(value)
+                if index < len(offsets):
+                    offsets[index] = tuple(value)
+            _write_ffd_offsets(properties, offsets)
         finally:
             _FFD_POINT_GUARD.discard(pointer)
         _controller_update(properties, context)
@@ -15282,8 +16121,6 @@ class SDH_OT_box_select_ffd_points(Operator):
                 pass
 
     def _selection_for_controller(self, context, event, controller):
-        from bpy_extras import view3d_utils
-
         if controller is None:
             return None
         target = find_target(controller)
@@ -15302,25 +16139,7 @@ class SDH_OT_box_select_ffd_points(Operator):
         except (AttributeError, TypeError, ValueError):
             ui_scale = 1.0
         hit_radius = max(10.0 * ui_scale, 8.0)
-        projected_points = {}
-
-        def projected(index):
-            if index not in projected_points:
-                world = self._point_world(
-                    target, controller, properties, index)
-                screen = view3d_utils.location_3d_to_region_2d(
-                    region, region_data, world)
-                if screen is None:
-                    projected_points[index] = None
-                else:
-                    try:
-                        depth = -float((region_data.view_matrix @ world).z)
-                    except (AttributeError, RuntimeError, TypeError, ValueError):
-                        depth = None
-                    projected_points[index] = (
-                        float(screen.x), float(screen.y), depth)
-            return projected_points[index]
-
+        projected = ffd_view_projection(target, controller, region, region_data)
         preferences = get_pref()
         return ffd_screen_selection_entity(
             properties,
@@ -15612,8 +16431,6 @@ class SDH_OT_box_select_ffd_points(Operator):
         return None
 
     def _apply_selection(self, context):
-        from bpy_extras import view3d_utils
-
         controller = self._controller()
         if controller is None:
             return False
@@ -15631,25 +16448,8 @@ class SDH_OT_box_select_ffd_points(Operator):
         x1, y1 = self._end
         left, right = sorted((x0, x1))
         bottom, top = sorted((y0, y1))
-        projected = {}
-
-        def project_point(index):
-            if index not in projected:
-                world = self._point_world(
-                    target, controller, properties, index)
-                screen = view3d_utils.location_3d_to_region_2d(
-                    region, region_data, world)
-                if screen is None:
-                    projected[index] = None
-                else:
-                    try:
-                        depth = -float((region_data.view_matrix @ world).z)
-                    except (AttributeError, RuntimeError, TypeError, ValueError):
-                        depth = None
-                    projected[index] = (
-                        float(screen.x), float(screen.y), depth)
-            return projected[index]
-
+        project_point = ffd_view_projection(
+            target, controller, region, region_data)
         preferences = get_pref()
         boxed, boxed_active, _boxed_mode = ffd_box_selection_indices(
             properties,
@@ -15668,10 +16468,7 @@ class SDH_OT_box_select_ffd_points(Operator):
         # the established behavior remains: a blank SET box clears selection.
         if bool(getattr(self, "_pre_edit_box_select", False)) and not boxed:
             return True
-        current = {
-            index for index, point in enumerate(properties.ffd_points)
-            if point.selected
-        }
+        current = set(ffd_selected_point_indices(properties))
         mode = getattr(self, "_selection_mode", "SET")
         selected = ffd_box_selection_update(current, boxed, mode)
         active = (
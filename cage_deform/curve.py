@@ -20,6 +20,7 @@ from mathutils import Matrix, Vector
 
 from ..utils import move_object_to_control_collection, set_helper_object_visible
 from . import undo as _undo
+from .revisions import bump_revision, memoized
 from .viewport import draw_gizmo_custom_shape as draw_cage_custom_shape
 
 
@@ -348,6 +349,7 @@ def _equalize_curve_station_factors(properties):
 
 def _curve_station_update(station, context):
     controller = _station_controller(station)
+    bump_revision(controller)
     pointer = _pointer(controller)
     if (
             not pointer or pointer in _STATION_SYNC_GUARD or
@@ -406,6 +408,7 @@ def _curve_point_index(point, properties):
 
 def _curve_point_shape_update(point, context):
     controller = _curve_point_controller(point)
+    bump_revision(controller)
     pointer = _pointer(controller)
     if (
             not pointer or pointer in _POINT_SYNC_GUARD or
@@ -1480,15 +1483,21 @@ def curve_preview_signature(properties):
     pointer = _pointer(controller)
     if pointer:
         _LATEST_PREVIEW_STATE[pointer] = (guide_signature, state)
-    stations = tuple(
-        (
-            float(station.factor).hex(),
-            _float_signature(station.scale),
-            _float_signature(station.offset),
-            float(station.radius).hex(),
-            float(station.twist).hex(),
-        )
-        for station in properties.curve_stations
+    # Station edits bump the controller revision; adding or removing one
+    # does not, so the station count is part of the memo slot.
+    stations = memoized(
+        properties,
+        ("curve_stations", len(properties.curve_stations)),
+        lambda: tuple(
+            (
+                float(station.factor).hex(),
+                _float_signature(station.scale),
+                _float_signature(station.offset),
+                float(station.radius).hex(),
+                float(station.twist).hex(),
+            )
+            for station in properties.curve_stations
+        ),
     )
     return (
         "SDH_CURVE_PREVIEW_V1",
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
 from mathutils import Vector
 
 from .deform_contract import (
@@ -31,69 +32,41 @@ def normalized_ffd_offsets(values=()):
     )
 
 
-def deform_point_local(point, size, deform_type="BEND", strength=0.0,
-                       factor=0.0, direction=0.0, mode="LIMITED",
-                       origin="BOTTOM", preserve_volume=True,
-                       top_scale=(1.0, 1.0), bottom_scale=(1.0, 1.0),
-                       top_offset=(0.0, 0.0), bottom_offset=(0.0, 0.0), *,
-                       stage_enabled=True,
-                       chain_eligible=True,
-                       chain_root_stage=False,
-                       chain_input_offset=(0.0, 0.0, 0.0),
-                       chain_input_frame=None,
-                       chain_output_frame=None,
-                       chain_source_coordinate=None,
-                       chain_source_start=None,
-                       chain_profile_after_end=False,
-                       chain_profile_gap_distance=0.0,
-                       deform_types=None, bend_strength=None,
-                       bend_direction=None, twist_strength=None,
-                       taper_factor=None, stretch_factor=None,
-                       shear_factors=(0.0, 0.0), ffd_offsets=(),
-                       deform_order=None, curve_deformer=None,
-                       _prepared=False):
-    """Reference implementation shared by viewport drawing and regressions.
+def _decode_operations(deform_type, deform_types, deform_order, prepared):
+    """Return the enabled operation set and its normalized evaluation order.
 
     Omitting ``deform_types`` preserves the original single-operation API.
-    Supplying ``deform_order`` composes enabled operations in that normalized
-    order, matching the permanent operation blocks in Geometry Nodes.
+    ``prepared`` callers have already normalized both values.
     """
-    raw_point = Vector(point)
-    point = raw_point.copy()
-    if not stage_enabled:
-        return raw_point.copy()
-    size = Vector((max(abs(value), EPSILON) for value in size))
-    if _prepared:
-        enabled = set(deform_types or ())
-        operation_order = tuple(deform_order or ())
-    elif deform_types is None and deform_order is None:
+    if prepared:
+        return set(deform_types or ()), tuple(deform_order or ())
+    if deform_types is None and deform_order is None:
         enabled = {deform_type} if deform_type in DEFORM_BITS else {"BEND"}
-    elif deform_types is None:
-        try:
-            enabled = {
-                name for name in (_deform_name(value) for value in deform_order)
-                if name is not None
-            }
-        except TypeError:
-            enabled = set()
     else:
+        values = deform_order if deform_types is None else deform_types
         try:
             enabled = {
-                name for name in (_deform_name(value) for value in deform_types)
+                name for name in (_deform_name(value) for value in values)
                 if name is not None
             }
         except TypeError:
             enabled = set()
-    if not _prepared:
-        operation_order = (
-            normalize_deform_order(
-                DEFORM_ORDER if deform_order is None else deform_order,
-                enabled,
-                deform_type,
-            )
-            if enabled else ()
+    operation_order = (
+        normalize_deform_order(
+            DEFORM_ORDER if deform_order is None else deform_order,
+            enabled,
+            deform_type,
         )
+        if enabled else ()
+    )
+    return enabled, operation_order
 
+
+def _decode_parameters(
+        deform_type, strength, factor, direction, bend_strength,
+        bend_direction, twist_strength, taper_factor, stretch_factor,
+        shear_factors):
+    """Resolve per-operation parameters, honoring the legacy scalar inputs."""
     bend_strength = (
         float(strength) if bend_strength is None and deform_type == "BEND"
         else float(bend_strength or 0.0))
@@ -117,74 +90,247 @@ def deform_point_local(point, size, deform_type="BEND", strength=0.0,
         shear_factors[0] if len(shear_factors) > 0 else 0.0,
         shear_factors[1] if len(shear_factors) > 1 else 0.0,
     )
-    ffd_offset_vectors = (
-        normalized_ffd_offsets(ffd_offsets) if "FFD" in enabled else ())
+    return (
+        bend_strength, bend_direction, twist_strength, taper_factor,
+        stretch_factor, shear_factors,
+    )
+
+
+def deform_point_local(point, size, *args, chain_eligible=True,
+                       chain_source_coordinate=None, **kwargs):
+    """Reference implementation shared by viewport drawing and regressions.
+
+    Omitting ``deform_types`` preserves the original single-operation API.
+    Supplying ``deform_order`` composes enabled operations in that normalized
+    order, matching the permanent operation blocks in Geometry Nodes.  This
+    compiles a :class:`DeformPlan` on every call; callers that evaluate many
+    points should compile once and use :func:`evaluate_point`.
+    """
+    return evaluate_point(
+        compile_deform_plan(size, *args, **kwargs),
+        point,
+        chain_eligible=chain_eligible,
+        chain_source_coordinate=chain_source_coordinate,
+    )
+
+
+def _point_array(points):
+    """Return a writable float64 ``(N, 3)`` copy of ``points``."""
+    values = np.array(points, dtype=np.float64)
+    if values.size == 0:
+        return np.zeros((0, 3), dtype=np.float64)
+    return values.reshape(-1, 3)
+
+
+def _frame_rows(frame):
+    """Return four plain-float three-component rows from a chain frame."""
+    rows = tuple(tuple(float(value) for value in row) for row in frame)
+    if len(rows) != 4 or any(len(row) != 3 for row in rows):
+        raise ValueError("chain frame must contain four vectors")
+    return rows
+
+
+class DeformPlan:
+    """Immutable stage parameters decoded once for repeated evaluation.
 
-    half = size * 0.5
-    configured_origin_y = {
-        "BOTTOM": -half.y,
+    A plan holds everything ``deform_point_local`` derives from its stage
+    arguments: the normalized operation order, coerced parameters, the
+    origin interval, the Bend rotation and curvature, the FFD corner offsets,
+    and validated chain frames.  :func:`evaluate` then only performs the
+    per-point math.  Frames, offsets and FFD corners are plain-float tuples
+    so the single-point kernels read them without NumPy conversions.
+    """
+
+    __slots__ = (
+        "stage_enabled", "size", "half", "mode", "origin", "origin_y",
+        "lower", "upper", "top_scale", "bottom_scale", "top_offset",
+        "bottom_offset", "chain_root_stage", "chain_input_frame",
+        "chain_input_offset", "chain_output_frame", "chain_source_start",
+        "enabled", "operation_order", "bend_active", "bend_cos",
+        "bend_sin", "bend_curvature", "twist_strength", "taper_factor",
+        "stretch_scale", "stretch_volume_scale", "shear_factors",
+        "ffd_offsets", "curve_deformer",
+    )
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            object.__setattr__(self, name, values[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DeformPlan is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("DeformPlan is immutable")
+
+    def __repr__(self):
+        return (
+            f"DeformPlan(mode={self.mode!r}, origin={self.origin!r}, "
+            f"operations={self.operation_order!r})")
+
+
+def compile_deform_plan(size, deform_type="BEND", strength=0.0,
+                        factor=0.0, direction=0.0, mode="LIMITED",
+                        origin="BOTTOM", preserve_volume=True,
+                        top_scale=(1.0, 1.0), bottom_scale=(1.0, 1.0),
+                        top_offset=(0.0, 0.0), bottom_offset=(0.0, 0.0), *,
+                        stage_enabled=True,
+                        chain_root_stage=False,
+                        chain_input_offset=(0.0, 0.0, 0.0),
+                        chain_input_frame=None,
+                        chain_output_frame=None,
+                        chain_source_start=None,
+                        chain_profile_after_end=False,
+                        chain_profile_gap_distance=0.0,
+                        deform_types=None, bend_strength=None,
+                        bend_direction=None, twist_strength=None,
+                        taper_factor=None, stretch_factor=None,
+                        shear_factors=(0.0, 0.0), ffd_offsets=(),
+                        deform_order=None, curve_deformer=None,
+                        _prepared=False):
+    """Decode ``deform_point_local`` stage arguments into a :class:`DeformPlan`.
+
+    Accepts the reference evaluator's arguments except the per-point
+    ``chain_eligible`` and ``chain_source_coordinate`` values, which are
+    supplied to :func:`evaluate` instead.
+    """
+    size = tuple(max(abs(float(value)), EPSILON) for value in size)
+    enabled, operation_order = _decode_operations(
+        deform_type, deform_types, deform_order, _prepared)
+    (
+        bend_strength, bend_direction, twist_strength, taper_factor,
+        stretch_factor, shear_factors,
+    ) = _decode_parameters(
+        deform_type, strength, factor, direction, bend_strength,
+        bend_direction, twist_strength, taper_factor, stretch_factor,
+        shear_factors)
+    half = tuple(value * 0.5 for value in size)
+    origin_y = {
+        "BOTTOM": -half[1],
         "CENTER": 0.0,
         "SYMMETRIC": 0.0,
-        "TOP": half.y,
+        "TOP": half[1],
     }[origin]
-    # CHAINED uses the authored Origin for the local deformation reference.
-    # The root continues from both outer ends, while downstream eligibility
-    # remains one-sided so later stages cannot modify the incoming prefix.
-    origin_y = configured_origin_y
-    lower = -half.y - origin_y
-    upper = half.y - origin_y
-
-    # A non-root chain stage is framed from its evaluated lower boundary.
-    # That boundary is not necessarily a fixed point for TOP/CENTER/
-    # SYMMETRIC origins.  The inverse chain input frame maps an incoming seam
-    # back to the authored lower boundary before evaluating this stage,
-    # preventing the boundary deformation from being applied twice.
-    chain_output = None
-    if mode == "CHAINED" and chain_eligible:
+
+    input_frame = None
+    input_offset = (0.0, 0.0, 0.0)
+    output_frame = None
+    if mode == "CHAINED":
         if chain_input_frame is not None:
             try:
-                pivot, inverse_x, inverse_y, inverse_z = (
-                    Vector(value) for value in chain_input_frame)
-                delta = point - pivot
-                point = Vector((
-                    delta.dot(inverse_x),
-                    delta.dot(inverse_y) - half.y,
-                    delta.dot(inverse_z),
-                ))
+                input_frame = _frame_rows(chain_input_frame)
             except (TypeError, ValueError, RuntimeError):
-                point = raw_point.copy()
+                # An unreadable frame evaluates the raw incoming point.
+                input_frame = False
         else:
             try:
-                offset = Vector(chain_input_offset)
+                input_offset = tuple(
+                    float(value) for value in chain_input_offset)
             except (TypeError, ValueError):
-                offset = Vector((0.0, 0.0, 0.0))
-            if len(offset) != 3 or not all(math.isfinite(value) for value in offset):
-                offset = Vector((0.0, 0.0, 0.0))
-            point -= offset
+                input_offset = ()
+            if (
+                    len(input_offset) != 3 or
+                    not all(math.isfinite(value) for value in input_offset)
+            ):
+                input_offset = (0.0, 0.0, 0.0)
         if chain_output_frame is not None:
             try:
-                output_offset, output_x, output_y, output_z = (
-                    Vector(value) for value in chain_output_frame)
+                output_frame = _frame_rows(chain_output_frame)
                 if not all(
-                        math.isfinite(component)
-                        for vector in (
-                            output_offset, output_x, output_y, output_z)
-                        for component in vector
+                        math.isfinite(value)
+                        for row in output_frame for value in row
                 ):
                     raise ValueError("non-finite chain output frame")
-                chain_output = (
-                    output_offset, output_x, output_y, output_z)
             except (TypeError, ValueError, RuntimeError):
-                chain_output = None
-
-    # A chained stage receives an already-deformed spatial Y from upstream,
-    # but a mixed Bend stage must evaluate its profile in the original source
-    # coordinate.  Geometry Nodes carries that coordinate through the point
-    # domain; the optional arguments keep the Python reference evaluator and
-    # frame sampling on the same authored axis.  Pure Bend remains on the
-    # post-frame local Y path because its axial composition is intentionally
-    # spatial.
-    authored_y_input = point.y
+                output_frame = None
+
+    stretch_scale = 1.0 + stretch_factor
+    ffd_rows = None
+    if "FFD" in enabled:
+        ffd_rows = tuple(
+            tuple(offset) for offset in normalized_ffd_offsets(ffd_offsets))
+    return DeformPlan(
+        stage_enabled=bool(stage_enabled),
+        size=size,
+        half=half,
+        mode=mode,
+        origin=origin,
+        origin_y=origin_y,
+        lower=-half[1] - origin_y,
+        upper=half[1] - origin_y,
+        top_scale=tuple(float(value) for value in top_scale),
+        bottom_scale=tuple(float(value) for value in bottom_scale),
+        top_offset=tuple(float(value) for value in top_offset),
+        bottom_offset=tuple(float(value) for value in bottom_offset),
+        chain_root_stage=bool(chain_root_stage),
+        chain_input_frame=input_frame,
+        chain_input_offset=input_offset,
+        chain_output_frame=output_frame,
+        chain_source_start=(
+            0.0 if chain_source_start is None else chain_source_start),
+        enabled=frozenset(enabled),
+        operation_order=tuple(operation_order),
+        bend_active=abs(bend_strength) >= EPSILON,
+        bend_cos=math.cos(bend_direction),
+        bend_sin=math.sin(bend_direction),
+        bend_curvature=bend_strength / size[1],
+        twist_strength=twist_strength,
+        taper_factor=taper_factor,
+        stretch_scale=stretch_scale,
+        stretch_volume_scale=(
+            max(abs(stretch_scale), EPSILON) ** -0.5
+            if preserve_volume else 1.0),
+        shear_factors=shear_factors,
+        ffd_offsets=ffd_rows,
+        curve_deformer=curve_deformer,
+    )
+
+
+def evaluate(plan, points, *, chain_eligible=True,
+             chain_source_coordinate=None):
+    """Evaluate a compiled :class:`DeformPlan` for an ``(N, 3)`` point array.
+
+    Every operation runs as one whole-array expression.  ``chain_eligible``
+    and ``chain_source_coordinate`` may be scalars or one value per point.
+    Only CURVE falls back to a per-point call, because its deformer is an
+    arbitrary callable.
+    """
+    raw = _point_array(points)
+    count = len(raw)
+    if not plan.stage_enabled or count == 0:
+        return raw
+    point = raw
+    size = plan.size
+    half = plan.half
+    mode = plan.mode
+    origin = plan.origin
+    origin_y = plan.origin_y
+    enabled = plan.enabled
+    operation_order = plan.operation_order
+    eligible = np.broadcast_to(
+        np.asarray(chain_eligible, dtype=bool), (count,))
+    # Rows in ``passthrough`` return their raw input, mirroring each early
+    # ``return raw_point.copy()`` of the scalar reference.
+    passthrough = np.zeros(count, dtype=bool)
+
+    chain_output = None
+    if mode == "CHAINED":
+        frame = plan.chain_input_frame
+        if frame is None:
+            point = raw - plan.chain_input_offset
+        elif frame is not False:
+            frame = np.array(frame)
+            delta = raw - frame[0]
+            point = np.stack((
+                delta @ frame[1],
+                delta @ frame[2] - half[1],
+                delta @ frame[3],
+            ), axis=1)
+        chain_output = plan.chain_output_frame
+        # Ineligible rows return their raw input, so the input frame only
+        # needs to be correct for the eligible subset.
+        passthrough |= ~eligible
+
+    authored_y_input = point[:, 1].copy()
     mixed_chain_source = (
         mode == "CHAINED" and
         chain_source_coordinate is not None and
@@ -193,178 +339,747 @@ def deform_point_local(point, size, deform_type="BEND", strength=0.0,
     )
     if mixed_chain_source:
         try:
-            source_start = float(
-                0.0 if chain_source_start is None else chain_source_start)
-            authored_y_input = (
-                float(chain_source_coordinate) - source_start - half.y)
-            if not math.isfinite(authored_y_input):
-                authored_y_input = point.y
+            source = np.broadcast_to(np.asarray(
+                chain_source_coordinate, dtype=np.float64), (count,))
+            source = source - float(plan.chain_source_start) - half[1]
+            authored_y_input = np.where(
+                np.isfinite(source), source, authored_y_input)
         except (TypeError, ValueError, OverflowError):
-            authored_y_input = point.y
+            pass
 
     distance = authored_y_input - origin_y
+    if mode == "WITHIN_BOX":
+        inside = (
+            (np.abs(point[:, 0]) <= half[0]) &
+            (np.abs(authored_y_input) <= half[1]) &
+            (np.abs(point[:, 2]) <= half[2])
+        )
+        passthrough |= ~inside
 
-    inside = (
-        abs(point.x) <= half.x and
-        abs(authored_y_input) <= half.y and
-        abs(point.z) <= half.z
-    )
-    if mode == "WITHIN_BOX" and not inside:
-        return raw_point.copy()
-    if mode == "CHAINED" and not chain_eligible:
-        return raw_point.copy()
-
-    frame_t = (authored_y_input + half.y) / size.y
+    frame_t = (authored_y_input + half[1]) / size[1]
     if mode != "UNLIMITED":
-        frame_t = min(max(frame_t, 0.0), 1.0)
+        frame_t = np.clip(frame_t, 0.0, 1.0)
+    top_scale, bottom_scale = plan.top_scale, plan.bottom_scale
+    top_offset, bottom_offset = plan.top_offset, plan.bottom_offset
     scale_x = bottom_scale[0] + (top_scale[0] - bottom_scale[0]) * frame_t
     scale_z = bottom_scale[1] + (top_scale[1] - bottom_scale[1]) * frame_t
     offset_x = bottom_offset[0] + (top_offset[0] - bottom_offset[0]) * frame_t
     offset_z = bottom_offset[1] + (top_offset[1] - bottom_offset[1]) * frame_t
-    result = Vector((
-        point.x * scale_x + offset_x,
-        point.y,
-        point.z * scale_z + offset_z,
-    ))
+    result = np.stack((
+        point[:, 0] * scale_x + offset_x,
+        point[:, 1],
+        point[:, 2] * scale_z + offset_z,
+    ), axis=1)
 
     evaluated_distance = distance
-    outside_distance = 0.0
+    outside_distance = np.zeros(count)
     if mode == "LIMITED":
-        evaluated_distance = min(max(distance, lower), upper)
+        evaluated_distance = np.clip(distance, plan.lower, plan.upper)
         outside_distance = distance - evaluated_distance
     elif mode == "CHAINED":
-        # Downstream stages preserve their incoming prefix. The root instead
-        # extends its lower boundary frame over geometry exposed by an inward
-        # boundary edit, matching the normal LIMITED end continuation.
-        if (
-                not chain_root_stage and
-                distance < lower - CHAIN_BOUNDARY_EPSILON
-        ):
-            return raw_point.copy()
-        evaluated_distance = min(max(distance, lower), upper)
+        if not plan.chain_root_stage:
+            passthrough |= distance < plan.lower - CHAIN_BOUNDARY_EPSILON
+        evaluated_distance = np.clip(distance, plan.lower, plan.upper)
         outside_distance = (
             distance - evaluated_distance
-            if chain_root_stage else
-            max(distance - upper, 0.0)
+            if plan.chain_root_stage else
+            np.maximum(distance - plan.upper, 0.0)
         )
 
-    # A connected stage carries its terminal frame beyond the cage without
-    # adding deformation in an authored gap.  Keep the compatibility
-    # arguments in the public reference API, but clamp every profile at the
-    # cage boundary.
-    profile_outside_distance = 0.0
-    profile_distance_input = evaluated_distance
     profile_distance = (
-        abs(profile_distance_input)
-        if origin == "SYMMETRIC" else profile_distance_input
+        np.abs(evaluated_distance)
+        if origin == "SYMMETRIC" else evaluated_distance
     )
-    profile = profile_distance / size.y
+    profile = profile_distance / size[1]
 
     def apply_chain_output(value):
         nonlocal chain_output
         if chain_output is None:
             return value
-        output_offset, output_x, output_y, output_z = chain_output
+        output = np.array(chain_output)
         chain_output = None
-        return Vector((
-            value.dot(output_x) + output_offset.x,
-            value.dot(output_y) + output_offset.y,
-            value.dot(output_z) + output_offset.z,
-        ))
+        return value @ output[1:].T + output[0]
 
     for operation in operation_order:
-        if operation == "BEND" and abs(bend_strength) >= EPSILON:
-            cos_direction = math.cos(bend_direction)
-            sin_direction = math.sin(bend_direction)
-            u = cos_direction * result.x + sin_direction * result.z
-            v = -sin_direction * result.x + cos_direction * result.z
-            curvature = bend_strength / size.y
+        if operation == "BEND" and plan.bend_active:
+            cos_direction = plan.bend_cos
+            sin_direction = plan.bend_sin
+            u = cos_direction * result[:, 0] + sin_direction * result[:, 2]
+            v = -sin_direction * result[:, 0] + cos_direction * result[:, 2]
+            curvature = np.full(count, plan.bend_curvature)
+            if origin == "SYMMETRIC":
+                curvature = np.where(
+                    authored_y_input < 0.0, -curvature, curvature)
+            radius = 1.0 / curvature
+            theta = curvature * evaluated_distance
+            cosine = np.cos(theta)
+            sine = np.sin(theta)
+            radial = radius + u
+            deformed_u = radial * cosine - radius - sine * outside_distance
+            authored_y = (
+                origin_y + radial * sine + cosine * outside_distance)
+            result = np.stack((
+                cos_direction * deformed_u - sin_direction * v,
+                result[:, 1] + authored_y - authored_y_input,
+                sin_direction * deformed_u + cos_direction * v,
+            ), axis=1)
+        elif operation == "TWIST":
+            theta = plan.twist_strength * profile
+            cosine = np.cos(theta)
+            sine = np.sin(theta)
+            result = np.stack((
+                cosine * result[:, 0] - sine * result[:, 2],
+                result[:, 1],
+                sine * result[:, 0] + cosine * result[:, 2],
+            ), axis=1)
+        elif operation == "TAPER":
+            scale = 1.0 + plan.taper_factor * profile
+            result = result * np.stack(
+                (scale, np.ones(count), scale), axis=1)
+        elif operation == "STRETCH":
+            authored_y = (
+                origin_y + evaluated_distance * plan.stretch_scale +
+                outside_distance)
+            volume_scale = plan.stretch_volume_scale
+            result = np.stack((
+                result[:, 0] * volume_scale,
+                result[:, 1] + authored_y - authored_y_input,
+                result[:, 2] * volume_scale,
+            ), axis=1)
+        elif operation == "SHEAR":
+            shear_x, shear_z = plan.shear_factors
+            result = np.stack((
+                result[:, 0] + shear_x * profile_distance,
+                result[:, 1],
+                result[:, 2] + shear_z * profile_distance,
+            ), axis=1)
+        elif operation == "FFD":
+            u = point[:, 0] / max(size[0], EPSILON) + 0.5
+            v = frame_t
+            w = point[:, 2] / max(size[2], EPSILON) + 0.5
+            if mode != "UNLIMITED":
+                u = np.clip(u, 0.0, 1.0)
+                w = np.clip(w, 0.0, 1.0)
+            displacement = np.zeros((count, 3))
+            for offset, (_label, x_sign, y_sign, z_sign) in zip(
+                    plan.ffd_offsets, FFD_CORNERS):
+                weight = (
+                    (u if x_sign > 0.0 else 1.0 - u) *
+                    (v if y_sign > 0.0 else 1.0 - v) *
+                    (w if z_sign > 0.0 else 1.0 - w)
+                )
+                displacement += weight[:, None] * offset
+            result = result + displacement
+        elif operation == "CURVE" and plan.curve_deformer is not None:
+            curve_size = Vector(size)
+            for index in np.flatnonzero(~passthrough):
+                try:
+                    result[index] = tuple(plan.curve_deformer(
+                        Vector(result[index]),
+                        float(authored_y_input[index]),
+                        curve_size,
+                    ))
+                except (AttributeError, ReferenceError, RuntimeError,
+                        TypeError, ValueError, OverflowError):
+                    pass
+
+        if operation == "BEND":
+            result = apply_chain_output(result)
+
+    result = apply_chain_output(result)
+    result[passthrough] = raw[passthrough]
+    return result
+
+
+def evaluate_point(plan, point, *, chain_eligible=True,
+                   chain_source_coordinate=None):
+    """Evaluate one point from a compiled :class:`DeformPlan`.
+
+    The single-point counterpart of :func:`evaluate`.  It runs on plain
+    floats because one point is far below the size where NumPy's per-call
+    overhead pays off; see :func:`evaluate_with_jacobian` for the same path
+    with derivatives.
+    """
+    raw = tuple(float(value) for value in point)
+    if not plan.stage_enabled:
+        return Vector(raw)
+    size = plan.size
+    half = plan.half
+    mode = plan.mode
+    origin = plan.origin
+    origin_y = plan.origin_y
+    local = raw
+    chain_output = None
+    if mode == "CHAINED":
+        if not chain_eligible:
+            return Vector(raw)
+        frame = plan.chain_input_frame
+        if frame is None:
+            offset = plan.chain_input_offset
+            local = (
+                raw[0] - offset[0], raw[1] - offset[1], raw[2] - offset[2])
+        elif frame is not False:
+            pivot, axis_x, axis_y, axis_z = frame
+            delta = (raw[0] - pivot[0], raw[1] - pivot[1], raw[2] - pivot[2])
+            local = (
+                delta[0] * axis_x[0] + delta[1] * axis_x[1] +
+                delta[2] * axis_x[2],
+                delta[0] * axis_y[0] + delta[1] * axis_y[1] +
+                delta[2] * axis_y[2] - half[1],
+                delta[0] * axis_z[0] + delta[1] * axis_z[1] +
+                delta[2] * axis_z[2],
+            )
+        chain_output = plan.chain_output_frame
+
+    authored_y_input = local[1]
+    if (
+            mode == "CHAINED" and
+            chain_source_coordinate is not None and
+            "BEND" in plan.enabled and
+            any(operation != "BEND" for operation in plan.operation_order)
+    ):
+        try:
+            source = (
+                float(chain_source_coordinate) -
+                float(plan.chain_source_start) - half[1])
+            if math.isfinite(source):
+                authored_y_input = source
+        except (TypeError, ValueError, OverflowError):
+            pass
+
+    distance = authored_y_input - origin_y
+    if mode == "WITHIN_BOX" and not (
+            abs(local[0]) <= half[0] and
+            abs(authored_y_input) <= half[1] and
+            abs(local[2]) <= half[2]
+    ):
+        return Vector(raw)
+    if (
+            mode == "CHAINED" and
+            not plan.chain_root_stage and
+            distance < plan.lower - CHAIN_BOUNDARY_EPSILON
+    ):
+        return Vector(raw)
+
+    frame_t = (authored_y_input + half[1]) / size[1]
+    if mode != "UNLIMITED":
+        frame_t = min(max(frame_t, 0.0), 1.0)
+    top_scale, bottom_scale = plan.top_scale, plan.bottom_scale
+    top_offset, bottom_offset = plan.top_offset, plan.bottom_offset
+    x = local[0] * (
+        bottom_scale[0] + (top_scale[0] - bottom_scale[0]) * frame_t) + (
+        bottom_offset[0] + (top_offset[0] - bottom_offset[0]) * frame_t)
+    y = local[1]
+    z = local[2] * (
+        bottom_scale[1] + (top_scale[1] - bottom_scale[1]) * frame_t) + (
+        bottom_offset[1] + (top_offset[1] - bottom_offset[1]) * frame_t)
+
+    evaluated_distance = distance
+    outside_distance = 0.0
+    if mode == "LIMITED":
+        evaluated_distance = min(max(distance, plan.lower), plan.upper)
+        outside_distance = distance - evaluated_distance
+    elif mode == "CHAINED":
+        evaluated_distance = min(max(distance, plan.lower), plan.upper)
+        outside_distance = (
+            distance - evaluated_distance
+            if plan.chain_root_stage else
+            max(distance - plan.upper, 0.0)
+        )
+    profile_distance = (
+        abs(evaluated_distance)
+        if origin == "SYMMETRIC" else evaluated_distance
+    )
+    profile = profile_distance / size[1]
+
+    for operation in plan.operation_order:
+        if operation == "BEND" and plan.bend_active:
+            cos_direction = plan.bend_cos
+            sin_direction = plan.bend_sin
+            u = cos_direction * x + sin_direction * z
+            v = -sin_direction * x + cos_direction * z
+            curvature = plan.bend_curvature
             if origin == "SYMMETRIC" and authored_y_input < 0.0:
                 curvature = -curvature
             radius = 1.0 / curvature
-            bend_evaluated_distance = (
-                evaluated_distance + profile_outside_distance)
-            bend_outside_distance = (
-                outside_distance - profile_outside_distance)
-            theta = curvature * bend_evaluated_distance
+            theta = curvature * evaluated_distance
             cosine = math.cos(theta)
             sine = math.sin(theta)
             radial = radius + u
-            deformed_u = (
-                radial * cosine - radius - sine * bend_outside_distance)
-            authored_y = (
-                origin_y + radial * sine +
-                cosine * bend_outside_distance)
-            result = Vector((
-                cos_direction * deformed_u - sin_direction * v,
-                result.y + authored_y - authored_y_input,
-                sin_direction * deformed_u + cos_direction * v,
-            ))
+            deformed_u = radial * cosine - radius - sine * outside_distance
+            authored_y = origin_y + radial * sine + cosine * outside_distance
+            x = cos_direction * deformed_u - sin_direction * v
+            y = y + authored_y - authored_y_input
+            z = sin_direction * deformed_u + cos_direction * v
         elif operation == "TWIST":
-            theta = twist_strength * profile
+            theta = plan.twist_strength * profile
             cosine = math.cos(theta)
             sine = math.sin(theta)
-            result = Vector((
-                cosine * result.x - sine * result.z,
-                result.y,
-                sine * result.x + cosine * result.z,
-            ))
+            x, z = cosine * x - sine * z, sine * x + cosine * z
         elif operation == "TAPER":
-            scale = 1.0 + taper_factor * profile
-            result = Vector((
-                result.x * scale, result.y, result.z * scale))
+            scale = 1.0 + plan.taper_factor * profile
+            x *= scale
+            z *= scale
         elif operation == "STRETCH":
-            scale = 1.0 + stretch_factor
-            # Preserve the endpoint displacement outside the cage without
-            # stretching an unowned chain gap.
-            stretch_outside = outside_distance
             authored_y = (
-                origin_y + evaluated_distance * scale + stretch_outside)
-            # Axial stretch is uniform over the stage.  Use that same
-            # constant for volume preservation in chained stages so a
-            # subdivided chain does not introduce artificial transverse
-            # scaling at each seam.
-            volume_scale_factor = scale
-            volume_scale = (
-                max(abs(volume_scale_factor), EPSILON) ** -0.5
-                if preserve_volume else 1.0)
-            result = Vector((
-                result.x * volume_scale,
-                result.y + authored_y - authored_y_input,
-                result.z * volume_scale,
-            ))
+                origin_y + evaluated_distance * plan.stretch_scale +
+                outside_distance)
+            volume_scale = plan.stretch_volume_scale
+            x *= volume_scale
+            y = y + authored_y - authored_y_input
+            z *= volume_scale
         elif operation == "SHEAR":
-            result = Vector((
-                result.x + shear_factors[0] * profile_distance,
-                result.y,
-                result.z + shear_factors[1] * profile_distance,
-            ))
+            shear_x, shear_z = plan.shear_factors
+            x += shear_x * profile_distance
+            z += shear_z * profile_distance
         elif operation == "FFD":
-            u = point.x / max(size.x, EPSILON) + 0.5
-            v = frame_t
-            w = point.z / max(size.z, EPSILON) + 0.5
+            u = local[0] / max(size[0], EPSILON) + 0.5
+            w = local[2] / max(size[2], EPSILON) + 0.5
             if mode != "UNLIMITED":
                 u = min(max(u, 0.0), 1.0)
                 w = min(max(w, 0.0), 1.0)
-            displacement = Vector((0.0, 0.0, 0.0))
+            v = frame_t
             for offset, (_label, x_sign, y_sign, z_sign) in zip(
-                    ffd_offset_vectors, FFD_CORNERS):
+                    plan.ffd_offsets, FFD_CORNERS):
                 weight = (
                     (u if x_sign > 0.0 else 1.0 - u) *
                     (v if y_sign > 0.0 else 1.0 - v) *
                     (w if z_sign > 0.0 else 1.0 - w)
                 )
-                displacement += offset * weight
-            result += displacement
-        elif operation == "CURVE" and curve_deformer is not None:
+                x += offset[0] * weight
+                y += offset[1] * weight
+                z += offset[2] * weight
+        elif operation == "CURVE" and plan.curve_deformer is not None:
             try:
-                result = Vector(curve_deformer(
-                    result, authored_y_input, size))
+                x, y, z = (float(value) for value in plan.curve_deformer(
+                    Vector((x, y, z)), authored_y_input, Vector(size)))
             except (AttributeError, ReferenceError, RuntimeError, TypeError,
                     ValueError, OverflowError):
                 pass
 
+        if operation == "BEND" and chain_output is not None:
+            x, y, z = _apply_frame_rows(chain_output, x, y, z)
+            chain_output = None
+
+    if chain_output is not None:
+        x, y, z = _apply_frame_rows(chain_output, x, y, z)
+    return Vector((x, y, z))
+
+
+def _apply_frame_rows(frame, x, y, z):
+    """Map one local point through a plain-float chain output frame."""
+    offset, axis_x, axis_y, axis_z = frame
+    return (
+        axis_x[0] * x + axis_x[1] * y + axis_x[2] * z + offset[0],
+        axis_y[0] * x + axis_y[1] * y + axis_y[2] * z + offset[1],
+        axis_z[0] * x + axis_z[1] * y + axis_z[2] * z + offset[2],
+    )
+
+
+def deform_points_local(points, size, *args, chain_eligible=True,
+                        chain_source_coordinate=None, **kwargs):
+    """Evaluate ``deform_point_local`` for an ``(N, 3)`` array of points.
+
+    The stage arguments are those of the scalar reference; they are compiled
+    into one :class:`DeformPlan` for the whole batch.
+    """
+    return evaluate(
+        compile_deform_plan(size, *args, **kwargs),
+        points,
+        chain_eligible=chain_eligible,
+        chain_source_coordinate=chain_source_coordinate,
+    )
+
+
+_ZERO_GRADIENT = (0.0, 0.0, 0.0)
+_IDENTITY_ROWS = ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))
+
+
+def _combine(first_scale, first, second_scale=0.0, second=_ZERO_GRADIENT,
+             third_scale=0.0, third=_ZERO_GRADIENT):
+    """Return a linear combination of up to three gradient tuples."""
+    return (
+        first_scale * first[0] + second_scale * second[0] +
+        third_scale * third[0],
+        first_scale * first[1] + second_scale * second[1] +
+        third_scale * third[1],
+        first_scale * first[2] + second_scale * second[2] +
+        third_scale * third[2],
+    )
+
+
+def _clamped_gradient(value, gradient, lower, upper):
+    """Return ``gradient`` inside ``[lower, upper]`` and zero outside it.
+
+    Bounds are inclusive so a point on a cage face keeps the one-sided
+    interior derivative, as the finite-difference gizmo sampling did.
+    """
+    return gradient if lower <= value <= upper else _ZERO_GRADIENT
+
+
+def evaluate_with_jacobian(plan, point, *, chain_eligible=True,
+                           chain_source_coordinate=None):
+    """Evaluate one point and its ``3x3`` Jacobian from a :class:`DeformPlan`.
+
+    Every operation carries its closed-form derivative through the plan's
+    operation order, including the chain input and output frames.  Clamped
+    ranges contribute a zero derivative outside the cage.  A mixed-chain
+    ``chain_source_coordinate`` is treated as independent of ``point``.
+    CURVE is the only operation without a closed form; its arbitrary
+    deformer is differentiated by central differences.
+
+    The math runs on plain floats because a single point is far below the
+    size where NumPy's per-call overhead pays off.  Returns
+    ``(Vector, Matrix)`` where column ``j`` of the matrix is the derivative
+    of the deformed point along local axis ``j``.
+    """
+    from mathutils import Matrix
+
+    raw = tuple(float(value) for value in point)
+
+    def passthrough():
+        return Vector(raw), Matrix(_IDENTITY_ROWS)
+
+    if not plan.stage_enabled:
+        return passthrough()
+    size = plan.size
+    half = plan.half
+    mode = plan.mode
+    origin = plan.origin
+    origin_y = plan.origin_y
+    # ``jacobian`` rows are the gradients of the transformed local point.
+    local = raw
+    jacobian = _IDENTITY_ROWS
+    chain_output = None
+    if mode == "CHAINED":
+        if not chain_eligible:
+            return passthrough()
+        frame = plan.chain_input_frame
+        if frame is None:
+            offset = plan.chain_input_offset
+            local = (
+                raw[0] - offset[0], raw[1] - offset[1], raw[2] - offset[2])
+        elif frame is not False:
+            rows = frame[1:]
+            pivot = frame[0]
+            delta = (raw[0] - pivot[0], raw[1] - pivot[1], raw[2] - pivot[2])
+            local = (
+                sum(a * b for a, b in zip(delta, rows[0])),
+                sum(a * b for a, b in zip(delta, rows[1])) - half[1],
+                sum(a * b for a, b in zip(delta, rows[2])),
+            )
+            jacobian = rows
+        chain_output = plan.chain_output_frame
+
+    authored_y_input = local[1]
+    authored_gradient = jacobian[1]
+    if (
+            mode == "CHAINED" and
+            chain_source_coordinate is not None and
+            "BEND" in plan.enabled and
+            any(operation != "BEND" for operation in plan.operation_order)
+    ):
+        try:
+            source = (
+                float(chain_source_coordinate) -
+                float(plan.chain_source_start) - half[1])
+            if math.isfinite(source):
+                authored_y_input = source
+                authored_gradient = _ZERO_GRADIENT
+        except (TypeError, ValueError, OverflowError):
+            pass
+
+    distance = authored_y_input - origin_y
+    if mode == "WITHIN_BOX" and not (
+            abs(local[0]) <= half[0] and
+            abs(authored_y_input) <= half[1] and
+            abs(local[2]) <= half[2]
+    ):
+        return passthrough()
+    if (
+            mode == "CHAINED" and
+            not plan.chain_root_stage and
+            distance < plan.lower - CHAIN_BOUNDARY_EPSILON
+    ):
+        return passthrough()
+
+    frame_t = (authored_y_input + half[1]) / size[1]
+    frame_gradient = _combine(1.0 / size[1], authored_gradient)
+    if mode != "UNLIMITED":
+        frame_gradient = _clamped_gradient(
+            frame_t, frame_gradient, 0.0, 1.0)
+        frame_t = min(max(frame_t, 0.0), 1.0)
+    top_scale, bottom_scale = plan.top_scale, plan.bottom_scale
+    top_offset, bottom_offset = plan.top_offset, plan.bottom_offset
+    scale_x = bottom_scale[0] + (top_scale[0] - bottom_scale[0]) * frame_t
+    scale_z = bottom_scale[1] + (top_scale[1] - bottom_scale[1]) * frame_t
+    offset_x = bottom_offset[0] + (top_offset[0] - bottom_offset[0]) * frame_t
+    offset_z = bottom_offset[1] + (top_offset[1] - bottom_offset[1]) * frame_t
+    result = (
+        local[0] * scale_x + offset_x,
+        local[1],
+        local[2] * scale_z + offset_z,
+    )
+    result_jacobian = (
+        _combine(
+            scale_x, jacobian[0],
+            local[0] * (top_scale[0] - bottom_scale[0]) +
+            top_offset[0] - bottom_offset[0], frame_gradient),
+        jacobian[1],
+        _combine(
+            scale_z, jacobian[2],
+            local[2] * (top_scale[1] - bottom_scale[1]) +
+            top_offset[1] - bottom_offset[1], frame_gradient),
+    )
+
+    evaluated_distance = distance
+    evaluated_gradient = authored_gradient
+    outside_distance = 0.0
+    outside_gradient = _ZERO_GRADIENT
+    if mode in {"LIMITED", "CHAINED"}:
+        evaluated_distance = min(max(distance, plan.lower), plan.upper)
+        evaluated_gradient = _clamped_gradient(
+            distance, authored_gradient, plan.lower, plan.upper)
+        if mode == "LIMITED" or plan.chain_root_stage:
+            outside_distance = distance - evaluated_distance
+            outside_gradient = _combine(
+                1.0, authored_gradient, -1.0, evaluated_gradient)
+        elif distance > plan.upper:
+            outside_distance = distance - plan.upper
+            outside_gradient = authored_gradient
+
+    profile_distance = evaluated_distance
+    profile_distance_gradient = evaluated_gradient
+    if origin == "SYMMETRIC":
+        profile_distance = abs(evaluated_distance)
+        if evaluated_distance < 0.0:
+            profile_distance_gradient = _combine(-1.0, evaluated_gradient)
+    profile = profile_distance / size[1]
+    profile_gradient = _combine(1.0 / size[1], profile_distance_gradient)
+
+    def apply_chain_output(value, value_jacobian):
+        nonlocal chain_output
+        if chain_output is None:
+            return value, value_jacobian
+        output = chain_output
+        chain_output = None
+        return (
+            tuple(
+                row[0] * value[0] + row[1] * value[1] + row[2] * value[2] +
+                output[0][axis]
+                for axis, row in enumerate(output[1:])),
+            tuple(
+                _combine(row[0], value_jacobian[0], row[1],
+                         value_jacobian[1], row[2], value_jacobian[2])
+                for row in output[1:]),
+        )
+
+    for operation in plan.operation_order:
+        if operation == "BEND" and plan.bend_active:
+            cos_direction = plan.bend_cos
+            sin_direction = plan.bend_sin
+            u = cos_direction * result[0] + sin_direction * result[2]
+            v = -sin_direction * result[0] + cos_direction * result[2]
+            u_gradient = _combine(
+                cos_direction, result_jacobian[0],
+                sin_direction, result_jacobian[2])
+            v_gradient = _combine(
+                -sin_direction, result_jacobian[0],
+                cos_direction, result_jacobian[2])
+            curvature = plan.bend_curvature
+            if origin == "SYMMETRIC" and authored_y_input < 0.0:
+                curvature = -curvature
+            radius = 1.0 / curvature
+            theta = curvature * evaluated_distance
+            cosine = math.cos(theta)
+            sine = math.sin(theta)
+            radial = radius + u
+            deformed_u = radial * cosine - radius - sine * outside_distance
+            deformed_u_gradient = _combine(
+                cosine, u_gradient,
+                -(radial * sine + cosine * outside_distance) * curvature,
+                evaluated_gradient,
+                -sine, outside_gradient)
+            authored_y = origin_y + radial * sine + cosine * outside_distance
+            authored_y_gradient = _combine(
+                sine, u_gradient,
+                (radial * cosine - sine * outside_distance) * curvature,
+                evaluated_gradient,
+                cosine, outside_gradient)
+            result = (
+                cos_direction * deformed_u - sin_direction * v,
+                result[1] + authored_y - authored_y_input,
+                sin_direction * deformed_u + cos_direction * v,
+            )
+            result_jacobian = (
+                _combine(cos_direction, deformed_u_gradient,
+                         -sin_direction, v_gradient),
+                _combine(1.0, result_jacobian[1], 1.0, authored_y_gradient,
+                         -1.0, authored_gradient),
+                _combine(sin_direction, deformed_u_gradient,
+                         cos_direction, v_gradient),
+            )
+        elif operation == "TWIST":
+            theta = plan.twist_strength * profile
+            cosine = math.cos(theta)
+            sine = math.sin(theta)
+            twisted_x = cosine * result[0] - sine * result[2]
+            twisted_z = sine * result[0] + cosine * result[2]
+            result_jacobian = (
+                _combine(cosine, result_jacobian[0], -sine,
+                         result_jacobian[2],
+                         -twisted_z * plan.twist_strength, profile_gradient),
+                result_jacobian[1],
+                _combine(sine, result_jacobian[0], cosine,
+                         result_jacobian[2],
+                         twisted_x * plan.twist_strength, profile_gradient),
+            )
+            result = (twisted_x, result[1], twisted_z)
+        elif operation == "TAPER":
+            scale = 1.0 + plan.taper_factor * profile
+            result_jacobian = (
+                _combine(scale, result_jacobian[0],
+                         result[0] * plan.taper_factor, profile_gradient),
+                result_jacobian[1],
+                _combine(scale, result_jacobian[2],
+                         result[2] * plan.taper_factor, profile_gradient),
+            )
+            result = (result[0] * scale, result[1], result[2] * scale)
+        elif operation == "STRETCH":
+            authored_y = (
+                origin_y + evaluated_distance * plan.stretch_scale +
+                outside_distance)
+            volume_scale = plan.stretch_volume_scale
+            result = (
+                result[0] * volume_scale,
+                result[1] + authored_y - authored_y_input,
+                result[2] * volume_scale,
+            )
+            result_jacobian = (
+                _combine(volume_scale, result_jacobian[0]),
+                _combine(
+                    1.0, _combine(
+                        1.0, result_jacobian[1],
+                        plan.stretch_scale, evaluated_gradient,
+                        1.0, outside_gradient),
+                    -1.0, authored_gradient),
+                _combine(volume_scale, result_jacobian[2]),
+            )
+        elif operation == "SHEAR":
+            shear_x, shear_z = plan.shear_factors
+            result = (
+                result[0] + shear_x * profile_distance,
+                result[1],
+                result[2] + shear_z * profile_distance,
+            )
+            result_jacobian = (
+                _combine(1.0, result_jacobian[0],
+                         shear_x, profile_distance_gradient),
+                result_jacobian[1],
+                _combine(1.0, result_jacobian[2],
+                         shear_z, profile_distance_gradient),
+            )
+        elif operation == "FFD":
+            u = local[0] / max(size[0], EPSILON) + 0.5
+            w = local[2] / max(size[2], EPSILON) + 0.5
+            u_gradient = _combine(1.0 / max(size[0], EPSILON), jacobian[0])
+            w_gradient = _combine(1.0 / max(size[2], EPSILON), jacobian[2])
+            if mode != "UNLIMITED":
+                u_gradient = _clamped_gradient(u, u_gradient, 0.0, 1.0)
+                w_gradient = _clamped_gradient(w, w_gradient, 0.0, 1.0)
+                u = min(max(u, 0.0), 1.0)
+                w = min(max(w, 0.0), 1.0)
+            v = frame_t
+            displacement = [0.0, 0.0, 0.0]
+            displacement_jacobian = [_ZERO_GRADIENT] * 3
+            for offset, (_label, x_sign, y_sign, z_sign) in zip(
+                    plan.ffd_offsets, FFD_CORNERS):
+                weight_u, slope_u = (
+                    (u, 1.0) if x_sign > 0.0 else (1.0 - u, -1.0))
+                weight_v, slope_v = (
+                    (v, 1.0) if y_sign > 0.0 else (1.0 - v, -1.0))
+                weight_w, slope_w = (
+                    (w, 1.0) if z_sign > 0.0 else (1.0 - w, -1.0))
+                weight = weight_u * weight_v * weight_w
+                weight_gradient = _combine(
+                    slope_u * weight_v * weight_w, u_gradient,
+                    weight_u * slope_v * weight_w, frame_gradient,
+                    weight_u * weight_v * slope_w, w_gradient)
+                for axis in range(3):
+                    component = offset[axis]
+                    displacement[axis] += component * weight
+                    displacement_jacobian[axis] = _combine(
+                        1.0, displacement_jacobian[axis],
+                        component, weight_gradient)
+            result = tuple(
+                result[axis] + displacement[axis] for axis in range(3))
+            result_jacobian = tuple(
+                _combine(1.0, result_jacobian[axis],
+                         1.0, displacement_jacobian[axis])
+                for axis in range(3))
+        elif operation == "CURVE" and plan.curve_deformer is not None:
+            result, result_jacobian = _curve_with_jacobian(
+                plan.curve_deformer, result, result_jacobian,
+                authored_y_input, authored_gradient, size)
+
         if operation == "BEND":
-            result = apply_chain_output(result)
+            result, result_jacobian = apply_chain_output(
+                result, result_jacobian)
+
+    result, result_jacobian = apply_chain_output(result, result_jacobian)
+    return Vector(result), Matrix(result_jacobian)
+
+
+def _curve_with_jacobian(deformer, value, value_jacobian, authored_y,
+                         authored_gradient, size):
+    """Apply a curve deformer and chain its central-difference derivative."""
+    curve_size = Vector(size)
+    step = max(max(size) * 1.0e-4, 1.0e-5)
+
+    def sample(axis=None, delta=0.0, authored_delta=0.0):
+        moved = list(value)
+        if axis is not None:
+            moved[axis] += delta
+        return tuple(float(component) for component in deformer(
+            Vector(moved), authored_y + authored_delta, curve_size))
+
+    try:
+        center = sample()
+        columns = [
+            tuple(
+                (after - before) / (2.0 * step)
+                for after, before in zip(
+                    sample(axis, step), sample(axis, -step)))
+            for axis in range(3)
+        ]
+        columns.append(tuple(
+            (after - before) / (2.0 * step)
+            for after, before in zip(
+                sample(authored_delta=step), sample(authored_delta=-step))))
+    except (AttributeError, ReferenceError, RuntimeError, TypeError,
+            ValueError, OverflowError):
+        return value, value_jacobian
+    return center, tuple(
+        _combine(
+            1.0, _combine(
+                columns[0][row], value_jacobian[0],
+                columns[1][row], value_jacobian[1],
+                columns[2][row], value_jacobian[2]),
+            columns[3][row], authored_gradient)
+        for row in range(3)
+    )
+
 
-    return apply_chain_output(result)
+def deform_point_local_with_jacobian(point, size, *args, chain_eligible=True,
+                                     chain_source_coordinate=None, **kwargs):
+    """Return ``deform_point_local`` and its local Jacobian in one evaluation.
+
+    Accepts the reference evaluator's arguments and returns
+    ``(Vector, Matrix)``; see :func:`evaluate_with_jacobian`.
+    """
+    return evaluate_with_jacobian(
+        compile_deform_plan(size, *args, **kwargs),
+        point,
+        chain_eligible=chain_eligible,
+        chain_source_coordinate=chain_source_coordinate,
+    )
@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 import gpu
-from gpu_extras.batch import batch_for_shader
 from mathutils import Vector
 
+from .gpu_batches import builtin_shader, cached_batch, draw_batch
 from .viewport import gizmo_depth_test
 
 
@@ -73,14 +73,21 @@ def _face_vertices(points, ratio):
 
 
 def draw_ffd_line_face_batches(
-        gizmo, entities, picked, world_points, groups, face_indices,
-        color_for=None):
+        gizmo, entities, picked, local_points, groups, face_indices,
+        color_for=None, *, matrix=None, signature=None):
     """Draw all FFD line and face controls using stable color buckets.
 
     The aggregate Gizmo owns every entity, so one ``color`` field cannot
     represent selected top/bottom groups at the same time.  ``color_for``
     lets the caller supply an entity palette while retaining batched GPU
     draws; the legacy palette remains the fallback for external callers.
+
+    ``local_points`` holds cage-local points, or is a callable returning
+    them, and is only read when a bucket must be tessellated.  ``matrix``
+    and the bucket color are applied at draw time.  A bucket's batch is
+    reused while ``signature`` and its entities are unchanged, so callers
+    must pass a signature that changes whenever the points, groups, or face
+    winding may; without one every bucket is rebuilt.
     """
     buckets = {}
     counts = {"LINE": 0, "FACE": 0}
@@ -92,46 +99,69 @@ def draw_ffd_line_face_batches(
         group = tuple(groups.get(tuple(entity), ()))
         if not group:
             continue
-        if mode == "LINE":
-            vertices = _line_vertices(
-                (world_points[index] for index in group),
-                getattr(gizmo, "ffd_line_length_ratio", 0.60),
-            )
-        else:
-            ordered = tuple(face_indices(
-                int(anchor), str(orientation), group))
-            vertices = _face_vertices(
-                (world_points[index] for index in ordered),
-                getattr(gizmo, "ffd_face_size_ratio", 0.35),
-            )
-        if not vertices:
-            continue
         highlighted = bool(gizmo.is_highlight and entity == picked)
         color = (
             tuple(color_for(entity, group, highlighted))
             if color_for is not None else _rgba(gizmo, highlighted)
         )
-        buckets.setdefault((mode, color), []).extend(vertices)
+        buckets.setdefault((mode, color), []).append((entity, group))
         counts[mode] += 1
 
-    shader = gpu.shader.from_builtin("UNIFORM_COLOR")
+    resolved = []
+
+    def points():
+        if not resolved:
+            resolved.append(
+                local_points() if callable(local_points) else local_points)
+        return resolved[0]
+
+    def tessellate(members, ratio):
+        vertices = []
+        for (anchor, mode, orientation), group in members:
+            if mode == "LINE":
+                vertices.extend(_line_vertices(
+                    (points()[index] for index in group), ratio))
+            else:
+                ordered = tuple(face_indices(
+                    int(anchor), str(orientation), group))
+                vertices.extend(_face_vertices(
+                    (points()[index] for index in ordered), ratio))
+        return {"pos": vertices}, None
+
+    # Slots are numbered per mode rather than keyed by color, so hovering
+    # only rebuilds the buckets whose entities changed and a selection
+    # change is caught by the caller's signature.
+    try:
+        owner = int(gizmo.as_pointer())
+    except (AttributeError, ReferenceError, RuntimeError, TypeError,
+            ValueError):
+        owner = id(gizmo)
+    base = object() if signature is None else signature
+    shader = builtin_shader("UNIFORM_COLOR")
     gpu.state.blend_set("ALPHA")
     gpu.state.depth_test_set(gizmo_depth_test())
     try:
         for mode in ("FACE", "LINE"):
             primitive = "TRIS" if mode == "FACE" else "LINES"
             if mode == "LINE":
+                ratio = getattr(gizmo, "ffd_line_length_ratio", 0.60)
                 gpu.state.line_width_set(max(
                     float(getattr(gizmo, "ffd_line_width", 1.0)), 1.0))
-            for (bucket_mode, color), vertices in tuple(buckets.items()):
+            else:
+                ratio = getattr(gizmo, "ffd_face_size_ratio", 0.35)
+            slot = 0
+            for (bucket_mode, color), members in tuple(buckets.items()):
                 if bucket_mode != mode:
                     continue
-                if not vertices:
-                    continue
-                batch = batch_for_shader(shader, primitive, {"pos": vertices})
-                shader.bind()
-                shader.uniform_float("color", color)
-                batch.draw(shader)
+                source = (base, float(ratio), tuple(
+                    entity for entity, _group in members))
+                batch = cached_batch(
+                    ("FFD_CONTROLS", owner, mode, slot), source,
+                    shader, primitive,
+                    lambda members=members, ratio=ratio: tessellate(
+                        members, ratio))
+                draw_batch(batch, shader, matrix, color)
+                slot += 1
     finally:
         gpu.state.line_width_set(1.0)
         gpu.state.depth_test_set("NONE")
@@ -7,6 +7,10 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
+
+from .lru_cache import BoundedLRUCache
+
 
 MIN_JACOBIAN_RATIO = 0.02
 SAFE_INTERPOLATION = "KEY_LINEAR"
@@ -44,22 +48,6 @@ def _mul(value, factor):
     return tuple(component * factor for component in value)
 
 
-def _dot(left, right):
-    return sum(a * b for a, b in zip(left, right))
-
-
-def _cross(left, right):
-    return (
-        left[1] * right[2] - left[2] * right[1],
-        left[2] * right[0] - left[0] * right[2],
-        left[0] * right[1] - left[1] * right[0],
-    )
-
-
-def _determinant(first, second, third):
-    return _dot(first, _cross(second, third))
-
-
 def _corner_indices(cell_u, cell_v, cell_w, resolution):
     u0, v0, w0 = cell_u, cell_v, cell_w
     u1, v1, w1 = u0 + 1, v0 + 1, w0 + 1
@@ -162,6 +150,155 @@ def _trilinear_jacobian(corners, sample):
     return tuple(tuple(value) for value in derivatives)
 
 
+_SAMPLE_WEIGHT_CACHE = BoundedLRUCache("ffd_guard.sample_weights", limit=8)
+
+
+def _sample_derivative_weights(samples):
+    """Return ``(S, 3, 8)`` corner weights of dP/d(s,t,r) per sample.
+
+    Row ``k`` of one sample holds the eight trilinear corner weights of the
+    derivative along local axis ``k``; see :func:`_trilinear_jacobian`.
+    """
+    samples = tuple(float(value) for value in samples)
+    cached = _SAMPLE_WEIGHT_CACHE.get(samples)
+    if cached is not None:
+        return cached
+    rows = []
+    for s in samples:
+        for t in samples:
+            for r in samples:
+                one = (1.0 - s, s)
+                two = (1.0 - t, t)
+                three = (1.0 - r, r)
+                d_s, d_t, d_r = [], [], []
+                # Corner order is (u, v, w) with each coordinate in {0, 1}.
+                for index in range(8):
+                    u = index & 1
+                    v = (index >> 1) & 1
+                    w = (index >> 2) & 1
+                    sign_u = 1.0 if u else -1.0
+                    sign_v = 1.0 if v else -1.0
+                    sign_w = 1.0 if w else -1.0
+                    d_s.append(sign_u * two[v] * three[w])
+                    d_t.append(one[u] * sign_v * three[w])
+                    d_r.append(one[u] * two[v] * sign_w)
+                rows.append((d_s, d_t, d_r))
+    weights = np.array(rows, dtype=np.float64).reshape(-1, 3, 8)
+    weights.setflags(write=False)
+    return _SAMPLE_WEIGHT_CACHE.put(samples, weights)
+
+
+def _cell_corner_indices(resolution, cells):
+    """Return a ``(C, 8)`` index array of the corners of each cell."""
+    return np.array(
+        tuple(_corner_indices(*cell, resolution) for cell in cells),
+        dtype=np.intp,
+    ).reshape(-1, 8)
+
+
+def _minimum_cell_determinant(corners, weights):
+    """Return the smallest sampled determinant over ``(C, 8, 3)`` corners.
+
+    All cells and samples are evaluated as one batched ``(C, S, 3, 3)``
+    determinant.  Non-finite corners or determinants return ``-inf``.
+    """
+    if len(corners) == 0:
+        return math.inf
+    with np.errstate(invalid="ignore", over="ignore"):
+        derivatives = _cell_derivatives(corners, weights)
+        determinants = _triple_product(
+            derivatives[..., 0, :],
+            derivatives[..., 1, :],
+            derivatives[..., 2, :],
+        )
+    if not np.all(np.isfinite(determinants)):
+        return -math.inf
+    return float(determinants.min())
+
+
+def _cell_derivatives(corners, weights):
+    """Return ``(C, S, 3, 3)`` rows dP/ds, dP/dt, dP/dr per cell sample."""
+    return (weights.reshape(-1, 8) @ corners).reshape(
+        len(corners), len(weights), 3, 3)
+
+
+def _triple_product(first, second, third):
+    return (first * np.cross(second, third)).sum(axis=-1)
+
+
+def _first_negative_fraction(coefficients):
+    """Return where each cubic ``c0 + c1 f + c2 f^2 + c3 f^3`` first drops
+    below zero on ``[0, 1]``, or ``inf`` when it stays non-negative.
+
+    ``coefficients`` has shape ``(M, 4)`` in ascending powers.  Roots come
+    from batched companion-matrix eigenvalues; leading coefficients that are
+    negligible against the others reduce the degree first.
+    """
+    coefficients = np.asarray(coefficients, dtype=np.float64)
+    result = np.full(len(coefficients), math.inf)
+    scale = np.maximum(np.abs(coefficients).max(axis=1), 1.0e-300)
+    tolerance = 1.0e-12 * scale
+    result[coefficients[:, 0] < -tolerance] = 0.0
+    # A sample sitting exactly on the limit fails for any positive step
+    # when it is already decreasing.
+    result[
+        (np.abs(coefficients[:, 0]) <= tolerance) &
+        (coefficients[:, 1] < 0.0)
+    ] = 0.0
+    pending = np.isinf(result)
+    for degree in (3, 2, 1):
+        rows = pending & (np.abs(coefficients[:, degree]) > tolerance)
+        pending &= ~rows
+        if not np.any(rows):
+            continue
+        selected = coefficients[rows, :degree + 1]
+        monic = selected[:, :degree] / selected[:, degree:degree + 1]
+        companion = np.zeros((len(selected), degree, degree))
+        companion[:, 1:, :-1] = np.eye(degree - 1)
+        companion[:, :, -1] = -monic
+        roots = np.linalg.eigvals(companion)
+        real = roots.real
+        valid = (
+            (np.abs(roots.imag) <= 1.0e-9 * np.maximum(np.abs(real), 1.0)) &
+            (real > 0.0) & (real <= 1.0)
+        )
+        result[rows] = np.where(valid, real, math.inf).min(axis=1)
+    return result
+
+
+def _analytic_safe_fraction(initial_corners, delta_corners, weights, limit):
+    """Solve the largest blend fraction keeping every sample above ``limit``.
+
+    Corners are affine in the fraction, so each sample determinant is a cubic
+    whose coefficients follow from the baseline and delta Jacobian rows.
+    """
+    with np.errstate(invalid="ignore", over="ignore"):
+        base = _cell_derivatives(initial_corners, weights).reshape(-1, 3, 3)
+        delta = _cell_derivatives(delta_corners, weights).reshape(-1, 3, 3)
+        a0, b0, c0 = base[:, 0], base[:, 1], base[:, 2]
+        a1, b1, c1 = delta[:, 0], delta[:, 1], delta[:, 2]
+        coefficients = np.stack((
+            _triple_product(a0, b0, c0) - limit,
+            _triple_product(a1, b0, c0) + _triple_product(a0, b1, c0) +
+            _triple_product(a0, b0, c1),
+            _triple_product(a0, b1, c1) + _triple_product(a1, b0, c1) +
+            _triple_product(a1, b1, c0),
+            _triple_product(a1, b1, c1),
+        ), axis=1)
+    if not np.all(np.isfinite(coefficients)):
+        return None
+    fraction = float(_first_negative_fraction(coefficients).min())
+    return min(fraction, 1.0)
+
+
+def _base_cell_volume(size, resolution):
+    base_size = tuple(max(abs(float(value)), 1.0e-8) for value in size)
+    return math.prod(
+        value / max(count - 1, 1)
+        for value, count in zip(base_size, resolution)
+    )
+
+
 def minimum_jacobian_ratio(
         points, size, resolution, *, samples=JACOBIAN_SAMPLES,
         cell_indices=None):
@@ -173,32 +310,22 @@ def minimum_jacobian_ratio(
     resolution = tuple(max(int(value), 2) for value in resolution)
     if len(points) != math.prod(resolution):
         return -math.inf
-    base_size = tuple(max(abs(float(value)), 1.0e-8) for value in size)
-    base_cell = math.prod(
-        value / max(count - 1, 1)
-        for value, count in zip(base_size, resolution)
-    )
+    base_cell = _base_cell_volume(size, resolution)
     if base_cell <= 0.0 or not math.isfinite(base_cell):
         return -math.inf
-    minimum = math.inf
     cells = _normalize_cell_indices(resolution, cell_indices)
-    for cell_u, cell_v, cell_w in cells:
-        corners = tuple(
-            tuple(float(component) for component in points[index])
-            for index in _corner_indices(
-                cell_u, cell_v, cell_w, resolution)
-        )
-        for sample in (
-                (s, t, r)
-                for s in samples
-                for t in samples
-                for r in samples):
-            d_s, d_t, d_r = _trilinear_jacobian(corners, sample)
-            determinant = _determinant(d_s, d_t, d_r)
-            if not math.isfinite(determinant):
-                return -math.inf
-            minimum = min(minimum, determinant / base_cell)
-    return float(minimum)
+    try:
+        point_array = np.array(
+            tuple(tuple(float(component) for component in point)
+                  for point in points),
+            dtype=np.float64,
+        ).reshape(-1, 3)
+    except (TypeError, ValueError, OverflowError):
+        return -math.inf
+    corners = point_array[_cell_corner_indices(resolution, cells)]
+    minimum = _minimum_cell_determinant(
+        corners, _sample_derivative_weights(samples))
+    return float(minimum / base_cell)
 
 
 def _effective_points(size, resolution, offsets, influences):
@@ -223,11 +350,17 @@ def _effective_points(size, resolution, offsets, influences):
 
 def clamp_offsets(
         size, resolution, baseline_offsets, candidate_offsets, influences,
-        *, threshold=MIN_JACOBIAN_RATIO, iterations=18, baseline_ratio=None):
+        *, threshold=MIN_JACOBIAN_RATIO, iterations=18, baseline_ratio=None,
+        solver="ANALYTIC"):
     """Clamp a candidate raw-offset field to the last valid cell transform.
 
     The returned tuple is ``(offsets, fraction, baseline_ratio, candidate_ratio)``.
     A fraction below one means the candidate crossed the safety boundary.
+
+    ``solver="ANALYTIC"`` solves each sample's cubic determinant for the
+    first unsafe fraction and verifies the result with one cell sweep;
+    ``"BISECTION"``, and any analytic result that fails verification, use
+    ``iterations`` bisection steps.
     """
     resolution = tuple(max(int(value), 2) for value in resolution)
     count = math.prod(resolution)
@@ -268,27 +401,24 @@ def clamp_offsets(
     if candidate_ratio >= float(threshold):
         return tuple(candidate_offsets), 1.0, baseline_ratio, candidate_ratio
 
-    low = 0.0
-    high = 1.0
-    for _index in range(max(int(iterations), 1)):
-        fraction = (low + high) * 0.5
-        probe = tuple(
-            _add(
-                baseline_offsets[index],
-                _mul(
-                    _sub(candidate_offsets[index], baseline_offsets[index]),
-                    fraction,
-                ),
-            )
-            for index in range(count)
-        )
-        points = _effective_points(size, resolution, probe, influences)
-        ratio = minimum_jacobian_ratio(
-            points, size, resolution, cell_indices=affected_cells)
-        if ratio >= float(threshold):
-            low = fraction
-        else:
-            high = fraction
+    # Effective points are affine in the bisection fraction, so the corner
+    # arrays of the affected cells are gathered once and blended per step.
+    corner_indices = _cell_corner_indices(resolution, affected_cells)
+    initial_corners = np.array(initial_points, dtype=np.float64)[
+        corner_indices]
+    delta_corners = np.array(candidate_points, dtype=np.float64)[
+        corner_indices] - initial_corners
+    weights = _sample_derivative_weights(JACOBIAN_SAMPLES)
+    base_cell = _base_cell_volume(size, resolution)
+    low = None
+    if str(solver).upper() == "ANALYTIC":
+        low = _verified_analytic_fraction(
+            initial_corners, delta_corners, weights, base_cell,
+            float(threshold))
+    if low is None:
+        low = _bisect_fraction(
+            initial_corners, delta_corners, weights, base_cell,
+            float(threshold), iterations)
     result = tuple(
         _add(
             baseline_offsets[index],
@@ -298,3 +428,38 @@ def clamp_offsets(
         for index in range(count)
     )
     return result, low, baseline_ratio, candidate_ratio
+
+
+def _verified_analytic_fraction(
+        initial_corners, delta_corners, weights, base_cell, threshold):
+    """Return the analytic safe fraction, or ``None`` if it fails a sweep."""
+    fraction = _analytic_safe_fraction(
+        initial_corners, delta_corners, weights, threshold * base_cell)
+    if fraction is None:
+        return None
+    # The root itself sits on the limit, and the returned offsets are
+    # re-derived from the fraction.  Step just inside the root so rounding
+    # cannot land the rebuilt field below the threshold.
+    for margin in (1.0e-9, 1.0e-6):
+        probe = max(fraction * (1.0 - margin), 0.0)
+        ratio = _minimum_cell_determinant(
+            initial_corners + delta_corners * probe, weights) / base_cell
+        if ratio >= threshold:
+            return probe
+    return None
+
+
+def _bisect_fraction(
+        initial_corners, delta_corners, weights, base_cell, threshold,
+        iterations):
+    low = 0.0
+    high = 1.0
+    for _index in range(max(int(iterations), 1)):
+        fraction = (low + high) * 0.5
+        ratio = _minimum_cell_determinant(
+            initial_corners + delta_corners * fraction, weights) / base_cell
+        if ratio >= threshold:
+            low = fraction
+        else:
+            high = fraction
+    return low
@@ -0,0 +1,185 @@
+"""Bulk access to the dedicated ``SDHFFDPoint`` collection.
+
+Every reader copies one attribute of the whole collection with
+``foreach_get`` into a flat array, and every writer assigns it back with one
+``foreach_set``.  ``foreach_set`` does not run RNA update callbacks, so
+writers leave controller synchronization to the caller exactly like a
+guarded per-point loop.
+
+A generation counter per owning controller lets callers skip re-reading
+unchanged points.  Point update callbacks and the bulk writers bump the
+owner's generation; frame changes, undo, and file loads bump a global epoch
+because animation and restored data never invoke point callbacks.  The
+depsgraph handler bumps an owner whenever its controller reports an update,
+which covers drivers and external ``foreach_set`` writes.
+"""
+from __future__ import annotations
+
+from collections import namedtuple
+
+import numpy as np
+
+from .lru_cache import BoundedLRUCache
+from .node_runtime import rna_pointer as _pointer
+from .revisions import bump_revision
+
+
+FFDPointArrays = namedtuple(
+    "FFDPointArrays", ("offsets", "influences", "selected"))
+
+_EPOCH = 0
+_GENERATIONS = {}
+_SNAPSHOT_CACHE = BoundedLRUCache("ffd_points.snapshots", limit=256)
+
+
+def _owner(properties):
+    return getattr(properties, "id_data", None) or properties
+
+
+def generation(properties):
+    """Return a token that changes whenever an owner's points may change.
+
+    The owner's ``session_uid`` keeps a recycled RNA pointer from matching a
+    snapshot taken for a deleted controller.
+    """
+    owner = _owner(properties)
+    return (
+        _EPOCH,
+        getattr(owner, "session_uid", None),
+        _GENERATIONS.get(_pointer(owner), 0),
+    )
+
+
+def bump_generation(properties=None):
+    """Invalidate one owner's point snapshots, or every owner's for ``None``."""
+    global _EPOCH
+    if properties is None:
+        _EPOCH += 1
+        _SNAPSHOT_CACHE.clear()
+        return
+    pointer = _pointer(_owner(properties))
+    if pointer:
+        _GENERATIONS[pointer] = _GENERATIONS.get(pointer, 0) + 1
+        _SNAPSHOT_CACHE.pop(pointer, None)
+
+
+def clear_generations():
+    global _EPOCH
+    _EPOCH += 1
+    _GENERATIONS.clear()
+    _SNAPSHOT_CACHE.clear()
+
+
+def _points(properties):
+    return getattr(properties, "ffd_points", None)
+
+
+def _read(points, name, dtype, width, default):
+    count = len(points) if points is not None else 0
+    values = np.zeros(count * width, dtype=dtype)
+    if not count:
+        return values
+    try:
+        points.foreach_get(name, values)
+    except (AttributeError, ReferenceError, RuntimeError, TypeError,
+            ValueError):
+        values = np.array([
+            component
+            for point in points
+            for component in (
+                getattr(point, name, default) if width > 1 else
+                (getattr(point, name, default),))
+        ], dtype=dtype)
+    return values
+
+
+def _write(points, name, values, dtype, width):
+    count = len(points) if points is not None else 0
+    values = np.ascontiguousarray(values, dtype=dtype).reshape(-1)
+    if values.size != count * width:
+        raise ValueError(
+            f"{name}: expected {count * width} values, got {values.size}")
+    if not count:
+        return
+    try:
+        points.foreach_set(name, values)
+    except (AttributeError, TypeError):
+        for index, point in enumerate(points):
+            if width > 1:
+                setattr(point, name, tuple(
+                    values[index * width:(index + 1) * width].tolist()))
+            else:
+                setattr(point, name, values[index].item())
+
+
+def read_offsets(properties):
+    """Return raw point offsets as a ``(N, 3)`` float32 array."""
+    return _read(
+        _points(properties), "offset", np.float32, 3, (0.0, 0.0, 0.0),
+    ).reshape(-1, 3)
+
+
+def read_influences(properties):
+    """Return point influences clamped to ``[0, 1]`` as a float32 array."""
+    values = _read(_points(properties), "influence", np.float32, 1, 1.0)
+    return np.clip(values, 0.0, 1.0, out=values)
+
+
+def read_selected(properties):
+    """Return point selection flags as a bool array."""
+    return _read(_points(properties), "selected", bool, 1, False)
+
+
+def write_offsets(properties, values):
+    _write(_points(properties), "offset", values, np.float32, 3)
+    bump_generation(properties)
+    bump_revision(properties)
+
+
+def write_influences(properties, values):
+    _write(_points(properties), "influence",
+           np.clip(np.asarray(values, dtype=np.float32), 0.0, 1.0),
+           np.float32, 1)
+    bump_generation(properties)
+    bump_revision(properties)
+
+
+def write_selected(properties, values):
+    _write(_points(properties), "selected", values, bool, 1)
+    bump_generation(properties)
+    # Selection is part of the projected FFD entities and their highlights.
+    bump_revision(properties)
+
+
+def point_arrays(properties):
+    """Return read-only offsets, influences, and selection for one owner.
+
+    The arrays are reused until the owner's generation changes or the point
+    count differs, so repeated draws and hit tests copy the collection once.
+    """
+    pointer = _pointer(_owner(properties))
+    points = _points(properties)
+    count = len(points) if points is not None else 0
+    token = generation(properties)
+    cached = _SNAPSHOT_CACHE.get(pointer) if pointer else None
+    if (
+            cached is not None and cached[0] == token and
+            len(cached[1].influences) == count
+    ):
+        return cached[1]
+    arrays = FFDPointArrays(
+        read_offsets(properties),
+        read_influences(properties),
+        read_selected(properties),
+    )
+    for value in arrays:
+        value.flags.writeable = False
+    if pointer:
+        _SNAPSHOT_CACHE.put(pointer, (token, arrays))
+    return arrays
+
+
+def effective_offsets(properties):
+    """Return offsets scaled by their influence as a ``(N, 3)`` array."""
+    arrays = point_arrays(properties)
+    return arrays.offsets * arrays.influences[:, None]
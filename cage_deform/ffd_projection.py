@@ -1,33 +1,432 @@
-"""Screen-space projection cache shared by FFD click and box selection."""
+"""Screen-space projection cache shared by FFD click and box selection.
+
+``project_points`` multiplies every FFD point by the view's perspective
+matrix in one array operation.  ``FFDProjectedEntities`` flattens projected
+point, line, and face controllers into segment arrays so click and box hit
+tests run as array predicates instead of per-entity Python loops.
+"""
 from __future__ import annotations
 
 import math
-from collections import OrderedDict
+from functools import cached_property
+
+import numpy as np
+
+from .deform_contract import EPSILON
+from .ffd_points import point_arrays
+from .lru_cache import BoundedLRUCache
+from .revisions import has_revision, revision
 
 
 def _quantized(value, digits=6):
     return round(float(value), digits)
 
 
+class FFDScreenProjection:
+    """Region positions, view depths, and visibility of projected points.
+
+    Calling the projection with a point index returns ``(x, y, depth)`` or
+    ``None`` behind the view, so it stands in for the per-point
+    ``project_point`` callbacks accepted by the selection helpers.
+    """
+
+    __slots__ = ("screen", "depth", "valid", "view_key")
+
+    def __init__(self, screen, depth, valid, view_key=None):
+        self.screen = screen
+        self.depth = depth
+        self.valid = valid
+        self.view_key = view_key
+
+    def __len__(self):
+        return len(self.valid)
+
+    def __call__(self, index):
+        index = int(index)
+        if not 0 <= index < len(self.valid) or not self.valid[index]:
+            return None
+        x, y = self.screen[index]
+        return float(x), float(y), float(self.depth[index])
+
+
+def project_points(
+        points, perspective_matrix, region_size, *, matrix=None,
+        view_matrix=None):
+    """Project ``(N, 3)`` points like ``location_3d_to_region_2d``.
+
+    ``matrix`` maps the points to world space first.  Points with a
+    non-positive clip ``w`` are invalid; depth is the distance in front of
+    the view and ``nan`` without a view matrix.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    homogeneous = np.empty((len(points), 4), dtype=np.float64)
+    homogeneous[:, :3] = points
+    homogeneous[:, 3] = 1.0
+    if matrix is not None:
+        homogeneous = homogeneous @ np.asarray(matrix, dtype=np.float64).T
+    clip = homogeneous @ np.asarray(perspective_matrix, dtype=np.float64).T
+    valid = clip[:, 3] > 0.0
+    w = np.where(valid, clip[:, 3], 1.0)
+    half = np.asarray(region_size, dtype=np.float64).reshape(2) * 0.5
+    screen = half + half * (clip[:, :2] / w[:, None])
+    if view_matrix is None:
+        depth = np.full(len(points), np.nan)
+    else:
+        depth = -(homogeneous @ np.asarray(view_matrix, dtype=np.float64)[2])
+    return FFDScreenProjection(screen, depth, valid)
+
+
+def project_view_points(points, region, region_data, *, matrix=None):
+    """Project points into one 3D View region."""
+    return project_points(
+        points,
+        region_data.perspective_matrix,
+        (region.width, region.height),
+        matrix=matrix,
+        view_matrix=region_data.view_matrix,
+    )
+
+
+def convex_hull(points):
+    """Return the counter-clockwise hull of 2D points as ``(x, y)`` tuples."""
+    unique = sorted({(float(point[0]), float(point[1])) for point in points})
+    if len(unique) <= 1:
+        return tuple(unique)
+
+    def cross(origin, first, second):
+        return (
+            (first[0] - origin[0]) * (second[1] - origin[1]) -
+            (first[1] - origin[1]) * (second[0] - origin[0]))
+
+    lower = []
+    for point in unique:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], point) <= 0.0:
+            lower.pop()
+        lower.append(point)
+    upper = []
+    for point in reversed(unique):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], point) <= 0.0:
+            upper.pop()
+        upper.append(point)
+    return tuple(lower[:-1] + upper[:-1])
+
+
+def segment_distances(position, first, second):
+    """Return the distance from one position to each ``(S, 2)`` segment."""
+    position = np.asarray(position, dtype=np.float64).reshape(2)
+    edge = second - first
+    relative = position - first
+    denominator = np.einsum("ij,ij->i", edge, edge)
+    usable = denominator > EPSILON
+    factor = np.einsum("ij,ij->i", edge, relative) / np.where(
+        usable, denominator, 1.0)
+    factor = np.where(usable, np.clip(factor, 0.0, 1.0), 0.0)
+    nearest = relative - edge * factor[:, None]
+    return np.hypot(nearest[:, 0], nearest[:, 1])
+
+
+def points_in_box(points, bounds):
+    left, right, bottom, top = bounds
+    return (
+        (left <= points[:, 0]) & (points[:, 0] <= right) &
+        (bottom <= points[:, 1]) & (points[:, 1] <= top))
+
+
+def segments_intersect_box(first, second, bounds):
+    """Liang-Barsky clip of every ``(S, 2)`` segment against one box."""
+    left, right, bottom, top = bounds
+    delta = second - first
+    directions = np.stack(
+        (-delta[:, 0], delta[:, 0], -delta[:, 1], delta[:, 1]), axis=1)
+    distances = np.stack((
+        first[:, 0] - left, right - first[:, 0],
+        first[:, 1] - bottom, top - first[:, 1],
+    ), axis=1)
+    parallel = np.abs(directions) <= EPSILON
+    rejected = np.any(parallel & (distances < 0.0), axis=1)
+    factors = distances / np.where(parallel, 1.0, directions)
+    minimum = np.max(np.where(
+        ~parallel & (directions < 0.0), factors, 0.0), axis=1)
+    maximum = np.min(np.where(
+        ~parallel & (directions > 0.0), factors, 1.0), axis=1)
+    return (
+        points_in_box(first, bounds) | points_in_box(second, bounds) |
+        (~rejected & (minimum <= maximum)))
+
+
+class FFDEntitySegments:
+    """Projected controller outlines flattened into one segment array.
+
+    Points become zero-length segments, lines their open polyline, and faces
+    their closed convex hull.  Segments are grouped per entity in order, so
+    ``starts`` reduces per-segment values to per-entity values; ``sizes``
+    counts the outline vertices of each entity.  Queries accept optional
+    sorted entity ``indices`` and then only touch those entities' segments.
+    """
+
+    __slots__ = ("first", "second", "starts", "sizes")
+
+    def __init__(self, outlines, closed):
+        first = []
+        second = []
+        starts = []
+        sizes = []
+        for outline in outlines:
+            starts.append(len(first))
+            sizes.append(len(outline))
+            if len(outline) <= 1:
+                point = outline[0] if outline else (math.nan, math.nan)
+                first.append(point)
+                second.append(point)
+                continue
+            pairs = tuple(zip(outline, outline[1:]))
+            if closed and len(outline) >= 3:
+                pairs += ((outline[-1], outline[0]),)
+            for start, end in pairs:
+                first.append(start)
+                second.append(end)
+        self.first = np.array(first, dtype=np.float64).reshape(-1, 2)
+        self.second = np.array(second, dtype=np.float64).reshape(-1, 2)
+        self.starts = np.array(starts, dtype=np.intp)
+        self.sizes = np.array(sizes, dtype=np.intp)
+
+    def bounds(self):
+        """Return per-entity ``(K, 2)`` minimum and maximum corners."""
+        return (
+            np.minimum.reduceat(
+                np.minimum(self.first, self.second), self.starts),
+            np.maximum.reduceat(
+                np.maximum(self.first, self.second), self.starts),
+        )
+
+    def _select(self, indices):
+        if indices is None:
+            return self.first, self.second, self.starts, self.sizes
+        ends = np.append(self.starts[1:], len(self.first))
+        counts = ends[indices] - self.starts[indices]
+        starts = np.zeros(len(indices), dtype=np.intp)
+        np.cumsum(counts[:-1], out=starts[1:])
+        segments = (
+            np.repeat(self.starts[indices] - starts, counts) +
+            np.arange(int(counts.sum())))
+        return (
+            self.first[segments], self.second[segments], starts,
+            self.sizes[indices])
+
+    def distances(self, position, indices=None):
+        first, second, starts, _sizes = self._select(indices)
+        return np.minimum.reduceat(
+            segment_distances(position, first, second), starts)
+
+    def intersect_box(self, bounds):
+        return np.logical_or.reduceat(
+            segments_intersect_box(self.first, self.second, bounds),
+            self.starts)
+
+    def contain(self, point, indices=None):
+        """Even-odd containment of one point in every closed outline."""
+        previous, current, starts, sizes = self._select(indices)
+        x, y = float(point[0]), float(point[1])
+        crosses = (current[:, 1] > y) != (previous[:, 1] > y)
+        denominator = np.where(
+            crosses, previous[:, 1] - current[:, 1], 1.0)
+        boundary = (
+            (previous[:, 0] - current[:, 0]) * (y - current[:, 1]) /
+            denominator + current[:, 0])
+        toggles = (crosses & (x < boundary)).astype(np.intp)
+        inside = np.add.reduceat(toggles, starts) % 2 == 1
+        return inside & (sizes >= 3)
+
+
+class ScreenBucketGrid:
+    """Uniform screen-space buckets over entity bounding boxes.
+
+    The cell size follows the average screen area per entity, so a query
+    around the mouse visits a handful of entities at any FFD resolution.
+    Entities spanning more than ``MAX_ENTITY_CELLS`` cells are kept in one
+    list that every query visits instead of being copied into each cell.
+    """
+
+    MAX_ENTITY_CELLS = 64
+    MIN_CELL = 8.0
+
+    __slots__ = ("origin", "cell", "buckets", "oversized")
+
+    def __init__(self, minimum, maximum):
+        finite = np.all(np.isfinite(minimum) & np.isfinite(maximum), axis=1)
+        indices = np.flatnonzero(finite)
+        self.buckets = {}
+        if not len(indices):
+            self.origin = np.zeros(2)
+            self.cell = self.MIN_CELL
+            self.oversized = np.empty(0, dtype=np.intp)
+            return
+        minimum = minimum[indices]
+        maximum = maximum[indices]
+        self.origin = minimum.min(axis=0)
+        span = np.maximum(maximum.max(axis=0) - self.origin, self.MIN_CELL)
+        self.cell = max(
+            math.sqrt(float(span[0] * span[1]) / len(indices)), self.MIN_CELL)
+        low = self._cells(minimum)
+        high = self._cells(maximum)
+        oversized = []
+        for index, (x0, y0), (x1, y1) in zip(
+                indices.tolist(), low.tolist(), high.tolist()):
+            if (x1 - x0 + 1) * (y1 - y0 + 1) > self.MAX_ENTITY_CELLS:
+                oversized.append(index)
+                continue
+            for x in range(x0, x1 + 1):
+                for y in range(y0, y1 + 1):
+                    self.buckets.setdefault((x, y), []).append(index)
+        self.oversized = np.array(oversized, dtype=np.intp)
+
+    def _cells(self, points):
+        return np.floor((points - self.origin) / self.cell).astype(np.intp)
+
+    def query(self, position, radius):
+        """Return sorted indices of entities whose box may lie within reach."""
+        position = np.asarray(position, dtype=np.float64).reshape(1, 2)
+        reach = float(radius) + EPSILON
+        (x0, y0), = self._cells(position - reach).tolist()
+        (x1, y1), = self._cells(position + reach).tolist()
+        found = [self.oversized]
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                bucket = self.buckets.get((x, y))
+                if bucket:
+                    found.append(np.array(bucket, dtype=np.intp))
+        return np.unique(np.concatenate(found))
+
+
+class FFDProjectedEntities(tuple):
+    """Projected FFD controllers of one mode with array hit tests.
+
+    The tuple holds the entity dictionaries built by the selection code;
+    each has a ``geometry`` sequence of screen points.  Segment arrays and
+    the hover bucket grid are built on first use and live as long as the
+    cached entity set for one view.
+    """
+
+    def __new__(cls, entities, mode):
+        self = super().__new__(cls, entities)
+        self.mode = str(mode)
+        return self
+
+    @cached_property
+    def segments(self):
+        if self.mode == "FACE":
+            outlines = (
+                convex_hull(entity["geometry"]) for entity in self)
+        elif self.mode == "LINE":
+            outlines = (
+                tuple((float(point[0]), float(point[1]))
+                      for point in entity["geometry"])
+                for entity in self)
+        else:
+            outlines = (
+                tuple((float(point[0]), float(point[1]))
+                      for point in entity["geometry"][:1])
+                for entity in self)
+        return FFDEntitySegments(tuple(outlines), self.mode == "FACE")
+
+    @cached_property
+    def grid(self):
+        return ScreenBucketGrid(*self.segments.bounds())
+
+    def screen_hits(
+            self, position, *, point_radius=8.0, line_radius=8.0,
+            face_margin=4.0):
+        """Return hit entity indices and their screen distances.
+
+        Only entities bucketed near ``position`` are tested.
+        """
+        empty = np.empty(0, dtype=np.intp), np.empty(0)
+        if not self:
+            return empty
+        radius = {"POINT": point_radius, "LINE": line_radius}.get(
+            self.mode, face_margin)
+        indices = self.grid.query(position, radius)
+        if not len(indices):
+            return empty
+        segments = self.segments
+        distances = segments.distances(position, indices)
+        if self.mode == "FACE":
+            hits = segments.sizes[indices] >= 3
+            hits &= segments.contain(position, indices) | (distances <= radius)
+        else:
+            hits = distances <= radius
+        return indices[hits], distances[hits]
+
+    def box_hits(self, bounds):
+        """Return indices of entities whose outline meets a normalized box."""
+        if not self:
+            return np.empty(0, dtype=np.intp)
+        segments = self.segments
+        hits = segments.intersect_box(bounds)
+        if self.mode == "FACE":
+            left, right, bottom, top = bounds
+            for corner in (
+                    (left, bottom), (right, bottom),
+                    (right, top), (left, top)):
+                hits |= segments.contain(corner)
+        return np.flatnonzero(hits)
+
+
+def _matrix_key(matrix):
+    return tuple(float(value) for row in matrix for value in row)
+
+
+def view_key(region, region_data, matrix=None):
+    """Key one 3D View projection by perspective matrix and region size."""
+    return (
+        _matrix_key(region_data.perspective_matrix),
+        int(region.width),
+        int(region.height),
+        None if matrix is None else _matrix_key(matrix),
+    )
+
+
 class FFDProjectedEntityCache:
-    """Cache projected FFD entities by geometry, view probe, and mode."""
+    """Cache projected FFD points per view and entities per view and mode.
+
+    Both layers key geometry by the controller revision.  Projected points
+    are also keyed by their point source and by the perspective matrix,
+    region size, and cage matrix, so an orbit re-projects the points once
+    while the entity groups come from the topology caches in ``core``.
+    Entity sets are keyed by the projection's ``view_key``; a projection
+    without one cannot be cached.
+    """
+
+    # Entity dictionaries hold a few screen vectors each; a flat estimate
+    # keeps ``put`` from walking every entity on a miss.
+    ENTITY_BYTES = 1024
+
+    def __init__(self, *, point_limit=64, entity_limit=256):
+        self.points = BoundedLRUCache(
+            "ffd_projection.points", limit=point_limit,
+            byte_budget=8 * 1024 * 1024, sizeof=self._projection_size)
+        self.entities = BoundedLRUCache(
+            "ffd_projection.entities", limit=entity_limit,
+            byte_budget=32 * 1024 * 1024,
+            sizeof=lambda entities: len(entities) * self.ENTITY_BYTES)
 
-    def __init__(self, limit=32):
-        self.limit = max(int(limit), 1)
-        self._values = OrderedDict()
-        self.hits = 0
-        self.misses = 0
+    @staticmethod
+    def _projection_size(projection):
+        return sum(
+            values.nbytes for values in (
+                projection.screen, projection.depth, projection.valid))
 
     def clear(self):
-        self._values.clear()
-        self.hits = 0
-        self.misses = 0
+        for cache in (self.points, self.entities):
+            cache.clear()
+            cache.reset_stats()
 
     def info(self):
         return {
-            "size": len(self._values),
-            "hits": self.hits,
-            "misses": self.misses,
+            "size": len(self.entities),
+            "hits": self.entities.hits,
+            "misses": self.entities.misses,
+            "points": self.points.info(),
         }
 
     @staticmethod
@@ -39,13 +438,17 @@ class FFDProjectedEntityCache:
 
     @staticmethod
     def _geometry_signature(properties, resolution):
-        point_count = math.prod(resolution)
-        points = getattr(properties, "ffd_points", ())
-        offsets = tuple(
-            tuple(_quantized(component, 7)
-                  for component in points[index].offset)
-            for index in range(min(len(points), point_count))
-        )
+        """Key projected geometry by controller revision when one exists.
+
+        Plain objects without an RNA owner fall back to their offsets.
+        """
+        if has_revision(properties):
+            offsets = revision(properties)
+        else:
+            point_count = math.prod(resolution)
+            offsets = np.round(
+                point_arrays(properties).offsets[:point_count].astype(float),
+                7).tobytes()
         return (
             FFDProjectedEntityCache._owner_pointer(properties),
             tuple(int(value) for value in resolution),
@@ -55,67 +458,55 @@ class FFDProjectedEntityCache:
             offsets,
         )
 
-    @staticmethod
-    def _probe_indices(resolution, point_index):
-        indices = {
-            point_index(u, v, w, resolution)
-            for u in (0, resolution[0] - 1)
-            for v in (0, resolution[1] - 1)
-            for w in (0, resolution[2] - 1)
-        }
-        center = tuple(max((value - 1) // 2, 0) for value in resolution)
-        indices.add(point_index(*center, resolution))
-        return tuple(sorted(indices))
+    def projection(
+            self, properties, resolution, points, region, region_data, *,
+            matrix=None, source="AUTHORED"):
+        """Return the cached projection of ``points()`` for one view.
 
-    @staticmethod
-    def _view_probe(project_point, indices, screen_value):
-        values = []
-        for index in indices:
-            screen, depth = screen_value(project_point(index))
-            values.append(
-                None if screen is None else (
-                    _quantized(screen.x),
-                    _quantized(screen.y),
-                    None if depth is None else _quantized(depth, 7),
-                )
-            )
-        return tuple(values)
+        ``source`` identifies what ``points`` returns beyond the controller's
+        own revision, such as the preview signature of display points that
+        follow upstream chain stages.  ``points`` only runs on a miss; the
+        result's ``view_key`` keys the entity sets derived from it.
+        """
+        key = (
+            self._geometry_signature(properties, resolution),
+            source,
+            view_key(region, region_data, matrix),
+        )
+        cached = self.points.get(key)
+        if cached is not None:
+            return cached
+        projected = project_view_points(
+            points(), region, region_data, matrix=matrix)
+        for values in (projected.screen, projected.depth, projected.valid):
+            values.flags.writeable = False
+        projected.view_key = key
+        return self.points.put(key, projected)
 
     def get(
             self, properties, project_point, mode, *, builder,
-            resolution_function, point_index_function, screen_value_function,
-            line_ratio=0.60, face_ratio=0.35):
-        resolution = tuple(resolution_function(properties))
+            resolution_function, line_ratio=0.60, face_ratio=0.35):
+        view = getattr(project_point, "view_key", None)
+        if view is None:
+            raise ValueError("projected FFD entities need a view_key")
         key = (
-            self._geometry_signature(properties, resolution),
+            self._geometry_signature(
+                properties, tuple(resolution_function(properties))),
             str(mode),
             _quantized(line_ratio),
             _quantized(face_ratio),
-            self._view_probe(
-                project_point,
-                self._probe_indices(resolution, point_index_function),
-                screen_value_function,
-            ),
+            view,
         )
-        cached = self._values.get(key)
+        cached = self.entities.get(key)
         if cached is not None:
-            self.hits += 1
-            self._values.move_to_end(key)
             return cached
-
-        self.misses += 1
-        result = builder(
+        return self.entities.put(key, builder(
             properties,
             project_point,
             mode,
             line_ratio=line_ratio,
             face_ratio=face_ratio,
-        )
-        self._values[key] = result
-        self._values.move_to_end(key)
-        while len(self._values) > self.limit:
-            self._values.popitem(last=False)
-        return result
+        ))
 
 
 projected_entity_cache = FFDProjectedEntityCache()
@@ -1,12 +1,34 @@
 """Pure helpers for preserving authored FFD data across grid resize."""
 from __future__ import annotations
 
+import json
 import math
-
-import bpy
-
-
-_AXIS_WEIGHT_CACHE = {}
+import os
+from pathlib import Path
+
+from .lru_cache import BoundedLRUCache
+
+
+_MISSING = object()
+_AXIS_WEIGHT_CACHE = BoundedLRUCache("ffd_resolution.axis_weights", limit=128)
+_AXIS_TRANSFORM_CACHE = BoundedLRUCache(
+    "ffd_resolution.axis_transforms", limit=256)
+_AXIS_INVERSE_CACHE = BoundedLRUCache(
+    "ffd_resolution.axis_inverses", limit=64)
+
+# Solved transforms and inverses persist across sessions in one versioned
+# JSON table.  Bump the version whenever the basis or the solve changes so
+# stale tables are ignored and rewritten.  New solves only mark the table
+# dirty; it is written once from a short timer, at unregister, or by
+# ``flush_persistent_tables``, so a resize burst does not rewrite the file
+# for every miss.
+_TABLE_VERSION = 1
+_TABLE_BASIS = "blender-lattice-key-curve"
+_TABLE_NAME = f"ffd_axis_tables_v{_TABLE_VERSION}.json"
+_FLUSH_DELAY = 2.0
+_PERSISTENT_DIRECTORY = None
+_PERSISTENT_TABLE = None
+_PERSISTENT_DIRTY = False
 
 
 def _point_index(u, v, w, resolution):
@@ -34,8 +56,49 @@ def _axis_sample(coordinate, old_size, new_size):
     return lower, upper, scaled - lower
 
 
+# Blender's ``key_curve_position_weights`` tension for the cardinal family.
+_CARDINAL_TENSION = {"KEY_CARDINAL": 0.71, "KEY_CATMULL_ROM": 0.5}
+LATTICE_INTERPOLATIONS = (
+    "KEY_LINEAR", "KEY_CARDINAL", "KEY_CATMULL_ROM", "KEY_BSPLINE")
+
+
+def key_curve_position_weights(t, interpolation):
+    """Return Blender's four lattice weights for local parameter ``t``.
+
+    The weights apply to control indices ``i - 1`` through ``i + 2`` around
+    the cell ``i`` that contains the sample.
+    """
+    t = float(t)
+    t2 = t * t
+    t3 = t2 * t
+    if interpolation == "KEY_LINEAR":
+        return 0.0, 1.0 - t, t, 0.0
+    if interpolation == "KEY_BSPLINE":
+        return (
+            -t3 / 6.0 + 0.5 * t2 - 0.5 * t + 1.0 / 6.0,
+            0.5 * t3 - t2 + 2.0 / 3.0,
+            -0.5 * t3 + 0.5 * t2 + 0.5 * t + 1.0 / 6.0,
+            t3 / 6.0,
+        )
+    tension = _CARDINAL_TENSION.get(interpolation)
+    if tension is None:
+        raise ValueError(f"unsupported lattice interpolation {interpolation!r}")
+    return (
+        -tension * t3 + 2.0 * tension * t2 - tension * t,
+        (2.0 - tension) * t3 + (tension - 3.0) * t2 + 1.0,
+        (tension - 2.0) * t3 + (3.0 - 2.0 * tension) * t2 + tension * t,
+        tension * t3 - tension * t2,
+    )
+
+
 def native_axis_weights(resolution, interpolation, samples):
-    """Sample Blender's native one-dimensional Lattice basis."""
+    """Evaluate Blender's native one-dimensional Lattice basis.
+
+    Each row holds the control weights of one normalized sample.  Matches
+    the Lattice modifier: the sample maps to ``value * (resolution - 1)``
+    on the regular grid, and out-of-range neighbours clamp to the end
+    controls.
+    """
     resolution = max(int(resolution), 2)
     interpolation = str(interpolation or "KEY_BSPLINE")
     samples = tuple(float(value) for value in samples)
@@ -48,6 +111,35 @@ def native_axis_weights(resolution, interpolation, samples):
     if cached is not None:
         return cached
 
+    rows = []
+    last = resolution - 1
+    for value in samples:
+        position = value * last
+        cell = int(math.floor(position))
+        weights = key_curve_position_weights(position - cell, interpolation)
+        row = [0.0] * resolution
+        for offset, weight in enumerate(weights):
+            if weight != 0.0:
+                row[min(max(cell - 1 + offset, 0), last)] += weight
+        rows.append(tuple(row))
+    result = tuple(rows)
+    _AXIS_WEIGHT_CACHE.put(key, result)
+    return result
+
+
+def probe_axis_weights(resolution, interpolation, samples):
+    """Measure Blender's one-dimensional Lattice basis with a probe scene.
+
+    Diagnostic only: builds a temporary mesh, lattice and modifier and runs
+    one depsgraph update per basis index.  Regression tests use it to
+    validate :func:`native_axis_weights`; runtime code must not call it.
+    """
+    import bpy
+
+    resolution = max(int(resolution), 2)
+    interpolation = str(interpolation or "KEY_BSPLINE")
+    samples = tuple(float(value) for value in samples)
+
     mesh = None
     target = None
     lattice_data = None
@@ -99,7 +191,6 @@ def native_axis_weights(resolution, interpolation, samples):
             tuple(weights[column][row] for column in range(resolution))
             for row in range(len(samples))
         )
-        _AXIS_WEIGHT_CACHE[key] = result
         return result
     finally:
         if target is not None:
@@ -163,6 +254,214 @@ def invert_dense_matrix(matrix):
     return tuple(tuple(row[size:]) for row in augmented)
 
 
+def set_persistent_cache_directory(path):
+    """Override the on-disk table directory; ``False`` disables persistence.
+
+    ``None`` restores the default extension user directory.
+    """
+    global _PERSISTENT_DIRECTORY, _PERSISTENT_TABLE
+    flush_persistent_tables()
+    _PERSISTENT_DIRECTORY = path
+    _PERSISTENT_TABLE = None
+
+
+def clear_axis_caches(*, persistent=False):
+    """Drop the in-memory tables, and the on-disk table when requested.
+
+    Pending solves are written first unless the on-disk table is removed.
+    """
+    global _PERSISTENT_TABLE, _PERSISTENT_DIRTY
+    if not persistent:
+        flush_persistent_tables()
+    _AXIS_WEIGHT_CACHE.clear()
+    _AXIS_TRANSFORM_CACHE.clear()
+    _AXIS_INVERSE_CACHE.clear()
+    _PERSISTENT_TABLE = None
+    _PERSISTENT_DIRTY = False
+    if persistent:
+        path = _persistent_table_path(create=False)
+        if path is not None:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def _top_package():
+    return (__package__ or "").rsplit(".", 1)[0]
+
+
+def _persistent_table_path(create=True):
+    directory = _PERSISTENT_DIRECTORY
+    if directory is False:
+        return None
+    if directory is None:
+        try:
+            import bpy
+        except ImportError:
+            return None
+        try:
+            directory = bpy.utils.extension_path_user(
+                _top_package(), path="cache", create=create)
+        except (AttributeError, RuntimeError, TypeError, ValueError):
+            directory = None
+        if not directory:
+            try:
+                directory = bpy.utils.user_resource(
+                    "CONFIG", path="simple_deform_helper/cache",
+                    create=create)
+            except (AttributeError, RuntimeError, TypeError, ValueError):
+                return None
+    if not directory:
+        return None
+    return Path(directory) / _TABLE_NAME
+
+
+def _persistent_table():
+    """Load the versioned on-disk table once per session."""
+    global _PERSISTENT_TABLE
+    if _PERSISTENT_TABLE is not None:
+        return _PERSISTENT_TABLE
+    table = {"transforms": {}, "inverses": {}}
+    path = _persistent_table_path(create=False)
+    if path is not None:
+        try:
+            stored = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, TypeError, ValueError):
+            stored = None
+        if (
+                isinstance(stored, dict) and
+                stored.get("version") == _TABLE_VERSION and
+                stored.get("basis") == _TABLE_BASIS
+        ):
+            for name in table:
+                values = stored.get(name)
+                if isinstance(values, dict):
+                    table[name] = values
+    _PERSISTENT_TABLE = table
+    return table
+
+
+def _matrix_from_table(value):
+    if value is None:
+        return None
+    try:
+        return tuple(tuple(float(item) for item in row) for row in value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _store_persistent(section, key, value):
+    """Record one solved table and schedule a batched write."""
+    global _PERSISTENT_DIRTY
+    table = _persistent_table()
+    table[section][key] = (
+        None if value is None else [list(row) for row in value])
+    if _PERSISTENT_DIRECTORY is False:
+        return
+    _PERSISTENT_DIRTY = True
+    _schedule_flush()
+
+
+def _schedule_flush():
+    try:
+        import bpy
+    except ImportError:
+        return
+    try:
+        if not bpy.app.timers.is_registered(_flush_timer):
+            bpy.app.timers.register(
+                _flush_timer, first_interval=_FLUSH_DELAY, persistent=True)
+    except (AttributeError, RuntimeError, TypeError, ValueError):
+        pass
+
+
+def _flush_timer():
+    flush_persistent_tables()
+    return None
+
+
+def cancel_persistent_flush():
+    """Write pending tables now and unregister the flush timer."""
+    flush_persistent_tables()
+    try:
+        import bpy
+    except ImportError:
+        return
+    try:
+        if bpy.app.timers.is_registered(_flush_timer):
+            bpy.app.timers.unregister(_flush_timer)
+    except (AttributeError, RuntimeError, TypeError, ValueError):
+        pass
+
+
+def flush_persistent_tables():
+    """Rewrite the on-disk table atomically when solves are pending.
+
+    Returns whether a file was written.
+    """
+    global _PERSISTENT_DIRTY
+    if not _PERSISTENT_DIRTY or _PERSISTENT_TABLE is None:
+        _PERSISTENT_DIRTY = False
+        return False
+    _PERSISTENT_DIRTY = False
+    table = _PERSISTENT_TABLE
+    path = _persistent_table_path(create=True)
+    if path is None:
+        return False
+    payload = {
+        "version": _TABLE_VERSION,
+        "basis": _TABLE_BASIS,
+        "transforms": table["transforms"],
+        "inverses": table["inverses"],
+    }
+    temporary = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary.write_text(
+            json.dumps(payload, sort_keys=True), encoding="utf-8")
+        os.replace(temporary, path)
+    except OSError:
+        return False
+    return True
+
+
+def _cached_table(cache, section, key, solve):
+    """Return a solved table from memory, disk, or ``solve`` in that order."""
+    cached = cache.get(key, _MISSING)
+    if cached is not _MISSING:
+        return cached
+    table = _persistent_table()[section]
+    if key in table:
+        value = _matrix_from_table(table[key])
+        if value is not None or table[key] is None:
+            cache.put(key, value)
+            return value
+    value = solve()
+    cache.put(key, value)
+    _store_persistent(section, key, value)
+    return value
+
+
+def native_axis_inverse(resolution, interpolation):
+    """Return the inverse of the basis sampled at each control position.
+
+    Chain subdivision solves stage controls from sampled source values with
+    this matrix; ``None`` marks a singular basis.
+    """
+    resolution = max(int(resolution), 1)
+    interpolation = str(interpolation or "KEY_BSPLINE")
+    samples = tuple(
+        value / max(resolution - 1, 1) for value in range(resolution))
+    return _cached_table(
+        _AXIS_INVERSE_CACHE,
+        "inverses",
+        f"{resolution}:{interpolation}",
+        lambda: invert_dense_matrix(
+            native_axis_weights(resolution, interpolation, samples)),
+    )
+
+
 def _axis_transform(old_size, new_size, interpolation):
     old_size = max(int(old_size), 1)
     new_size = max(int(new_size), 1)
@@ -171,6 +470,16 @@ def _axis_transform(old_size, new_size, interpolation):
             tuple(1.0 if old == new else 0.0 for old in range(old_size))
             for new in range(new_size)
         )
+    interpolation = str(interpolation or "KEY_BSPLINE")
+    return _cached_table(
+        _AXIS_TRANSFORM_CACHE,
+        "transforms",
+        f"{old_size}:{new_size}:{interpolation}",
+        lambda: _solve_axis_transform(old_size, new_size, interpolation),
+    )
+
+
+def _solve_axis_transform(old_size, new_size, interpolation):
     sample_count = max(old_size, new_size) * 8 + 1
     samples = tuple(
         value / max(sample_count - 1, 1) for value in range(sample_count))
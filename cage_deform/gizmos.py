@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 import math
-from time import monotonic
+from time import perf_counter
 
 import bpy
+import numpy as np
 from bpy.props import FloatProperty
 from bpy.types import Gizmo, GizmoGroup
 from mathutils import Euler, Matrix, Vector
@@ -14,6 +15,15 @@ from ..utils import GizmoUtils, get_pref
 from . import core as _core_module
 from . import undo as _undo
 from .ffd_batch import draw_ffd_line_face_batches
+from .ffd_projection import project_view_points
+from .lru_cache import BoundedLRUCache
+from .preview_lod import probe_steps, rail_lod_steps, rail_turning
+from .redraw_budget import redraw_scheduler
+from .revisions import memoized, revision
+from .ffd_points import (
+    generation as ffd_point_generation,
+    point_arrays as ffd_point_arrays,
+)
 from .chain import (
     apply_shared_boundary_edit,
     capture_chain_boundary_state,
@@ -43,6 +53,9 @@ from .core import (
     cage_local_matrix,
     chain_global_stretch_value,
     deform_point_for_display,
+    deform_points_for_display,
+    deform_point_with_jacobian_for_display,
+    display_deform_plan,
     end_shape_handle_world,
     flush_pending_chain_updates,
     cage_modifiers,
@@ -60,6 +73,7 @@ from .core import (
     ffd_selection_entities,
     ffd_screen_selection_entity,
     ffd_selection_modes,
+    ffd_view_projection,
     ffd_selected_indices,
     ffd_selection_indices,
     ffd_set_selection,
@@ -151,24 +165,39 @@ SDHCageControllerProperties.__annotations__["tooltip_shear_plane"] = FloatProper
 
 # draw_prepare → draw 同周期去重（避免 __slots__ 动态属性问题）
 _MATRIX_FRESH_IDS = set()
-_CAGE_WIRE_GEOMETRY_CACHE = {}
-_CAGE_WIRE_INDEX_CACHE = {}
-_CAGE_GUIDE_GEOMETRY_CACHE = {}
-_BEND_TREND_LOCAL_FRAME_CACHE = {}
-_CHAIN_DISPLAY_BY_PREVIEW_SIGNATURE = {}
-_GEOMETRY_CACHE_LIMIT = 64
+# Redraw geometry caches evict least-recently-used entries under an entry
+# and byte budget instead of emptying at a fixed size mid-drag.
+_MIB = 1024 * 1024
+_CAGE_WIRE_GEOMETRY_CACHE = BoundedLRUCache(
+    "gizmos.cage_wire_geometry", limit=256, byte_budget=16 * _MIB)
+_CAGE_WIRE_INDEX_CACHE = BoundedLRUCache(
+    "gizmos.cage_wire_indices", limit=64)
+_CAGE_GUIDE_GEOMETRY_CACHE = BoundedLRUCache(
+    "gizmos.cage_guide_geometry", limit=256, byte_budget=8 * _MIB)
+_CAGE_LOD_PROBE_CACHE = BoundedLRUCache(
+    "gizmos.cage_lod_probes", limit=256, byte_budget=2 * _MIB,
+    sizeof=lambda entry: entry[0].nbytes + entry[1].nbytes)
+_BEND_TREND_LOCAL_FRAME_CACHE = BoundedLRUCache(
+    "gizmos.bend_trend_local_frames", limit=128, byte_budget=2 * _MIB)
+_CHAIN_DISPLAY_BY_PREVIEW_SIGNATURE = BoundedLRUCache(
+    "gizmos.chain_display_by_preview", limit=128, byte_budget=8 * _MIB)
+_DEFORM_PLAN_BY_PREVIEW_SIGNATURE = BoundedLRUCache(
+    "gizmos.deform_plan_by_preview", limit=128, byte_budget=8 * _MIB)
 _GIZMO_UNDO_ACTIVE = _undo.ACTIVE_TRANSACTIONS
 
 # Interactive drags change the cage signature on every mouse event, so the
 # signature-keyed geometry caches never hit and each event pays a full Python
 # re-tessellation for every affected stage.  Wire rebuilds and inactive-stage
-# handle matrices are therefore rate limited: within the window the previous
-# shape/matrix is reused and one deferred redraw guarantees convergence after
-# the burst ends.  Active-stage handles are exempt so dragging stays 1:1.
-_WIRE_THROTTLE_WINDOW = 1.0 / 30.0
-_BUNDLE_MATRIX_THROTTLE_WINDOW = 0.05
-_WIRE_THROTTLE_STATE = {}
-_WIRE_THROTTLE_LIMIT = 128
+# handle matrices therefore go through the frame-budget scheduler: the active
+# stage rebuilds once per frame, inactive stages share the preference budget,
+# and deferred consumers reuse their previous shape/matrix.  One deferred
+# redraw guarantees convergence after the burst ends.  Active-stage handles
+# are exempt so dragging stays 1:1.
+_DEFERRED_REDRAW_INTERVAL = 1.0 / 60.0
+# Shapes are owned and byte-accounted by the wire geometry caches, so the
+# throttle state only counts entries.
+_WIRE_THROTTLE_STATE = BoundedLRUCache(
+    "gizmos.wire_throttle", limit=128, sizeof=lambda _entry: 0)
 _THROTTLE_REDRAW_PENDING = []
 _END_SHAPE_DRAG_STATE = {}
 
@@ -299,7 +328,7 @@ def _request_throttled_redraw():
     _THROTTLE_REDRAW_PENDING.append(True)
     try:
         bpy.app.timers.register(
-            _tag_view3d_redraw, first_interval=_WIRE_THROTTLE_WINDOW)
+            _tag_view3d_redraw, first_interval=_DEFERRED_REDRAW_INTERVAL)
     except (AttributeError, RuntimeError, TypeError, ValueError):
         _THROTTLE_REDRAW_PENDING.clear()
 
@@ -313,34 +342,32 @@ def clear_throttled_redraw():
         pass
     _THROTTLE_REDRAW_PENDING.clear()
     _WIRE_THROTTLE_STATE.clear()
+    redraw_scheduler.clear()
     _CHAIN_DISPLAY_BY_PREVIEW_SIGNATURE.clear()
+    _DEFORM_PLAN_BY_PREVIEW_SIGNATURE.clear()
     _END_SHAPE_DRAG_STATE.clear()
 
 
-def _throttled_wire_shape(key):
+def _throttled_wire_shape(key, *, active=False):
     """Return ``(use_stale, shape)`` for one rate-limited wire consumer.
 
     ``settled`` state (two consecutive identical signatures) bypasses the
-    throttle entirely, so idle redraws keep the exact signature-cache path
+    scheduler entirely, so idle redraws keep the exact signature-cache path
     and never schedule timers.
     """
     state = _WIRE_THROTTLE_STATE.get(key)
-    if state is None or state[3] or state[2] is None:
+    if state is None or state[2] or state[1] is None:
         return False, None
-    if monotonic() - state[0] < _WIRE_THROTTLE_WINDOW:
-        _request_throttled_redraw()
-        return True, state[2]
-    return False, None
+    if redraw_scheduler.allow(key, active=active):
+        return False, None
+    _request_throttled_redraw()
+    return True, state[1]
 
 
-def _store_wire_shape(key, signature, shape, *, rebuilt):
-    previous = _WIRE_THROTTLE_STATE.get(key)
-    settled = previous is not None and previous[1] == signature
-    stamp = (
-        monotonic() if rebuilt or previous is None else previous[0])
-    if len(_WIRE_THROTTLE_STATE) > _WIRE_THROTTLE_LIMIT:
-        _WIRE_THROTTLE_STATE.clear()
-    _WIRE_THROTTLE_STATE[key] = (stamp, signature, shape, settled)
+def _store_wire_shape(key, signature, shape):
+    previous = _WIRE_THROTTLE_STATE.peek(key)
+    settled = previous is not None and previous[0] == signature
+    _WIRE_THROTTLE_STATE.put(key, (signature, shape, settled))
 
 
 def _shape_vertices(name):
@@ -594,10 +621,12 @@ def _deformed_section_frame(cage_matrix, properties, local_y, direction=0.0):
         _core_module.chain_global_stretch_preview_state(properties))
     chain_prefix_state = (
         _core_module.chain_global_prefix_preview_state(properties))
+    plan = display_deform_plan(
+        properties, chain_prefix_state=chain_prefix_state)
 
     def sample(point):
         return Vector(deform_point_for_display(
-            point, properties,
+            point, properties, plan=plan,
             chain_prefix_state=chain_prefix_state,
             chain_stretch_state=chain_stretch_state))
 
@@ -662,10 +691,12 @@ def _deformed_cross_section_frame(cage_matrix, properties, local_y):
         _core_module.chain_global_stretch_preview_state(properties))
     chain_prefix_state = (
         _core_module.chain_global_prefix_preview_state(properties))
+    plan = display_deform_plan(
+        properties, chain_prefix_state=chain_prefix_state)
 
     def sample(point):
         return Vector(deform_point_for_display(
-            point, properties,
+            point, properties, plan=plan,
             chain_prefix_state=chain_prefix_state,
             chain_stretch_state=chain_stretch_state))
 
@@ -734,13 +765,15 @@ def _bend_open_axis_world(cage_matrix, properties):
         _core_module.chain_global_stretch_preview_state(properties))
     chain_prefix_state = (
         _core_module.chain_global_prefix_preview_state(properties))
+    plan = display_deform_plan(
+        properties, chain_prefix_state=chain_prefix_state)
     center = Vector(deform_point_for_display(
-        (0.0, handle_y, 0.0), properties,
+        (0.0, handle_y, 0.0), properties, plan=plan,
         chain_prefix_state=chain_prefix_state,
         chain_stretch_state=chain_stretch_state))
     offset = local_u * span
     plus = Vector(deform_point_for_display(
-        (offset.x, handle_y, offset.z), properties,
+        (offset.x, handle_y, offset.z), properties, plan=plan,
         chain_prefix_state=chain_prefix_state,
         chain_stretch_state=chain_stretch_state))
     axis_local = plus - center
@@ -1263,19 +1296,31 @@ def _ordered_enabled_deform_types(properties):
 
 
 def cage_picker_geometry_signature(properties):
-    """Return an exact, hashable signature for deformed cage geometry."""
+    """Return an exact, hashable signature for deformed cage geometry.
+
+    The authored-property part is rebuilt only when the controller revision
+    changes and is otherwise returned as the same tuple object.  A Curve
+    cage still appends its guide signature, which follows an external
+    object that never runs a controller update callback.
+    """
+    signature = memoized(
+        properties, "cage_picker_geometry",
+        lambda: _cage_property_signature(properties))
+    if str(getattr(properties, "cage_type", "STANDARD")) != "CURVE":
+        return signature
+    try:
+        from .curve import curve_preview_signature
+        curve_signature = curve_preview_signature(properties)
+    except (AttributeError, ImportError, ReferenceError, RuntimeError,
+            TypeError, ValueError):
+        curve_signature = ("SDH_CURVE_PREVIEW_UNAVAILABLE",)
+    return (*signature[:-1], curve_signature)
+
+
+def _cage_property_signature(properties):
     def floats(values):
         return tuple(float(value).hex() for value in values)
 
-    curve_signature = ()
-    if str(getattr(properties, "cage_type", "STANDARD")) == "CURVE":
-        try:
-            from .curve import curve_preview_signature
-            curve_signature = curve_preview_signature(properties)
-        except (AttributeError, ImportError, ReferenceError, RuntimeError,
-                TypeError, ValueError):
-            curve_signature = ("SDH_CURVE_PREVIEW_UNAVAILABLE",)
-
     return (
         "SDH_CAGE_WIRE_V2",
         floats(properties.size),
@@ -1294,7 +1339,7 @@ def cage_picker_geometry_signature(properties):
         floats(properties.bottom_scale),
         floats(properties.top_offset),
         floats(properties.bottom_offset),
-        curve_signature,
+        (),
     )
 
 
@@ -1332,18 +1377,50 @@ def cage_preview_geometry_state(properties):
         _core_module.chain_display_preview_signature(
             chain_display_state),
     )
-    _cache_geometry(
-        _CHAIN_DISPLAY_BY_PREVIEW_SIGNATURE, signature,
-        chain_display_state)
+    # Idle redraws repeat the same signature; only a new state pays for the
+    # recursive size estimate.
+    if (
+            _CHAIN_DISPLAY_BY_PREVIEW_SIGNATURE.peek(signature) is not
+            chain_display_state
+    ):
+        _CHAIN_DISPLAY_BY_PREVIEW_SIGNATURE.put(
+            signature, chain_display_state)
     return signature, output_frame
 
 
-def _cache_geometry(cache, key, value):
-    """Bound redraw caches while retaining the current drag state."""
-    if len(cache) >= _GEOMETRY_CACHE_LIMIT:
-        cache.clear()
-    cache[key] = value
-    return value
+def _preview_sample_points(
+        properties, points, preview_state, *, chain_prefix_state,
+        chain_stretch_state, chain_display_state, curve_deformer):
+    """Evaluate preview samples with one deform plan per preview signature.
+
+    Every sampler of one drag tick shares the plan, so stage parameters are
+    decoded once instead of once per rail or ring point.
+    """
+    preview_signature, preview_output_frame = preview_state
+    plan = _DEFORM_PLAN_BY_PREVIEW_SIGNATURE.get(preview_signature)
+    if (
+            plan is None and not chain_prefix_state and
+            not chain_stretch_state and not chain_display_state
+    ):
+        plan = _core_module.deform_plan_from_properties(
+            properties,
+            chain_preview=True,
+            preview_output_frame=preview_output_frame,
+            curve_deformer_override=curve_deformer,
+        )
+        if plan is not None:
+            _DEFORM_PLAN_BY_PREVIEW_SIGNATURE.put(preview_signature, plan)
+    values = deform_points_for_display(
+        points,
+        properties,
+        plan=plan,
+        preview_output_frame=preview_output_frame,
+        chain_prefix_state=chain_prefix_state,
+        chain_stretch_state=chain_stretch_state,
+        chain_display_state=chain_display_state,
+        curve_deformer_override=curve_deformer,
+    )
+    return tuple(tuple(float(value) for value in row) for row in values)
 
 
 def cage_preview_ring_vertices(
@@ -1390,28 +1467,31 @@ def cage_preview_ring_vertices(
                 TypeError, ValueError):
             curve_deformer = None
     corner_signs = ((-1, -1), (-1, 1), (1, 1), (1, -1))
-    vertices = []
-    for ring_t in ring_positions:
-        ring_y = -half.y + size_y * ring_t
-        ring = tuple(
-            tuple(deform_point_for_display(
-                (x_sign * half.x, ring_y, z_sign * half.z), properties,
-                chain_prefix_state=chain_prefix_state,
-                chain_stretch_state=chain_stretch_state,
-                chain_display_state=chain_display_state,
-                curve_deformer_override=curve_deformer,
-                preview_output_frame=preview_output_frame))
+    samples = _preview_sample_points(
+        properties,
+        tuple(
+            (x_sign * half.x, -half.y + size_y * ring_t, z_sign * half.z)
+            for ring_t in ring_positions
             for x_sign, z_sign in corner_signs
-        )
+        ),
+        (preview_signature, preview_output_frame),
+        chain_prefix_state=chain_prefix_state,
+        chain_stretch_state=chain_stretch_state,
+        chain_display_state=chain_display_state,
+        curve_deformer=curve_deformer,
+    )
+    vertices = []
+    for ring_index in range(len(ring_positions)):
+        ring = samples[ring_index * 4:ring_index * 4 + 4]
         for index, next_index in ((0, 1), (1, 2), (2, 3), (3, 0)):
             vertices.extend((ring[index], ring[next_index]))
-    return _cache_geometry(
-        _CAGE_WIRE_GEOMETRY_CACHE, signature, tuple(vertices))
+    return _CAGE_WIRE_GEOMETRY_CACHE.put(signature, tuple(vertices))
 
 
 def cage_preview_wire_vertices(
         properties, steps=24, ring_positions=(0.0, 0.25, 0.5, 0.75, 1.0),
-        *, preview_state=None, throttle_key=None):
+        *, preview_state=None, throttle_key=None, throttle_active=False,
+        lod_view=None):
     """Return cached deformed cage rails/rings as independent line pairs.
 
     Active cage drawing, the bend-trend chooser, and inactive cage selection
@@ -1419,12 +1499,20 @@ def cage_preview_wire_vertices(
     path, so a user-defined operation order is reflected without viewport-only
     deformation logic.
 
-    ``throttle_key`` opts one draw consumer into rate-limited rebuilds: while
-    its content keeps changing (an interactive drag), at most one rebuild per
-    throttle window runs and the previous shape is reused in between.
+    ``lod_view`` is an optional ``(region, region_data, matrix)`` triple; with
+    it ``steps`` is only the upper bound and rails are sampled at the level
+    chosen by :func:`cage_preview_lod_steps`.  Use
+    :func:`cage_preview_wire_steps` to recover the step count of the result.
+
+    ``throttle_key`` opts one draw consumer into budgeted rebuilds: while its
+    content keeps changing (an interactive drag), the redraw scheduler admits
+    at most one measured rebuild per frame, and inactive consumers also wait
+    for frame budget; the previous shape is reused in between.
+    ``throttle_active`` gives the consumer the active stage's priority.
     """
     if throttle_key is not None:
-        use_stale, stale = _throttled_wire_shape(throttle_key)
+        use_stale, stale = _throttled_wire_shape(
+            throttle_key, active=throttle_active)
         if use_stale:
             return stale
     steps = max(int(steps), 1)
@@ -1432,6 +1520,10 @@ def cage_preview_wire_vertices(
     preview_signature, preview_output_frame = (
         cage_preview_geometry_state(properties)
         if preview_state is None else preview_state)
+    if lod_view is not None:
+        steps = cage_preview_lod_steps(
+            properties, *lod_view, maximum=steps,
+            preview_state=(preview_signature, preview_output_frame))
     signature = (
         preview_signature,
         steps,
@@ -1440,9 +1532,10 @@ def cage_preview_wire_vertices(
     cached = _CAGE_WIRE_GEOMETRY_CACHE.get(signature)
     if cached is not None:
         if throttle_key is not None:
-            _store_wire_shape(throttle_key, signature, cached, rebuilt=False)
+            _store_wire_shape(throttle_key, signature, cached)
         return cached
 
+    started = perf_counter()
     half = Vector(properties.size) * 0.5
     size_y = float(properties.size[1])
     chain_stretch_state = (
@@ -1463,22 +1556,27 @@ def cage_preview_wire_vertices(
                 TypeError, ValueError):
             curve_deformer = None
     corner_signs = ((-1, -1), (-1, 1), (1, 1), (1, -1))
-    vertices = []
-
-    for x_sign, z_sign in corner_signs:
-        rail = tuple(
-            tuple(deform_point_for_display((
+    samples = _preview_sample_points(
+        properties,
+        tuple(
+            (
                 x_sign * half.x,
                 -half.y + size_y * index / steps,
                 z_sign * half.z,
-            ), properties,
-                chain_prefix_state=chain_prefix_state,
-                chain_stretch_state=chain_stretch_state,
-                chain_display_state=chain_display_state,
-                curve_deformer_override=curve_deformer,
-                preview_output_frame=preview_output_frame))
+            )
+            for x_sign, z_sign in corner_signs
             for index in range(steps + 1)
-        )
+        ),
+        (preview_signature, preview_output_frame),
+        chain_prefix_state=chain_prefix_state,
+        chain_stretch_state=chain_stretch_state,
+        chain_display_state=chain_display_state,
+        curve_deformer=curve_deformer,
+    )
+    vertices = []
+
+    for rail_index in range(len(corner_signs)):
+        rail = samples[rail_index * (steps + 1):(rail_index + 1) * (steps + 1)]
         for index in range(steps):
             vertices.extend((rail[index], rail[index + 1]))
 
@@ -1488,13 +1586,69 @@ def cage_preview_wire_vertices(
         preview_state=(preview_signature, preview_output_frame),
         _chain_display_state=chain_display_state,
     ))
-    result = _cache_geometry(
-        _CAGE_WIRE_GEOMETRY_CACHE, signature, tuple(vertices))
+    result = _CAGE_WIRE_GEOMETRY_CACHE.put(signature, tuple(vertices))
     if throttle_key is not None:
-        _store_wire_shape(throttle_key, signature, result, rebuilt=True)
+        redraw_scheduler.record(
+            throttle_key, (perf_counter() - started) * 1000.0)
+        _store_wire_shape(throttle_key, signature, result)
     return result
 
 
+def cage_preview_lod_steps(
+        properties, region, region_data, matrix, *, maximum=24,
+        preview_state=None):
+    """Return rail steps keeping the preview's chord error under a pixel.
+
+    Rail turning comes from a coarse probe cached per preview signature, so
+    orbiting and zooming only re-project its few points.  Without a 3D view
+    the legacy ``maximum`` is used.
+    """
+    maximum = max(int(maximum), 1)
+    if region is None or region_data is None:
+        return maximum
+    preview_state = (
+        cage_preview_geometry_state(properties)
+        if preview_state is None else preview_state)
+    steps = probe_steps(
+        int(getattr(properties, "curve_resolution", 24))
+        if str(getattr(properties, "cage_type", "STANDARD")) == "CURVE"
+        else None)
+    probe_key = (preview_state[0], steps)
+    probe = _CAGE_LOD_PROBE_CACHE.get(probe_key)
+    if probe is None:
+        half = Vector(properties.size) * 0.5
+        vertices, _indices, _endpoints = cage_preview_guide_geometry(
+            properties,
+            tuple(
+                (x_sign * half.x, z_sign * half.z)
+                for x_sign, z_sign in ((-1, -1), (-1, 1), (1, 1), (1, -1))),
+            steps=steps,
+            preview_state=preview_state,
+        )
+        rails = np.asarray(vertices, dtype=np.float64).reshape(
+            4, steps + 1, 3)
+        rails.flags.writeable = False
+        probe = _CAGE_LOD_PROBE_CACHE.put(
+            probe_key, (rails, rail_turning(rails)))
+    rails, turning = probe
+    try:
+        projection = project_view_points(
+            rails.reshape(-1, 3), region, region_data, matrix=matrix)
+    except (AttributeError, ReferenceError, TypeError, ValueError):
+        return maximum
+    return rail_lod_steps(
+        projection.screen.reshape(rails.shape[0], rails.shape[1], 2),
+        projection.valid,
+        turning,
+        maximum=maximum,
+    )
+
+
+def cage_preview_wire_steps(vertices, ring_positions):
+    """Return the rail step count of a :func:`cage_preview_wire_vertices` shape."""
+    return max(len(vertices) // 8 - len(tuple(ring_positions)), 1)
+
+
 def cage_preview_wire_indices(
         steps=24, ring_positions=(0.0, 0.25, 0.5, 0.75, 1.0)):
     """Return cached rail/ring indices for :func:`cage_preview_wire_vertices`."""
@@ -1511,8 +1665,7 @@ def cage_preview_wire_indices(
     ring_indices = tuple(
         (index, index + 1)
         for index in range(rail_vertex_count, total_vertex_count, 2))
-    return _cache_geometry(
-        _CAGE_WIRE_INDEX_CACHE, key, (rail_indices, ring_indices))
+    return _CAGE_WIRE_INDEX_CACHE.put(key, (rail_indices, ring_indices))
 
 
 def cage_preview_guide_geometry(
@@ -1556,33 +1709,28 @@ def cage_preview_guide_geometry(
         except (AttributeError, ImportError, ReferenceError, RuntimeError,
                 TypeError, ValueError):
             curve_deformer = None
-    vertices = []
+    vertices = _preview_sample_points(
+        properties,
+        tuple(
+            (rail_x, -half.y + size_y * index / steps, rail_z)
+            for rail_x, rail_z in rail_offsets
+            for index in range(steps + 1)
+        ),
+        (preview_signature, preview_output_frame),
+        chain_prefix_state=chain_prefix_state,
+        chain_stretch_state=chain_stretch_state,
+        chain_display_state=chain_display_state,
+        curve_deformer=curve_deformer,
+    )
     indices = []
     endpoints = []
-    for rail_x, rail_z in rail_offsets:
-        start = len(vertices)
-        vertices.extend(
-            tuple(deform_point_for_display(
-                (
-                    rail_x,
-                    -half.y + size_y * index / steps,
-                    rail_z,
-                ),
-                properties,
-                chain_prefix_state=chain_prefix_state,
-                chain_stretch_state=chain_stretch_state,
-                chain_display_state=chain_display_state,
-                curve_deformer_override=curve_deformer,
-                preview_output_frame=preview_output_frame,
-            ))
-            for index in range(steps + 1)
-        )
+    for rail_index in range(len(rail_offsets)):
+        start = rail_index * (steps + 1)
         indices.extend(
             (start + index, start + index + 1)
             for index in range(steps))
         endpoints.append(start + steps)
-    return _cache_geometry(
-        _CAGE_GUIDE_GEOMETRY_CACHE,
+    return _CAGE_GUIDE_GEOMETRY_CACHE.put(
         signature,
         (tuple(vertices), tuple(indices), tuple(endpoints)),
     )
@@ -1637,7 +1785,7 @@ def cage_picker_wire_vertices(properties, steps=12, *, preview_state=None):
         tuple(center + (Vector(vertex) - center) * CAGE_STAGE_PICKER_SCALE)
         for vertex in full_vertices
     )
-    return _cache_geometry(_CAGE_WIRE_GEOMETRY_CACHE, signature, vertices)
+    return _CAGE_WIRE_GEOMETRY_CACHE.put(signature, vertices)
 
 
 class SDHCageStagePickerGizmo(Gizmo):
@@ -1702,15 +1850,15 @@ class SDHCageStagePickerGizmo(Gizmo):
                     # deferred redraw scheduled above rebuilds it when idle.
                     pass
                 else:
-                    vertices = cage_picker_wire_vertices(
-                        properties, preview_state=(signature, output_frame))
-                    shape_factory = getattr(self, "new_custom_shape", None)
-                    self.custom_shape = (
-                        shape_factory("LINES", vertices)
-                        if callable(shape_factory) else vertices)
+                    with redraw_scheduler.measure(throttle_key):
+                        vertices = cage_picker_wire_vertices(
+                            properties, preview_state=(signature, output_frame))
+                        shape_factory = getattr(self, "new_custom_shape", None)
+                        self.custom_shape = (
+                            shape_factory("LINES", vertices)
+                            if callable(shape_factory) else vertices)
                     self.geometry_signature = picker_signature
-                    _store_wire_shape(
-                        throttle_key, picker_signature, True, rebuilt=True)
+                    _store_wire_shape(throttle_key, picker_signature, True)
             self.matrix_basis = cage_local_matrix(target, controller)
         style = CONTROLLER_STYLES.get(
             _primary_enabled_type(properties),
@@ -2582,47 +2730,65 @@ def ffd_point_world(target, controller, point_index):
     return ffd_corner_world(target, controller, point_index)
 
 
+def ffd_wire_signature(properties, *, effective=False):
+    """Return a cheap key that changes whenever the FFD wire would change."""
+    signature = (
+        "SDH_FFD_WIRE_V1",
+        _rna_pointer(getattr(properties, "id_data", None)),
+        ffd_point_generation(properties),
+        tuple(ffd_resolution(properties)),
+        bool(getattr(properties, "ffd_use_outside", False)),
+        tuple(float(value).hex() for value in properties.size),
+        bool(effective),
+    )
+    if not is_dedicated_ffd(properties):
+        signature += (tuple(
+            float(value) for value in getattr(properties, "ffd_offsets", ())),)
+    return signature
+
+
+def ffd_wire_has_weighted_offsets(properties):
+    """Return whether any partial point weight separates authored and runtime."""
+    arrays = ffd_point_arrays(properties)
+    if not len(arrays.offsets):
+        return False
+    hidden = arrays.offsets * (1.0 - arrays.influences)[:, None]
+    return bool(np.any(np.abs(hidden) > 1.0e-7))
+
+
 def ffd_wire_geometry(properties, *, effective=False):
-    """Return the authored cage or its weighted runtime result."""
-    resolution = ffd_resolution(properties)
-    surface_only = bool(getattr(properties, "ffd_use_outside", False))
+    """Return the authored cage or its weighted runtime result.
+
+    Vertices are one ``(N, 3)`` float32 array built from a bulk offset read;
+    edges are the cached int32 topology for the resolution and hollow mode.
+    """
+    resolution = tuple(ffd_resolution(properties))
+    topology = _core_module.ffd_wire_topology(
+        resolution, bool(getattr(properties, "ffd_use_outside", False)))
+    count = len(topology.surface)
     offset_for = (
         ffd_point_effective_offset if effective else ffd_point_offset)
-    vertices = tuple(
-        ffd_point_source_local(properties, index) +
-        offset_for(properties, index)
-        for index in range(math.prod(resolution))
-    )
-    edges = []
-    for w in range(resolution[2]):
-        for v in range(resolution[1]):
-            for u in range(resolution[0]):
-                index = ffd_point_index(u, v, w, resolution)
-                if u + 1 < resolution[0]:
-                    neighbor = ffd_point_index(u + 1, v, w, resolution)
-                    if (
-                            not surface_only or
-                            ffd_point_is_surface(index, resolution) and
-                            ffd_point_is_surface(neighbor, resolution)
-                    ):
-                        edges.append((index, neighbor))
-                if v + 1 < resolution[1]:
-                    neighbor = ffd_point_index(u, v + 1, w, resolution)
-                    if (
-                            not surface_only or
-                            ffd_point_is_surface(index, resolution) and
-                            ffd_point_is_surface(neighbor, resolution)
-                    ):
-                        edges.append((index, neighbor))
-                if w + 1 < resolution[2]:
-                    neighbor = ffd_point_index(u, v, w + 1, resolution)
-                    if (
-                            not surface_only or
-                            ffd_point_is_surface(index, resolution) and
-                            ffd_point_is_surface(neighbor, resolution)
-                    ):
-                        edges.append((index, neighbor))
-    return vertices, tuple(edges)
+    if not is_dedicated_ffd(properties):
+        vertices = np.array([
+            tuple(
+                ffd_point_source_local(properties, index) +
+                offset_for(properties, index))
+            for index in range(count)
+        ], dtype=np.float32).reshape(-1, 3)
+        return vertices, topology.edges
+    size = np.array(tuple(properties.size), dtype=np.float32)
+    vertices = (topology.grid - np.float32(0.5)) * size
+    arrays = ffd_point_arrays(properties)
+    offsets = arrays.offsets
+    if effective:
+        offsets = offsets * arrays.influences[:, None]
+    available = min(len(offsets), count)
+    vertices[:available] += offsets[:available]
+    # A collection that has not been resized yet falls back per point,
+    # exactly like the single-point readers.
+    for index in range(available, count):
+        vertices[index] += tuple(offset_for(properties, index))
+    return vertices, topology.edges
 
 
 class SDHCageFFDCornerGizmo(Gizmo):
@@ -3266,7 +3432,7 @@ class SDHCageFFDAggregateGizmo(Gizmo):
                 self,
                 entities,
                 picked,
-                self.aggregate_world_points,
+                lambda: _core_module.ffd_authored_local_points(properties),
                 self.aggregate_groups,
                 lambda anchor, orientation, group:
                     _core_module._ffd_face_winding_indices(
@@ -3274,6 +3440,13 @@ class SDHCageFFDAggregateGizmo(Gizmo):
                 color_for=lambda entity, group, highlighted: self._entity_color(
                     properties, entity, group,
                     bool(highlighted or entity == hover)),
+                matrix=cage_local_matrix(target, controller),
+                signature=(
+                    revision(properties),
+                    ffd_point_generation(properties),
+                    tuple(ffd_resolution(properties)),
+                    bool(getattr(properties, "ffd_use_outside", False)),
+                ),
             )
             batch_ok = True
         except (AttributeError, ReferenceError, RuntimeError, TypeError,
@@ -3327,29 +3500,26 @@ class SDHCageFFDAggregateGizmo(Gizmo):
             self.picked_entity = None
             return -1
         try:
-            from bpy_extras import view3d_utils
             region = context.region
             region_data = context.space_data.region_3d
-        except (AttributeError, ImportError):
+        except AttributeError:
             self.picked_entity = None
             return -1
-        projected_points = {}
-
-        def projected(index):
-            if index not in projected_points:
-                world = Vector(ffd_point_world(target, controller, index))
-                screen = view3d_utils.location_3d_to_region_2d(
-                    region, region_data, world)
-                if screen is None:
-                    projected_points[index] = None
-                else:
-                    try:
-                        depth = -float((region_data.view_matrix @ world).z)
-                    except (AttributeError, RuntimeError, TypeError, ValueError):
-                        depth = None
-                    projected_points[index] = (
-                        float(screen.x), float(screen.y), depth)
-            return projected_points[index]
+        points = source = None
+        if not is_dedicated_ffd(properties):
+            def points():
+                plan = display_deform_plan(properties)
+                return [
+                    tuple(deform_point_for_display(
+                        ffd_corner_source_point(properties, index),
+                        properties, plan=plan))
+                    for index in range(len(FFD_CORNERS))
+                ]
+            # Display points follow upstream chain stages and the preview
+            # frames, which the controller's own revision does not cover.
+            source = ("DISPLAY", cage_preview_geometry_state(properties)[0])
+        projected = ffd_view_projection(
+            target, controller, region, region_data, points, source)
 
         preferences = get_pref()
         try:
@@ -3611,9 +3781,12 @@ _BEND_TREND_FACE_AXES = {
 
 def _deformation_jacobian(
         properties, point, half, preview_output_frame=None):
-    """Finite-difference the configured deformation at a cage face point.
+    """Differentiate the configured deformation at a cage face point.
 
-    Face-normal samples are one-sided toward the cage interior.  This keeps
+    Standalone stages use the closed-form Jacobian of the compiled plan,
+    whose clamps keep the interior derivative on the cage faces.  Linked
+    chains and chain-global previews finite-difference the display path;
+    face-normal samples are one-sided toward the cage interior.  This keeps
     WITHIN_BOX mode on the deformed branch instead of sampling an unchanged
     point immediately outside the limit.
     """
@@ -3621,15 +3794,38 @@ def _deformation_jacobian(
         _core_module.chain_global_stretch_preview_state(properties))
     chain_prefix_state = (
         _core_module.chain_global_prefix_preview_state(properties))
+    plan = display_deform_plan(
+        properties, preview_output_frame=preview_output_frame,
+        chain_prefix_state=chain_prefix_state)
 
     def preview(value):
         return Vector(deform_point_for_display(
-            value, properties,
+            value, properties, plan=plan,
             chain_prefix_state=chain_prefix_state,
             chain_stretch_state=chain_stretch_state,
             preview_output_frame=preview_output_frame))
 
     point = Vector(point)
+    analytic = deform_point_with_jacobian_for_display(
+        point, properties, plan=plan,
+        preview_output_frame=preview_output_frame,
+        chain_prefix_state=chain_prefix_state,
+        chain_stretch_state=chain_stretch_state,
+    )
+    if analytic is not None:
+        center, analytic_jacobian = analytic
+        jacobian = Matrix.Identity(3)
+        for axis in range(3):
+            derivative = Vector(analytic_jacobian.col[axis])
+            if derivative.length <= EPSILON:
+                derivative = Vector((
+                    1.0 if axis == 0 else 0.0,
+                    1.0 if axis == 1 else 0.0,
+                    1.0 if axis == 2 else 0.0,
+                ))
+            jacobian.col[axis] = derivative
+        return Vector(center), jacobian
+
     center = preview(point)
     jacobian = Matrix.Identity(3)
     for axis in range(3):
@@ -3701,8 +3897,7 @@ def _bend_trend_local_frames(properties):
             center.freeze(),
             jacobian.copy().freeze(),
         )
-    return _cache_geometry(
-        _BEND_TREND_LOCAL_FRAME_CACHE, signature, frames)
+    return _BEND_TREND_LOCAL_FRAME_CACHE.put(signature, frames)
 
 
 def bend_trend_deformed_face_frame(properties, alignment):
@@ -4795,24 +4990,24 @@ def _prepare_other_stage_bundle(
             _mark_matrix_fresh(handle)
         _request_throttled_redraw()
         return
-    now = monotonic()
+    schedule_key = ("BUNDLE_MATRIX", stage_pointer)
     if (
             bundle.get("_matrix_stage") == stage_pointer and
             bundle.get("_matrix_visible") == visible_ids and
-            now - bundle.get("_matrix_time", 0.0) <
-            _BUNDLE_MATRIX_THROTTLE_WINDOW
+            not redraw_scheduler.allow(schedule_key)
     ):
         # Inactive-stage handles keep their previously prepared matrices
-        # during an input burst; the active stage stays per-event exact.
+        # while the frame budget is spent; the active stage stays per-event
+        # exact.
         _request_throttled_redraw()
         return
     bundle["_matrix_stage"] = stage_pointer
     bundle["_matrix_visible"] = visible_ids
-    bundle["_matrix_time"] = now
-    for handle in visible_handles:
-        _invalidate_matrix_fresh(handle)
-        handle._update_matrix(context)
-        _mark_matrix_fresh(handle)
+    with redraw_scheduler.measure(schedule_key):
+        for handle in visible_handles:
+            _invalidate_matrix_fresh(handle)
+            handle._update_matrix(context)
+            _mark_matrix_fresh(handle)
 
 
 class SDHCageDeformGizmoGroup(GizmoGroup):
@@ -0,0 +1,74 @@
+"""Process-local GPU batch cache for viewport cage overlays.
+
+Redraws reuse one uploaded ``GPUBatch`` per draw slot until the slot's
+source changes.  Sources are compared by identity first, so tuples returned
+by the signature-keyed geometry caches hit without touching their contents,
+and by value otherwise.  Cached batches hold cage-local vertices; callers
+apply the cage matrix through ``gpu.matrix`` so moving a controller or
+orbiting the view reuses the uploaded buffers.
+"""
+from __future__ import annotations
+
+import gpu
+from gpu_extras.batch import batch_for_shader
+
+from .lru_cache import BoundedLRUCache
+
+
+# Entries are ``(source, batch)``; their size is the uploaded buffer size
+# estimated from the geometry, not the Python wrapper.
+_BATCHES = BoundedLRUCache(
+    "gpu_batches", limit=256, byte_budget=64 * 1024 * 1024)
+_SHADERS = {}
+
+
+def batch_cache():
+    return _BATCHES
+
+
+def clear_batch_cache():
+    """Release every cached batch, for example after unregistering."""
+    _BATCHES.clear()
+    _SHADERS.clear()
+
+
+def builtin_shader(name):
+    shader = _SHADERS.get(name)
+    if shader is None:
+        shader = gpu.shader.from_builtin(name)
+        _SHADERS[name] = shader
+    return shader
+
+
+def cached_batch(key, source, shader, primitive, geometry):
+    """Return a cached batch; ``geometry()`` yields ``(content, indices)``.
+
+    ``geometry`` only runs on a miss, so callers can defer tessellation and
+    world transforms until the source actually changed.
+    """
+    entry = _BATCHES.peek(key)
+    if entry is not None and (entry[0] is source or entry[0] == source):
+        return _BATCHES.get(key)[1]
+    _BATCHES.misses += 1
+    content, indices = geometry()
+    if indices is None:
+        batch = batch_for_shader(shader, primitive, content)
+    else:
+        batch = batch_for_shader(shader, primitive, content, indices=indices)
+    size = sum(len(values) for values in content.values()) * 16
+    size += 0 if indices is None else len(indices) * 8
+    _BATCHES.put(key, (source, batch), size=size)
+    return batch
+
+
+def draw_batch(batch, shader, matrix=None, color=None):
+    """Draw one batch, optionally under a model matrix and uniform color."""
+    shader.bind()
+    if color is not None:
+        shader.uniform_float("color", color)
+    if matrix is None:
+        batch.draw(shader)
+        return
+    with gpu.matrix.push_pop():
+        gpu.matrix.multiply_matrix(matrix)
+        batch.draw(shader)
@@ -0,0 +1,162 @@
+"""Batched Geometry Nodes input writes for controller synchronization.
+
+Synchronizers used to write modifier inputs one socket at a time and tag the
+target after every pass, so a reconnect that re-synced each stage of a long
+chain tagged the same target once per stage.  Inside a batch, writes are
+collected per modifier and reads see the pending values.  When the outermost
+batch closes, every pending value is diffed against a snapshot of the socket
+taken before its first write in the batch, only changed sockets are written,
+and each affected target is tagged once.  Outside a batch, writes and tags
+are applied immediately.
+
+The snapshot lives for one outermost batch only, so a socket edited by hand
+between passes is never mistaken for the value last written.
+
+The module has no Blender dependency.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+
+_STALE_ERRORS = (
+    AttributeError, ReferenceError, RuntimeError, TypeError, ValueError)
+_MISSING = object()
+
+
+class ModifierInputBatch:
+    """Collect modifier input writes and apply them per modifier.
+
+    ``read(modifier, identifier)`` and ``write(modifier, identifier, value)``
+    access one socket, ``tag(target)`` requests re-evaluation,
+    ``different(old, value)`` compares socket values, and ``key(obj)``
+    returns a stable identity.  A modifier's target is its ``id_data``.
+    """
+
+    def __init__(self, *, read, write, tag, different, key):
+        self._read = read
+        self._write = write
+        self._tag = tag
+        self._different = different
+        self._key = key
+        self._pending = {}
+        self._snapshot = {}
+        self._targets = {}
+        self.depth = 0
+        self.writes = 0
+        self.skipped = 0
+        self.failed = 0
+        self.tags = 0
+
+    @property
+    def active(self):
+        return self.depth > 0
+
+    def begin(self):
+        self.depth += 1
+
+    def end(self):
+        """Close one batch level; the outermost level flushes."""
+        self.depth = max(self.depth - 1, 0)
+        if not self.depth:
+            self.flush()
+
+    @contextmanager
+    def batch(self):
+        self.begin()
+        try:
+            yield self
+        finally:
+            self.end()
+
+    def _identity(self, obj):
+        return self._key(obj) or id(obj)
+
+    def set(self, modifier, identifier, value):
+        """Write one socket now, or queue it while a batch is open."""
+        if not self.depth:
+            self._write(modifier, identifier, value)
+            self.writes += 1
+            return
+        modifier_key = self._identity(modifier)
+        slot = (modifier_key, identifier)
+        if slot not in self._snapshot:
+            try:
+                self._snapshot[slot] = self._read(modifier, identifier)
+            except _STALE_ERRORS:
+                self._snapshot[slot] = _MISSING
+        entry = self._pending.get(modifier_key)
+        if entry is None:
+            entry = self._pending[modifier_key] = (modifier, {})
+        entry[1][identifier] = value
+
+    def pending(self, modifier, identifier, default=None):
+        """Return the value queued for a socket, or ``default``."""
+        if not self._pending:
+            return default
+        entry = self._pending.get(self._identity(modifier))
+        if entry is None:
+            return default
+        return entry[1].get(identifier, default)
+
+    def tag(self, target):
+        """Tag ``target`` now, or once when the outermost batch closes."""
+        if target is None:
+            return
+        if not self.depth:
+            self._tag_now(target)
+            return
+        self._targets.setdefault(self._identity(target), target)
+
+    def _tag_now(self, target):
+        try:
+            self._tag(target)
+        except _STALE_ERRORS:
+            return
+        self.tags += 1
+
+    def flush(self):
+        """Write every changed pending socket and tag each target once."""
+        pending, self._pending = self._pending, {}
+        targets, self._targets = self._targets, {}
+        snapshot, self._snapshot = self._snapshot, {}
+        for modifier_key, (modifier, values) in pending.items():
+            written = False
+            for identifier, value in values.items():
+                old = snapshot.get((modifier_key, identifier), _MISSING)
+                if old is not _MISSING and not self._different(old, value):
+                    self.skipped += 1
+                    continue
+                try:
+                    self._write(modifier, identifier, value)
+                except _STALE_ERRORS:
+                    # The stage may have been removed while the batch was
+                    # open, or one socket changed type; the remaining
+                    # sockets are still tried.
+                    self.failed += 1
+                    continue
+                self.writes += 1
+                written = True
+            if written:
+                target = getattr(modifier, "id_data", None)
+                if target is not None:
+                    targets.setdefault(self._identity(target), target)
+        for target in targets.values():
+            self._tag_now(target)
+
+    def clear(self):
+        """Drop pending writes without applying them."""
+        self._pending.clear()
+        self._snapshot.clear()
+        self._targets.clear()
+        self.depth = 0
+
+    def info(self):
+        return {
+            "depth": self.depth,
+            "pending": sum(len(values) for _, values in self._pending.values()),
+            "writes": self.writes,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "tags": self.tags,
+        }
@@ -0,0 +1,169 @@
+"""Bounded LRU caches with entry and byte budgets for redraw-time geometry.
+
+Viewport caches used to empty themselves completely once they reached a
+fixed entry count.  In a long chain that wipe lands in the middle of a drag
+and every stage is re-sampled in the same redraw.  ``BoundedLRUCache`` evicts
+only the least recently used entries instead, and accounts an approximate
+byte size per entry so large tessellations cannot grow without bound.
+
+Every cache registers itself by name; ``cache_stats()`` reports hits,
+misses, evictions, and sizes for the diagnostics operator.  The module has
+no Blender dependency.
+"""
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+
+
+_MISSING = object()
+_REGISTRY = {}
+_CONTAINERS = (tuple, list, set, frozenset)
+
+
+def estimate_size(value, _seen=None):
+    """Return an approximate retained size of ``value`` in bytes.
+
+    Containers are walked recursively and shared members are counted once;
+    NumPy arrays report their buffer size.  Other objects, including
+    ``mathutils`` values, use ``sys.getsizeof``.
+    """
+    if _seen is None:
+        _seen = set()
+    identity = id(value)
+    if identity in _seen:
+        return 0
+    _seen.add(identity)
+    size = sys.getsizeof(value, 64)
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return size + nbytes
+    if isinstance(value, _CONTAINERS):
+        return size + sum(estimate_size(item, _seen) for item in value)
+    if isinstance(value, dict):
+        return size + sum(
+            estimate_size(key, _seen) + estimate_size(item, _seen)
+            for key, item in value.items())
+    return size
+
+
+class BoundedLRUCache:
+    """Least-recently-used mapping bounded by entries and estimated bytes.
+
+    ``get`` refreshes recency, ``put`` evicts old entries until both budgets
+    hold again.  The newest entry is always kept, even when it alone exceeds
+    ``byte_budget``, so the state of the current drag is never dropped.
+    """
+
+    def __init__(self, name, *, limit=64, byte_budget=None, sizeof=None):
+        self.name = str(name)
+        self.limit = max(int(limit), 1)
+        self.byte_budget = (
+            None if byte_budget is None else max(int(byte_budget), 0))
+        self._sizeof = estimate_size if sizeof is None else sizeof
+        self._values = OrderedDict()
+        self._sizes = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        _REGISTRY[self.name] = self
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, key):
+        return key in self._values
+
+    def __iter__(self):
+        return iter(tuple(self._values))
+
+    def keys(self):
+        return tuple(self._values)
+
+    def get(self, key, default=None):
+        value = self._values.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self._values.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def peek(self, key, default=None):
+        """Return a value without touching recency or counters."""
+        return self._values.get(key, default)
+
+    def put(self, key, value, *, size=None):
+        """Store ``value`` as the most recent entry and return it."""
+        self._discard(key)
+        size = self._sizeof(value) if size is None else int(size)
+        self._values[key] = value
+        self._sizes[key] = size
+        self.bytes += size
+        self._evict()
+        return value
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def pop(self, key, default=None):
+        value = self._values.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        self._discard(key)
+        return value
+
+    def clear(self):
+        """Drop every entry; counters survive so stats span the session."""
+        self._values.clear()
+        self._sizes.clear()
+        self.bytes = 0
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def info(self):
+        requests = self.hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._values),
+            "limit": self.limit,
+            "bytes": self.bytes,
+            "byte_budget": self.byte_budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / requests if requests else 0.0,
+        }
+
+    def _discard(self, key):
+        if key in self._values:
+            del self._values[key]
+            self.bytes -= self._sizes.pop(key, 0)
+
+    def _over_budget(self):
+        return len(self._values) > self.limit or (
+            self.byte_budget is not None and self.bytes > self.byte_budget)
+
+    def _evict(self):
+        while len(self._values) > 1 and self._over_budget():
+            key, _value = self._values.popitem(last=False)
+            self.bytes -= self._sizes.pop(key, 0)
+            self.evictions += 1
+
+
+def registered_caches():
+    return tuple(_REGISTRY[name] for name in sorted(_REGISTRY))
+
+
+def cache_stats():
+    """Return ``info()`` for every registered cache, sorted by name."""
+    return tuple(cache.info() for cache in registered_caches())
+
+
+def reset_cache_stats():
+    for cache in registered_caches():
+        cache.reset_stats()
@@ -0,0 +1,191 @@
+"""Runtime index of managed objects keyed by their ownership UUIDs.
+
+Ownership lookups used to copy ``bpy.data.objects`` and compare custom
+properties object by object, which costs milliseconds per call in large
+scenes and ran from timers and polls.  ``OwnershipIndex`` files every object
+under the ``(table, key)`` pairs its classifier reports, for example a
+target UUID or a ``(target UUID, modifier UUID)`` pair, so lookups are
+dictionary hits.
+
+The index is maintained incrementally: ``note`` re-files one object after a
+UUID write or a depsgraph update, and ``invalidate`` drops everything after
+load and undo.  It also rebuilds itself when the object count changes,
+because deletions are never reported individually.  Every candidate is
+re-classified before it is returned, and a stale entry, for example a
+removed object or a rewritten UUID, triggers one rebuild and a retry.
+
+The module has no Blender dependency.
+"""
+from __future__ import annotations
+
+
+_STALE_ERRORS = (AttributeError, ReferenceError, RuntimeError, TypeError)
+
+
+class OwnershipIndex:
+    """Map ``(table, key)`` pairs to the objects classified under them.
+
+    ``objects()`` returns the live object collection, ``classify(obj)`` the
+    pairs one object belongs to, and ``pointer(obj)`` a stable identity or
+    ``0``.  Candidates keep the collection order of the last rebuild, also
+    when ``note`` re-files them, so the first valid candidate matches what a
+    linear scan would have found then.  Objects the rebuild did not see are
+    filed after the others.
+    """
+
+    def __init__(self, objects, classify, pointer):
+        self._objects = objects
+        self._classify = classify
+        self._pointer = pointer
+        self._tables = {}
+        self._entries = {}
+        self._order = {}
+        self._generation = None
+        self.epoch = 0
+        self.version = 0
+        self.rebuilds = 0
+        self.stale = 0
+
+    def _classification(self, obj):
+        try:
+            return tuple(dict.fromkeys(self._classify(obj)))
+        except _STALE_ERRORS:
+            return ()
+
+    def _count(self):
+        try:
+            return len(self._objects())
+        except _STALE_ERRORS:
+            return None
+
+    def invalidate(self):
+        """Forget every entry; the next lookup rebuilds from the collection."""
+        self.epoch += 1
+        self.version += 1
+        self._tables.clear()
+        self._entries.clear()
+        self._order.clear()
+        self._generation = None
+
+    def rebuild(self):
+        """Re-file every object of the collection."""
+        self._tables.clear()
+        self._entries.clear()
+        self._order.clear()
+        self._generation = None
+        try:
+            objects = tuple(self._objects())
+        except _STALE_ERRORS:
+            # Blender's restricted registration data has no objects yet.
+            return False
+        for index, obj in enumerate(objects):
+            self._order[self._key(obj)] = index
+            self._file(obj, self._classification(obj))
+        self._generation = (self.epoch, len(objects))
+        self.version += 1
+        self.rebuilds += 1
+        return True
+
+    def _key(self, obj):
+        # Blender may hand out a new Python wrapper for the same ID, so
+        # objects are identified by their RNA pointer.
+        return self._pointer(obj) or id(obj)
+
+    def _position(self, obj):
+        return self._order.get(self._key(obj), len(self._order))
+
+    def _file(self, obj, pairs):
+        pointer = self._key(obj)
+        if pairs:
+            self._entries[pointer] = (obj, pairs)
+        position = self._position(obj)
+        for table, key in pairs:
+            candidates = self._tables.setdefault(table, {}).setdefault(key, [])
+            index = len(candidates)
+            while index and self._position(candidates[index - 1]) > position:
+                index -= 1
+            candidates.insert(index, obj)
+
+    def _unfile(self, pointer):
+        entry = self._entries.pop(pointer, None)
+        if entry is None:
+            return
+        _obj, pairs = entry
+        for table, key in pairs:
+            candidates = self._tables.get(table, {}).get(key)
+            if not candidates:
+                continue
+            candidates[:] = [
+                candidate for candidate in candidates
+                if self._key(candidate) != pointer]
+            if not candidates:
+                del self._tables[table][key]
+
+    def _ensure(self):
+        count = self._count()
+        if count is None:
+            return False
+        if self._generation != (self.epoch, count):
+            return self.rebuild()
+        return True
+
+    def note(self, obj):
+        """Re-file one object whose ownership properties may have changed."""
+        if obj is None or self._generation is None:
+            return
+        pointer = self._key(obj)
+        pairs = self._classification(obj)
+        entry = self._entries.get(pointer)
+        if entry is not None and entry[1] == pairs:
+            return
+        self._unfile(pointer)
+        self._file(obj, pairs)
+        self.version += 1
+
+    def current_version(self):
+        """Return a token that changes whenever any object is re-filed."""
+        self._ensure()
+        return self.version
+
+    def _valid(self, obj, table, key):
+        return (table, key) in self._classification(obj)
+
+    def get(self, table, key):
+        """Return the live objects filed under ``key`` in collection order."""
+        for attempt in range(2):
+            if not self._ensure():
+                return ()
+            candidates = tuple(self._tables.get(table, {}).get(key, ()))
+            valid = tuple(
+                obj for obj in candidates if self._valid(obj, table, key))
+            if len(valid) == len(candidates) or attempt:
+                return valid
+            self.stale += 1
+            self.rebuild()
+        return ()
+
+    def first(self, table, key, default=None):
+        candidates = self.get(table, key)
+        return candidates[0] if candidates else default
+
+    def objects(self, *tables):
+        """Return every live object filed in ``tables``, without duplicates."""
+        if not self._ensure():
+            return ()
+        found = {}
+        for table in tables:
+            for key, candidates in tuple(self._tables.get(table, {}).items()):
+                for obj in candidates:
+                    if self._valid(obj, table, key):
+                        found.setdefault(self._key(obj), obj)
+        return tuple(found.values())
+
+    def info(self):
+        return {
+            "objects": len(self._entries),
+            "tables": {
+                table: len(keys) for table, keys in self._tables.items()},
+            "epoch": self.epoch,
+            "rebuilds": self.rebuilds,
+            "stale": self.stale,
+        }
@@ -0,0 +1,82 @@
+"""Screen-space level of detail for sampled cage preview rails.
+
+Preview rails used to be sampled at a fixed step count whatever the cage's
+on-screen size or deformation.  A rail of length ``L`` that turns by ``theta``
+and is drawn as ``n`` chords deviates from the true curve by about
+``L * theta / (8 * n ** 2)``, so the step count that keeps this chord error
+under a pixel tolerance follows from the rail's projected length and its
+measured turning.  Turning is measured once per preview signature on a coarse
+probe of the deformed rails; only the projection is per view.  Curve cages
+follow an arbitrary guide whose bends a coarse probe can step over, so they
+are probed at the guide resolution and never below the legacy 24 steps.
+Step counts snap to a short list of levels so zooming reuses cached geometry.
+
+The module has no Blender dependency.
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+
+LOD_LEVELS = (1, 2, 3, 4, 6, 8, 12, 16, 24, 32, 48)
+PROBE_STEPS = 8
+CURVE_PROBE_STEPS = 24
+PIXEL_TOLERANCE = 0.5
+_EPSILON = 1.0e-12
+
+
+def probe_steps(curve_resolution=None):
+    """Return the probe step count; pass the guide resolution of a Curve cage."""
+    if curve_resolution is None:
+        return PROBE_STEPS
+    return max(int(curve_resolution), CURVE_PROBE_STEPS)
+
+
+def rail_turning(rails):
+    """Return the total turning angle in radians of each sampled rail.
+
+    ``rails`` has shape ``(rail_count, samples, 3)``.  Joint angles of a
+    uniformly sampled arc add up to ``(n - 1) / n`` of its turning, which is
+    compensated so coarse probes do not under-sample bent rails.
+    """
+    rails = np.asarray(rails, dtype=np.float64)
+    segments = np.diff(rails, axis=1)
+    segment_count = segments.shape[1]
+    if segment_count < 2:
+        return np.zeros(rails.shape[0])
+    first = segments[:, :-1]
+    second = segments[:, 1:]
+    lengths = np.linalg.norm(segments, axis=2)
+    scale = lengths[:, :-1] * lengths[:, 1:]
+    degenerate = scale <= _EPSILON
+    cosine = np.einsum("rsi,rsi->rs", first, second) / np.where(
+        degenerate, 1.0, scale)
+    angles = np.where(degenerate, 0.0, np.arccos(np.clip(cosine, -1.0, 1.0)))
+    return angles.sum(axis=1) * (segment_count / (segment_count - 1))
+
+
+def rail_lod_steps(
+        screen_rails, valid, turning, *, maximum,
+        tolerance=PIXEL_TOLERANCE, levels=LOD_LEVELS):
+    """Return the smallest level whose chord error stays within ``tolerance``.
+
+    ``screen_rails`` has shape ``(rail_count, samples, 2)`` in pixels.  Rails
+    that cross behind the viewer have no meaningful screen length and use
+    ``maximum``, as does any need beyond the largest level not above it.
+    """
+    maximum = max(int(maximum), 1)
+    if not np.all(valid):
+        return maximum
+    screen = np.asarray(screen_rails, dtype=np.float64)
+    lengths = np.linalg.norm(np.diff(screen, axis=1), axis=2).sum(axis=1)
+    error = lengths * np.asarray(turning, dtype=np.float64) / (
+        8.0 * max(float(tolerance), _EPSILON))
+    needed = math.ceil(math.sqrt(max(float(error.max(initial=0.0)), 0.0)))
+    for level in levels:
+        if level >= maximum:
+            break
+        if level >= needed:
+            return level
+    return maximum
@@ -0,0 +1,161 @@
+"""Frame-budget scheduler for rate-limited cage preview rebuilds.
+
+Interactive drags change preview signatures on every event, so without a
+limit each redraw re-tessellates every affected stage.  The scheduler
+measures each rebuild and spends a per-frame millisecond budget: the active
+stage rebuilds once per frame regardless, inactive stages are admitted while
+the budget lasts, and a consumer deferred for ``max_defer_frames`` frames is
+admitted anyway so every preview converges.  Denied consumers keep their
+previous shape.
+
+Frames are delimited by ``begin_redraw`` from the viewport draw callback.
+Every 3D View draws once per redraw cycle, so a frame ends only when a
+viewport that already drew in it draws again; the other viewports of the
+same cycle share its budget.  A consumer that runs without a draw callback
+for ``frame_timeout`` seconds starts a new frame itself.  Per-key state is
+kept for the ``KEY_LIMIT`` most recently seen keys.  The module has no
+Blender dependency.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from time import perf_counter
+
+
+class FrameBudgetScheduler:
+    """Admit measured rebuilds per frame within a millisecond budget."""
+
+    # Rebuild costs are smoothed so one slow outlier does not starve a stage.
+    COST_SMOOTHING = 0.3
+    KEY_LIMIT = 512
+
+    def __init__(
+            self, budget_ms=4.0, *, max_defer_frames=8, frame_timeout=0.1,
+            clock=perf_counter):
+        self.budget_ms = max(float(budget_ms), 0.0)
+        self.max_defer_frames = max(int(max_defer_frames), 1)
+        self.frame_timeout = float(frame_timeout)
+        self._clock = clock
+        self._frame_start = clock()
+        self._costs = {}
+        self._rebuilt = {}
+        self._waiting = {}
+        self._seen = OrderedDict()
+        self._views = set()
+        self.frame = 0
+        self.spent_ms = 0.0
+        self.admitted = 0
+        self.deferred = 0
+        self.forced = 0
+
+    def begin_frame(self, budget_ms=None):
+        """Start a new frame, optionally with a new budget."""
+        if budget_ms is not None:
+            self.budget_ms = max(float(budget_ms), 0.0)
+        self.frame += 1
+        self._frame_start = self._clock()
+        self._views.clear()
+        self.spent_ms = 0.0
+
+    def begin_redraw(self, view, budget_ms=None):
+        """Join ``view`` to the current frame, or start the next frame.
+
+        A new frame starts when ``view`` already drew in the current one.
+        """
+        if view in self._views:
+            self.begin_frame(budget_ms)
+        elif budget_ms is not None:
+            self.budget_ms = max(float(budget_ms), 0.0)
+        self._views.add(view)
+
+    def _touch(self, key):
+        self._seen[key] = self.frame
+        self._seen.move_to_end(key)
+        while len(self._seen) > self.KEY_LIMIT:
+            stale, _frame = self._seen.popitem(last=False)
+            self._costs.pop(stale, None)
+            self._rebuilt.pop(stale, None)
+            self._waiting.pop(stale, None)
+
+    def _sync_frame(self):
+        if self._clock() - self._frame_start > self.frame_timeout:
+            self.begin_frame()
+
+    def allow(self, key, *, active=False):
+        """Return whether ``key`` may rebuild now.
+
+        Each key rebuilds at most once per frame.  Active keys are otherwise
+        always admitted and spend the budget first.
+        """
+        self._sync_frame()
+        self._touch(key)
+        if self._rebuilt.get(key) == self.frame:
+            return False
+        if active:
+            return self._admit(key)
+        if (
+                self.spent_ms <= 0.0 or
+                self.spent_ms + self._costs.get(key, 0.0) <= self.budget_ms
+        ):
+            return self._admit(key)
+        if self.frame - self._waiting.get(key, self.frame) >= (
+                self.max_defer_frames):
+            self.forced += 1
+            return self._admit(key)
+        self._waiting.setdefault(key, self.frame)
+        self.deferred += 1
+        return False
+
+    def _admit(self, key):
+        self._waiting.pop(key, None)
+        self.admitted += 1
+        return True
+
+    def record(self, key, elapsed_ms):
+        """Charge one measured rebuild to the current frame."""
+        elapsed_ms = max(float(elapsed_ms), 0.0)
+        self._touch(key)
+        self._rebuilt[key] = self.frame
+        self.spent_ms += elapsed_ms
+        previous = self._costs.get(key)
+        self._costs[key] = elapsed_ms if previous is None else (
+            previous + (elapsed_ms - previous) * self.COST_SMOOTHING)
+
+    @contextmanager
+    def measure(self, key):
+        """Time the enclosed rebuild and ``record`` it for ``key``."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.record(key, (self._clock() - start) * 1000.0)
+
+    def cost(self, key):
+        return self._costs.get(key)
+
+    def clear(self):
+        self._costs.clear()
+        self._rebuilt.clear()
+        self._waiting.clear()
+        self._seen.clear()
+        self._views.clear()
+        self.spent_ms = 0.0
+        self.admitted = 0
+        self.deferred = 0
+        self.forced = 0
+
+    def info(self):
+        return {
+            "frame": self.frame,
+            "budget_ms": self.budget_ms,
+            "spent_ms": self.spent_ms,
+            "admitted": self.admitted,
+            "deferred": self.deferred,
+            "forced": self.forced,
+            "waiting": len(self._waiting),
+            "keys": len(self._seen),
+        }
+
+
+redraw_scheduler = FrameBudgetScheduler()
@@ -0,0 +1,107 @@
+"""Per-controller revision counters used as redraw cache keys.
+
+Signature builders used to hash every authored float on each redraw and
+pick.  A controller's revision changes whenever one of its properties can
+have changed: property update callbacks and bulk writers bump it, the
+depsgraph handler bumps controllers it reports as updated, and frame
+changes, undo, and file loads advance a global epoch because animation and
+restored data never run update callbacks.  ``memoized`` reuses a built
+signature while that revision is unchanged, so idle redraws neither build
+nor compare the full tuple.
+
+Owners bumped individually are also remembered until
+``take_dirty_owners`` collects them, which lets controller synchronization
+visit only what changed instead of sweeping the scene.
+
+Set ``SDH_REVISION_DEBUG=1`` to rebuild every memoized value anyway and log
+any mismatch, which exposes a write path that forgot to bump.
+"""
+from __future__ import annotations
+
+import logging
+import os
+
+from .lru_cache import BoundedLRUCache
+from .node_runtime import rna_pointer as _pointer
+
+
+_LOG = logging.getLogger(__name__)
+DEBUG_VERIFY = os.environ.get("SDH_REVISION_DEBUG", "") not in {"", "0"}
+
+_EPOCH = 0
+_REVISIONS = {}
+_DIRTY = {}
+_MEMO = BoundedLRUCache("revisions.signatures", limit=1024)
+
+
+def _owner(properties):
+    return getattr(properties, "id_data", None) or properties
+
+
+def revision(properties):
+    """Return a token that changes whenever the owner's properties may."""
+    owner = _owner(properties)
+    return (
+        _EPOCH,
+        getattr(owner, "session_uid", None),
+        _REVISIONS.get(_pointer(owner), 0),
+    )
+
+
+def has_revision(properties):
+    """Return whether ``properties`` belongs to a tracked RNA owner."""
+    return bool(_pointer(_owner(properties)))
+
+
+def bump_revision(properties=None):
+    """Advance one owner's revision, or the global epoch for ``None``."""
+    global _EPOCH
+    if properties is None:
+        _EPOCH += 1
+        return
+    owner = _owner(properties)
+    pointer = _pointer(owner)
+    if pointer:
+        _REVISIONS[pointer] = _REVISIONS.get(pointer, 0) + 1
+        _DIRTY[pointer] = owner
+
+
+def take_dirty_owners():
+    """Return the owners bumped since the last call and forget them."""
+    owners = tuple(_DIRTY.values())
+    _DIRTY.clear()
+    return owners
+
+
+def clear_revisions():
+    global _EPOCH
+    _EPOCH += 1
+    _REVISIONS.clear()
+    _DIRTY.clear()
+    _MEMO.clear()
+
+
+def memoized(properties, slot, build):
+    """Return ``build()``, reused while the owner's revision is unchanged.
+
+    Values for owners without an RNA pointer are always rebuilt.
+    """
+    pointer = _pointer(_owner(properties))
+    if not pointer:
+        return build()
+    key = (pointer, slot)
+    token = revision(properties)
+    cached = _MEMO.get(key)
+    if cached is not None and cached[0] == token:
+        if not DEBUG_VERIFY:
+            return cached[1]
+        value = build()
+        if value == cached[1]:
+            return cached[1]
+        _LOG.warning(
+            "SDH revision %s for %r is stale; a property write did not "
+            "bump the controller revision", token, slot)
+    else:
+        value = build()
+    _MEMO.put(key, (token, value))
+    return value
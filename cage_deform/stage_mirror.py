@@ -49,26 +49,19 @@ def _mirror_ffd_points(properties):
     core.ensure_ffd_point_collection(properties)
     resolution = core.ffd_resolution(properties)
     points_u, points_v, points_w = resolution
-    points = properties.ffd_points
-    if len(points) != points_u * points_v * points_w:
+    if len(properties.ffd_points) != points_u * points_v * points_w:
         return
-    snapshot = tuple(
-        (tuple(point.offset), float(point.influence), bool(point.selected))
-        for point in points
-    )
-
-    def index_of(u, v, w):
-        return w * points_u * points_v + v * points_u + u
-
-    for w in range(points_w):
-        for v in range(points_v):
-            for u in range(points_u):
-                offset, influence, selected = snapshot[
-                    index_of(points_u - 1 - u, v, w)]
-                point = points[index_of(u, v, w)]
-                point.offset = (-offset[0], offset[1], offset[2])
-                point.influence = influence
-                point.selected = selected
+    # Points are stored W-major, then V, then U; reversing the last grid
+    # axis swaps every point with its mirrored U partner.
+    shape = (points_w, points_v, points_u)
+    offsets = core._read_ffd_offsets(properties).reshape(*shape, 3)
+    offsets = offsets[:, :, ::-1].reshape(-1, 3)
+    offsets[:, 0] *= -1.0
+    influences = core._read_ffd_influences(properties).reshape(shape)
+    selected = core._read_ffd_selected(properties).reshape(shape)
+    core._write_ffd_offsets(properties, offsets)
+    core._write_ffd_influences(properties, influences[:, :, ::-1])
+    core._write_ffd_selected(properties, selected[:, :, ::-1])
 
 
 def _mirror_legacy_ffd_offsets(properties):
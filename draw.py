@@ -244,6 +244,8 @@ class DrawHandler(DrawText):
                 cls.G_HandleData["handler"], "WINDOW")
         cls.G_HandleData.clear()
         cls.G_ShaderData.clear()
+        from .cage_deform.gpu_batches import clear_batch_cache
+        clear_batch_cache()
 
 
 class Draw3D(DrawHandler):
@@ -260,6 +262,11 @@ class Draw3D(DrawHandler):
 
     def draw_post_view(self):
         try:
+            from .cage_deform.redraw_budget import redraw_scheduler
+            region = bpy.context.region
+            redraw_scheduler.begin_redraw(
+                region.as_pointer() if region is not None else None,
+                getattr(self.pref, "cage_redraw_budget_ms", None))
             if self.draw_poll:
                 self._shader_set_prop_()
                 self.draw_3d(bpy.context)
@@ -309,8 +316,15 @@ class Draw3D(DrawHandler):
         )
         from .cage_deform.gizmos import (
             cage_preview_wire_indices,
+            cage_preview_wire_steps,
             cage_preview_wire_vertices,
             ffd_wire_geometry,
+            ffd_wire_signature,
+        )
+        from .cage_deform.gpu_batches import (
+            builtin_shader,
+            cached_batch,
+            draw_batch,
         )
         active_properties = getattr(
             active_controller, "sdh_cage_deform", None)
@@ -321,27 +335,17 @@ class Draw3D(DrawHandler):
         # The RGB values still follow each operation's controller type color.
         preview_alpha = 0.19
         ring_alpha = 0.12
-        steps = 12
+        # Rails are sampled by on-screen size and bend up to this many steps;
+        # distant or straight stages cost a handful of evaluations.
+        max_steps = 24
         ring_positions = (0.0, 0.5, 1.0)
-        rail_indices, ring_indices = cage_preview_wire_indices(
-            steps=steps, ring_positions=ring_positions)
-
-        rail_positions = []
-        rail_colors = []
-        rail_segments = []
-        ring_positions_world = []
-        ring_colors = []
-        ring_segments = []
-
-        def extend_geometry(
-                positions, colors, segments, vertices, indices, color):
-            offset = len(positions)
-            positions.extend(vertices)
-            colors.extend(color for _vertex in vertices)
-            segments.extend(
-                (offset + first, offset + second)
-                for first, second in indices)
+        region = getattr(context, "region", None)
+        region_data = getattr(context, "region_data", None)
 
+        # Each stage keeps its own cage-local vertex buffer and is drawn with
+        # its matrix and a uniform color, so a frame only re-uploads the
+        # stages whose wire signature changed and never expands colors.
+        shader = builtin_shader("POLYLINE_UNIFORM_COLOR")
         for stage_modifier in cage_modifiers(target):
             if stage_modifier == active_modifier or not stage_modifier.show_viewport:
                 continue
@@ -364,38 +368,46 @@ class Draw3D(DrawHandler):
                 primary_type,
                 CONTROLLER_STYLES["BEND"],
             )
-            rgb = style[1][:3]
+            rgb = tuple(style[1][:3])
             matrix = cage_local_matrix(target, stage_controller)
+            stage_key = ("STAGE_PREVIEW", self._draw_pointer(stage_controller))
             if str(getattr(properties, "cage_type", "STANDARD")) == "FFD":
-                wire_local, wire_indices = ffd_wire_geometry(
-                    properties, effective=True)
-                wire = self.matrix_calculation(matrix, wire_local)
-                extend_geometry(
-                    rail_positions, rail_colors, rail_segments,
-                    wire, wire_indices, (*rgb, preview_alpha))
+                def ffd_geometry(properties=properties):
+                    vertices, edges = ffd_wire_geometry(
+                        properties, effective=True)
+                    return {"pos": vertices}, edges
+
+                draw_batch(
+                    cached_batch(
+                        (*stage_key, "FFD"),
+                        ffd_wire_signature(properties, effective=True),
+                        shader, "LINES", ffd_geometry),
+                    shader, matrix, (*rgb, preview_alpha))
                 continue
-            try:
-                preview_key = ("PREVIEW", int(stage_controller.as_pointer()))
-            except (AttributeError, ReferenceError, RuntimeError, TypeError,
-                    ValueError):
-                preview_key = ("PREVIEW", id(stage_controller))
             wire_local = cage_preview_wire_vertices(
-                properties, steps=steps, ring_positions=ring_positions,
-                throttle_key=preview_key)
-            wire = self.matrix_calculation(matrix, wire_local)
-            extend_geometry(
-                rail_positions, rail_colors, rail_segments,
-                wire, rail_indices, (*rgb, preview_alpha))
-            extend_geometry(
-                ring_positions_world, ring_colors, ring_segments,
-                wire, ring_indices, (*rgb, ring_alpha))
-
-        if rail_positions:
-            self.draw_smooth_3d_shader_colors(
-                rail_positions, rail_segments, rail_colors)
-        if ring_positions_world:
-            self.draw_smooth_3d_shader_colors(
-                ring_positions_world, ring_segments, ring_colors)
+                properties, steps=max_steps, ring_positions=ring_positions,
+                throttle_key=("PREVIEW", stage_key[1]),
+                lod_view=(region, region_data, matrix))
+            rail_indices, ring_indices = cage_preview_wire_indices(
+                steps=cage_preview_wire_steps(wire_local, ring_positions),
+                ring_positions=ring_positions)
+            for slot, indices, alpha in (
+                    ("RAILS", rail_indices, preview_alpha),
+                    ("RINGS", ring_indices, ring_alpha)):
+                draw_batch(
+                    cached_batch(
+                        (*stage_key, slot), wire_local, shader, "LINES",
+                        lambda wire_local=wire_local, indices=indices: (
+                            {"pos": wire_local}, indices)),
+                    shader, matrix, (*rgb, alpha))
+
+    @staticmethod
+    def _draw_pointer(value):
+        try:
+            return int(value.as_pointer())
+        except (AttributeError, ReferenceError, RuntimeError, TypeError,
+                ValueError):
+            return id(value)
 
     def draw_cage_deform(self, context):
         from .cage_deform import (
@@ -407,10 +419,19 @@ class Draw3D(DrawHandler):
         from .cage_deform.gizmos import (
             cage_preview_guide_geometry,
             cage_preview_geometry_state,
+            cage_preview_lod_steps,
             cage_preview_ring_vertices,
             cage_preview_wire_indices,
+            cage_preview_wire_steps,
             cage_preview_wire_vertices,
             ffd_wire_geometry,
+            ffd_wire_has_weighted_offsets,
+            ffd_wire_signature,
+        )
+        from .cage_deform.gpu_batches import (
+            builtin_shader,
+            cached_batch,
+            draw_batch,
         )
         from .cage_deform.viewport import cage_overlay_depth_test
         target, modifier, controller = resolve_context_deform(
@@ -457,8 +478,11 @@ class Draw3D(DrawHandler):
 
         # Trend selection and ordinary editing share this exact cached sample.
         # The chooser therefore previews the current combined deformation and
-        # never overlays the old undeformed reference box.
-        steps = 24
+        # never overlays the old undeformed reference box.  Rails are sampled
+        # by on-screen size and bend, up to ``max_steps``.
+        max_steps = 48
+        region = getattr(context, "region", None)
+        region_data = getattr(context, "region_data", None)
         effect_caps = ()
         if is_curve:
             range_start, range_end = curve_effect_range(properties)
@@ -483,37 +507,54 @@ class Draw3D(DrawHandler):
         else:
             ring_positions = (0.0, 0.25, 0.5, 0.75, 1.0)
         preview_state = cage_preview_geometry_state(properties)
+        steps = cage_preview_lod_steps(
+            properties, region, region_data, matrix, maximum=max_steps,
+            preview_state=preview_state)
+        # Wire batches hold cage-local vertices and are re-uploaded only when
+        # their geometry signature changes; the cage matrix is applied on the
+        # GPU so orbiting and moving the controller reuse the same buffers.
+        uniform_shader = builtin_shader("POLYLINE_UNIFORM_COLOR")
+        batch_key = ("ACTIVE_CAGE", self._draw_pointer(controller))
+
+        def local_batch(slot, source, geometry):
+            return cached_batch(
+                (*batch_key, slot), source, uniform_shader, "LINES",
+                geometry)
+
+        def ffd_geometry(effective):
+            vertices, edges = ffd_wire_geometry(
+                properties, effective=effective)
+            return {"pos": vertices}, edges
+
         if cage_type == "FFD":
-            wire_local, wire_indices = ffd_wire_geometry(properties)
-            wire = self.matrix_calculation(matrix, wire_local)
-            effective_local, _effective_indices = ffd_wire_geometry(
-                properties, effective=True)
-            effective_wire = self.matrix_calculation(matrix, effective_local)
-            if any(
-                    (Vector(authored) - Vector(effective)).length > 1.0e-7
-                    for authored, effective in zip(wire, effective_wire)
-            ):
+            if ffd_wire_has_weighted_offsets(properties):
                 # Weight is a deformation mask, not a handle sensitivity.
                 # Keep the authored cage under the cursor and show the actual
                 # evaluated lattice as a quiet secondary reference.
-                self.draw_smooth_3d_shader(
-                    effective_wire, wire_indices,
-                    (1.0, 0.58, 0.18, 0.22))
-            self.draw_smooth_3d_shader(
-                wire, wire_indices, (0.0, 0.72, 1.0, cage_alpha))
+                draw_batch(
+                    local_batch(
+                        "FFD_EFFECTIVE",
+                        ffd_wire_signature(properties, effective=True),
+                        lambda: ffd_geometry(True)),
+                    uniform_shader, matrix, (1.0, 0.58, 0.18, 0.22))
+            draw_batch(
+                local_batch(
+                    "FFD", ffd_wire_signature(properties),
+                    lambda: ffd_geometry(False)),
+                uniform_shader, matrix, (0.0, 0.72, 1.0, cage_alpha))
         else:
-            try:
-                active_key = ("ACTIVE_WIRE", int(controller.as_pointer()))
-            except (AttributeError, ReferenceError, RuntimeError, TypeError,
-                    ValueError):
-                active_key = ("ACTIVE_WIRE", id(controller))
+            active_key = ("ACTIVE_WIRE", self._draw_pointer(controller))
             wire_local = cage_preview_wire_vertices(
                 properties, steps=steps, ring_positions=ring_positions,
-                preview_state=preview_state, throttle_key=active_key)
+                preview_state=preview_state, throttle_key=active_key,
+                throttle_active=True)
             rail_indices, ring_indices = cage_preview_wire_indices(
-                steps=steps, ring_positions=ring_positions)
-            wire = self.matrix_calculation(matrix, wire_local)
+                steps=cage_preview_wire_steps(wire_local, ring_positions),
+                ring_positions=ring_positions)
             if is_curve and view_matrix is not None:
+                # Depth cueing depends on the view, so these colors are
+                # rebuilt per draw instead of being cached.
+                wire = self.matrix_calculation(matrix, wire_local)
                 self.draw_smooth_3d_shader_colors(
                     wire,
                     rail_indices,
@@ -529,10 +570,16 @@ class Draw3D(DrawHandler):
                         (0.0, 0.72, 1.0, ring_alpha)),
                 )
             else:
-                self.draw_smooth_3d_shader(
-                    wire, rail_indices, (0.0, 0.72, 1.0, cage_alpha))
-                self.draw_smooth_3d_shader(
-                    wire, ring_indices, (0.0, 0.72, 1.0, ring_alpha))
+                draw_batch(
+                    local_batch(
+                        "RAILS", (wire_local, rail_indices),
+                        lambda: ({"pos": wire_local}, rail_indices)),
+                    uniform_shader, matrix, (0.0, 0.72, 1.0, cage_alpha))
+                draw_batch(
+                    local_batch(
+                        "RINGS", (wire_local, ring_indices),
+                        lambda: ({"pos": wire_local}, ring_indices)),
+                    uniform_shader, matrix, (0.0, 0.72, 1.0, ring_alpha))
 
         # Curve effect limits are not a second cage.  Draw only their two cap
         # loops, in the same top/bottom colors as the boundary handles.  The
@@ -590,14 +637,24 @@ class Draw3D(DrawHandler):
             cage_preview_guide_geometry(
                 properties, rail_offsets, steps=steps,
                 preview_state=preview_state))
-        guide = self.matrix_calculation(matrix, guide_local)
-        if guide:
-            self.draw_smooth_3d_shader(
-                guide, guide_indices, (1.0, 0.28, 0.02, guide_alpha))
-        endpoints = tuple(guide[index] for index in endpoint_indices)
-        self.draw_3d_shader(
-            endpoints, (), (1.0, 0.55, 0.05, min(1.0, guide_alpha + 0.35)),
-            shader_name="UNIFORM_COLOR", draw_type="POINTS")
+        if guide_local:
+            draw_batch(
+                local_batch(
+                    "GUIDES", (guide_local, guide_indices),
+                    lambda: ({"pos": guide_local}, guide_indices)),
+                uniform_shader, matrix, (1.0, 0.28, 0.02, guide_alpha))
+        if endpoint_indices:
+            point_shader = builtin_shader("UNIFORM_COLOR")
+            draw_batch(
+                cached_batch(
+                    (*batch_key, "ENDPOINTS"),
+                    (guide_local, endpoint_indices),
+                    point_shader, "POINTS",
+                    lambda: ({"pos": tuple(
+                        guide_local[index] for index in endpoint_indices)},
+                        None)),
+                point_shader, matrix,
+                (1.0, 0.55, 0.05, min(1.0, guide_alpha + 0.35)))
         self._shader_set_prop_()
         return True
 
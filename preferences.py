@@ -234,6 +234,19 @@ class SimpleDeformGizmoAddonPreferences(AddonPreferences, GizmoUtils):
         min=5,
         max=60)
 
+    cage_redraw_budget_ms: FloatProperty(
+        name="Cage Preview Budget (ms)",
+        description=(
+            "Time per viewport redraw spent rebuilding inactive cage previews "
+            "while dragging. The active cage always updates first; other "
+            "stages catch up over the following redraws"
+        ),
+        default=4.0,
+        min=0.5,
+        max=50.0,
+        precision=1,
+    )
+
     def draw(self, context):
         col = self.layout.column()
         col.prop(self, "show_gizmo")
@@ -252,6 +265,7 @@ class SimpleDeformGizmoAddonPreferences(AddonPreferences, GizmoUtils):
         col.prop(self, "show_drag_hud")
         col.prop(self, "warn_low_topology")
         col.prop(self, "wireframe_preview_fps")
+        col.prop(self, "cage_redraw_budget_ms")
 
         box = col.box()
         box.label(text="Shortcut Cheat Sheet", icon="EVENT_OS")
@@ -0,0 +1,188 @@
+"""Shared loader, timer, report, and baseline comparison for kernel benches.
+
+The kernel benchmarks import the dependency-neutral ``cage_deform`` modules
+directly, without registering the add-on or creating a scene.  They run in
+``blender --background`` or in any Python that provides the modules a kernel
+needs; ``deform_math`` needs ``mathutils``.  Groups whose dependency is
+missing are reported as skipped instead of failing the suite.
+"""
+from __future__ import annotations
+
+import importlib
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+import types
+from pathlib import Path
+
+
+SOURCE = Path(os.environ.get(
+    "SDH_BENCH_SOURCE",
+    str(Path(__file__).resolve().parents[2]),
+)).resolve()
+RESULT = Path(os.environ.get(
+    "SDH_BENCH_RESULT",
+    str(Path(__file__).resolve().with_name("kernel_benchmark.json")),
+)).resolve()
+BASELINE = Path(os.environ.get(
+    "SDH_BENCH_BASELINE",
+    str(Path(__file__).resolve().with_name("baseline.json")),
+)).resolve()
+SCHEMA = "sdh-kernel-benchmark/1"
+PACKAGE = "sdh_bench_cage_deform"
+POINT_COUNTS = (100, 1_000, 10_000, 100_000, 1_000_000)
+FFD_RESOLUTIONS = ((2, 2, 2), (3, 3, 3), (4, 4, 4), (5, 5, 5), (6, 6, 6))
+
+
+def _environment_float(name, default):
+    try:
+        return float(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return float(default)
+
+
+MAX_POINTS = int(_environment_float("SDH_BENCH_MAX_POINTS", POINT_COUNTS[-1]))
+# A case regresses when its best time exceeds the baseline by this ratio and
+# by at least ``MIN_DELTA_MS``; the absolute floor ignores timer jitter on
+# sub-millisecond cases.
+TOLERANCE = _environment_float("SDH_BENCH_TOLERANCE", 1.5)
+MIN_DELTA_MS = _environment_float("SDH_BENCH_MIN_DELTA_MS", 0.1)
+BUDGET_SECONDS = _environment_float("SDH_BENCH_CASE_SECONDS", 0.5)
+
+
+class Skip(Exception):
+    """Raised by a benchmark group whose runtime dependency is missing."""
+
+
+def point_counts():
+    return tuple(count for count in POINT_COUNTS if count <= MAX_POINTS)
+
+
+def load_kernel(name):
+    """Import one ``cage_deform`` module without running the add-on package.
+
+    ``cage_deform/__init__.py`` registers Blender classes, so the kernels are
+    loaded under a synthetic parent package that only provides their
+    relative imports.
+    """
+    package = sys.modules.get(PACKAGE)
+    if package is None:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [str(SOURCE / "cage_deform")]
+        sys.modules[PACKAGE] = package
+    try:
+        return importlib.import_module(f"{PACKAGE}.{name}")
+    except ImportError as error:
+        raise Skip(f"{name}: {error}") from error
+
+
+def measure(function, *, repeat=None, budget=None):
+    """Return per-call wall times in milliseconds.
+
+    Without an explicit ``repeat`` the case runs at least three times and
+    until the per-case budget is spent, capped at fifty samples.
+    """
+    budget = BUDGET_SECONDS if budget is None else budget
+    function()
+    samples = []
+    started = time.perf_counter()
+    while True:
+        call_started = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - call_started) * 1000.0)
+        if repeat is not None:
+            if len(samples) >= repeat:
+                break
+        elif len(samples) >= 3 and (
+                len(samples) >= 50 or
+                time.perf_counter() - started >= budget):
+            break
+    return samples
+
+
+class Suite:
+    """Collect benchmark cases for one report."""
+
+    def __init__(self):
+        self.cases = {}
+        self.skipped = {}
+
+    def run(self, group, name, function, *, params=None, items=None,
+            repeat=None):
+        samples = measure(function, repeat=repeat)
+        best = min(samples)
+        entry = {
+            "group": group,
+            "params": dict(params or {}),
+            "samples": len(samples),
+            "best_ms": round(best, 6),
+            "median_ms": round(statistics.median(samples), 6),
+        }
+        if items:
+            entry["items"] = int(items)
+            entry["best_ns_per_item"] = round(best * 1.0e6 / items, 3)
+        self.cases[f"{group}/{name}"] = entry
+        print(f"SDH_KERNEL_BENCH::CASE::{group}/{name}::"
+              f"{entry['best_ms']:.3f}ms", flush=True)
+        return entry
+
+    def skip(self, group, reason):
+        self.skipped[group] = str(reason)
+        print(f"SDH_KERNEL_BENCH::SKIP::{group}::{reason}", flush=True)
+
+    def report(self):
+        environment = {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+        }
+        numpy = sys.modules.get("numpy")
+        if numpy is not None:
+            environment["numpy"] = numpy.__version__
+        bpy = sys.modules.get("bpy")
+        if bpy is not None:
+            environment["blender"] = ".".join(
+                str(value) for value in getattr(bpy.app, "version", ()))
+        return {
+            "schema": SCHEMA,
+            "environment": environment,
+            "max_points": MAX_POINTS,
+            "cases": self.cases,
+            "skipped": self.skipped,
+        }
+
+
+def write_json(path, value):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(value, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8")
+
+
+def compare(report, baseline):
+    """Return ``(regressions, improvements, missing)`` against a baseline."""
+    regressions = []
+    improvements = []
+    reference = baseline.get("cases", {}) if baseline else {}
+    missing = sorted(name for name in report["cases"] if name not in reference)
+    for name, entry in sorted(report["cases"].items()):
+        previous = reference.get(name)
+        if previous is None or entry["params"] != previous.get("params"):
+            continue
+        before = float(previous.get("best_ms", 0.0))
+        after = float(entry["best_ms"])
+        if not math.isfinite(before) or before <= 0.0:
+            continue
+        ratio = after / before
+        entry["baseline_best_ms"] = before
+        entry["ratio"] = round(ratio, 4)
+        if ratio > TOLERANCE and after - before > MIN_DELTA_MS:
+            regressions.append((name, before, after, ratio))
+        elif ratio < 1.0 / TOLERANCE and before - after > MIN_DELTA_MS:
+            improvements.append((name, before, after, ratio))
+    return regressions, improvements, missing
@@ -0,0 +1,36 @@
+"""Benchmarks for operation-order normalization."""
+from __future__ import annotations
+
+import itertools
+
+import _harness
+
+
+GROUP = "deform_contract"
+
+
+def run(suite):
+    contract = _harness.load_kernel("deform_contract")
+    permutations = tuple(itertools.permutations(contract.DEFORM_ORDER))
+    suite.run(
+        GROUP, "normalize_deform_order/all_orders",
+        lambda: [contract.normalize_deform_order(order)
+                 for order in permutations],
+        params={"orders": len(permutations)},
+        items=len(permutations),
+    )
+    enabled = ("BEND", "SHEAR", "FFD")
+    suite.run(
+        GROUP, "normalize_deform_order/enabled_subset",
+        lambda: [contract.normalize_deform_order(order, enabled)
+                 for order in permutations],
+        params={"orders": len(permutations), "enabled": list(enabled)},
+        items=len(permutations),
+    )
+    suite.run(
+        GROUP, "deform_order_signature/all_orders",
+        lambda: [contract.deform_order_signature(order)
+                 for order in permutations],
+        params={"orders": len(permutations)},
+        items=len(permutations),
+    )
@@ -0,0 +1,171 @@
+"""Benchmarks for the scalar, batched, and Jacobian deformation kernels."""
+from __future__ import annotations
+
+import itertools
+
+import _harness
+
+
+GROUP = "deform_math"
+SIZE = (1.5, 3.0, 1.25)
+SCALAR_POINT_LIMIT = 10_000
+PERMUTATION_POINTS = 1_000
+# CURVE calls an arbitrary Python deformer per point, so it is measured on
+# its own at a small count instead of dominating every ordered case.
+LINEAR_OPERATIONS = ("BEND", "TWIST", "TAPER", "STRETCH", "SHEAR", "FFD")
+CHAIN_FRAMES = dict(
+    chain_root_stage=False,
+    chain_source_start=0.3,
+    chain_input_frame=(
+        (0.2, 0.1, -0.1), (1.0, 0.1, 0.0), (0.0, 1.0, 0.05),
+        (0.02, 0.0, 1.0)),
+    chain_output_frame=(
+        (0.1, 0.3, -0.2), (0.9, 0.1, 0.0), (0.0, 1.1, 0.1),
+        (0.05, 0.0, 1.0)),
+)
+
+
+def curve_deformer(point, authored_y, _size):
+    return (
+        point[0] + 0.1 * authored_y,
+        point[1] * 1.1,
+        point[2] - 0.05 * authored_y * authored_y,
+    )
+
+
+def stage_arguments(order, mode="LIMITED"):
+    return dict(
+        size=SIZE,
+        mode=mode,
+        origin="BOTTOM",
+        top_scale=(1.2, 0.9),
+        bottom_scale=(0.95, 1.1),
+        top_offset=(0.05, -0.05),
+        bottom_offset=(-0.1, 0.1),
+        deform_types=order,
+        deform_order=order,
+        bend_strength=1.3,
+        bend_direction=0.4,
+        twist_strength=0.9,
+        taper_factor=0.3,
+        stretch_factor=0.2,
+        shear_factors=(0.3, -0.2),
+        ffd_offsets=tuple(
+            0.05 * ((index * 7) % 5 - 2) for index in range(24)),
+        curve_deformer=curve_deformer,
+    )
+
+
+def points(count):
+    import numpy as np
+
+    generator = np.random.default_rng(count)
+    return generator.uniform(
+        (-0.9, -1.8, -0.75), (0.9, 1.8, 0.75), size=(count, 3))
+
+
+def run(suite):
+    deform_math = _harness.load_kernel("deform_math")
+    import numpy as np
+
+    full = LINEAR_OPERATIONS
+    orders = {"canonical": full, "reversed": tuple(reversed(full))}
+    for count in _harness.point_counts():
+        values = points(count)
+        for label, order in orders.items():
+            plan = deform_math.compile_deform_plan(**stage_arguments(order))
+            suite.run(
+                GROUP, f"evaluate/{label}/n={count}",
+                lambda plan=plan, values=values: deform_math.evaluate(
+                    plan, values),
+                params={"order": list(order), "points": count},
+                items=count,
+            )
+        plan = deform_math.compile_deform_plan(
+            **stage_arguments(full, "CHAINED"), **CHAIN_FRAMES)
+        sources = 0.3 + values[:, 1] + SIZE[1] * 0.5
+        suite.run(
+            GROUP, f"evaluate/chained/n={count}",
+            lambda plan=plan, values=values, sources=sources:
+            deform_math.evaluate(
+                plan, values, chain_source_coordinate=sources),
+            params={"order": list(full), "points": count, "mode": "CHAINED"},
+            items=count,
+        )
+        if count > SCALAR_POINT_LIMIT:
+            continue
+        rows = [tuple(row) for row in values]
+        kwargs = stage_arguments(full)
+        suite.run(
+            GROUP, f"scalar/canonical/n={count}",
+            lambda rows=rows, kwargs=kwargs: [
+                deform_math.deform_point_local(row, **kwargs)
+                for row in rows],
+            params={"order": list(full), "points": count},
+            items=count,
+        )
+        plan = deform_math.compile_deform_plan(**kwargs)
+        suite.run(
+            GROUP, f"scalar_plan/canonical/n={count}",
+            lambda rows=rows, plan=plan: [
+                deform_math.evaluate_point(plan, row) for row in rows],
+            params={"order": list(full), "points": count},
+            items=count,
+        )
+
+    values = points(min(SCALAR_POINT_LIMIT, _harness.MAX_POINTS))
+    count = len(values)
+    for operation in LINEAR_OPERATIONS:
+        plan = deform_math.compile_deform_plan(
+            **stage_arguments((operation,)))
+        suite.run(
+            GROUP, f"evaluate_single/{operation}/n={count}",
+            lambda plan=plan: deform_math.evaluate(plan, values),
+            params={"order": [operation], "points": count},
+            items=count,
+        )
+
+    curve_points = points(min(PERMUTATION_POINTS, _harness.MAX_POINTS))
+    count = len(curve_points)
+    plan = deform_math.compile_deform_plan(
+        **stage_arguments(full + ("CURVE",)))
+    suite.run(
+        GROUP, f"evaluate/curve/n={count}",
+        lambda: deform_math.evaluate(plan, curve_points),
+        params={"order": list(full + ("CURVE",)), "points": count},
+        items=count,
+    )
+
+    permutations = tuple(itertools.permutations(LINEAR_OPERATIONS))
+
+    def every_order():
+        for order in permutations:
+            deform_math.evaluate(
+                deform_math.compile_deform_plan(**stage_arguments(order)),
+                curve_points)
+
+    suite.run(
+        GROUP, f"evaluate_permutations/n={count}",
+        every_order,
+        params={"orders": len(permutations), "points": count},
+        items=len(permutations) * count,
+        repeat=1,
+    )
+    suite.run(
+        GROUP, "compile_permutations",
+        lambda: [
+            deform_math.compile_deform_plan(**stage_arguments(order))
+            for order in permutations],
+        params={"orders": len(permutations)},
+        items=len(permutations),
+    )
+
+    plan = deform_math.compile_deform_plan(**stage_arguments(full))
+    rows = [tuple(row) for row in np.asarray(curve_points)]
+    suite.run(
+        GROUP, f"jacobian/canonical/n={len(rows)}",
+        lambda: [deform_math.evaluate_with_jacobian(plan, row)
+                 for row in rows],
+        params={"order": list(full), "points": len(rows)},
+        items=len(rows),
+    )
@@ -0,0 +1,57 @@
+"""Benchmarks for the FFD anti-foldover guard."""
+from __future__ import annotations
+
+import math
+
+import _harness
+
+
+GROUP = "ffd_guard"
+SIZE = (2.0, 3.0, 1.5)
+
+
+def label(resolution):
+    return "x".join(str(value) for value in resolution)
+
+
+def run(suite):
+    guard = _harness.load_kernel("ffd_guard")
+    for resolution in _harness.FFD_RESOLUTIONS:
+        count = math.prod(resolution)
+        zero = tuple((0.0, 0.0, 0.0) for _index in range(count))
+        influences = (1.0,) * count
+        # A smooth shear keeps every cell valid; pushing the centre point
+        # through its neighbours folds the grid and forces the bisection.
+        smooth = tuple(
+            (0.05 * (index % resolution[0]), 0.0, 0.0)
+            for index in range(count))
+        folded = list(smooth)
+        folded[count // 2] = (0.0, SIZE[1] * 2.0, 0.0)
+        folded = tuple(folded)
+        points = guard._effective_points(SIZE, resolution, smooth, influences)
+        params = {"resolution": list(resolution)}
+        suite.run(
+            GROUP, f"minimum_jacobian_ratio/{label(resolution)}",
+            lambda points=points, resolution=resolution:
+            guard.minimum_jacobian_ratio(points, SIZE, resolution),
+            params=params,
+            items=count,
+        )
+        suite.run(
+            GROUP, f"clamp_offsets/accept/{label(resolution)}",
+            lambda resolution=resolution, zero=zero, smooth=smooth,
+            influences=influences: guard.clamp_offsets(
+                SIZE, resolution, zero, smooth, influences),
+            params=params,
+            items=count,
+        )
+        for solver in ("ANALYTIC", "BISECTION"):
+            suite.run(
+                GROUP, f"clamp_offsets/fold/{solver}/{label(resolution)}",
+                lambda resolution=resolution, zero=zero, folded=folded,
+                influences=influences, solver=solver: guard.clamp_offsets(
+                    SIZE, resolution, zero, folded, influences,
+                    solver=solver),
+                params=dict(params, solver=solver),
+                items=count,
+            )
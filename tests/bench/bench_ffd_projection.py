@@ -0,0 +1,178 @@
+"""Benchmarks for FFD screen projection, hit tests, and the entity cache."""
+from __future__ import annotations
+
+import math
+from types import SimpleNamespace
+
+import numpy as np
+
+import _harness
+
+
+GROUP = "ffd_projection"
+
+
+class ScreenPoint(tuple):
+    x = property(lambda self: self[0])
+    y = property(lambda self: self[1])
+
+
+def point_index(u, v, w, resolution):
+    return w * resolution[0] * resolution[1] + v * resolution[0] + u
+
+
+def properties_for(resolution):
+    count = math.prod(resolution)
+    return SimpleNamespace(
+        ffd_points=tuple(
+            SimpleNamespace(offset=(0.001 * index, 0.0, -0.002 * index))
+            for index in range(count)),
+        ffd_use_outside=False,
+        size=(2.0, 3.0, 1.5),
+        resolution=resolution,
+    )
+
+
+def project_point(index):
+    return ScreenPoint((index * 3.5, index * -1.25))
+
+
+# Entity sets are keyed by the projection's view.
+project_point.view_key = ("bench",)
+
+
+def builder(properties, project, mode, *, line_ratio, face_ratio):
+    return tuple(
+        project(index) for index in range(len(properties.ffd_points)))
+
+
+def grid_points(resolution):
+    return np.array([
+        (u, v, w)
+        for w in range(resolution[2])
+        for v in range(resolution[1])
+        for u in range(resolution[0])
+    ], dtype=np.float64) / np.maximum(np.array(resolution) - 1, 1) - 0.5
+
+
+def screen_entities(projection, resolution, mode):
+    """Build point, U-line, or UV-face entities like the selection code."""
+    screen = projection.screen
+    entities = []
+    for w in range(resolution[2]):
+        for v in range(resolution[1]):
+            for u in range(resolution[0]):
+                index = point_index(u, v, w, resolution)
+                if mode == "POINT":
+                    geometry = (tuple(screen[index]),)
+                elif mode == "LINE":
+                    if u:
+                        continue
+                    geometry = tuple(
+                        tuple(screen[point_index(step, v, w, resolution)])
+                        for step in range(resolution[0]))
+                else:
+                    if u + 1 >= resolution[0] or v + 1 >= resolution[1]:
+                        continue
+                    geometry = tuple(
+                        tuple(screen[point_index(u + du, v + dv, w, resolution)])
+                        for du, dv in ((0, 0), (1, 0), (1, 1), (0, 1)))
+                entities.append({"geometry": geometry})
+    return entities
+
+
+def label(resolution):
+    return "x".join(str(value) for value in resolution)
+
+
+PERSPECTIVE = (
+    (1.8, 0.0, 0.2, 0.0),
+    (0.0, 2.4, 0.1, 0.0),
+    (0.0, 0.0, -1.0, -0.2),
+    (0.0, 0.0, -1.0, 6.0),
+)
+VIEW = (
+    (1.0, 0.0, 0.0, 0.0),
+    (0.0, 1.0, 0.0, 0.0),
+    (0.0, 0.0, 1.0, -6.0),
+    (0.0, 0.0, 0.0, 1.0),
+)
+REGION = (1280, 720)
+
+
+def run(suite):
+    projection = _harness.load_kernel("ffd_projection")
+    for resolution in _harness.FFD_RESOLUTIONS:
+        points = grid_points(resolution)
+        projected = projection.project_points(
+            points, PERSPECTIVE, REGION, view_matrix=VIEW)
+        suite.run(
+            GROUP, f"project/{label(resolution)}",
+            lambda points=points: projection.project_points(
+                points, PERSPECTIVE, REGION, view_matrix=VIEW),
+            params={"resolution": list(resolution)}, items=len(points))
+        center = tuple(projected.screen.mean(axis=0))
+        bounds = (center[0] - 40.0, center[0] + 40.0,
+                  center[1] - 40.0, center[1] + 40.0)
+        for mode in ("POINT", "LINE", "FACE"):
+            entities = projection.FFDProjectedEntities(
+                screen_entities(projected, resolution, mode), mode)
+            # Segment arrays are built once per view, outside the hit tests.
+            entities.segments
+            params = {"resolution": list(resolution), "mode": mode}
+            suite.run(
+                GROUP, f"screen_hits/{mode}/{label(resolution)}",
+                lambda entities=entities, center=center:
+                entities.screen_hits(center),
+                params=params, items=len(entities))
+            suite.run(
+                GROUP, f"box_hits/{mode}/{label(resolution)}",
+                lambda entities=entities, bounds=bounds:
+                entities.box_hits(bounds),
+                params=params, items=len(entities))
+
+        properties = properties_for(resolution)
+        options = dict(
+            builder=builder,
+            resolution_function=lambda value: value.resolution,
+        )
+        params = {"resolution": list(resolution)}
+        count = math.prod(resolution)
+
+        def miss(properties=properties, options=options):
+            cache = projection.FFDProjectedEntityCache()
+            return cache.get(properties, project_point, "POINT", **options)
+
+        cache = projection.FFDProjectedEntityCache()
+        cache.get(properties, project_point, "POINT", **options)
+        suite.run(
+            GROUP, f"get/miss/{label(resolution)}", miss,
+            params=params, items=count)
+        suite.run(
+            GROUP, f"get/hit/{label(resolution)}",
+            lambda cache=cache, properties=properties, options=options:
+            cache.get(properties, project_point, "POINT", **options),
+            params=params, items=count)
+        # RNA owners key geometry by their revision instead of offsets.
+        owned = properties_for(resolution)
+        owned.as_pointer = lambda count=count: 0x1000 + count
+        cache.get(owned, project_point, "POINT", **options)
+        suite.run(
+            GROUP, f"get/hit_revision/{label(resolution)}",
+            lambda cache=cache, properties=owned, options=options:
+            cache.get(properties, project_point, "POINT", **options),
+            params=params, items=count)
+        region = SimpleNamespace(width=REGION[0], height=REGION[1])
+        region_data = SimpleNamespace(
+            perspective_matrix=PERSPECTIVE, view_matrix=VIEW)
+        points = grid_points(resolution)
+        cache.projection(
+            owned, resolution, lambda points=points: points,
+            region, region_data)
+        suite.run(
+            GROUP, f"projection/hit/{label(resolution)}",
+            lambda cache=cache, properties=owned, points=points,
+            resolution=resolution, region=region, region_data=region_data:
+            cache.projection(
+                properties, resolution, lambda: points, region, region_data),
+            params=params, items=count)
@@ -0,0 +1,106 @@
+"""Benchmarks for FFD resolution resampling."""
+from __future__ import annotations
+
+import math
+import tempfile
+
+import _harness
+
+
+GROUP = "ffd_resolution"
+INTERPOLATIONS = (
+    "KEY_LINEAR", "KEY_CARDINAL", "KEY_CATMULL_ROM", "KEY_BSPLINE")
+TRANSITIONS = (
+    ((2, 2, 2), (3, 3, 3)),
+    ((3, 3, 3), (4, 4, 4)),
+    ((4, 4, 4), (6, 6, 6)),
+    ((6, 6, 6), (4, 4, 4)),
+    ((2, 3, 4), (6, 5, 2)),
+)
+
+
+def label(resolution):
+    return "x".join(str(value) for value in resolution)
+
+
+def run(suite):
+    resolution_module = _harness.load_kernel("ffd_resolution")
+    with tempfile.TemporaryDirectory() as directory:
+        try:
+            _run(suite, resolution_module, directory)
+        finally:
+            resolution_module.set_persistent_cache_directory(None)
+            resolution_module.clear_axis_caches()
+
+
+def _run(suite, resolution_module, directory):
+    for interpolation in INTERPOLATIONS:
+        interpolations = (interpolation,) * 3
+        for old, new in TRANSITIONS:
+            count = math.prod(old)
+            offsets = tuple(
+                (0.01 * index, -0.02 * (index % 3), 0.03 * (index % 5))
+                for index in range(count))
+            name = f"{interpolation}/{label(old)}->{label(new)}"
+            params = {
+                "interpolation": interpolation,
+                "old": list(old),
+                "new": list(new),
+            }
+            suite.run(
+                GROUP, f"resample_offsets/warm/{name}",
+                lambda offsets=offsets, old=old, new=new,
+                interpolations=interpolations:
+                resolution_module.resample_offsets(
+                    offsets, old, new, interpolations),
+                params=params,
+                items=math.prod(new),
+            )
+
+            def cold(offsets=offsets, old=old, new=new,
+                     interpolations=interpolations):
+                resolution_module.set_persistent_cache_directory(False)
+                resolution_module.clear_axis_caches()
+                return resolution_module.resample_offsets(
+                    offsets, old, new, interpolations)
+
+            suite.run(
+                GROUP, f"resample_offsets/cold/{name}", cold,
+                params=params,
+                items=math.prod(new),
+                repeat=3,
+            )
+
+            # A new session: memory is empty, the solved tables are on disk.
+            resolution_module.set_persistent_cache_directory(directory)
+            resolution_module.resample_offsets(
+                offsets, old, new, interpolations)
+
+            def persisted(offsets=offsets, old=old, new=new,
+                          interpolations=interpolations):
+                resolution_module.clear_axis_caches()
+                return resolution_module.resample_offsets(
+                    offsets, old, new, interpolations)
+
+            suite.run(
+                GROUP, f"resample_offsets/persisted/{name}", persisted,
+                params=params,
+                items=math.prod(new),
+                repeat=3,
+            )
+        old, new = (4, 4, 4), (6, 6, 6)
+        values = tuple(
+            (index % 7) / 6.0 for index in range(math.prod(old)))
+        suite.run(
+            GROUP, f"resample_values/warm/{interpolation}/"
+            f"{label(old)}->{label(new)}",
+            lambda values=values, interpolations=interpolations:
+            resolution_module.resample_values(
+                values, old, new, interpolations),
+            params={
+                "interpolation": interpolation,
+                "old": list(old),
+                "new": list(new),
+            },
+            items=math.prod(new),
+        )
@@ -0,0 +1,109 @@
+"""Benchmark the dependency-neutral cage deformation kernels.
+
+Run with ``python tests/bench/run_kernel_benchmarks.py`` or, for the groups
+that need Blender modules, ``blender --background --factory-startup
+--python tests/bench/run_kernel_benchmarks.py``.  No scene, viewport, or
+add-on registration is involved.
+
+The report is written as sorted JSON to ``SDH_BENCH_RESULT`` (default
+``tests/bench/kernel_benchmark.json``) and compared with
+``tests/bench/baseline.json`` (``SDH_BENCH_BASELINE``).  A case regresses
+when its best time is slower than the baseline by more than
+``SDH_BENCH_TOLERANCE`` (default 1.5x); any regression, or a missing or
+incompatible baseline, exits non-zero.  Set ``SDH_BENCH_UPDATE_BASELINE=1``
+on the reference machine to store the current report as the new baseline.  ``SDH_BENCH_ONLY`` selects a
+comma-separated subset of groups and ``SDH_BENCH_MAX_POINTS`` caps the
+point-count sweep.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import _harness  # noqa: E402
+import bench_deform_contract  # noqa: E402
+import bench_deform_math  # noqa: E402
+import bench_ffd_guard  # noqa: E402
+import bench_ffd_projection  # noqa: E402
+import bench_ffd_resolution  # noqa: E402
+
+
+GROUPS = (
+    bench_deform_contract,
+    bench_deform_math,
+    bench_ffd_guard,
+    bench_ffd_resolution,
+    bench_ffd_projection,
+)
+
+
+def selected_groups():
+    only = {
+        name.strip() for name in os.environ.get("SDH_BENCH_ONLY", "").split(",")
+        if name.strip()
+    }
+    return tuple(
+        group for group in GROUPS if not only or group.GROUP in only)
+
+
+def main():
+    suite = _harness.Suite()
+    for group in selected_groups():
+        try:
+            group.run(suite)
+        except _harness.Skip as error:
+            suite.skip(group.GROUP, error)
+    report = suite.report()
+
+    baseline = None
+    if _harness.BASELINE.is_file():
+        baseline = json.loads(_harness.BASELINE.read_text(encoding="utf-8"))
+        if baseline.get("schema") != _harness.SCHEMA:
+            print(f"SDH_KERNEL_BENCH::BASELINE_SCHEMA::"
+                  f"{baseline.get('schema')!r}")
+            baseline = None
+    regressions, improvements, missing = _harness.compare(report, baseline)
+    report["comparison"] = {
+        "baseline": str(_harness.BASELINE) if baseline else None,
+        "tolerance": _harness.TOLERANCE,
+        "regressions": [name for name, *_values in regressions],
+        "improvements": [name for name, *_values in improvements],
+        "missing_from_baseline": missing,
+    }
+    _harness.write_json(_harness.RESULT, report)
+    print(f"SDH_KERNEL_BENCH::RESULT::{_harness.RESULT}")
+
+    if os.environ.get("SDH_BENCH_UPDATE_BASELINE") == "1":
+        stored = dict(report)
+        stored.pop("comparison")
+        _harness.write_json(_harness.BASELINE, stored)
+        print(f"SDH_KERNEL_BENCH::BASELINE_UPDATED::{_harness.BASELINE}")
+        return 0
+
+    for name, before, after, ratio in improvements:
+        print(f"SDH_KERNEL_BENCH::FASTER::{name}::"
+              f"{before:.3f}ms->{after:.3f}ms ({ratio:.2f}x)")
+    for name, before, after, ratio in regressions:
+        print(f"SDH_KERNEL_BENCH::REGRESSION::{name}::"
+              f"{before:.3f}ms->{after:.3f}ms ({ratio:.2f}x)")
+    if baseline is None:
+        print("SDH_KERNEL_BENCH::NO_BASELINE::"
+              "run with SDH_BENCH_UPDATE_BASELINE=1 to record one")
+        print("SDH_KERNEL_BENCH::FAIL")
+        return 1
+    if regressions:
+        print("SDH_KERNEL_BENCH::FAIL")
+        return 1
+    print("SDH_KERNEL_BENCH::PASS")
+    return 0
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    if exit_code:
+        raise SystemExit(exit_code)
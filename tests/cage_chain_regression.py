@@ -362,9 +362,10 @@ def native_modifier_reorder_recovery():
           "native modifier reorder was not detected")
 
     # Reproduce the depsgraph event emitted by the native Modifier-panel
-    # reorder.  The runtime handler must queue only this target's recoverable
-    # order mismatch; the actual metadata writes stay in the safe timer path.
+    # reorder.  The runtime handler only queues this chained target; chain
+    # validation and the actual metadata writes stay in the safe timer path.
     deform.core._CHAIN_RECONNECT_QUEUE.clear()
+    deform.core._CHAIN_VALIDATION_QUEUE.clear()
 
     class _GeometryUpdate:
         id = target
@@ -376,6 +377,10 @@ def native_modifier_reorder_recovery():
         updates = (_GeometryUpdate(),)
 
     deform.core._depsgraph_sync(None, _Depsgraph())
+    check(not deform.core._CHAIN_RECONNECT_QUEUE,
+          "depsgraph handler validated the chain inline")
+    check(deform.core._drain_chain_validation_queue() == 1,
+          "deferred validation did not find the recoverable reorder")
     chain_uuid = chain.stage_chain_uuid(reordered[0])
     queue_key = deform.core._chain_request_key(target, chain_uuid)
     check(queue_key in deform.core._CHAIN_RECONNECT_QUEUE,
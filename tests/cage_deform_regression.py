@@ -3,6 +3,7 @@
 import importlib
 import math
 import sys
+import time
 import traceback
 from pathlib import Path
 from types import SimpleNamespace
@@ -1230,6 +1231,29 @@ def animation_and_render_sync():
 case("animation_and_render_sync", animation_and_render_sync)
 
 
+def dirty_controller_sync():
+    core = deform.core
+    second_properties = stage_state["controller"].sdh_cage_deform
+    total = core.sync_all_controllers(pull_transform=False)
+    check(total >= 2, f"full sync found too few controllers: {total}")
+    # Drain echoes of the full pass's own writes before measuring idle cost.
+    core.sync_all_controllers(sync_mode="timer", dirty_only=True)
+    idle = core.sync_all_controllers(sync_mode="timer", dirty_only=True)
+    check(idle == 0, f"idle dirty-only sync visited {idle} controllers")
+    second_properties.bend_strength = math.radians(35.0)
+    visited = core.sync_all_controllers(sync_mode="timer", dirty_only=True)
+    check(1 <= visited < total,
+          f"dirty-only sync visited {visited} of {total} controllers")
+    core.request_full_controller_sync()
+    check(core.sync_all_controllers(
+        sync_mode="timer", dirty_only=True) == total,
+          "a requested reconciliation did not visit every controller")
+    return visited, total
+
+
+case("dirty_controller_sync", dirty_controller_sync)
+
+
 def cage_keyframe_operators():
     second = stage_state["second"]
     second_controller = stage_state["controller"]
@@ -1260,6 +1284,14 @@ def cage_keyframe_operators():
     }
     check(required.issubset(animated_paths),
           f"cage keyframe channels are missing: {required - set(animated_paths)!r}")
+    kinds = deform.core.controller_animated_channels(second_controller)
+    check({"PROPERTIES", "TRANSFORM"}.issubset(kinds),
+          f"animated-channel index missed keyed channels: {sorted(kinds)!r}")
+    frame_controllers = {
+        controller.name
+        for controller in deform.core.frame_sync_controllers()}
+    check(second_controller.name in frame_controllers,
+          "frame changes would not re-sync the keyed controller")
 
     scene.frame_set(25)
     expected_size = Vector((3.0, 6.0, 4.5))
@@ -1284,6 +1316,61 @@ def cage_keyframe_operators():
 case("cage_keyframe_operators", cage_keyframe_operators)
 
 
+def constrained_controller_frame_sync():
+    second_controller = stage_state["controller"]
+    controller = next(
+        candidate for candidate in (
+            deform.find_controller(obj, modifier) for modifier in obj.modifiers)
+        if candidate is not None and candidate != second_controller)
+    driver = bpy.data.objects.new("Constraint Driver", None)
+    bpy.context.collection.objects.link(driver)
+    constraint = controller.constraints.new("COPY_LOCATION")
+    constraint.target = driver
+    try:
+        deform.core.invalidate_animated_channels(controller)
+        deform.core.frame_sync_controllers()
+        kinds = deform.core.controller_animated_channels(controller)
+        check("DEPENDENCIES" in kinds,
+              f"constrained controller is not re-synced on frames: {kinds!r}")
+        check(controller in deform.core.frame_sync_controllers(),
+              "frame changes would skip the constrained controller")
+    finally:
+        controller.constraints.remove(constraint)
+        bpy.data.objects.remove(driver, do_unlink=True)
+        deform.core.invalidate_animated_channels(controller)
+    return sorted(kinds)
+
+
+case("constrained_controller_frame_sync", constrained_controller_frame_sync)
+
+
+def modifier_panel_edit_pulls_controller():
+    second = stage_state["second"]
+    second_controller = stage_state["controller"]
+    properties = second_controller.sdh_cage_deform
+    original = float(properties.twist_strength)
+    edited = original + math.radians(17.0)
+    deform.core.sync_all_controllers(pull_transform=True, sync_mode="timer")
+    try:
+        # A Modifier-panel edit writes the socket and reports the target;
+        # the controller itself receives no update.
+        deform.core.set_modifier_input(second, "Twist Angle", edited)
+        bpy.context.view_layer.update()
+        deform.core._CONTROLLER_FULL_SYNC_TIME = time.monotonic()
+        deform.core.sync_all_controllers(
+            pull_transform=True, sync_mode="timer", dirty_only=True)
+        check(abs(float(properties.twist_strength) - edited) < 1.0e-5,
+              "dirty-only sync did not pull a Modifier-panel socket edit")
+    finally:
+        properties.twist_strength = original
+        deform.sync_controller(second_controller, pull_transform=False)
+    return math.degrees(edited)
+
+
+case("modifier_panel_edit_pulls_controller",
+     modifier_panel_edit_pulls_controller)
+
+
 def survives_extension_disable():
     before = evaluated_points(obj)
     addon.unregister()
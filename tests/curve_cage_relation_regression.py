@@ -343,6 +343,18 @@ try:
     check(deform.core.curve_control_mode_identifier(properties) == "CURVE",
           "Legacy Fit Guide did not migrate to Curve mode")
 
+    # Reassigning the guide's Curve data must re-route datablock updates.
+    previous_data = guide.data
+    replacement = previous_data.copy()
+    guide.data = replacement
+    bpy.context.view_layer.update()
+    dispatch = deform.core.depsgraph_dispatch()
+    check(guide in dispatch.curve_guide_data.get(replacement.as_pointer(), ()),
+          "Reassigned guide Curve data is not routed to its guide")
+    guide.data = previous_data
+    bpy.context.view_layer.update()
+    bpy.data.curves.remove(replacement)
+
     print("SDH_CURVE_CAGE_RELATION::PASS")
 finally:
     curve.clear_curve_relation_sync()
@@ -0,0 +1,169 @@
+"""Compare the vectorized deformation evaluator with the frozen reference.
+
+The reference is the pre-batch scalar evaluator kept verbatim in
+``deform_math_reference.py``; it decodes its own stage arguments, so a
+decode or parameter bug in the compiled plan cannot cancel out.
+"""
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import itertools
+import random
+import sys
+from pathlib import Path
+
+from mathutils import Vector
+
+
+SOURCE = Path(__file__).resolve().parents[1]
+PACKAGE = SOURCE.name
+sys.path.insert(0, str(SOURCE.parent))
+
+deform_math = importlib.import_module(f"{PACKAGE}.cage_deform.deform_math")
+# Load the frozen copy beside deform_math so its relative contract import
+# resolves to the shipped constants.
+reference_spec = importlib.util.spec_from_file_location(
+    f"{PACKAGE}.cage_deform._deform_math_reference",
+    Path(__file__).with_name("deform_math_reference.py"),
+)
+reference = importlib.util.module_from_spec(reference_spec)
+reference_spec.loader.exec_module(reference)
+
+# mathutils stores float32 components, so the scalar reference carries a
+# rounding error that grows with the magnitude of the deformed point.
+TOLERANCE = 1.0e-6
+OPERATIONS = ("BEND", "TWIST", "TAPER", "STRETCH", "SHEAR", "FFD", "CURVE")
+
+
+def check(condition, message):
+    if not condition:
+        raise AssertionError(message)
+
+
+def curve_deformer(point, authored_y, _size):
+    return Vector((
+        point.x + 0.1 * authored_y,
+        point.y * 1.1,
+        point.z - 0.05 * authored_y * authored_y,
+    ))
+
+
+def compare(points, label, *, chain_eligible=True,
+            chain_source_coordinate=None, **kwargs):
+    batch = deform_math.deform_points_local(
+        points,
+        chain_eligible=chain_eligible,
+        chain_source_coordinate=chain_source_coordinate,
+        **kwargs,
+    )
+    check(batch.shape == (len(points), 3),
+          f"{label}: batch shape drifted to {batch.shape}")
+    for index, point in enumerate(points):
+        point_kwargs = dict(
+            chain_eligible=(
+                chain_eligible[index]
+                if isinstance(chain_eligible, list) else chain_eligible),
+            chain_source_coordinate=(
+                chain_source_coordinate[index]
+                if isinstance(chain_source_coordinate, list)
+                else chain_source_coordinate),
+            **kwargs,
+        )
+        expected = reference.deform_point_local(point, **point_kwargs)
+        scale = max(1.0, max(abs(float(value)) for value in expected))
+        for name, actual in (
+                ("batch", batch[index]),
+                ("scalar", deform_math.deform_point_local(
+                    point, **point_kwargs)),
+        ):
+            error = max(
+                abs(float(first) - float(second))
+                for first, second in zip(expected, actual))
+            check(error <= TOLERANCE * scale,
+                  f"{label}: {name} point {point} differs by {error}")
+
+
+rng = random.Random(7)
+points = [
+    (x * 0.45, y * 0.6, z * 0.45)
+    for x, y, z in itertools.product(range(-3, 4), range(-5, 6), (-2, 0, 2))
+]
+
+for deform_type in ("BEND", "TWIST", "TAPER", "STRETCH"):
+    compare(points, f"legacy {deform_type}", size=(1.0, 2.0, 1.0),
+            deform_type=deform_type, strength=1.2, factor=0.4, direction=0.3)
+
+for mode, origin, order in itertools.product(
+        ("LIMITED", "WITHIN_BOX", "UNLIMITED", "CHAINED"),
+        ("BOTTOM", "CENTER", "SYMMETRIC", "TOP"),
+        (OPERATIONS, tuple(reversed(OPERATIONS)), ("SHEAR", "BEND", "FFD"))):
+    kwargs = dict(
+        size=(1.5, 3.0, 1.25),
+        mode=mode,
+        origin=origin,
+        preserve_volume=rng.random() < 0.5,
+        top_scale=(1.4, 0.8),
+        bottom_scale=(0.9, 1.2),
+        top_offset=(0.1, -0.05),
+        bottom_offset=(-0.2, 0.15),
+        deform_types=order,
+        deform_order=order,
+        bend_strength=rng.uniform(-2.5, 2.5),
+        bend_direction=rng.uniform(-3.0, 3.0),
+        twist_strength=rng.uniform(-2.5, 2.5),
+        taper_factor=rng.uniform(-0.8, 0.8),
+        stretch_factor=rng.uniform(-0.4, 0.8),
+        shear_factors=(rng.uniform(-1.0, 1.0), rng.uniform(-1.0, 1.0)),
+        ffd_offsets=tuple(rng.uniform(-0.4, 0.4) for _index in range(24)),
+        curve_deformer=curve_deformer,
+    )
+    label = f"{mode}/{origin}/{','.join(order)}"
+    if mode != "CHAINED":
+        compare(points, label, **kwargs)
+        continue
+    eligible = [rng.random() < 0.8 for _point in points]
+    sources = [0.3 + point[1] + 1.5 for point in points]
+    for root in (False, True):
+        compare(points, f"{label} root={root} offset", chain_root_stage=root,
+                chain_eligible=eligible,
+                chain_input_offset=(0.1, -0.2, 0.05), **kwargs)
+        compare(points, f"{label} root={root} frames", chain_root_stage=root,
+                chain_eligible=eligible,
+                chain_source_coordinate=sources,
+                chain_source_start=0.3,
+                chain_input_frame=(
+                    (0.2, 0.1, -0.1), (1.0, 0.1, 0.0),
+                    (0.0, 1.0, 0.05), (0.02, 0.0, 1.0)),
+                chain_output_frame=(
+                    (0.1, 0.3, -0.2), (0.9, 0.1, 0.0),
+                    (0.0, 1.1, 0.1), (0.05, 0.0, 1.0)),
+                **kwargs)
+
+plan = deform_math.compile_deform_plan(
+    (1.5, 3.0, 1.25), deform_types=OPERATIONS, deform_order=OPERATIONS,
+    bend_strength=1.1, twist_strength=0.7, taper_factor=0.2,
+    ffd_offsets=(0.1,) * 24, curve_deformer=curve_deformer)
+try:
+    plan.mode = "UNLIMITED"
+except AttributeError:
+    pass
+else:
+    raise AssertionError("compiled DeformPlan accepted a mutation")
+check(not hasattr(plan, "__dict__"), "DeformPlan lost its __slots__ layout")
+first = deform_math.evaluate(plan, points)
+second = deform_math.evaluate(plan, points)
+check((first == second).all(), "reusing a DeformPlan changed its result")
+compare(points, "compiled plan", size=(1.5, 3.0, 1.25),
+        deform_types=OPERATIONS, deform_order=OPERATIONS,
+        bend_strength=1.1, twist_strength=0.7, taper_factor=0.2,
+        ffd_offsets=(0.1,) * 24, curve_deformer=curve_deformer)
+
+disabled = deform_math.deform_points_local(
+    points, (1.0, 2.0, 1.0), stage_enabled=False, bend_strength=2.0)
+check(all(tuple(row) == point for row, point in zip(disabled, points)),
+      "disabled stage changed batched points")
+check(deform_math.deform_points_local((), (1.0, 1.0, 1.0)).shape == (0, 3),
+      "empty batch did not return an empty point array")
+
+print("SDH_DEFORM_MATH_BATCH::PASS")
@@ -0,0 +1,130 @@
+"""Compare closed-form deformation Jacobians with central differences."""
+from __future__ import annotations
+
+import importlib
+import itertools
+import random
+import sys
+from pathlib import Path
+
+from mathutils import Vector
+
+
+SOURCE = Path(__file__).resolve().parents[1]
+PACKAGE = SOURCE.name
+sys.path.insert(0, str(SOURCE.parent))
+
+deform_math = importlib.import_module(f"{PACKAGE}.cage_deform.deform_math")
+
+# The central-difference reference runs through float32 mathutils vectors,
+# so its step is large enough to stay above single-precision rounding.
+STEP = 1.0e-3
+TOLERANCE = 2.0e-3
+OPERATIONS = ("BEND", "TWIST", "TAPER", "STRETCH", "SHEAR", "FFD", "CURVE")
+
+
+def check(condition, message):
+    if not condition:
+        raise AssertionError(message)
+
+
+def curve_deformer(point, authored_y, _size):
+    return Vector((
+        point.x + 0.1 * authored_y + 0.2 * point.x * point.z,
+        point.y * 1.1,
+        point.z - 0.05 * authored_y * authored_y,
+    ))
+
+
+def central_jacobian(point, kwargs):
+    columns = []
+    for axis in range(3):
+        after = list(point)
+        before = list(point)
+        after[axis] += STEP
+        before[axis] -= STEP
+        columns.append(
+            (deform_math.deform_point_local(after, **kwargs) -
+             deform_math.deform_point_local(before, **kwargs)) /
+            (2.0 * STEP))
+    return columns
+
+
+def compare(point, label, **kwargs):
+    value, jacobian = deform_math.deform_point_local_with_jacobian(
+        point, **kwargs)
+    expected = deform_math.deform_point_local(point, **kwargs)
+    check((value - expected).length <= 1.0e-5,
+          f"{label}: point {point} drifted to {value}, expected {expected}")
+    for axis, column in enumerate(central_jacobian(point, kwargs)):
+        error = (Vector(jacobian.col[axis]) - column).length
+        scale = max(1.0, column.length)
+        check(error <= TOLERANCE * scale,
+              f"{label}: d/d{'xyz'[axis]} at {point} differs by {error}")
+
+
+rng = random.Random(11)
+for mode, origin, order in itertools.product(
+        ("LIMITED", "WITHIN_BOX", "UNLIMITED", "CHAINED"),
+        ("BOTTOM", "CENTER", "SYMMETRIC", "TOP"),
+        (OPERATIONS, tuple(reversed(OPERATIONS)), ("SHEAR", "BEND", "FFD"))):
+    kwargs = dict(
+        size=(1.5, 3.0, 1.25),
+        mode=mode,
+        origin=origin,
+        preserve_volume=rng.random() < 0.5,
+        top_scale=(1.4, 0.8),
+        bottom_scale=(0.9, 1.2),
+        top_offset=(0.1, -0.05),
+        bottom_offset=(-0.2, 0.15),
+        deform_types=order,
+        deform_order=order,
+        bend_strength=rng.uniform(-2.5, 2.5),
+        bend_direction=rng.uniform(-3.0, 3.0),
+        twist_strength=rng.uniform(-2.5, 2.5),
+        taper_factor=rng.uniform(-0.8, 0.8),
+        stretch_factor=rng.uniform(-0.4, 0.8),
+        shear_factors=(rng.uniform(-1.0, 1.0), rng.uniform(-1.0, 1.0)),
+        ffd_offsets=tuple(rng.uniform(-0.4, 0.4) for _index in range(24)),
+        curve_deformer=curve_deformer,
+    )
+    if mode == "CHAINED":
+        kwargs.update(
+            chain_root_stage=rng.random() < 0.5,
+            chain_input_frame=(
+                (0.2, 0.1, -0.1), (1.0, 0.1, 0.0),
+                (0.0, 1.0, 0.05), (0.02, 0.0, 1.0)),
+            chain_output_frame=(
+                (0.1, 0.3, -0.2), (0.9, 0.1, 0.0),
+                (0.0, 1.1, 0.1), (0.05, 0.0, 1.0)),
+        )
+    label = f"{mode}/{origin}/{','.join(order)}"
+    for _sample in range(12):
+        # Stay away from clamp seams, where the one-sided limits differ.
+        point = (
+            rng.uniform(-0.6, 0.6),
+            rng.choice((-1.0, 1.0)) * rng.uniform(0.05, 1.35),
+            rng.uniform(-0.5, 0.5),
+        )
+        compare(point, label, **kwargs)
+
+# Cage faces keep the interior derivative, matching one-sided sampling.
+value, jacobian = deform_math.deform_point_local_with_jacobian(
+    (0.0, 1.0, 0.0), (1.0, 2.0, 1.0), mode="WITHIN_BOX",
+    deform_types=("BEND",), bend_strength=1.5)
+check(abs(Vector(jacobian.col[1]).length - 1.0) <= 1.0e-5,
+      "WITHIN_BOX top face lost the deformed axial derivative")
+check(Vector(jacobian.col[1]) != Vector((0.0, 1.0, 0.0)),
+      "WITHIN_BOX top face sampled the undeformed branch")
+
+value, jacobian = deform_math.deform_point_local_with_jacobian(
+    (0.2, 0.3, 0.1), (1.0, 2.0, 1.0), stage_enabled=False,
+    bend_strength=2.0)
+check((value - Vector((0.2, 0.3, 0.1))).length <= 1.0e-7,
+      "disabled stage changed the point")
+check(all(
+    jacobian[row][column] == (1.0 if row == column else 0.0)
+    for row in range(3) for column in range(3)),
+    "disabled stage Jacobian is not the identity")
+
+print("SDH_DEFORM_MATH_JACOBIAN::PASS")
@@ -155,14 +155,34 @@ try:
                             float(point_screen.x), float(point_screen.y), depth)
                 return projected[index]
 
+            box = (screen.x - 4.0, screen.x + 4.0,
+                   screen.y - 4.0, screen.y + 4.0)
             boxed, _active, _mode = cage.core.ffd_box_selection_indices(
-                properties,
-                project_point,
-                (screen.x - 4.0, screen.x + 4.0,
-                 screen.y - 4.0, screen.y + 4.0),
-            )
+                properties, project_point, box)
             if not boxed:
-                raise RuntimeError("FFD box selection missed the cached point")
+                raise RuntimeError("FFD box selection missed the visible point")
+
+            # The hit test and box path read the per-view projection cache;
+            # it must agree with the independent projection above.
+            cached_projection = cage.core.ffd_view_projection(
+                target, controller, region, space.region_3d)
+            for index in range(cage.core.ffd_point_count(properties)):
+                expected = project_point(index)
+                actual = cached_projection(index)
+                if (expected is None) != (actual is None) or (
+                        expected is not None and max(
+                            abs(float(first) - float(second))
+                            for first, second in zip(expected, actual)
+                        ) > 1.0e-3):
+                    raise RuntimeError(
+                        f"cached FFD projection drifted at {index}: "
+                        f"{actual!r} != {expected!r}")
+            cached_boxed, _active, _mode = cage.core.ffd_box_selection_indices(
+                properties, cached_projection, box)
+            if tuple(cached_boxed) != tuple(boxed):
+                raise RuntimeError(
+                    f"cached box selection differs: {cached_boxed!r} != "
+                    f"{boxed!r}")
             after = gizmo_module._ffd_projected_entity_cache_info()
             if after["hits"] - before["hits"] < 2:
                 raise RuntimeError(
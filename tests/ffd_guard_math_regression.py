@@ -1,16 +1,24 @@
 """Pure regression checks for the FFD anti-foldover guard."""
 from __future__ import annotations
 
-import importlib.util
+import importlib
+import itertools
+import math
+import random
+import sys
+import types
 from pathlib import Path
 
 
 SOURCE = Path(__file__).resolve().parents[1]
-spec = importlib.util.spec_from_file_location(
-    "sdh_ffd_guard", SOURCE / "cage_deform" / "ffd_guard.py")
-guard = importlib.util.module_from_spec(spec)
-assert spec.loader is not None
-spec.loader.exec_module(guard)
+# ``cage_deform/__init__.py`` registers Blender classes, so the guard is
+# loaded under a synthetic parent package that only provides its relative
+# imports.
+PACKAGE = "sdh_ffd_guard_kernels"
+package = types.ModuleType(PACKAGE)
+package.__path__ = [str(SOURCE / "cage_deform")]
+sys.modules[PACKAGE] = package
+guard = importlib.import_module(f"{PACKAGE}.ffd_guard")
 
 
 def check(condition, message):
@@ -18,6 +26,14 @@ def check(condition, message):
         raise AssertionError(message)
 
 
+def determinant(first, second, third):
+    return (
+        first[0] * (second[1] * third[2] - second[2] * third[1]) +
+        first[1] * (second[2] * third[0] - second[0] * third[2]) +
+        first[2] * (second[0] * third[1] - second[1] * third[0])
+    )
+
+
 resolution = (2, 2, 2)
 size = (2.0, 2.0, 2.0)
 count = 8
@@ -99,4 +115,81 @@ check(coarse_ratio >= guard.MIN_JACOBIAN_RATIO,
 check(safe_ratio < guard.MIN_JACOBIAN_RATIO,
       f"dense Jacobian sampling missed an interior fold: {safe_ratio}")
 
+
+def reference_ratio(points, size, resolution, samples=guard.JACOBIAN_SAMPLES):
+    """Per-sample tuple evaluation retained as the batched guard's oracle."""
+    base_cell = math.prod(
+        value / (count - 1) for value, count in zip(size, resolution))
+    minimum = math.inf
+    for cell in guard._all_cell_indices(resolution):
+        corners = tuple(points[index]
+                        for index in guard._corner_indices(*cell, resolution))
+        for sample in itertools.product(samples, repeat=3):
+            minimum = min(minimum, determinant(
+                *guard._trilinear_jacobian(corners, sample)) / base_cell)
+    return minimum
+
+
+# The batched determinant must agree with the per-sample reference across
+# every supported grid size, including folded fields.
+rng = random.Random(5)
+for grid in ((2, 2, 2), (3, 2, 4), (4, 4, 4), (6, 6, 6)):
+    grid_count = math.prod(grid)
+    grid_size = (2.0, 3.0, 1.5)
+    offsets = tuple(
+        tuple(rng.uniform(-0.6, 0.6) for _axis in range(3))
+        for _index in range(grid_count))
+    points = guard._effective_points(
+        grid_size, grid, offsets, (1.0,) * grid_count)
+    expected = reference_ratio(points, grid_size, grid)
+    actual = guard.minimum_jacobian_ratio(points, grid_size, grid)
+    check(abs(actual - expected) <= 1.0e-9 * max(1.0, abs(expected)),
+          f"batched Jacobian ratio drifted at {grid}: {actual} != {expected}")
+    clamped, clamp_fraction, _, _ = guard.clamp_offsets(
+        grid_size, grid, ((0.0, 0.0, 0.0),) * grid_count, offsets,
+        (1.0,) * grid_count)
+    clamped_ratio = guard.minimum_jacobian_ratio(
+        guard._effective_points(
+            grid_size, grid, clamped, (1.0,) * grid_count),
+        grid_size, grid)
+    check(clamp_fraction == 1.0 or
+          clamped_ratio >= guard.MIN_JACOBIAN_RATIO,
+          f"bisection left an unsafe field at {grid}: {clamped_ratio}")
+
+# The closed-form fraction is exact, so it may only exceed the bisection
+# result by the bisection's own 2^-18 resolution and must stay safe.
+for grid in ((2, 2, 2), (4, 4, 4), (6, 6, 6)):
+    grid_count = math.prod(grid)
+    grid_size = (2.0, 3.0, 1.5)
+    baseline = tuple(
+        tuple(rng.uniform(-0.2, 0.2) for _axis in range(3))
+        for _index in range(grid_count))
+    for _edit in range(20):
+        candidate = list(baseline)
+        for _point in range(rng.randint(1, 3)):
+            candidate[rng.randrange(grid_count)] = tuple(
+                rng.uniform(-4.0, 4.0) for _axis in range(3))
+        candidate = tuple(candidate)
+        unit = (1.0,) * grid_count
+        analytic = guard.clamp_offsets(
+            grid_size, grid, baseline, candidate, unit)
+        bisected = guard.clamp_offsets(
+            grid_size, grid, baseline, candidate, unit, solver="BISECTION")
+        if analytic[1] == 1.0 or analytic[2] < guard.MIN_JACOBIAN_RATIO:
+            continue
+        check(0.0 <= analytic[1] - bisected[1] <= 2.0 ** -18,
+              f"analytic fraction {analytic[1]} disagrees with bisection "
+              f"{bisected[1]} at {grid}")
+        analytic_ratio = guard.minimum_jacobian_ratio(
+            guard._effective_points(grid_size, grid, analytic[0], unit),
+            grid_size, grid)
+        check(analytic_ratio >= guard.MIN_JACOBIAN_RATIO,
+              f"analytic clamp left an unsafe field: {analytic_ratio}")
+
+nan_points = list(guard._effective_points(
+    size, resolution, zero, influences))
+nan_points[3] = (math.nan, 0.0, 0.0)
+check(guard.minimum_jacobian_ratio(nan_points, size, resolution) == -math.inf,
+      "non-finite control point did not fail the Jacobian guard")
+
 print("SDH_FFD_GUARD_MATH::PASS")
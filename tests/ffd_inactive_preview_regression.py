@@ -60,11 +60,19 @@ try:
     target.modifiers.active = active_modifier
     active_controller.sdh_cage_deform.show_other_cages = True
 
+    # Each inactive stage owns one cage-local batch drawn with a uniform
+    # color.  Record the geometry a cache miss would upload instead of
+    # touching the GPU in background mode.
+    batches = importlib.import_module(f"{PACKAGE}.cage_deform.gpu_batches")
     calls = []
+    batches.builtin_shader = lambda name: name
+    batches.cached_batch = (
+        lambda key, source, shader, primitive, geometry:
+            (key, primitive, geometry()))
+    batches.draw_batch = (
+        lambda batch, shader, matrix=None, color=None:
+            calls.append((batch, matrix, color)))
     renderer = draw_module.Draw3D()
-    renderer.draw_smooth_3d_shader_colors = (
-        lambda vertices, indices, colors: calls.append(
-            (tuple(vertices), tuple(indices), tuple(colors))))
     renderer._draw_other_cage_previews(
         bpy.context, target, active_modifier, active_controller)
 
@@ -72,24 +80,24 @@ try:
         gizmos.ffd_wire_geometry(
             controller.sdh_cage_deform, effective=True)
         for controller in controllers[1:])
-    if len(calls) != 1:
+    if len(calls) != len(expected):
         raise RuntimeError(
-            f"expected one merged inactive FFD batch, got {len(calls)} draws")
-    vertices, indices, colors = calls[0]
-    expected_vertex_count = sum(len(local) for local, _edges in expected)
-    expected_edge_count = sum(len(edges) for _local, edges in expected)
-    if (
-            len(vertices) != expected_vertex_count or
-            len(indices) != expected_edge_count or
-            len(colors) != expected_vertex_count
-    ):
-        raise RuntimeError(
-            "merged FFD preview used incomplete geometry: "
-            f"vertices={len(vertices)}/{expected_vertex_count}, "
-            f"edges={len(indices)}/{expected_edge_count}, "
-            f"colors={len(colors)}/{expected_vertex_count}")
-    if any(not 0.0 < color[3] < 0.5 for color in colors):
-        raise RuntimeError("merged FFD preview did not use inactive alpha")
+            f"expected one batch per inactive FFD stage, got {len(calls)} draws")
+    for (batch, matrix, color), (local, edges) in zip(calls, expected):
+        _key, primitive, (content, indices) = batch
+        if (
+                primitive != "LINES" or
+                len(content["pos"]) != len(local) or
+                len(indices) != len(edges)
+        ):
+            raise RuntimeError(
+                "inactive FFD preview used incomplete geometry: "
+                f"vertices={len(content['pos'])}/{len(local)}, "
+                f"edges={len(indices)}/{len(edges)}")
+        if matrix is None:
+            raise RuntimeError("inactive FFD preview lost its cage matrix")
+        if not 0.0 < color[3] < 0.5:
+            raise RuntimeError("inactive FFD preview did not use inactive alpha")
 
     addon.unregister()
     finish("PASS::INACTIVE_FFD_CHAIN_GRIDS::3_STAGES")
@@ -135,6 +135,123 @@ try:
     properties.ffd_points[0].influence = 1.0
     properties.ffd_points[0].offset = (0.0, 0.0, 0.0)
     deform.sync_controller(controller, pull_transform=False)
+    ffd_points = importlib.import_module(f"{PACKAGE}.cage_deform.ffd_points")
+    snapshot = ffd_points.point_arrays(properties)
+    if ffd_points.point_arrays(properties) is not snapshot:
+        raise AssertionError("unchanged FFD points were copied again")
+    properties.ffd_points[3].offset = (0.0, 0.25, 0.0)
+    bulk = ffd_points.point_arrays(properties)
+    if bulk is snapshot or abs(float(bulk.offsets[3][1]) - 0.25) > 1.0e-6:
+        raise AssertionError("FFD point edit did not refresh the bulk snapshot")
+    if tuple(bulk.selected.nonzero()[0]) != (0, 1):
+        raise AssertionError("bulk FFD selection read drifted")
+    ffd_points.write_offsets(properties, bulk.offsets * 0.0)
+    if any(Vector(point.offset).length > 1.0e-6
+           for point in properties.ffd_points):
+        raise AssertionError("bulk FFD offset write did not reach the points")
+    deform.sync_controller(controller, pull_transform=False)
+    revisions = importlib.import_module(f"{PACKAGE}.cage_deform.revisions")
+    signature = deform.gizmos.cage_picker_geometry_signature(properties)
+    if deform.gizmos.cage_picker_geometry_signature(properties) is not signature:
+        raise AssertionError("idle picker signature was rebuilt")
+    revision = revisions.revision(properties)
+    properties.ffd_points[2].offset = (0.0, 0.0, 0.125)
+    if revisions.revision(properties) == revision:
+        raise AssertionError("FFD point edit did not bump the revision")
+    revision = revisions.revision(properties)
+    ffd_points.write_offsets(
+        properties, ffd_points.point_arrays(properties).offsets * 0.0)
+    if revisions.revision(properties) == revision:
+        raise AssertionError("bulk FFD write did not bump the revision")
+    revision = revisions.revision(properties)
+    ffd_points.write_selected(
+        properties, ffd_points.point_arrays(properties).selected)
+    if revisions.revision(properties) == revision:
+        raise AssertionError("bulk FFD selection write did not bump the revision")
+    # An external foreach_set runs no point callback; the depsgraph report
+    # on the controller must still retire the cached snapshot.
+    snapshot = ffd_points.point_arrays(properties)
+    external = snapshot.offsets.copy()
+    external[5] = (0.0, 0.0, 0.2)
+    properties.ffd_points.foreach_set("offset", external.reshape(-1))
+    controller.update_tag()
+    bpy.context.view_layer.update()
+    refreshed = ffd_points.point_arrays(properties)
+    if refreshed is snapshot or abs(float(refreshed.offsets[5][2]) - 0.2) > 1.0e-6:
+        raise AssertionError("external FFD write kept serving a stale snapshot")
+    ffd_points.write_offsets(properties, external * 0.0)
+    deform.sync_controller(controller, pull_transform=False)
+    revision = revisions.revision(properties)
+    properties.bend_strength += 0.1
+    if revisions.revision(properties) == revision:
+        raise AssertionError("controller edit did not bump the revision")
+    if deform.gizmos.cage_picker_geometry_signature(properties) == signature:
+        raise AssertionError("picker signature ignored a controller edit")
+    properties.bend_strength -= 0.1
+    deform.sync_controller(controller, pull_transform=False)
+    properties.ffd_points[4].offset = (0.1, -0.2, 0.3)
+    authored = deform.core.ffd_authored_local_points(properties)
+    box_operator = deform.core.SDH_OT_box_select_ffd_points
+    for index in range(len(authored)):
+        expected_local = box_operator._point_local(properties, index)
+        if (Vector(authored[index]) - expected_local).length > 1.0e-5:
+            raise AssertionError("bulk FFD authored points drifted")
+    projection_module = importlib.import_module(
+        f"{PACKAGE}.cage_deform.ffd_projection")
+    perspective = Matrix.Translation((0.0, 0.0, -6.0))
+    perspective[3][2] = -1.0
+    perspective[3][3] = 6.0
+    view = Matrix.Translation((0.0, 0.0, -6.0))
+    cage_matrix = Matrix.Rotation(0.3, 4, "X")
+    screen_projection = projection_module.project_points(
+        authored, perspective, (200, 100),
+        matrix=cage_matrix, view_matrix=view)
+    for index in range(len(authored)):
+        world = cage_matrix @ Vector(authored[index])
+        clip = perspective @ world.to_4d()
+        expected = (
+            100.0 + 100.0 * clip.x / clip.w,
+            50.0 + 50.0 * clip.y / clip.w,
+            -(view @ world).z,
+        )
+        if any(abs(value - reference) > 1.0e-4 for value, reference in zip(
+                screen_projection(index), expected)):
+            raise AssertionError("vectorized FFD projection drifted")
+    view_region = SimpleNamespace(width=200, height=100)
+    view_data = SimpleNamespace(
+        perspective_matrix=perspective, view_matrix=view)
+    cache = deform.core.projected_entity_cache
+    cached_projection = cache.projection(
+        properties, deform.core.ffd_resolution(properties),
+        lambda: authored, view_region, view_data, matrix=cage_matrix)
+    if cache.projection(
+            properties, deform.core.ffd_resolution(properties),
+            lambda: authored, view_region, view_data,
+            matrix=cage_matrix) is not cached_projection:
+        raise AssertionError("unchanged FFD view re-projected its points")
+    if cache.projection(
+            properties, deform.core.ffd_resolution(properties),
+            lambda: authored, view_region, view_data, matrix=cage_matrix,
+            source=("DISPLAY", "upstream")) is cached_projection:
+        raise AssertionError("FFD display points reused the authored projection")
+    deform.core.ffd_box_selection_indices(
+        properties, cached_projection, (0.0, 200.0, 0.0, 100.0))
+    topology_info = deform.core._ffd_projected_entity_topology.cache_info()
+    orbit_data = SimpleNamespace(
+        perspective_matrix=Matrix.Rotation(0.2, 4, "Y") @ perspective,
+        view_matrix=view)
+    orbit_projection = cache.projection(
+        properties, deform.core.ffd_resolution(properties),
+        lambda: authored, view_region, orbit_data, matrix=cage_matrix)
+    if orbit_projection is cached_projection:
+        raise AssertionError("FFD projection ignored a view change")
+    deform.core.ffd_box_selection_indices(
+        properties, orbit_projection, (0.0, 200.0, 0.0, 100.0))
+    orbit_info = deform.core._ffd_projected_entity_topology.cache_info()
+    if (orbit_info.misses != topology_info.misses or
+            orbit_info.hits <= topology_info.hits):
+        raise AssertionError("FFD orbit rebuilt the entity topology")
+    properties.ffd_points[4].offset = (0.0, 0.0, 0.0)
     initial_topology_token = initial_lattice.get(
         deform.core.FFD_LATTICE_TOPOLOGY_TOKEN)
     if not initial_topology_token:
@@ -657,6 +774,15 @@ try:
     _vertices, edges = gizmos.ffd_wire_geometry(properties)
     if any(left not in visible or right not in visible for left, right in edges):
         raise AssertionError("hollow FFD wire contains an interior edge")
+    topology = deform.core.ffd_wire_topology(
+        tuple(deform.core.ffd_resolution(properties)), True)
+    if (
+            edges is not topology.edges or edges.dtype.name != "int32" or
+            deform.core.ffd_wire_topology(
+                tuple(deform.core.ffd_resolution(properties)), True)
+            is not topology
+    ):
+        raise AssertionError("FFD wire topology was rebuilt instead of cached")
     lattice_modifier = next(
         item for item in target.modifiers
         if item.type == "LATTICE" and item.object == lattice
@@ -0,0 +1,93 @@
+"""Validate the analytic FFD lattice basis against Blender's Lattice modifier."""
+from __future__ import annotations
+
+import importlib
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+
+SOURCE = Path(__file__).resolve().parents[1]
+PACKAGE = SOURCE.name
+sys.path.insert(0, str(SOURCE.parent))
+
+ffd_resolution = importlib.import_module(
+    f"{PACKAGE}.cage_deform.ffd_resolution")
+
+# The Lattice modifier evaluates in float32.
+TOLERANCE = 2.0e-6
+SAMPLES = tuple(value / 40.0 for value in range(41))
+
+
+def check(condition, message):
+    if not condition:
+        raise AssertionError(message)
+
+
+for interpolation in ffd_resolution.LATTICE_INTERPOLATIONS:
+    for resolution in range(2, 9):
+        analytic = ffd_resolution.native_axis_weights(
+            resolution, interpolation, SAMPLES)
+        probed = ffd_resolution.probe_axis_weights(
+            resolution, interpolation, SAMPLES)
+        check(len(analytic) == len(probed) == len(SAMPLES),
+              f"{interpolation}/{resolution}: sample count drifted")
+        for sample, expected_row, row in zip(SAMPLES, probed, analytic):
+            error = max(
+                abs(expected - actual)
+                for expected, actual in zip(expected_row, row))
+            check(error <= TOLERANCE,
+                  f"{interpolation}/{resolution} at {sample}: analytic "
+                  f"basis {row} differs from the modifier {expected_row}")
+            check(abs(sum(row) - 1.0) <= 1.0e-12,
+                  f"{interpolation}/{resolution} at {sample}: weights do "
+                  f"not sum to one")
+
+try:
+    ffd_resolution.native_axis_weights(4, "KEY_UNKNOWN", (0.5,))
+except ValueError:
+    pass
+else:
+    raise AssertionError("unknown lattice interpolation was accepted")
+
+# Solved transforms and inverses round-trip through the on-disk table, and a
+# table written for another basis version is ignored.
+with tempfile.TemporaryDirectory() as directory:
+    ffd_resolution.set_persistent_cache_directory(directory)
+    try:
+        ffd_resolution.clear_axis_caches()
+        solved = ffd_resolution._axis_transform(4, 6, "KEY_BSPLINE")
+        inverse = ffd_resolution.native_axis_inverse(5, "KEY_CARDINAL")
+        table = Path(directory) / ffd_resolution._TABLE_NAME
+        check(not table.is_file(),
+              "solved FFD tables were written before the batched flush")
+        check(ffd_resolution.flush_persistent_tables(),
+              "pending FFD tables were not flushed")
+        check(table.is_file(), "solved FFD tables were not persisted")
+        check(not ffd_resolution.flush_persistent_tables(),
+              "a clean FFD table was rewritten")
+
+        ffd_resolution.clear_axis_caches()
+        check(ffd_resolution._axis_transform(4, 6, "KEY_BSPLINE") == solved,
+              "persisted FFD transform did not round-trip")
+        check(ffd_resolution.native_axis_inverse(5, "KEY_CARDINAL") ==
+              inverse, "persisted FFD inverse did not round-trip")
+
+        stored = json.loads(table.read_text(encoding="utf-8"))
+        stored["version"] = -1
+        stored["inverses"]["5:KEY_CARDINAL"] = [[0.0] * 5] * 5
+        table.write_text(json.dumps(stored), encoding="utf-8")
+        ffd_resolution.clear_axis_caches()
+        check(ffd_resolution.native_axis_inverse(5, "KEY_CARDINAL") ==
+              inverse, "stale FFD table version was not ignored")
+
+        table.write_text("{", encoding="utf-8")
+        ffd_resolution.clear_axis_caches()
+        check(ffd_resolution._axis_transform(4, 6, "KEY_BSPLINE") == solved,
+              "corrupt FFD table was not ignored")
+    finally:
+        ffd_resolution.set_persistent_cache_directory(None)
+        ffd_resolution.clear_axis_caches()
+
+print("SDH_FFD_RESOLUTION_BASIS::PASS")
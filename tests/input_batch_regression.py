@@ -0,0 +1,135 @@
+"""Pure regression checks for batched Geometry Nodes input writes."""
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+
+SOURCE = Path(__file__).resolve().parents[1]
+spec = importlib.util.spec_from_file_location(
+    "sdh_input_batch", SOURCE / "cage_deform" / "input_batch.py")
+input_batch = importlib.util.module_from_spec(spec)
+assert spec.loader is not None
+spec.loader.exec_module(input_batch)
+
+
+def check(condition, message):
+    if not condition:
+        raise AssertionError(message)
+
+
+class Target:
+    def __init__(self, name):
+        self.name = name
+        self.tags = 0
+
+    def update_tag(self):
+        self.tags += 1
+
+
+class Modifier:
+    def __init__(self, target):
+        self.id_data = target
+        self.sockets = {}
+        self.writes = []
+
+
+def write(modifier, identifier, value):
+    modifier.sockets[identifier] = value
+    modifier.writes.append(identifier)
+
+
+def different(old, value):
+    return old is None or abs(float(old) - float(value)) > 1.0e-6
+
+
+batch = input_batch.ModifierInputBatch(
+    read=lambda modifier, identifier: modifier.sockets.get(identifier),
+    write=write,
+    tag=lambda target: target.update_tag(),
+    different=different,
+    key=lambda _obj: 0,
+)
+target = Target("Chain")
+stages = tuple(Modifier(target) for _index in range(12))
+for stage in stages:
+    stage.sockets.update({"Center": 0.0, "Size": 2.0})
+
+# Outside a batch writes and tags are immediate, as before batching.
+batch.set(stages[0], "Center", 1.0)
+check(stages[0].sockets["Center"] == 1.0, "unbatched write was deferred")
+batch.tag(target)
+check(target.tags == 1, "unbatched tag was deferred")
+
+# A chain drag re-syncs every downstream stage; the target must be tagged
+# once, only changed sockets are written, and reads see pending values.
+target.tags = 0
+for stage in stages:
+    stage.writes.clear()
+with batch.batch():
+    for index, stage in enumerate(stages):
+        batch.set(stage, "Center", float(index))
+        batch.set(stage, "Size", 2.0)
+        batch.tag(target)
+        with batch.batch():
+            batch.set(stage, "Center", float(index) + 0.5)
+    check(batch.pending(stages[3], "Center") == 3.5,
+          "reads inside a batch did not see the pending value")
+    check(stages[3].sockets["Center"] == 0.0, "batched write was applied early")
+    check(target.tags == 0, "nested batch flushed before the outer one")
+check(target.tags == 1, f"chain sync tagged the target {target.tags} times")
+check(all(stage.writes == ["Center"] for stage in stages),
+      "unchanged sockets were rewritten")
+check(stages[5].sockets["Center"] == 5.5, "last pending value was not written")
+
+# Values that return to the snapshot within a batch are not written and do
+# not tag anything.
+target.tags = 0
+with batch.batch():
+    batch.set(stages[0], "Size", 4.0)
+    batch.set(stages[0], "Size", 2.0)
+check(target.tags == 0 and stages[0].sockets["Size"] == 2.0,
+      "a reverted socket was written")
+
+# The snapshot is per batch, so a socket edited by hand is written again.
+stages[1].sockets["Size"] = 7.0
+stages[1].writes.clear()
+with batch.batch():
+    batch.set(stages[1], "Size", 2.0)
+check(stages[1].writes == ["Size"] and stages[1].sockets["Size"] == 2.0,
+      "a stale snapshot masked a hand-edited socket")
+
+# Flushing inside an open batch applies queued writes for evaluators.
+with batch.batch():
+    batch.set(stages[2], "Size", 3.0)
+    batch.flush()
+    check(stages[2].sockets["Size"] == 3.0, "explicit flush kept writes queued")
+    check(batch.active, "explicit flush closed the batch")
+check(batch.info()["depth"] == 0 and batch.info()["pending"] == 0,
+      "batch state leaked after the outer batch closed")
+
+# One failed socket write is counted and does not drop the other sockets
+# of the same modifier.
+def failing_write(modifier, identifier, value):
+    if identifier == "Broken":
+        raise TypeError("socket type changed")
+    write(modifier, identifier, value)
+
+
+failing = input_batch.ModifierInputBatch(
+    read=lambda modifier, identifier: modifier.sockets.get(identifier),
+    write=failing_write,
+    tag=lambda target: target.update_tag(),
+    different=different,
+    key=lambda _obj: 0,
+)
+target.tags = 0
+with failing.batch():
+    failing.set(stages[4], "Broken", 1.0)
+    failing.set(stages[4], "Center", 9.0)
+check(stages[4].sockets["Center"] == 9.0,
+      "a failed socket write dropped the remaining sockets")
+check(failing.info()["failed"] == 1, "the failed socket write was not counted")
+check(target.tags == 1, "a partially written modifier was not tagged")
+
+print("SDH_INPUT_BATCH::PASS")
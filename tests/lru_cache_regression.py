@@ -0,0 +1,73 @@
+"""Pure regression checks for the bounded redraw LRU caches."""
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+
+SOURCE = Path(__file__).resolve().parents[1]
+spec = importlib.util.spec_from_file_location(
+    "sdh_lru_cache", SOURCE / "cage_deform" / "lru_cache.py")
+lru = importlib.util.module_from_spec(spec)
+assert spec.loader is not None
+spec.loader.exec_module(lru)
+
+
+def check(condition, message):
+    if not condition:
+        raise AssertionError(message)
+
+
+cache = lru.BoundedLRUCache("test.entries", limit=3)
+for index in range(3):
+    cache.put(index, (float(index),))
+check(cache.get(0) == (0.0,), "stored value was not returned")
+cache.put(3, (3.0,))
+check(1 not in cache and 0 in cache,
+      "eviction did not drop the least recently used entry")
+check(len(cache) == 3, f"entry limit not enforced: {len(cache)}")
+check(cache.get(1) is None, "evicted key still returned a value")
+info = cache.info()
+check((info["hits"], info["misses"], info["evictions"]) == (1, 1, 1),
+      f"unexpected counters: {info}")
+
+# The full-wipe policy this replaces dropped every stage at the limit.  A
+# rolling drag over more keys than the limit must keep the newest entries.
+rolling = lru.BoundedLRUCache("test.rolling", limit=8)
+for index in range(20):
+    rolling.put(index, index)
+check(rolling.keys() == tuple(range(12, 20)),
+      f"rolling window lost recent entries: {rolling.keys()}")
+
+sized = lru.BoundedLRUCache(
+    "test.bytes", limit=100, byte_budget=1000, sizeof=lambda value: value)
+sized.put("a", 400)
+sized.put("b", 400)
+sized.put("c", 400)
+check(sized.keys() == ("b", "c") and sized.bytes == 800,
+      f"byte budget not enforced: {sized.keys()} {sized.bytes}")
+sized.put("huge", 5000)
+check(sized.keys() == ("huge",) and sized.bytes == 5000,
+      "an oversized newest entry must be retained alone")
+check(sized.pop("huge") == 5000 and sized.bytes == 0,
+      "pop did not release accounted bytes")
+sized.put("a", 10)
+sized.put("a", 30)
+check(sized.bytes == 30, f"replacing a key double-counted bytes: {sized.bytes}")
+
+shared = (1.0, 2.0, 3.0)
+single = lru.estimate_size((shared,))
+double = lru.estimate_size((shared, shared))
+check(0 < single < double < single * 2,
+      "shared members should be counted once")
+
+stats = {info["name"]: info for info in lru.cache_stats()}
+check({"test.entries", "test.rolling", "test.bytes"} <= set(stats),
+      f"caches missing from registry: {sorted(stats)}")
+lru.reset_cache_stats()
+check(cache.info()["hits"] == 0 and len(cache) == 3,
+      "reset_cache_stats must keep entries and zero counters")
+cache.clear()
+check(len(cache) == 0 and cache.bytes == 0, "clear left entries behind")
+
+print("SDH_LRU_CACHE::PASS")
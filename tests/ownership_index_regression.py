@@ -0,0 +1,139 @@
+"""Pure regression checks for the runtime ownership UUID index."""
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+
+SOURCE = Path(__file__).resolve().parents[1]
+spec = importlib.util.spec_from_file_location(
+    "sdh_ownership", SOURCE / "cage_deform" / "ownership.py")
+ownership = importlib.util.module_from_spec(spec)
+assert spec.loader is not None
+spec.loader.exec_module(ownership)
+
+
+def check(condition, message):
+    if not condition:
+        raise AssertionError(message)
+
+
+class FakeObject:
+    _next_pointer = 1
+
+    def __init__(self, name, **properties):
+        self.name = name
+        self.properties = dict(properties)
+        self.removed = False
+        self.pointer = FakeObject._next_pointer
+        FakeObject._next_pointer += 1
+
+    def as_pointer(self):
+        if self.removed:
+            raise ReferenceError(self.name)
+        return self.pointer
+
+    def get(self, key, default=None):
+        if self.removed:
+            raise ReferenceError(self.name)
+        return self.properties.get(key, default)
+
+    def wrapper(self):
+        # Blender can return a different Python wrapper for the same ID.
+        other = FakeObject.__new__(FakeObject)
+        other.__dict__ = self.__dict__
+        return other
+
+
+def pointer(obj):
+    try:
+        return obj.as_pointer()
+    except ReferenceError:
+        return 0
+
+
+def classify(obj):
+    if obj.get("controller"):
+        return (("controllers", (obj.get("target", ""), obj.get("modifier", ""))),)
+    target = obj.get("target", "")
+    return (("targets", target),) if target else ()
+
+
+scene = []
+scans = []
+
+
+def objects():
+    scans.append(len(scene))
+    return scene
+
+
+index = ownership.OwnershipIndex(objects, classify, pointer)
+target = FakeObject("Target", target="T1")
+copy = FakeObject("Target.001", target="T1")
+controller = FakeObject("Controller", controller=True, target="T1", modifier="M1")
+scene.extend((FakeObject("Plain"), target, controller, copy))
+
+check(index.first("targets", "T1") is target,
+      "lookup must return the first object in collection order")
+check(index.get("controllers", ("T1", "M1")) == (controller,),
+      "controller was not indexed by its target and modifier UUIDs")
+check(index.first("targets", "missing") is None, "unknown key must miss")
+rebuilds = index.rebuilds
+for _index in range(10):
+    index.first("targets", "T1")
+check(index.rebuilds == rebuilds, "repeated lookups must not rebuild")
+
+# A rewritten UUID is re-filed incrementally through ``note``.
+copy.properties["target"] = "T2"
+index.note(copy.wrapper())
+check(index.get("targets", "T1") == (target,),
+      "a re-noted object kept its old key")
+check(index.first("targets", "T2") is not None, "note did not file the new key")
+check(index.rebuilds == rebuilds, "note must not rebuild the index")
+version = index.current_version()
+index.note(copy)
+check(index.current_version() == version,
+      "re-noting an unchanged object must keep the index version")
+
+# Re-filed objects keep collection order instead of moving to the end.
+copy.properties["target"] = "T1"
+index.note(copy)
+target.properties["target"] = "T4"
+index.note(target)
+target.properties["target"] = "T1"
+index.note(target)
+check(index.get("targets", "T1") == (target, copy),
+      "note appended a re-filed object after later candidates")
+copy.properties["target"] = "T2"
+index.note(copy)
+
+# A write that was never noted is caught by re-classification.
+target.properties["target"] = "T3"
+check(index.first("targets", "T1") is None,
+      "a stale candidate was returned after its UUID changed")
+check(index.stale == 1 and index.first("targets", "T3") is target,
+      "a stale hit must rebuild the index")
+
+# Deletions change the object count and rebuild before the next lookup.
+scene.remove(controller)
+controller.removed = True
+check(index.get("controllers", ("T1", "M1")) == (),
+      "a removed controller is still indexed")
+check(len(index.objects("controllers", "targets")) == 2,
+      "objects() must list every live indexed object once")
+
+index.invalidate()
+check(index.info()["objects"] == 0, "invalidate must drop every entry")
+check(index.first("targets", "T3") is target, "lookup after invalidate failed")
+
+
+def restricted():
+    raise AttributeError("_RestrictData")
+
+
+blocked = ownership.OwnershipIndex(restricted, classify, pointer)
+check(blocked.get("targets", "T1") == () and blocked.objects("targets") == (),
+      "restricted data must behave like an empty scene")
+
+print("SDH_OWNERSHIP_INDEX::PASS")
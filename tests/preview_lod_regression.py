@@ -0,0 +1,93 @@
+"""Pure regression checks for screen-space cage preview rail sampling."""
+from __future__ import annotations
+
+import importlib.util
+import math
+from pathlib import Path
+
+import numpy as np
+
+
+SOURCE = Path(__file__).resolve().parents[1]
+spec = importlib.util.spec_from_file_location(
+    "sdh_preview_lod", SOURCE / "cage_deform" / "preview_lod.py")
+lod = importlib.util.module_from_spec(spec)
+assert spec.loader is not None
+spec.loader.exec_module(lod)
+
+
+def check(condition, message):
+    if not condition:
+        raise AssertionError(message)
+
+
+def arc_rails(theta, length=1.0, samples=lod.PROBE_STEPS + 1):
+    t = np.linspace(0.0, 1.0, samples)
+    if theta == 0.0:
+        rail = np.stack((np.zeros_like(t), t * length, np.zeros_like(t)), 1)
+    else:
+        radius = length / theta
+        rail = np.stack((
+            radius * (1.0 - np.cos(t * theta)),
+            radius * np.sin(t * theta),
+            np.zeros_like(t)), 1)
+    return rail[None, :, :]
+
+
+def screen(rails, pixels_per_unit):
+    return rails[..., :2] * pixels_per_unit
+
+
+straight = arc_rails(0.0)
+turning = lod.rail_turning(straight)
+check(float(turning[0]) == 0.0, f"straight rail turned: {turning}")
+check(
+    lod.rail_lod_steps(
+        screen(straight, 2000.0), np.ones(straight.shape[:2], bool), turning,
+        maximum=48) == 1,
+    "an undeformed rail must use a single step")
+
+for theta in (0.3, math.pi * 0.5, math.pi):
+    measured = float(lod.rail_turning(arc_rails(theta))[0])
+    check(abs(measured - theta) < 1.0e-9,
+          f"probe turning {measured} differs from arc turning {theta}")
+
+# Bent rails gain steps as they grow on screen, and the chosen level keeps
+# the chord error of the true arc within the pixel tolerance.
+bent = arc_rails(math.pi * 0.5)
+bent_turning = lod.rail_turning(bent)
+previous = 0
+for pixels in (20.0, 200.0, 800.0, 3000.0):
+    steps = lod.rail_lod_steps(
+        screen(bent, pixels), np.ones(bent.shape[:2], bool), bent_turning,
+        maximum=1000, levels=tuple(range(1, 1000)))
+    check(steps >= previous, f"steps shrank while zooming in: {steps}")
+    previous = steps
+    radius = pixels / (math.pi * 0.5)
+    sag = radius * (1.0 - math.cos(math.pi * 0.25 / steps))
+    check(sag <= lod.PIXEL_TOLERANCE * 1.01,
+          f"{steps} steps leave {sag:.3f}px error at {pixels}px")
+
+check(
+    lod.rail_lod_steps(
+        screen(bent, 3000.0), np.ones(bent.shape[:2], bool), bent_turning,
+        maximum=24) == 24,
+    "large needs must clamp to the maximum")
+check(
+    lod.rail_lod_steps(
+        screen(bent, 200.0), np.ones(bent.shape[:2], bool), bent_turning,
+        maximum=48) in lod.LOD_LEVELS,
+    "chosen steps must snap to a cached level")
+valid = np.ones(bent.shape[:2], bool)
+valid[0, 3] = False
+check(
+    lod.rail_lod_steps(
+        screen(bent, 20.0), valid, bent_turning, maximum=24) == 24,
+    "rails behind the viewer must use the maximum")
+
+# Curve cages are probed at their guide resolution, never below 24 steps.
+check(lod.probe_steps() == lod.PROBE_STEPS, "standard probe changed")
+check(lod.probe_steps(4) == 24, "coarse curve guides lost the 24-step probe")
+check(lod.probe_steps(48) == 48, "fine curve guides were probed too coarsely")
+
+print("SDH_PREVIEW_LOD::PASS")
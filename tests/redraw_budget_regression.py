@@ -0,0 +1,112 @@
+"""Pure regression checks for the cage preview frame-budget scheduler."""
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+
+SOURCE = Path(__file__).resolve().parents[1]
+spec = importlib.util.spec_from_file_location(
+    "sdh_redraw_budget", SOURCE / "cage_deform" / "redraw_budget.py")
+budget = importlib.util.module_from_spec(spec)
+assert spec.loader is not None
+spec.loader.exec_module(budget)
+
+
+def check(condition, message):
+    if not condition:
+        raise AssertionError(message)
+
+
+class Clock:
+    now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+clock = Clock()
+scheduler = budget.FrameBudgetScheduler(
+    budget_ms=4.0, max_defer_frames=3, clock=clock)
+stages = tuple(("PREVIEW", index) for index in range(30))
+
+# Every inactive stage costs 2 ms and the active stage 3 ms.  Once measured,
+# a 4 ms budget must not rebuild the whole chain in one frame.
+for key in stages:
+    scheduler.begin_frame()
+    check(scheduler.allow(key), "first rebuild of a frame was deferred")
+    scheduler.record(key, 2.0)
+check(scheduler.cost(stages[0]) == 2.0, "rebuild cost was not measured")
+scheduler.begin_frame()
+check(scheduler.allow("ACTIVE", active=True), "active stage was deferred")
+scheduler.record("ACTIVE", 3.0)
+check(not scheduler.allow("ACTIVE", active=True),
+      "active stage rebuilt twice in one frame")
+admitted = [key for key in stages if scheduler.allow(key)]
+for key in admitted:
+    scheduler.record(key, 2.0)
+check(admitted == [], f"over-budget frame admitted inactive stages: {admitted}")
+
+scheduler.begin_frame()
+admitted = []
+for key in stages:
+    if scheduler.allow(key):
+        scheduler.record(key, 2.0)
+        admitted.append(key)
+check(len(admitted) == 2, f"idle frame ignored the budget: {len(admitted)}")
+
+# Deferred stages are admitted after ``max_defer_frames`` frames even when
+# the active stage keeps the budget spent, so previews always converge.
+refreshed = set(admitted)
+for _frame in range(12):
+    scheduler.begin_frame()
+    scheduler.allow("ACTIVE", active=True)
+    scheduler.record("ACTIVE", 5.0)
+    for key in stages:
+        if scheduler.allow(key):
+            scheduler.record(key, 2.0)
+            refreshed.add(key)
+check(refreshed == set(stages),
+      f"stages starved under load: {sorted(set(stages) - refreshed)}")
+check(scheduler.info()["forced"] > 0, "starvation guard never engaged")
+
+# Without a draw callback a stalled frame ends after the timeout.
+frame = scheduler.frame
+clock.now += 1.0
+scheduler.allow(stages[0])
+check(scheduler.frame == frame + 1, "frame timeout did not start a frame")
+
+# Viewports drawn in one redraw cycle share a frame; the next cycle starts
+# when the first viewport draws again.
+views = ("VIEW_A", "VIEW_B", "VIEW_C")
+for view in views:
+    scheduler.begin_redraw(view)
+frame = scheduler.frame
+for view in views:
+    scheduler.begin_redraw(view)
+check(scheduler.frame == frame + 1,
+      "every viewport of one redraw cycle started its own frame")
+scheduler.begin_redraw("VIEW_A", budget_ms=6.0)
+check(scheduler.frame == frame + 2 and scheduler.budget_ms == 6.0,
+      "the next redraw cycle did not start a frame")
+
+# Per-key state evicts the least recently seen keys instead of wiping
+# every measured cost at the limit.
+scheduler.clear()
+scheduler.begin_frame()
+for index in range(scheduler.KEY_LIMIT + 10):
+    scheduler.record(("STAGE", index), 1.0)
+check(scheduler.info()["keys"] == scheduler.KEY_LIMIT,
+      "scheduler key state grew past its limit")
+check(scheduler.cost(("STAGE", 0)) is None,
+      "least recently seen key survived eviction")
+check(scheduler.cost(("STAGE", scheduler.KEY_LIMIT + 9)) == 1.0,
+      "recent key cost was dropped")
+check(scheduler.cost(("STAGE", 10)) == 1.0,
+      "eviction wiped keys still within the limit")
+
+scheduler.clear()
+check(scheduler.info()["waiting"] == 0 and scheduler.cost(stages[0]) is None,
+      "clear left scheduler state behind")
+
+print("SDH_REDRAW_BUDGET::PASS")
@@ -659,6 +659,9 @@ translations_dict = {
     "Warn when the active deformation axis has too few geometry points":
         "活动形变轴上的几何点过少时显示警告",
     "Wireframe Preview FPS": "线框预览帧率",
+    "Cage Preview Budget (ms)": "笼预览预算 (毫秒)",
+    "Time per viewport redraw spent rebuilding inactive cage previews while dragging. The active cage always updates first; other stages catch up over the following redraws":
+        "拖动时每次视图重绘用于重建非活动笼预览的时间。活动笼始终优先更新；其他阶段会在随后的重绘中跟上",
     "Maximum refresh rate for the optional deformed wireframe preview":
         "可选形变线框预览的最高刷新率",
     "User Origin is protected": "用户 Origin 已受保护",
@@ -1235,6 +1238,8 @@ translations_ja_JP = _localized_catalog({
     "Warn About Low Topology": "低トポロジーを警告",
     "Warn when the active deformation axis has too few geometry points": "アクティブ変形軸のジオメトリ点が少なすぎる場合に警告",
     "Wireframe Preview FPS": "ワイヤーフレームプレビュー FPS",
+    "Cage Preview Budget (ms)": "ケージプレビュー予算 (ms)",
+    "Time per viewport redraw spent rebuilding inactive cage previews while dragging. The active cage always updates first; other stages catch up over the following redraws": "ドラッグ中、ビューポートの再描画ごとに非アクティブなケージプレビューの再構築に使う時間。アクティブなケージは常に先に更新され、他のステージは続く再描画で追いつきます",
     "Maximum refresh rate for the optional deformed wireframe preview": "任意の変形ワイヤーフレームプレビューの最大更新レート",
     "User Origin is protected": "ユーザー原点は保護されています",
     "Follow-limit Origin modes are disabled.": "制限追従の原点モードは無効です。",
@@ -1784,6 +1789,8 @@ translations_ko_KR = _localized_catalog({
     "Warn About Low Topology": "낮은 토폴로지 경고",
     "Warn when the active deformation axis has too few geometry points": "활성 변형 축의 지오메트리 점이 너무 적을 때 경고",
     "Wireframe Preview FPS": "와이어프레임 미리보기 FPS",
+    "Cage Preview Budget (ms)": "케이지 미리보기 예산 (ms)",
+    "Time per viewport redraw spent rebuilding inactive cage previews while dragging. The active cage always updates first; other stages catch up over the following redraws": "드래그 중 뷰포트를 다시 그릴 때마다 비활성 케이지 미리보기를 다시 만드는 데 쓰는 시간. 활성 케이지는 항상 먼저 갱신되고 다른 단계는 이후 다시 그리기에서 따라잡습니다",
     "Maximum refresh rate for the optional deformed wireframe preview": "선택적 변형 와이어프레임 미리보기의 최대 새로고침 속도",
     "User Origin is protected": "사용자 원점이 보호되어 있습니다",
     "Follow-limit Origin modes are disabled.": "제한 추종 원점 모드가 비활성화되어 있습니다.",
@@ -4674,6 +4681,36 @@ translations_ko_KR.update(_CREATE_CAGE_UI_KO)
 translations_en_US.update({source: source for source in _CREATE_CAGE_UI_ZH})
 
 
+_CACHE_STATS_ZH = {
+    "Report Cage Cache Statistics": "报告笼缓存统计",
+    "Print hit, miss, eviction, and memory counters of the cage redraw caches to the console and the Info log":
+        "将笼重绘缓存的命中、未命中、淘汰和内存计数输出到控制台和信息日志",
+    "Reset Counters": "重置计数",
+    "Zero the hit, miss, and eviction counters after reporting":
+        "报告后将命中、未命中和淘汰计数清零",
+}
+_CACHE_STATS_JA = {
+    "Report Cage Cache Statistics": "ケージキャッシュ統計を報告",
+    "Print hit, miss, eviction, and memory counters of the cage redraw caches to the console and the Info log":
+        "ケージ再描画キャッシュのヒット、ミス、破棄、メモリのカウンターをコンソールと情報ログに出力",
+    "Reset Counters": "カウンターをリセット",
+    "Zero the hit, miss, and eviction counters after reporting":
+        "報告後にヒット、ミス、破棄のカウンターをゼロに戻す",
+}
+_CACHE_STATS_KO = {
+    "Report Cage Cache Statistics": "케이지 캐시 통계 보고",
+    "Print hit, miss, eviction, and memory counters of the cage redraw caches to the console and the Info log":
+        "케이지 다시 그리기 캐시의 적중, 실패, 제거, 메모리 카운터를 콘솔과 정보 로그에 출력",
+    "Reset Counters": "카운터 초기화",
+    "Zero the hit, miss, and eviction counters after reporting":
+        "보고 후 적중, 실패, 제거 카운터를 0으로 초기화",
+}
+translations_dict.update(_CACHE_STATS_ZH)
+translations_ja_JP.update(_CACHE_STATS_JA)
+translations_ko_KR.update(_CACHE_STATS_KO)
+translations_en_US.update({source: source for source in _CACHE_STATS_ZH})
+
+
 SimpleDeform_CN = TranslationHelper(
     "SimpleDeform_CN",
     {